@@ -0,0 +1,18 @@
+"""
+Benchmark suite for the converter, validator and batch hot paths.
+
+Unlike the pass/fail timing assertions in ``tests/performance``, the
+benchmarks measure throughput and latency at fixed input sizes, generated
+with ``tests/fixtures/data_generators.py``, and report them as JSON so runs
+can be compared against a stored baseline.
+
+Usage:
+    python -m benchmarks                         # run all, print JSON
+    python -m benchmarks --output results.json   # write the report
+    python -m benchmarks --save-baseline         # store benchmarks/baseline.json
+    python -m benchmarks --compare               # fail on regressions
+    python -m benchmarks -k convert_content      # run matching benchmarks
+
+Each benchmark runs in its own process so that its peak RSS is not inflated
+by the benchmarks before it.
+"""
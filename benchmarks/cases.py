@@ -0,0 +1,183 @@
+"""
+Benchmark definitions.
+
+Every benchmark works on inputs of a fixed size generated by
+``tests/fixtures/data_generators.py``, so results from different runs and
+machines measure the same work. A benchmark's setup builds its inputs and
+returns the operation to time; it is not part of the measurement.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+from tests.fixtures.data_generators import StressTestGenerator
+
+# Roles and tasks per role of the generated project
+PROJECT_ROLES = 20
+TASKS_PER_ROLE = 20
+
+# Size of the generated memory stress playbook
+STRESS_CONTENT_MB = 2
+
+# Copies of the generated project in the batch benchmarks' tree
+BATCH_PROJECTS = 8
+
+Setup = Callable[[Path], Tuple[Callable[[], Any], Dict[str, Any]]]
+
+
+@dataclass
+class Case:
+    """
+    A registered benchmark.
+
+    Attributes:
+        name: Benchmark name, "<api>/<input>"
+        setup: Builds inputs in a scratch directory and returns the
+              operation to time with the params describing its inputs
+        iterations: Number of timed operations
+        warmup: Number of untimed operations made first
+    """
+
+    name: str
+    setup: Setup
+    iterations: int
+    warmup: int = 1
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, iterations: int, warmup: int = 1) -> Callable[[Setup], Setup]:
+    """Register a benchmark setup function under name."""
+
+    def register(setup: Setup) -> Setup:
+        CASES[name] = Case(name, setup, iterations, warmup)
+        return setup
+
+    return register
+
+
+def _project_tasks() -> str:
+    """Return the tasks file of the first role of the generated project."""
+    project = StressTestGenerator.generate_large_project(
+        num_roles=1, tasks_per_role=TASKS_PER_ROLE
+    )
+    return project["roles"]["role_000"]["tasks/main.yml"]
+
+
+def _project_params() -> Dict[str, Any]:
+    return {"roles": PROJECT_ROLES, "tasks_per_role": TASKS_PER_ROLE}
+
+
+def _write_project(root: Path) -> int:
+    """Write the generated project under root and return its file count."""
+    project = StressTestGenerator.generate_large_project(
+        num_roles=PROJECT_ROLES, tasks_per_role=TASKS_PER_ROLE
+    )
+    count = 0
+    for name, content in project["playbooks"].items():
+        root.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(content, encoding="utf-8")
+        count += 1
+    for role, files in project["roles"].items():
+        for relative, content in files.items():
+            path = root / "roles" / role / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            count += 1
+    return count
+
+
+def _write_projects(workdir: Path) -> Tuple[Path, int]:
+    """Write BATCH_PROJECTS copies of the project and return the tree root."""
+    root = workdir / "projects"
+    files = sum(
+        _write_project(root / f"project_{i:02d}") for i in range(BATCH_PROJECTS)
+    )
+    return root, files
+
+
+@case("mapping_load/cold", iterations=50)
+def mapping_load(workdir: Path) -> Tuple[Callable[[], Any], Dict[str, Any]]:
+    """Load the default mappings and build their index from scratch."""
+    from fqcn_converter.config.index import (
+        clear_mapping_index_cache,
+        load_mapping_index,
+    )
+
+    def operation() -> Any:
+        clear_mapping_index_cache()
+        return load_mapping_index()
+
+    return operation, {}
+
+
+@case("convert_content/tasks_file", iterations=200, warmup=5)
+def convert_tasks_file(workdir: Path) -> Tuple[Callable[[], Any], Dict[str, Any]]:
+    """Convert one role tasks file of the generated project."""
+    from fqcn_converter.core.converter import FQCNConverter
+
+    converter = FQCNConverter()
+    content = _project_tasks()
+    return lambda: converter.convert_content(content), {"tasks": TASKS_PER_ROLE}
+
+
+@case("convert_content/stress", iterations=20)
+def convert_stress(workdir: Path) -> Tuple[Callable[[], Any], Dict[str, Any]]:
+    """Convert the generated memory stress playbook."""
+    from fqcn_converter.core.converter import FQCNConverter
+
+    converter = FQCNConverter()
+    content = StressTestGenerator.generate_memory_stress_content(STRESS_CONTENT_MB)
+    return lambda: converter.convert_content(content), {"size_mb": STRESS_CONTENT_MB}
+
+
+@case("validate_content/tasks_file", iterations=200, warmup=5)
+def validate_tasks_file(workdir: Path) -> Tuple[Callable[[], Any], Dict[str, Any]]:
+    """Validate one role tasks file of the generated project."""
+    from fqcn_converter.core.validator import ValidationEngine
+
+    validator = ValidationEngine()
+    content = _project_tasks()
+    return lambda: validator.validate_content(content), {"tasks": TASKS_PER_ROLE}
+
+
+@case("validate_content/stress", iterations=20)
+def validate_stress(workdir: Path) -> Tuple[Callable[[], Any], Dict[str, Any]]:
+    """Validate the generated memory stress playbook."""
+    from fqcn_converter.core.validator import ValidationEngine
+
+    validator = ValidationEngine()
+    content = StressTestGenerator.generate_memory_stress_content(STRESS_CONTENT_MB)
+    return lambda: validator.validate_content(content), {"size_mb": STRESS_CONTENT_MB}
+
+
+@case("discover_projects/tree", iterations=100, warmup=5)
+def discover_projects(workdir: Path) -> Tuple[Callable[[], Any], Dict[str, Any]]:
+    """Discover the projects of a tree of generated projects."""
+    from fqcn_converter.core.batch import BatchProcessor
+
+    root, files = _write_projects(workdir)
+    processor = BatchProcessor()
+    return lambda: processor.discover_projects(root), {
+        "projects": BATCH_PROJECTS,
+        "files": files,
+        **_project_params(),
+    }
+
+
+@case("process_projects/tree", iterations=10)
+def process_projects(workdir: Path) -> Tuple[Callable[[], Any], Dict[str, Any]]:
+    """Dry-run convert a tree of generated projects."""
+    from fqcn_converter.core.batch import BatchProcessor
+
+    root, files = _write_projects(workdir)
+    processor = BatchProcessor(max_workers=4)
+    projects = processor.discover_projects(root)
+    return lambda: processor.process_projects(projects, dry_run=True), {
+        "projects": len(projects),
+        "files": files,
+        "workers": processor.max_workers,
+        **_project_params(),
+    }
@@ -0,0 +1,192 @@
+"""
+Measurement and baseline comparison for the benchmark suite.
+"""
+
+import math
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# Bump when the report layout changes
+REPORT_VERSION = 1
+
+# Relative slowdown (or memory growth) beyond which a benchmark regressed
+DEFAULT_THRESHOLD = 0.2
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Measurements of one benchmark.
+
+    Attributes:
+        name: Benchmark name
+        iterations: Number of timed operations
+        ops_per_sec: Operations per second over all timed operations
+        p50_ms: Median latency of one operation
+        p99_ms: 99th percentile latency of one operation
+        peak_rss_mb: Peak resident set size of the benchmark process
+        params: Fixed input sizes the benchmark ran with
+    """
+
+    name: str
+    iterations: int
+    ops_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    peak_rss_mb: Optional[float]
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        """Create from dictionary loaded from JSON."""
+        return cls(**data)
+
+
+@dataclass
+class Regression:
+    """
+    A metric that got worse than its baseline by more than the threshold.
+
+    Attributes:
+        name: Benchmark name
+        metric: Name of the metric that regressed
+        baseline: Baseline value
+        current: Current value
+        change: Relative change, positive meaning worse
+    """
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.metric} {self.baseline:.4g} -> "
+            f"{self.current:.4g} ({self.change:+.1%} worse)"
+        )
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Return the peak resident set size of this process in MB, if known."""
+    try:
+        import resource
+    except ImportError:
+        resource = None  # type: ignore[assignment]
+
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+    try:
+        import psutil
+
+        info = psutil.Process().memory_info()
+        # Windows reports the peak working set
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def measure(
+    name: str,
+    operation: Callable[[], Any],
+    iterations: int,
+    warmup: int = 1,
+    params: Optional[Dict[str, Any]] = None,
+) -> BenchmarkResult:
+    """
+    Time an operation and summarize its latency.
+
+    Args:
+        name: Benchmark name
+        operation: Callable performing one operation
+        iterations: Number of timed calls
+        warmup: Number of untimed calls made first
+        params: Input sizes to record with the result
+
+    Returns:
+        BenchmarkResult for the timed calls
+    """
+    for _ in range(warmup):
+        operation()
+
+    samples = []
+    for _ in range(max(1, iterations)):
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+
+    total = sum(samples)
+    return BenchmarkResult(
+        name=name,
+        iterations=len(samples),
+        ops_per_sec=len(samples) / total if total > 0 else float("inf"),
+        p50_ms=percentile(samples, 50) * 1000,
+        p99_ms=percentile(samples, 99) * 1000,
+        peak_rss_mb=peak_rss_mb(),
+        params=dict(params or {}),
+    )
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: List[BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Regression]:
+    """
+    Find benchmarks that regressed against a baseline.
+
+    Throughput regresses when ops/sec drops by more than the threshold, and
+    p99 latency and peak RSS when they grow by more than it. Benchmarks
+    missing from the baseline, or run with different params, are skipped.
+
+    Args:
+        results: Current results
+        baseline: Baseline results
+        threshold: Allowed relative change, e.g. 0.2 for 20%
+
+    Returns:
+        Regressions found, in result order
+    """
+    reference = {result.name: result for result in baseline}
+    regressions = []
+
+    for result in results:
+        base = reference.get(result.name)
+        if base is None or base.params != result.params:
+            continue
+
+        checks = [
+            # (metric, baseline, current, relative change where positive is worse)
+            ("ops_per_sec", base.ops_per_sec, result.ops_per_sec, -1),
+            ("p99_ms", base.p99_ms, result.p99_ms, 1),
+            ("peak_rss_mb", base.peak_rss_mb, result.peak_rss_mb, 1),
+        ]
+        for metric, before, after, sign in checks:
+            if not before or after is None:
+                continue
+            change = sign * (after - before) / before
+            if change > threshold:
+                regressions.append(
+                    Regression(result.name, metric, before, after, change)
+                )
+
+    return regressions
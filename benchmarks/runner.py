@@ -0,0 +1,216 @@
+"""
+Command line runner for the benchmark suite.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .harness import (
+    DEFAULT_THRESHOLD,
+    REPORT_VERSION,
+    BenchmarkResult,
+    compare,
+    measure,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = REPO_ROOT / "benchmarks" / "baseline.json"
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the argument parser of the runner."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the converter, validator and batch hot paths",
+    )
+    parser.add_argument(
+        "-k",
+        dest="select",
+        action="append",
+        metavar="PATTERN",
+        help="Only run benchmarks whose name contains PATTERN (repeatable)",
+    )
+    parser.add_argument("--list", action="store_true", help="List the benchmarks")
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        metavar="N",
+        help="Override the number of timed operations of every benchmark",
+    )
+    parser.add_argument(
+        "--output", "-o", metavar="PATH", help="Write the JSON report to PATH"
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="PATH",
+        default=str(DEFAULT_BASELINE),
+        help="Baseline report (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the report as the baseline",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Compare against the baseline and exit with status 1 on regressions",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed relative change before flagging a regression "
+        f"(default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run every benchmark in this process; peak RSS is then cumulative",
+    )
+    parser.add_argument("--child", metavar="NAME", help=argparse.SUPPRESS)
+    return parser
+
+
+def run_case(name: str, iterations: Optional[int] = None) -> BenchmarkResult:
+    """Set up and measure one benchmark in this process."""
+    from .cases import CASES
+
+    case = CASES[name]
+    with tempfile.TemporaryDirectory(prefix="fqcn_bench_") as workdir:
+        operation, params = case.setup(Path(workdir))
+        return measure(
+            name,
+            operation,
+            iterations=iterations or case.iterations,
+            warmup=case.warmup,
+            params=params,
+        )
+
+
+def run_case_isolated(name: str, iterations: Optional[int] = None) -> BenchmarkResult:
+    """Measure one benchmark in a fresh interpreter."""
+    command = [sys.executable, "-m", "benchmarks", "--child", name]
+    if iterations:
+        command += ["--iterations", str(iterations)]
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(REPO_ROOT / "src"), str(REPO_ROOT), env.get("PYTHONPATH")])
+    )
+    completed = subprocess.run(
+        command, cwd=str(REPO_ROOT), env=env, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Benchmark {name} failed:\n{completed.stderr.strip()}")
+
+    # The result is the last line; anything before it is stray output
+    lines = completed.stdout.strip().splitlines()
+    return BenchmarkResult.from_dict(json.loads(lines[-1]))
+
+
+def load_report(path: str) -> List[BenchmarkResult]:
+    """Load the results of a JSON report."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [BenchmarkResult.from_dict(item) for item in data["benchmarks"]]
+
+
+def build_report(
+    results: List[BenchmarkResult], regressions: Optional[List[Any]] = None
+) -> Dict[str, Any]:
+    """Build the JSON report of a run."""
+    report: Dict[str, Any] = {
+        "version": REPORT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "benchmarks": [result.to_dict() for result in results],
+    }
+    if regressions is not None:
+        report["regressions"] = [
+            {
+                "name": regression.name,
+                "metric": regression.metric,
+                "baseline": regression.baseline,
+                "current": regression.current,
+                "change": regression.change,
+            }
+            for regression in regressions
+        ]
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the selected benchmarks and report them."""
+    from .cases import CASES
+
+    args = create_parser().parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_case(args.child, args.iterations).to_dict()))
+        return 0
+
+    names = [
+        name
+        for name in CASES
+        if not args.select or any(pattern in name for pattern in args.select)
+    ]
+    if args.list:
+        for name in names:
+            print(name)
+        return 0
+    if not names:
+        print("No benchmarks match", file=sys.stderr)
+        return 1
+
+    results = []
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        if args.in_process:
+            result = run_case(name, args.iterations)
+        else:
+            result = run_case_isolated(name, args.iterations)
+        print(
+            f"  {result.ops_per_sec:10.2f} ops/s  p50 {result.p50_ms:8.2f} ms  "
+            f"p99 {result.p99_ms:8.2f} ms  peak RSS {result.peak_rss_mb or 0:7.1f} MB",
+            file=sys.stderr,
+        )
+        results.append(result)
+
+    regressions = None
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"Baseline not found: {args.baseline}", file=sys.stderr)
+            return 1
+        regressions = compare(results, load_report(args.baseline), args.threshold)
+
+    report = json.dumps(build_report(results, regressions), indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+
+    if args.save_baseline:
+        Path(args.baseline).write_text(report + "\n", encoding="utf-8")
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+
+    if regressions:
+        print(
+            f"{len(regressions)} regression(s) beyond {args.threshold:.0%}:",
+            file=sys.stderr,
+        )
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Build the precompiled FQCN mapping bundle.
+
+Parses config/fqcn_mapping.yml once and writes the merged mappings with the
+digest of the YAML to config/fqcn_mapping.bundle.json, which the converter
+loads at startup instead of parsing the YAML while the two match.
+
+Usage:
+    python3 scripts/build_mapping_bundle.py [--output PATH] [--check]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fqcn_converter.config.bundle import read_bundle  # noqa: E402
+from fqcn_converter.config.manager import ConfigurationManager  # noqa: E402
+
+
+def main() -> int:
+    """Build, or check, the bundle of the default mapping file."""
+    parser = argparse.ArgumentParser(
+        description="Precompile the default FQCN mapping file for fast startup"
+    )
+    parser.add_argument(
+        "--output", help="Bundle file to write (default: next to the mapping file)"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if the bundle is missing or stale",
+    )
+    args = parser.parse_args()
+
+    manager = ConfigurationManager()
+    source = manager._default_config_path
+    if source is None:
+        print("Error: default mapping file not found", file=sys.stderr)
+        return 1
+
+    output = Path(args.output) if args.output else None
+    if args.check:
+        if read_bundle(source, output) is None:
+            print(f"Mapping bundle is missing or stale for {source}", file=sys.stderr)
+            return 1
+        print(f"Mapping bundle is up to date for {source}")
+        return 0
+
+    print(f"Wrote {manager.build_mapping_bundle(output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,8 +6,11 @@ from short module names to fully qualified collection names (FQCNs) with robust
 handling, configurable mappings, and comprehensive validation.
 """
 
+from typing import TYPE_CHECKING, Any, List
+
 # Import version information from dedicated module
 from ._version import __version__, __version_tuple__
+from ._lazy import lazy_attribute
 
 # Package metadata
 __title__ = "fqcn-converter"
@@ -18,21 +21,52 @@ __license__ = "MIT"
 __url__ = "https://github.com/mhtalci/ansible_fqcn_converter"
 __version_info__ = __version_tuple__
 
-from .config.manager import ConfigurationManager
-from .core.batch import BatchProcessor, BatchResult
+# Public API, imported on first attribute access so that importing the
+# package (e.g. for the version) does not load PyYAML and the engines
+_LAZY_IMPORTS = {
+    "ConfigurationManager": ".config.manager",
+    "BatchProcessor": ".core.batch",
+    "BatchResult": ".core.batch",
+    "ConversionResult": ".core.converter",
+    "FQCNConverter": ".core.converter",
+    "ParsedDocument": ".core.document",
+    "ValidationEngine": ".core.validator",
+    "ValidationIssue": ".core.validator",
+    "ValidationResult": ".core.validator",
+    "BatchProcessingError": ".exceptions",
+    "ConfigurationError": ".exceptions",
+    "ConversionError": ".exceptions",
+    "FileAccessError": ".exceptions",
+    "FQCNConverterError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "YAMLParsingError": ".exceptions",
+}
+
+if TYPE_CHECKING:
+    from .config.manager import ConfigurationManager
+    from .core.batch import BatchProcessor, BatchResult
+    from .core.converter import ConversionResult, FQCNConverter
+    from .core.document import ParsedDocument
+    from .core.validator import ValidationEngine, ValidationIssue, ValidationResult
+    from .exceptions import (
+        BatchProcessingError,
+        ConfigurationError,
+        ConversionError,
+        FileAccessError,
+        FQCNConverterError,
+        ValidationError,
+        YAMLParsingError,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API names on first access."""
+    return lazy_attribute(__name__, _LAZY_IMPORTS, name, globals())
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# Public API exports
-from .core.converter import ConversionResult, FQCNConverter
-from .core.validator import ValidationEngine, ValidationIssue, ValidationResult
-from .exceptions import (
-    BatchProcessingError,
-    ConfigurationError,
-    ConversionError,
-    FileAccessError,
-    FQCNConverterError,
-    ValidationError,
-    YAMLParsingError,
-)
 
 __all__ = [
     # Version information
@@ -47,6 +81,7 @@ __all__ = [
     # Core classes
     "FQCNConverter",
     "ConversionResult",
+    "ParsedDocument",
     "ValidationEngine",
     "ValidationResult",
     "ValidationIssue",
@@ -0,0 +1,43 @@
+"""
+Deferred imports for package namespaces.
+
+Package ``__init__`` modules re-export their public API through a module
+level ``__getattr__`` (PEP 562) backed by lazy_attribute, so importing a
+package only loads the submodules that are actually used. This keeps the
+start-up of short runs such as ``fqcn-converter --version`` or the
+pre-commit hook free of PyYAML, the engines and the worker pools.
+"""
+
+import importlib
+from typing import Any, Dict, MutableMapping
+
+
+def lazy_attribute(
+    package: str,
+    lazy_imports: Dict[str, str],
+    name: str,
+    namespace: MutableMapping[str, Any],
+) -> Any:
+    """
+    Import a re-exported name of a package on first access.
+
+    Args:
+        package: Name of the package, i.e. ``__name__`` of its ``__init__``
+        lazy_imports: Exported names mapped to the relative module defining them
+        name: Attribute being looked up
+        namespace: Globals of the package; the value is cached there so later
+                  lookups do not reach ``__getattr__`` again
+
+    Returns:
+        The attribute value
+
+    Raises:
+        AttributeError: If name is not a lazily exported attribute
+    """
+    module_name = lazy_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, package), name)
+    namespace[name] = value
+    return value
@@ -10,15 +10,43 @@ import json
 import logging
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
-
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from ..core.changes import (
+    DEFAULT_MANIFEST,
+    FileManifest,
+    common_directory,
+    git_changed_files,
+    settings_fingerprint,
+)
 from ..core.converter import ConversionResult, FQCNConverter
+from ..core.discovery import (
+    DEFAULT_SKIP_DIRS,
+    DEFAULT_WALK_WORKERS,
+    IgnoreRules,
+    has_project_marker,
+    iter_files,
+    parallel_walk,
+    walk,
+)
+from ..core.document import ParsedDocument
+from ..core.workers import (
+    EXECUTORS,
+    FileRecord,
+    ProjectFiles,
+    iter_file_records,
+    iter_thread_records,
+    largest_first,
+)
 from ..core.validator import ValidationEngine, ValidationResult
 from ..exceptions import ConfigurationError, FQCNConverterError
+from ..utils.profiling import phase
+
+# Directories never treated as or searched for projects
+BATCH_SKIP_DIRS = DEFAULT_SKIP_DIRS | {".vagrant", ".molecule"}
 
 
 def add_batch_arguments(parser: argparse.ArgumentParser) -> None:
@@ -57,6 +85,14 @@ def add_batch_arguments(parser: argparse.ArgumentParser) -> None:
         help="Number of parallel workers for batch processing (default: 4)",
     )
 
+    parser.add_argument(
+        "--executor",
+        choices=EXECUTORS,
+        default="thread",
+        help="Run workers as threads or processes; processes use multiple "
+        "cores for conversion (default: thread)",
+    )
+
     parser.add_argument(
         "--dry-run",
         "-n",
@@ -88,6 +124,24 @@ def add_batch_arguments(parser: argparse.ArgumentParser) -> None:
         help="Maximum directory depth for project discovery (default: 5)",
     )
 
+    # Incremental options
+    parser.add_argument(
+        "--since",
+        metavar="REF",
+        help="Only convert files changed since a git ref (e.g. origin/main)",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        nargs="?",
+        const=DEFAULT_MANIFEST,
+        metavar="MANIFEST",
+        help=(
+            "Only convert files changed since the last run, tracked in a manifest "
+            f"(default: {DEFAULT_MANIFEST})"
+        ),
+    )
+
     # Reporting options
     parser.add_argument(
         "--report",
@@ -152,6 +206,9 @@ class BatchCommand:
         self.converter: Optional[FQCNConverter] = None
         self.validator: Optional[ValidationEngine] = None
         self.results: List[ProjectResult] = []
+        self.manifest: Optional[FileManifest] = None
+        self._changed_files: Optional[Set[Path]] = None
+        self._project_files: Dict[str, List[Path]] = {}
         self.stats = {
             "projects_discovered": 0,
             "projects_processed": 0,
@@ -176,7 +233,8 @@ class BatchCommand:
             self._initialize_components()
 
             # Discover or get projects
-            projects = self._get_projects()
+            with phase("discover"):
+                projects = self._get_projects()
 
             if not projects:
                 self.logger.warning("No Ansible projects found")
@@ -195,14 +253,21 @@ class BatchCommand:
             if self.args.dry_run:
                 self.logger.info("DRY RUN MODE - No files will be modified")
 
+            # Load the change set once for all projects
+            self._prepare_change_filter()
+
             success = self._process_projects(projects)
 
-            # Generate report if requested
-            if self.args.report:
-                self._generate_report()
+            # Remember converted files for the next incremental run
+            self._update_manifest()
 
-            # Print summary
-            self._print_summary()
+            with phase("report"):
+                # Generate report if requested
+                if self.args.report:
+                    self._generate_report()
+
+                # Print summary
+                self._print_summary()
 
             return 0 if success else 1
 
@@ -274,81 +339,47 @@ class BatchCommand:
         ]
 
         patterns = self.args.patterns or default_patterns
-
-        # Walk through directory tree
-        for current_dir in self._walk_directories(root_dir, self.args.max_depth):
-            if self._should_exclude_directory(current_dir, exclude_patterns):
-                continue
-
-            # Check if directory contains Ansible project indicators
-            if self._is_ansible_project(current_dir, patterns):
-                projects.append(current_dir)
-                self.logger.debug(f"Discovered Ansible project: {current_dir}")
+        rules = IgnoreRules.compile(
+            tuple(exclude_patterns), BATCH_SKIP_DIRS, substring_words=True
+        )
+
+        # Walk the tree once, listing directories concurrently; excluded
+        # directories are pruned before descending
+        for entry in parallel_walk(
+            root_dir,
+            rules,
+            max_depth=self.args.max_depth,
+            skip_hidden=True,
+            max_workers=max(self.args.workers, DEFAULT_WALK_WORKERS),
+        ):
+            # Check the listing for Ansible project indicators
+            if has_project_marker(entry, patterns):
+                projects.append(entry.path)
+                self.logger.debug(f"Discovered Ansible project: {entry.path}")
 
         return sorted(projects)
 
     def _walk_directories(self, root_dir: Path, max_depth: int) -> List[Path]:
         """Walk directory tree up to max_depth."""
-        directories = [root_dir]
-
-        def _walk_recursive(directory: Path, current_depth: int) -> None:
-            if current_depth >= max_depth:
-                return
-
-            try:
-                for item in directory.iterdir():
-                    if item.is_dir() and not item.name.startswith("."):
-                        directories.append(item)
-                        _walk_recursive(item, current_depth + 1)
-            except (PermissionError, OSError) as e:
-                self.logger.debug(f"Cannot access directory {directory}: {e}")
-
-        _walk_recursive(root_dir, 0)
-        return directories
+        rules = IgnoreRules.compile(skip_dirs=frozenset())
+        return [
+            entry.path
+            for entry in walk(root_dir, rules, max_depth=max_depth, skip_hidden=True)
+        ]
 
     def _should_exclude_directory(
         self, directory: Path, exclude_patterns: List[str]
     ) -> bool:
         """Check if directory should be excluded."""
-        dir_str = str(directory)
-
-        for pattern in exclude_patterns:
-            if pattern in dir_str:
-                return True
-
-        # Skip common non-Ansible directories
-        skip_dirs = {
-            ".git",
-            ".github",
-            "__pycache__",
-            ".pytest_cache",
-            "node_modules",
-            ".venv",
-            "venv",
-            ".tox",
-            "build",
-            "dist",
-            ".vagrant",
-            ".molecule",
-        }
-
-        return directory.name in skip_dirs
+        rules = IgnoreRules.compile(
+            tuple(exclude_patterns), BATCH_SKIP_DIRS, substring_words=True
+        )
+        return rules.is_excluded(directory, is_dir=True)
 
     def _is_ansible_project(self, directory: Path, patterns: List[str]) -> bool:
         """Check if directory contains Ansible project indicators."""
-        for pattern in patterns:
-            if pattern.endswith("/"):
-                # Directory pattern
-                subdir = directory / pattern.rstrip("/")
-                if subdir.exists() and subdir.is_dir():
-                    return True
-            else:
-                # File pattern
-                matches = list(directory.glob(pattern))
-                if matches:
-                    return True
-
-        return False
+        listing = next(walk(directory, max_depth=0), None)
+        return listing is not None and has_project_marker(listing, patterns)
 
     def _list_projects(self, projects: List[Path]) -> None:
         """List discovered projects."""
@@ -360,7 +391,9 @@ class BatchCommand:
 
     def _process_projects(self, projects: List[Path]) -> bool:
         """Process all projects."""
-        if self.args.workers > 1 and len(projects) > 1:
+        if getattr(self.args, "executor", "thread") == "process":
+            return self._process_projects_in_pool(projects)
+        elif self.args.workers > 1:
             return self._process_projects_parallel(projects)
         else:
             return self._process_projects_sequential(projects)
@@ -390,38 +423,88 @@ class BatchCommand:
         return success
 
     def _process_projects_parallel(self, projects: List[Path]) -> bool:
-        """Process projects in parallel."""
+        """Process projects by converting their files on a thread pool."""
+        return self._process_project_files(
+            projects,
+            lambda files: iter_thread_records(
+                self.converter,
+                files,
+                dry_run=self.args.dry_run,
+                max_workers=self.args.workers,
+            ),
+        )
+
+    def _process_projects_in_pool(self, projects: List[Path]) -> bool:
+        """Process projects by converting their files in a process pool."""
+        return self._process_project_files(
+            projects,
+            lambda files: iter_file_records(
+                files,
+                dry_run=self.args.dry_run,
+                max_workers=self.args.workers,
+                config_path=self.args.config,
+            ),
+        )
+
+    def _process_project_files(
+        self,
+        projects: List[Path],
+        convert_files: Callable[[List[str]], Iterator[FileRecord]],
+    ) -> bool:
+        """
+        Convert the files of all projects as one queue and roll up results.
+
+        Args:
+            projects: Projects to process
+            convert_files: Converts files given largest-first and yields
+                          their records as they complete
+
+        Returns:
+            True if every project succeeded
+        """
         success = True
+        completed = 0
+        project_files: Dict[Path, List[Path]] = {}
 
-        with ThreadPoolExecutor(max_workers=self.args.workers) as executor:
-            # Submit all processing tasks
-            future_to_project = {
-                executor.submit(self._process_single_project, project): project
-                for project in projects
-            }
+        for project in projects:
+            try:
+                project_files[project] = self._find_ansible_files_in_project(project)
+            except Exception as e:
+                self.logger.error(f"Exception processing {project}: {e}")
+                completed += 1
+                result = ProjectResult(project_path=str(project), success=False)
+                result.errors.append(f"Unexpected error: {e}")
+                self._record_project_result(result, completed, len(projects))
+                success = False
 
-            # Collect results as they complete
-            completed = 0
-            for future in as_completed(future_to_project):
-                project = future_to_project[future]
+        # Projects without Ansible files complete immediately
+        for project, files in project_files.items():
+            if not files:
                 completed += 1
+                result = self._project_result_from_records(project, [], [])
+                self._record_project_result(result, completed, len(projects))
 
-                print(
-                    f"Completed project {completed}/{len(projects)}: {project}",
-                    file=sys.stderr,
+        # One largest-first queue across projects keeps every worker busy;
+        # files of nested projects are converted once and count for each
+        work = ProjectFiles(project_files)
+        file_records = convert_files(largest_first(work.files))
+        try:
+            for project, records in work.collect(file_records):
+                completed += 1
+                result = self._project_result_from_records(
+                    project, project_files[project], records
                 )
+                self._record_project_result(result, completed, len(projects))
 
-                try:
-                    result = future.result()
-                    self.results.append(result)
-                    self._update_stats(result)
-
-                    if not result.success:
-                        success = False
-
-                except Exception as e:
-                    self.logger.error(f"Exception processing {project}: {e}")
+                if not result.success:
                     success = False
+                    if not self.args.continue_on_error:
+                        self.logger.error(
+                            f"Stopping batch processing due to error in {project}"
+                        )
+                        break
+        finally:
+            file_records.close()
 
         # Sort results by project path for consistent output
         self.results.sort(key=lambda r: r.project_path)
@@ -429,6 +512,60 @@ class BatchCommand:
         self.stats["end_time"] = datetime.now()
         return success
 
+    def _project_result_from_records(
+        self,
+        project_path: Path,
+        ansible_files: List[Path],
+        records: List[FileRecord],
+    ) -> ProjectResult:
+        """Build a project result from worker file records."""
+        result = ProjectResult(project_path=str(project_path), success=False)
+
+        if not ansible_files:
+            self.logger.warning(f"No Ansible files found in project: {project_path}")
+            result.success = True  # Empty project is considered successful
+            return result
+
+        for record in records:
+            if record.exception is not None:
+                error_msg = f"Error converting {record.file_path}: {record.exception}"
+                result.errors.append(error_msg)
+                self.logger.error(error_msg)
+            elif record.success:
+                if record.changes_made > 0:
+                    result.files_converted += 1
+                    result.modules_converted += record.changes_made
+            else:
+                result.errors.extend(record.errors)
+                result.warnings.extend(record.warnings)
+
+        result.files_processed = len(ansible_files)
+        result.duration = sum(record.processing_time for record in records)
+
+        # Validate if requested
+        if self.args.validate and self.validator:
+            try:
+                result.validation_result = self._validate_project(
+                    project_path, ansible_files
+                )
+            except Exception as e:
+                result.warnings.append(f"Validation failed: {e}")
+
+        # Consider successful if no errors occurred
+        result.success = len(result.errors) == 0
+        return result
+
+    def _record_project_result(
+        self, result: ProjectResult, completed: int, total: int
+    ) -> None:
+        """Store a finished project result and report progress."""
+        print(
+            f"Completed project {completed}/{total}: {result.project_path}",
+            file=sys.stderr,
+        )
+        self.results.append(result)
+        self._update_stats(result)
+
     def _process_single_project(self, project_path: Path) -> ProjectResult:
         """Process a single project."""
         start_time = time.time()
@@ -450,13 +587,28 @@ class BatchCommand:
             # Convert files
             files_converted = 0
             modules_converted = 0
+            validate = self.args.validate and self.validator
+            documents: Dict[Path, ParsedDocument] = {}
 
             for file_path in ansible_files:
+                # Only the content handed to the validator is kept
+                hand_off = validate and file_path == ansible_files[0]
                 try:
                     conversion_result = self.converter.convert_file(
-                        file_path, dry_run=self.args.dry_run
+                        file_path,
+                        dry_run=self.args.dry_run,
+                        retain_content="full" if hand_off else "none",
                     )
 
+                    if hand_off:
+                        # Hand the final content to the validator so it is not
+                        # read back from disk
+                        final_content = self._final_content(conversion_result)
+                        if final_content is not None:
+                            documents[file_path] = ParsedDocument(
+                                final_content, file_path
+                            )
+
                     if conversion_result.success:
                         if conversion_result.changes_made > 0:
                             files_converted += 1
@@ -475,10 +627,10 @@ class BatchCommand:
             result.modules_converted = modules_converted
 
             # Validate if requested
-            if self.args.validate and self.validator:
+            if validate:
                 try:
                     validation_result = self._validate_project(
-                        project_path, ansible_files
+                        project_path, ansible_files, documents=documents
                     )
                     result.validation_result = validation_result
                 except Exception as e:
@@ -501,19 +653,82 @@ class BatchCommand:
 
         return result
 
+    def _final_content(self, conversion_result: ConversionResult) -> Optional[str]:
+        """Return the content a file holds after conversion, if known."""
+        if not conversion_result.success:
+            return None
+
+        if not self.args.dry_run and conversion_result.changes_made > 0:
+            content = conversion_result.converted_content
+        else:
+            content = conversion_result.original_content
+
+        return content if isinstance(content, str) else None
+
     def _find_ansible_files_in_project(self, project_path: Path) -> List[Path]:
         """Find Ansible files in a project directory."""
-        ansible_files = []
+        ansible_files = [
+            file_path
+            for file_path in iter_files(project_path)
+            if self._is_ansible_file(file_path)
+        ]
+
+        ansible_files = self._select_changed_files(sorted(ansible_files))
+        self._project_files[str(project_path)] = ansible_files
+        return ansible_files
 
-        # Common Ansible file patterns
-        patterns = ["**/*.yml", "**/*.yaml"]
+    def _prepare_change_filter(self) -> None:
+        """Load the git change set and manifest for --since and --incremental."""
+        since = getattr(self.args, "since", None)
+        manifest_path = getattr(self.args, "incremental", None)
 
-        for pattern in patterns:
-            for file_path in project_path.glob(pattern):
-                if file_path.is_file() and self._is_ansible_file(file_path):
-                    ansible_files.append(file_path)
+        # Only string values come from the command line
+        since = since if isinstance(since, str) else None
+        manifest_path = manifest_path if isinstance(manifest_path, str) else None
 
-        return sorted(ansible_files)
+        if since is not None:
+            self._changed_files = {
+                path for path in git_changed_files(since, cwd=self._git_cwd())
+            }
+            self.logger.info(
+                f"{len(self._changed_files)} YAML files changed since {since}"
+            )
+
+        if manifest_path:
+            self.manifest = FileManifest(
+                manifest_path,
+                scope="convert",
+                fingerprint=settings_fingerprint(self.args.config),
+            )
+
+    def _git_cwd(self) -> Optional[str]:
+        """Return a directory inside the repository holding the projects."""
+        if self.args.root_directory:
+            return str(self.args.root_directory)
+        directory = common_directory(self.args.projects or [])
+        return str(directory) if directory else None
+
+    def _select_changed_files(self, files: List[Path]) -> List[Path]:
+        """Narrow project files down to those changed per --since or --incremental."""
+        if self._changed_files is not None:
+            files = [path for path in files if path.resolve() in self._changed_files]
+        if self.manifest is not None:
+            files = self.manifest.changed(files)
+        return files
+
+    def _update_manifest(self) -> None:
+        """Record the files of successful projects in the incremental manifest."""
+        if self.manifest is None or self.args.dry_run:
+            return
+
+        for result in self.results:
+            for file_path in self._project_files.get(result.project_path, []):
+                if result.success:
+                    self.manifest.record(file_path)
+                else:
+                    self.manifest.forget(file_path)
+
+        self.manifest.save()
 
     def _is_ansible_file(self, file_path: Path) -> bool:
         """Check if a file appears to be an Ansible file."""
@@ -578,11 +793,19 @@ class BatchCommand:
         return False
 
     def _validate_project(
-        self, project_path: Path, ansible_files: List[Path]
+        self,
+        project_path: Path,
+        ansible_files: List[Path],
+        documents: Optional[Dict[Path, ParsedDocument]] = None,
     ) -> ValidationResult:
         """Validate all files in a project."""
         # For simplicity, validate the first file or create a summary
         if ansible_files:
+            document = (documents or {}).get(ansible_files[0])
+            if document is not None:
+                return self.validator.validate_conversion(
+                    ansible_files[0], document=document
+                )
             return self.validator.validate_conversion(ansible_files[0])
 
         # Return empty validation result for projects with no files
@@ -0,0 +1,98 @@
+"""
+Cache command implementation for CLI.
+
+This module handles the cache subcommand, which reports statistics about
+the on-disk result cache used by ``--cache-dir`` and clears it.
+"""
+
+import argparse
+import json
+import logging
+
+from ..core.cache import DEFAULT_MAX_CACHE_SIZE, ResultCache, default_cache_dir
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add cache command arguments to parser."""
+    parser.add_argument(
+        "action",
+        choices=["stats", "clear"],
+        help="Show cache statistics or remove all cached results",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help=f"Cache directory (default: {default_cache_dir()})",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format for cache statistics (default: text)",
+    )
+
+
+class CacheCommand:
+    """Handler for the cache command."""
+
+    def __init__(self, args: argparse.Namespace):
+        """Initialize cache command handler."""
+        self.args = args
+        self.logger = logging.getLogger(__name__)
+        self.cache = ResultCache(
+            getattr(args, "cache_dir", None), max_size_bytes=DEFAULT_MAX_CACHE_SIZE
+        )
+
+    def run(self) -> int:
+        """Execute the cache command."""
+        try:
+            if self.args.action == "clear":
+                removed = self.cache.clear()
+                print(f"Removed {removed} cached results from {self.cache.cache_dir}")
+                return 0
+
+            self._print_stats()
+            return 0
+
+        except Exception as e:
+            self.logger.error(f"Cache operation failed: {e}")
+            return 1
+
+    def _print_stats(self) -> None:
+        """Print cache statistics."""
+        stats = self.cache.stats()
+
+        if getattr(self.args, "format", "text") == "json":
+            print(
+                json.dumps(
+                    {
+                        "cache_dir": stats.cache_dir,
+                        "entries": stats.entries,
+                        "total_entries": stats.total_entries,
+                        "size_bytes": stats.size_bytes,
+                        "max_size_bytes": stats.max_size_bytes,
+                    },
+                    indent=2,
+                )
+            )
+            return
+
+        print("=" * 60)
+        print("RESULT CACHE")
+        print("=" * 60)
+        print(f"Cache directory: {stats.cache_dir}")
+        for kind, count in stats.entries.items():
+            print(f"Cached {kind} results: {count}")
+        print(f"Total entries: {stats.total_entries}")
+        print(
+            f"Size: {stats.size_bytes / 1024 / 1024:.2f} MB "
+            f"of {stats.max_size_bytes / 1024 / 1024:.0f} MB"
+        )
+        print("=" * 60)
+
+
+def main(args: argparse.Namespace) -> int:
+    """Handle cache subcommand."""
+    command = CacheCommand(args)
+    return command.run()
@@ -8,19 +8,40 @@ verbosity, and custom configuration.
 import argparse
 import json
 import logging
-import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from ..core.converter import ConversionResult, FQCNConverter
+from typing import Any, Dict, List, Optional, Union
+
+from ..config.manager import ConfigurationManager
+from ..core.backups import DEFAULT_BACKUP_DIR, BackupRun, BackupStore
+from ..core.cache import ResultCache
+from ..core.changes import (
+    DEFAULT_MANIFEST,
+    FileManifest,
+    common_directory,
+    select_changed_files,
+    settings_fingerprint,
+)
+from ..core.converter import ConversionResult, FQCNConverter, ResultRecord
+from ..core.discovery import IgnoreRules, iter_files
+from ..core.reader import LARGE_FILE_POLICIES, parse_size
+from ..core.writer import FSYNC_POLICIES, FileWriter
 from ..exceptions import (
     ConfigurationError,
     ConversionError,
     FileAccessError,
     FQCNConverterError,
 )
+from ..utils.profiling import phase
+
+
+def _file_size(text: str) -> int:
+    """Parse a --max-file-size value for argparse."""
+    try:
+        return parse_size(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
 
 
 def add_convert_arguments(parser: argparse.ArgumentParser) -> None:
@@ -47,7 +68,19 @@ def add_convert_arguments(parser: argparse.ArgumentParser) -> None:
         "--backup",
         "-b",
         action="store_true",
-        help="Create backup files before conversion",
+        help=(
+            "Back up changed files into the backup store before replacing them; "
+            "undo a run with 'fqcn-converter rollback'"
+        ),
+    )
+
+    parser.add_argument(
+        "--backup-dir",
+        metavar="DIR",
+        help=(
+            "Backup store directory (default: backup_directory of --config, "
+            f"else {DEFAULT_BACKUP_DIR})"
+        ),
     )
 
     parser.add_argument(
@@ -56,6 +89,17 @@ def add_convert_arguments(parser: argparse.ArgumentParser) -> None:
         help="Skip creating backup files (overrides default backup behavior)",
     )
 
+    parser.add_argument(
+        "--fsync",
+        choices=FSYNC_POLICIES,
+        default="none",
+        help=(
+            "When converted files are flushed to disk: after each file, once "
+            "after all files, or left to the OS (default: none). Files are "
+            "always replaced atomically"
+        ),
+    )
+
     # Progress and reporting
     parser.add_argument(
         "--progress", action="store_true", help="Show progress bar for large operations"
@@ -91,6 +135,52 @@ def add_convert_arguments(parser: argparse.ArgumentParser) -> None:
         help="Exclude files/directories matching pattern (can be used multiple times)",
     )
 
+    # Caching options
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse conversion results for unchanged files from this cache directory",
+    )
+
+    # Large file options
+    parser.add_argument(
+        "--max-file-size",
+        type=_file_size,
+        metavar="SIZE",
+        help=(
+            "Apply --large-files to files larger than SIZE, e.g. 512K, 50M or 1G "
+            "(default: no limit)"
+        ),
+    )
+
+    parser.add_argument(
+        "--large-files",
+        choices=LARGE_FILE_POLICIES,
+        default="skip",
+        help=(
+            "Files over --max-file-size: skip them unread, stream to convert only "
+            "those whose raw bytes contain module keys, or process them normally "
+            "(default: skip)"
+        ),
+    )
+
+    # Incremental options
+    parser.add_argument(
+        "--since",
+        metavar="REF",
+        help="Only convert files changed since a git ref (e.g. origin/main)",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        nargs="?",
+        const=DEFAULT_MANIFEST,
+        metavar="MANIFEST",
+        help=(
+            "Only convert files changed since the last run, tracked in a manifest "
+            f"(default: {DEFAULT_MANIFEST})"
+        ),
+    )
+
 
 class ConvertCommand:
     """Handler for the convert command."""
@@ -100,7 +190,9 @@ class ConvertCommand:
         self.args = args
         self.logger = logging.getLogger(__name__)
         self.converter: Optional[FQCNConverter] = None
-        self.results: List[ConversionResult] = []
+        self.results: List[Union[ConversionResult, ResultRecord]] = []
+        self.manifest: Optional[FileManifest] = None
+        self.backup_run: Optional[BackupRun] = None
         self.stats = {
             "files_processed": 0,
             "files_converted": 0,
@@ -117,12 +209,20 @@ class ConvertCommand:
             self._initialize_converter()
 
             # Discover files to convert
-            files_to_convert = self._discover_files()
+            with phase("discover"):
+                files_to_convert = self._discover_files()
 
             if not files_to_convert:
                 self.logger.warning("No Ansible files found to convert")
                 return 0
 
+            # Skip files unchanged since the given ref or the last run
+            files_to_convert = self._select_changed_files(files_to_convert)
+
+            if not files_to_convert:
+                self.logger.info("No changed files to convert")
+                return 0
+
             self.logger.info(f"Found {len(files_to_convert)} files to convert")
 
             if self.args.dry_run:
@@ -130,13 +230,21 @@ class ConvertCommand:
 
             # Convert files
             success = self._convert_files(files_to_convert)
+            if not self.args.dry_run:
+                success = self._flush_writes() and success
+            if self.backup_run is not None:
+                self.backup_run.close()
+
+            # Remember converted files for the next incremental run
+            self._update_manifest()
 
-            # Generate report if requested
-            if self.args.report:
-                self._generate_report()
+            with phase("report"):
+                # Generate report if requested
+                if self.args.report:
+                    self._generate_report()
 
-            # Print summary
-            self._print_summary()
+                # Print summary
+                self._print_summary()
 
             return 0 if success else 1
 
@@ -157,11 +265,44 @@ class ConvertCommand:
     def _initialize_converter(self) -> None:
         """Initialize the FQCN converter."""
         try:
-            self.converter = FQCNConverter(config_path=self.args.config)
+            options: Dict[str, Any] = {"config_path": self.args.config}
+            cache_dir = getattr(self.args, "cache_dir", None)
+            if cache_dir:
+                options["cache"] = ResultCache(cache_dir)
+            max_file_size = getattr(self.args, "max_file_size", None)
+            if isinstance(max_file_size, int):
+                options["max_file_size"] = max_file_size
+                options["large_files"] = getattr(self.args, "large_files", "skip")
+            if getattr(self.args, "dry_run", None) is False:
+                if (
+                    getattr(self.args, "backup", False) is True
+                    and getattr(self.args, "no_backup", False) is not True
+                ):
+                    self.backup_run = BackupStore(self._backup_dir()).begin_run(
+                        "convert"
+                    )
+                    options["backups"] = self.backup_run
+                # Write behind the conversion; failures are collected in run()
+                fsync = getattr(self.args, "fsync", None)
+                options["writer"] = FileWriter(
+                    fsync=fsync if isinstance(fsync, str) else "none",
+                    write_behind=True,
+                )
+            self.converter = FQCNConverter(**options)
             self.logger.debug("Converter initialized successfully")
         except ConfigurationError as e:
             raise ConfigurationError(f"Failed to initialize converter: {e}")
 
+    def _backup_dir(self) -> str:
+        """Return --backup-dir, else the backup_directory of --config."""
+        backup_dir = getattr(self.args, "backup_dir", None)
+        if isinstance(backup_dir, str):
+            return backup_dir
+        if isinstance(self.args.config, str):
+            settings = ConfigurationManager().load_settings(self.args.config)
+            return settings.backup_directory
+        return DEFAULT_BACKUP_DIR
+
     def _discover_files(self) -> List[Path]:
         """Discover Ansible files to convert."""
         files_to_convert = []
@@ -182,57 +323,65 @@ class ConvertCommand:
 
         return sorted(files_to_convert)
 
+    def _select_changed_files(self, files: List[Path]) -> List[Path]:
+        """Narrow files down to those changed per --since or --incremental."""
+        since = getattr(self.args, "since", None)
+        manifest_path = getattr(self.args, "incremental", None)
+
+        # Only string values come from the command line
+        since = since if isinstance(since, str) else None
+        manifest_path = manifest_path if isinstance(manifest_path, str) else None
+
+        if manifest_path:
+            self.manifest = FileManifest(
+                manifest_path,
+                scope="convert",
+                fingerprint=settings_fingerprint(self.args.config),
+            )
+
+        if since is None and self.manifest is None:
+            return files
+
+        return select_changed_files(
+            files,
+            since=since,
+            manifest=self.manifest,
+            cwd=common_directory(self.args.files),
+        )
+
+    def _update_manifest(self) -> None:
+        """Record successfully converted files in the incremental manifest."""
+        if self.manifest is None or self.args.dry_run:
+            return
+
+        for result in self.results:
+            if result.success:
+                self.manifest.record(result.file_path)
+            else:
+                self.manifest.forget(result.file_path)
+
+        self.manifest.save()
+
     def _find_ansible_files(
         self, directory: Path, exclude_patterns: List[str]
     ) -> List[Path]:
         """Find Ansible files in a directory."""
-        ansible_files = []
-
-        # Common Ansible file patterns
-        patterns = ["**/*.yml", "**/*.yaml"]
-
-        for pattern in patterns:
-            for file_path in directory.glob(pattern):
-                if file_path.is_file() and self._should_process_file(
-                    file_path, exclude_patterns
-                ):
-                    # Additional checks for Ansible files
-                    if self._is_ansible_file(file_path):
-                        ansible_files.append(file_path)
-
-        return ansible_files
+        rules = IgnoreRules.compile(tuple(exclude_patterns), substring_words=True)
+        return [
+            file_path
+            for file_path in iter_files(directory, rules)
+            if self._is_ansible_file(file_path)
+        ]
 
     def _should_process_file(
         self, file_path: Path, exclude_patterns: List[str]
     ) -> bool:
         """Check if a file should be processed."""
-        file_str = str(file_path)
-
-        # Check exclude patterns
-        for pattern in exclude_patterns:
-            if pattern in file_str:
-                self.logger.debug(
-                    f"Excluding file due to pattern '{pattern}': {file_path}"
-                )
-                return False
-
-        # Skip common non-Ansible directories
-        skip_dirs = {
-            ".git",
-            ".github",
-            "__pycache__",
-            ".pytest_cache",
-            "node_modules",
-            ".venv",
-            "venv",
-            ".tox",
-            "build",
-            "dist",
-        }
-
-        for part in file_path.parts:
-            if part in skip_dirs:
-                return False
+        if IgnoreRules.compile(
+            tuple(exclude_patterns), substring_words=True
+        ).is_excluded(file_path):
+            self.logger.debug(f"Excluding file: {file_path}")
+            return False
 
         return True
 
@@ -298,18 +447,13 @@ class ConvertCommand:
                 print(f"Processing {i}/{len(files)}: {file_path}", file=sys.stderr)
 
             try:
-                # Create backup if requested and not dry run
-                if (
-                    self.args.backup
-                    and not self.args.dry_run
-                    and not self.args.no_backup
-                ):
-                    self._create_backup(file_path)
-
-                # Convert the file
+                # Convert the file, backing it up first if it changes
                 result = self.converter.convert_file(
                     file_path, dry_run=self.args.dry_run
                 )
+                # Reports only need the counts, not every file body
+                if isinstance(result, ConversionResult):
+                    result = result.compact()
                 self.results.append(result)
 
                 # Update statistics
@@ -349,15 +493,25 @@ class ConvertCommand:
         self.stats["end_time"] = datetime.now()
         return success
 
-    def _create_backup(self, file_path: Path) -> None:
-        """Create a backup of the file."""
-        backup_path = file_path.with_suffix(file_path.suffix + ".fqcn_backup")
-
-        try:
-            shutil.copy2(file_path, backup_path)
-            self.logger.debug(f"Created backup: {backup_path}")
-        except Exception as e:
-            self.logger.warning(f"Failed to create backup for {file_path}: {e}")
+    def _flush_writes(self) -> bool:
+        """Wait for queued file writes and mark files whose write failed."""
+        failures = {failure.path: failure.error for failure in self.converter.flush()}
+        if not failures:
+            return True
+
+        for result in self.results:
+            error = failures.get(str(result.file_path))
+            if error is None or not result.success:
+                continue
+            message = f"Cannot write file: {error}"
+            self.logger.error(f"Failed to convert {result.file_path}: {message}")
+            result.success = False
+            result.errors = tuple(result.errors) + (message,)
+            self.stats["files_failed"] += 1
+            if result.changes_made > 0:
+                self.stats["files_converted"] -= 1
+                self.stats["total_changes"] -= result.changes_made
+        return False
 
     def _generate_report(self) -> None:
         """Generate detailed conversion report."""
@@ -426,6 +580,11 @@ class ConvertCommand:
 
         if self.args.dry_run:
             print("\nDRY RUN - No files were modified")
+        elif self.backup_run is not None and self.backup_run.files:
+            print(
+                f"\nBacked up {self.backup_run.files} files as run {self.backup_run.run_id}"
+            )
+            print(f"Undo with: fqcn-converter rollback {self.backup_run.run_id}")
 
         print("=" * 60)
 
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Optional
 
 from ..core.converter import FQCNConverter
+from ..core.discovery import iter_files
 from ..utils.logging import setup_logging, get_logger
 from ..reporting.report_generator import ReportGenerator
 from ..reporting.models import ReportFormat
@@ -100,7 +101,7 @@ def convert_with_report(ctx, target: Path, report_format: str, output: Optional[
         if target.is_file():
             files_to_process = [target]
         else:
-            files_to_process = list(target.rglob("*.yml")) + list(target.rglob("*.yaml"))
+            files_to_process = list(iter_files(target))
         
         for file_path in files_to_process:
             import time
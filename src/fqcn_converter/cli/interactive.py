@@ -12,6 +12,7 @@ import click
 from colorama import Fore, Style, init
 
 from ..core.converter import FQCNConverter
+from ..core.discovery import iter_files
 from ..core.validator import FQCNValidator
 from ..utils.logging import get_logger
 
@@ -98,7 +99,7 @@ class InteractiveMode:
         
         if target_path.is_dir():
             # Count potential files
-            yaml_files = list(target_path.rglob("*.yml")) + list(target_path.rglob("*.yaml"))
+            yaml_files = list(iter_files(target_path))
             click.echo(f"Found {Fore.YELLOW}{len(yaml_files)}{Style.RESET_ALL} YAML files to process")
         
         return click.confirm(f"\nProceed with interactive conversion?", default=True)
@@ -162,7 +163,7 @@ class InteractiveMode:
         """
         try:
             # Find all YAML files
-            yaml_files = list(dir_path.rglob("*.yml")) + list(dir_path.rglob("*.yaml"))
+            yaml_files = list(iter_files(dir_path))
             
             if not yaml_files:
                 self._print_warning("No YAML files found in directory.")
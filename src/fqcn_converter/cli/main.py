@@ -2,15 +2,80 @@
 Main CLI entry point for FQCN Converter.
 
 This module provides the main command-line interface with subcommands
-for convert, validate, and batch operations.
+for convert, validate, batch, cache and rollback operations.
 """
 
 import argparse
+import importlib
 import logging
 import sys
-from typing import List, Optional, Tuple
+from types import ModuleType
+from typing import Any, Callable, List, Optional, Tuple
 
-from . import batch, convert, validate
+# Subcommand modules import the engines, worker pools and reporting code.
+# They are loaded only once their subcommand is parsed or run, so that
+# --version, --help and argument errors stay fast.
+COMMANDS = ("convert", "validate", "batch", "cache", "rollback")
+
+# Profilers of --profile. Mirrors utils.profiling.PROFILERS, which is only
+# imported when profiling, like the subcommand modules.
+PROFILERS = ("cprofile", "tracemalloc", "timeline")
+
+
+def load_command(command: str) -> ModuleType:
+    """Import and return the module implementing a subcommand."""
+    return importlib.import_module(f".{command}", __package__)
+
+
+def __getattr__(name: str) -> Any:
+    """Expose subcommand modules as attributes, importing them on access."""
+    if name in COMMANDS:
+        return load_command(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class DeferredArgumentParser(argparse.ArgumentParser):
+    """
+    Subcommand parser that adds its arguments when first used.
+
+    The arguments are added right before the parser parses or formats help,
+    so building the main parser does not import every subcommand module.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        add_arguments: Optional[Callable[[argparse.ArgumentParser], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._add_arguments = add_arguments
+
+    def _ensure_arguments(self) -> None:
+        if self._add_arguments is not None:
+            add_arguments, self._add_arguments = self._add_arguments, None
+            add_arguments(self)
+
+    def parse_known_args(self, args=None, namespace=None):  # type: ignore[override]
+        self._ensure_arguments()
+        return super().parse_known_args(args, namespace)
+
+    def format_usage(self) -> str:
+        self._ensure_arguments()
+        return super().format_usage()
+
+    def format_help(self) -> str:
+        self._ensure_arguments()
+        return super().format_help()
+
+
+def _deferred_arguments(command: str) -> Callable[[argparse.ArgumentParser], None]:
+    """Return a callback adding the arguments of a subcommand."""
+
+    def add_arguments(parser: argparse.ArgumentParser) -> None:
+        getattr(load_command(command), f"add_{command}_arguments")(parser)
+
+    return add_arguments
 
 
 def setup_logging(verbosity: str) -> None:
@@ -20,12 +85,20 @@ def setup_logging(verbosity: str) -> None:
     level = levels.get(verbosity, logging.INFO)
 
     # Configure root logger
+    handler = logging.StreamHandler(sys.stdout)
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
+        handlers=[handler],
     )
 
+    # Verbose runs log for every file; write those records on a background
+    # thread, unless logging was already configured by the caller
+    if level == logging.DEBUG and logging.root.handlers == [handler]:
+        from ..utils.logging import enable_async_logging
+
+        enable_async_logging()
+
     # Suppress verbose output from third-party libraries unless in debug mode
     if level != logging.DEBUG:
         logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -60,6 +133,10 @@ Examples:
   fqcn-converter convert --verbose --dry-run playbook.yml
   fqcn-converter convert --dry-run playbook.yml --verbose
 
+  # Profile a slow run and see where the time went
+  fqcn-converter --profile timeline batch /path/to/projects
+  python -m pstats fqcn-profile.pstats  # after --profile cprofile
+
 For more help on specific commands, use:
   fqcn-converter <command> --help
         """,
@@ -97,12 +174,31 @@ For more help on specific commands, use:
     # Set default verbosity
     parser.set_defaults(verbosity="normal")
 
+    # Profiling
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=PROFILERS,
+        metavar="MODE",
+        help="Profile the command: cprofile (default) writes a .pstats file, "
+        "tracemalloc the top allocation sites, timeline the time spent per "
+        "phase (discover, read, parse, convert, validate, write, report)",
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="PATH",
+        help="File written by --profile (default: fqcn-profile.pstats, "
+        ".txt or .json)",
+    )
+
     # Create subparsers for commands
     subparsers = parser.add_subparsers(
         title="Commands",
         description="Available commands for FQCN conversion",
         dest="command",
         help='Use "fqcn-converter <command> --help" for command-specific help',
+        parser_class=DeferredArgumentParser,
     )
 
     # Convert command
@@ -125,8 +221,8 @@ Examples:
   # Convert and create backup
   fqcn-converter convert --backup playbook.yml
         """,
+        add_arguments=_deferred_arguments("convert"),
     )
-    convert.add_convert_arguments(convert_parser)
 
     # Validate command
     validate_parser = subparsers.add_parser(
@@ -145,8 +241,8 @@ Examples:
   # Generate validation report
   fqcn-converter validate --report validation_report.json roles/
         """,
+        add_arguments=_deferred_arguments("validate"),
     )
-    validate.add_validate_arguments(validate_parser)
 
     # Batch command
     batch_parser = subparsers.add_parser(
@@ -161,12 +257,55 @@ Examples:
   
   # Batch convert with 8 workers
   fqcn-converter batch --workers 8 /path/to/projects
-  
+
+  # Batch convert across all cores with worker processes
+  fqcn-converter batch --executor process --workers 8 /path/to/projects
+
   # Generate batch report
   fqcn-converter batch --report batch_report.json /path/to/projects
         """,
+        add_arguments=_deferred_arguments("batch"),
+    )
+
+    # Cache command
+    cache_parser = subparsers.add_parser(
+        "cache",
+        help="Inspect or clear the result cache",
+        description="Show statistics of the on-disk result cache or clear it",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Reuse results for unchanged files between CI runs
+  fqcn-converter validate --cache-dir .fqcn_cache roles/
+
+  # Show cache statistics
+  fqcn-converter cache stats --cache-dir .fqcn_cache
+
+  # Remove all cached results
+  fqcn-converter cache clear --cache-dir .fqcn_cache
+        """,
+        add_arguments=_deferred_arguments("cache"),
+    )
+
+    # Rollback command
+    rollback_parser = subparsers.add_parser(
+        "rollback",
+        help="Restore files from the backup store",
+        description="List backup runs recorded by convert --backup or restore the files of a run",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Back up changed files while converting
+  fqcn-converter convert --backup roles/
+
+  # List recorded runs
+  fqcn-converter rollback --list
+
+  # Restore every file changed by the last run
+  fqcn-converter rollback latest
+        """,
+        add_arguments=_deferred_arguments("rollback"),
     )
-    batch.add_batch_arguments(batch_parser)
 
     return parser
 
@@ -175,8 +314,10 @@ def preprocess_args(args: List[str]) -> Tuple[List[str], str]:
     """
     Preprocess command line arguments to extract global flags and reorder them.
 
-    This allows global flags like --verbose, --quiet, --debug to be placed anywhere
-    in the command line, including after the subcommand.
+    This allows global flags like --verbose, --quiet, --debug and --profile to
+    be placed anywhere in the command line, including after the subcommand.
+    ``--profile`` is rewritten as ``--profile=MODE`` so that it never takes
+    the subcommand or a path as its mode.
 
     Args:
         args: Raw command line arguments
@@ -205,6 +346,17 @@ def preprocess_args(args: List[str]) -> Tuple[List[str], str]:
             global_args.append(arg)
         elif arg == "--version":
             global_args.append(arg)
+        elif arg == "--profile":
+            if i + 1 < len(args) and args[i + 1] in PROFILERS:
+                i += 1
+                global_args.append(f"--profile={args[i]}")
+            else:
+                global_args.append("--profile=cprofile")
+        elif arg == "--profile-output" and i + 1 < len(args):
+            global_args.extend(args[i : i + 2])
+            i += 1
+        elif arg.startswith(("--profile=", "--profile-output=")):
+            global_args.append(arg)
         else:
             reordered_args.append(arg)
 
@@ -248,12 +400,23 @@ def main() -> Optional[int]:
 
     try:
         # Route to appropriate command handler
-        if args.command == "convert":
-            return convert.main(args)
-        elif args.command == "validate":
-            return validate.main(args)
-        elif args.command == "batch":
-            return batch.main(args)
+        if args.command in COMMANDS:
+            if args.verbosity == "verbose":
+                from ..utils.yaml_handler import yaml_backend
+
+                logger.debug(f"YAML backend: {yaml_backend()}")
+            command = load_command(args.command)
+            profile_mode = getattr(args, "profile", None)
+            if not isinstance(profile_mode, str):
+                return command.main(args)
+
+            from ..utils.profiling import profile
+
+            with profile(profile_mode, output=args.profile_output) as profiler:
+                code = command.main(args)
+            if profiler.timeline is not None:
+                logger.info(f"Time per phase:\n{profiler.timeline.format_summary()}")
+            return code
         else:
             logger.error(f"Unknown command: {args.command}")
             return 1
@@ -0,0 +1,156 @@
+"""
+Rollback command implementation for CLI.
+
+This module handles the rollback subcommand, which lists the runs recorded
+in the backup store by ``convert --backup`` and restores the files of a run.
+"""
+
+import argparse
+import json
+import logging
+
+from ..core.backups import DEFAULT_BACKUP_DIR, LATEST_RUN, BackupStore
+from ..exceptions import FQCNConverterError
+
+
+def add_rollback_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add rollback command arguments to parser."""
+    parser.add_argument(
+        "run_id",
+        nargs="?",
+        help=f"Run to roll back: its id, a unique prefix, or '{LATEST_RUN}'",
+    )
+
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List the recorded runs instead of rolling one back",
+    )
+
+    parser.add_argument(
+        "--backup-dir",
+        metavar="DIR",
+        help=f"Backup store directory (default: {DEFAULT_BACKUP_DIR})",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        "-n",
+        action="store_true",
+        help="Show which files would be restored without changing them",
+    )
+
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Also restore files modified since the run, discarding those edits",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+
+
+class RollbackCommand:
+    """Handler for the rollback command."""
+
+    def __init__(self, args: argparse.Namespace):
+        """Initialize rollback command handler."""
+        self.args = args
+        self.logger = logging.getLogger(__name__)
+        self.store = BackupStore(getattr(args, "backup_dir", None))
+
+    def run(self) -> int:
+        """Execute the rollback command."""
+        try:
+            if self.args.list:
+                self._print_runs()
+                return 0
+
+            if not self.args.run_id:
+                self.logger.error(
+                    f"Specify a run id or '{LATEST_RUN}', or use --list to show runs"
+                )
+                return 1
+
+            return self._rollback()
+
+        except FQCNConverterError as e:
+            self.logger.error(f"Rollback failed: {e.message}")
+            return 1
+        except Exception as e:
+            self.logger.error(f"Rollback failed: {e}")
+            return 1
+
+    def _print_runs(self) -> None:
+        """Print the recorded runs, oldest first."""
+        runs = self.store.runs()
+
+        if self.args.format == "json":
+            print(
+                json.dumps(
+                    [
+                        {
+                            "run_id": run.run_id,
+                            "created": run.created,
+                            "command": run.command,
+                            "files": run.files,
+                        }
+                        for run in runs
+                    ],
+                    indent=2,
+                )
+            )
+            return
+
+        if not runs:
+            print(f"No backup runs in {self.store.root}")
+            return
+        for run in runs:
+            print(f"{run.run_id}  {run.created}  {run.command}  {run.files} files")
+
+    def _rollback(self) -> int:
+        """Restore the files of the selected run."""
+        result = self.store.rollback(
+            self.args.run_id, dry_run=self.args.dry_run, force=self.args.force
+        )
+
+        if self.args.format == "json":
+            print(
+                json.dumps(
+                    {
+                        "run_id": result.run_id,
+                        "dry_run": result.dry_run,
+                        "restored": result.restored,
+                        "unchanged": result.unchanged,
+                        "modified": result.modified,
+                        "failed": result.failed,
+                    },
+                    indent=2,
+                )
+            )
+        else:
+            verb = "Would restore" if result.dry_run else "Restored"
+            for path in result.restored:
+                print(f"{verb}: {path}")
+            for path in result.modified:
+                print(f"Skipped, modified since the run (use --force): {path}")
+            for path, reason in result.failed.items():
+                print(f"Failed: {path}: {reason}")
+            print(
+                f"Run {result.run_id}: {len(result.restored)} "
+                f"{'to restore' if result.dry_run else 'restored'}, "
+                f"{len(result.unchanged)} unchanged, "
+                f"{len(result.modified)} modified, {len(result.failed)} failed"
+            )
+
+        return 0 if result.success else 1
+
+
+def main(args: argparse.Namespace) -> int:
+    """Handle rollback subcommand."""
+    command = RollbackCommand(args)
+    return command.run()
@@ -16,8 +16,27 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..core.cache import ResultCache
+from ..core.changes import (
+    DEFAULT_MANIFEST,
+    FileManifest,
+    common_directory,
+    select_changed_files,
+    settings_fingerprint,
+)
+from ..core.discovery import IgnoreRules, iter_files
+from ..core.reader import LARGE_FILE_POLICIES, parse_size
 from ..core.validator import ValidationEngine, ValidationIssue, ValidationResult
 from ..exceptions import FileAccessError, FQCNConverterError, ValidationError
+from ..utils.profiling import phase
+
+
+def _file_size(text: str) -> int:
+    """Parse a --max-file-size value for argparse."""
+    try:
+        return parse_size(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
 
 
 def add_validate_arguments(parser: argparse.ArgumentParser) -> None:
@@ -95,6 +114,52 @@ def add_validate_arguments(parser: argparse.ArgumentParser) -> None:
         help="Number of parallel workers for validation (default: 4)",
     )
 
+    # Caching options
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse validation results for unchanged files from this cache directory",
+    )
+
+    # Large file options
+    parser.add_argument(
+        "--max-file-size",
+        type=_file_size,
+        metavar="SIZE",
+        help=(
+            "Apply --large-files to files larger than SIZE, e.g. 512K, 50M or 1G "
+            "(default: no limit)"
+        ),
+    )
+
+    parser.add_argument(
+        "--large-files",
+        choices=LARGE_FILE_POLICIES,
+        default="skip",
+        help=(
+            "Files over --max-file-size: skip them unread, stream to validate only "
+            "those whose raw bytes contain module keys, or process them normally "
+            "(default: skip)"
+        ),
+    )
+
+    # Incremental options
+    parser.add_argument(
+        "--since",
+        metavar="REF",
+        help="Only validate files changed since a git ref (e.g. origin/main)",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        nargs="?",
+        const=DEFAULT_MANIFEST,
+        metavar="MANIFEST",
+        help=(
+            "Only validate files changed since they last passed, tracked in a "
+            f"manifest (default: {DEFAULT_MANIFEST})"
+        ),
+    )
+
 
 class ValidateCommand:
     """Handler for the validate command."""
@@ -105,6 +170,7 @@ class ValidateCommand:
         self.logger = logging.getLogger(__name__)
         self.validator: Optional[ValidationEngine] = None
         self.results: List[ValidationResult] = []
+        self.manifest: Optional[FileManifest] = None
         self.stats = {
             "files_validated": 0,
             "files_passed": 0,
@@ -124,23 +190,35 @@ class ValidateCommand:
             self._initialize_validator()
 
             # Discover files to validate
-            files_to_validate = self._discover_files()
+            with phase("discover"):
+                files_to_validate = self._discover_files()
 
             if not files_to_validate:
                 self.logger.warning("No Ansible files found to validate")
                 return 0
 
+            # Skip files unchanged since the given ref or the last run
+            files_to_validate = self._select_changed_files(files_to_validate)
+
+            if not files_to_validate:
+                self.logger.info("No changed files to validate")
+                return 0
+
             self.logger.info(f"Found {len(files_to_validate)} files to validate")
 
             # Validate files
             success = self._validate_files(files_to_validate)
 
-            # Generate report if requested
-            if self.args.report:
-                self._generate_report()
+            # Remember passing files for the next incremental run
+            self._update_manifest()
+
+            with phase("report"):
+                # Generate report if requested
+                if self.args.report:
+                    self._generate_report()
 
-            # Print results
-            self._print_results()
+                # Print results
+                self._print_results()
 
             return 0 if success else 1
 
@@ -161,7 +239,15 @@ class ValidateCommand:
     def _initialize_validator(self) -> None:
         """Initialize the validation engine."""
         try:
-            self.validator = ValidationEngine()
+            options: Dict[str, Any] = {}
+            cache_dir = getattr(self.args, "cache_dir", None)
+            if cache_dir:
+                options["cache"] = ResultCache(cache_dir)
+            max_file_size = getattr(self.args, "max_file_size", None)
+            if isinstance(max_file_size, int):
+                options["max_file_size"] = max_file_size
+                options["large_files"] = getattr(self.args, "large_files", "skip")
+            self.validator = ValidationEngine(**options)
             self.logger.debug("Validator initialized successfully")
         except Exception as e:
             raise ValidationError(f"Failed to initialize validator: {e}")
@@ -186,57 +272,66 @@ class ValidateCommand:
 
         return sorted(files_to_validate)
 
+    def _select_changed_files(self, files: List[Path]) -> List[Path]:
+        """Narrow files down to those changed per --since or --incremental."""
+        since = getattr(self.args, "since", None)
+        manifest_path = getattr(self.args, "incremental", None)
+
+        # Only string values come from the command line
+        since = since if isinstance(since, str) else None
+        manifest_path = manifest_path if isinstance(manifest_path, str) else None
+
+        if manifest_path:
+            self.manifest = FileManifest(
+                manifest_path,
+                scope="validate",
+                fingerprint=settings_fingerprint(getattr(self.args, "config", None)),
+            )
+
+        if since is None and self.manifest is None:
+            return files
+
+        return select_changed_files(
+            files,
+            since=since,
+            manifest=self.manifest,
+            cwd=common_directory(self.args.files),
+        )
+
+    def _update_manifest(self) -> None:
+        """Record files that passed without issues in the incremental manifest."""
+        if self.manifest is None:
+            return
+
+        # Files with warnings stay unrecorded so they keep being reported
+        for result in self.results:
+            if result.valid and not result.issues:
+                self.manifest.record(result.file_path)
+            else:
+                self.manifest.forget(result.file_path)
+
+        self.manifest.save()
+
     def _find_ansible_files(
         self, directory: Path, exclude_patterns: List[str]
     ) -> List[Path]:
         """Find Ansible files in a directory."""
-        ansible_files = []
-
-        # Common Ansible file patterns
-        patterns = ["**/*.yml", "**/*.yaml"]
-
-        for pattern in patterns:
-            for file_path in directory.glob(pattern):
-                if file_path.is_file() and self._should_process_file(
-                    file_path, exclude_patterns
-                ):
-                    # Additional checks for Ansible files
-                    if self._is_ansible_file(file_path):
-                        ansible_files.append(file_path)
-
-        return ansible_files
+        rules = IgnoreRules.compile(tuple(exclude_patterns), substring_words=True)
+        return [
+            file_path
+            for file_path in iter_files(directory, rules)
+            if self._is_ansible_file(file_path)
+        ]
 
     def _should_process_file(
         self, file_path: Path, exclude_patterns: List[str]
     ) -> bool:
         """Check if a file should be processed."""
-        file_str = str(file_path)
-
-        # Check exclude patterns
-        for pattern in exclude_patterns:
-            if pattern in file_str:
-                self.logger.debug(
-                    f"Excluding file due to pattern '{pattern}': {file_path}"
-                )
-                return False
-
-        # Skip common non-Ansible directories
-        skip_dirs = {
-            ".git",
-            ".github",
-            "__pycache__",
-            ".pytest_cache",
-            "node_modules",
-            ".venv",
-            "venv",
-            ".tox",
-            "build",
-            "dist",
-        }
-
-        for part in file_path.parts:
-            if part in skip_dirs:
-                return False
+        if IgnoreRules.compile(
+            tuple(exclude_patterns), substring_words=True
+        ).is_excluded(file_path):
+            self.logger.debug(f"Excluding file: {file_path}")
+            return False
 
         return True
 
@@ -1,5 +1,26 @@
 """Configuration management for FQCN Converter."""
 
-from .manager import ConfigurationManager
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ["ConfigurationManager"]
+from .._lazy import lazy_attribute
+
+_LAZY_IMPORTS = {
+    "ConfigurationManager": ".manager",
+    "MappingIndex": ".index",
+    "load_mapping_index": ".index",
+}
+
+if TYPE_CHECKING:
+    from .index import MappingIndex, load_mapping_index
+    from .manager import ConfigurationManager
+
+__all__ = ["ConfigurationManager", "MappingIndex", "load_mapping_index"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodule exports on first access."""
+    return lazy_attribute(__name__, _LAZY_IMPORTS, name, globals())
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
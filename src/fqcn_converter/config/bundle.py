@@ -0,0 +1,127 @@
+"""
+Precompiled mapping bundle for fast startup.
+
+Parsing the default mapping YAML and merging its sections dominates the
+startup of short runs. A bundle is a JSON sidecar next to the YAML file
+holding the already merged mappings together with the SHA-256 of the YAML
+it was built from. ConfigurationManager.load_default_mappings reads the
+bundle when that digest matches the YAML on disk and falls back to parsing
+the YAML when the bundle is missing, unreadable or stale.
+
+Build or refresh the bundle with ``make mapping-bundle``, which runs
+scripts/build_mapping_bundle.py.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..exceptions import FileAccessError
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bumped whenever the merge rules or the bundle layout change
+BUNDLE_FORMAT = 1
+
+# Suffix replacing ".yml" of the source, e.g. fqcn_mapping.bundle.json
+BUNDLE_SUFFIX = ".bundle.json"
+
+
+def bundle_path(source: Path) -> Path:
+    """Return the bundle location for a mapping YAML file."""
+    return source.with_name(source.stem + BUNDLE_SUFFIX)
+
+
+def source_digest(data: bytes) -> str:
+    """Return the digest a bundle records for its YAML source."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def read_bundle(
+    source: Path, bundle: Optional[Path] = None
+) -> Optional[Dict[str, str]]:
+    """
+    Return the bundled mappings of a YAML file if the bundle is current.
+
+    Args:
+        source: Mapping YAML file the bundle was built from
+        bundle: Bundle file; defaults to bundle_path(source)
+
+    Returns:
+        Merged mappings, or None if the bundle is missing, unreadable, of
+        another format or built from different YAML content
+    """
+    bundle = bundle or bundle_path(source)
+    try:
+        payload = json.loads(bundle.read_bytes())
+        digest = source_digest(source.read_bytes())
+    except (OSError, ValueError) as e:
+        logger.debug(f"No usable mapping bundle at {bundle}: {e}")
+        return None
+
+    if not isinstance(payload, dict) or payload.get("format") != BUNDLE_FORMAT:
+        logger.debug(f"Ignoring mapping bundle of another format: {bundle}")
+        return None
+
+    if payload.get("source_sha256") != digest:
+        logger.info(f"Mapping bundle {bundle} is stale, loading {source}")
+        return None
+
+    mappings = payload.get("mappings")
+    if not isinstance(mappings, dict):
+        return None
+    return mappings
+
+
+def write_bundle(
+    source: Path, mappings: Dict[str, str], bundle: Optional[Path] = None
+) -> Path:
+    """
+    Write the bundle for a YAML file atomically.
+
+    Args:
+        source: Mapping YAML file the mappings were loaded from
+        mappings: Merged mappings of the source
+        bundle: Bundle file; defaults to bundle_path(source)
+
+    Returns:
+        Path of the written bundle
+
+    Raises:
+        FileAccessError: If the source cannot be read or the bundle written
+    """
+    bundle = bundle or bundle_path(source)
+    try:
+        payload = {
+            "format": BUNDLE_FORMAT,
+            "source": source.name,
+            "source_sha256": source_digest(source.read_bytes()),
+            "mappings": mappings,
+        }
+        fd, tmp_name = tempfile.mkstemp(
+            dir=str(bundle.parent), prefix=".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=1)
+                f.write("\n")
+            # Shipped next to the YAML, so readable like it
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, bundle)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        raise FileAccessError(
+            f"Cannot write mapping bundle: {bundle}",
+            file_path=str(bundle),
+            operation="write",
+            os_error=e,
+        ) from e
+
+    logger.info(f"Wrote {len(mappings)} mappings to {bundle}")
+    return bundle
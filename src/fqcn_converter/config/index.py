@@ -0,0 +1,220 @@
+"""
+Shared, immutable index over merged FQCN mappings.
+
+Every converter and validator needs the same several hundred default mappings.
+This module builds them into one read-only MappingIndex per process, memoized
+by the configuration files (path and modification time) and custom mappings
+that produced it, so components created later in the same process, such as
+batch workers or the pre-commit hook, reuse it instead of parsing YAML again.
+"""
+
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    Dict,
+    FrozenSet,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Optional,
+    Tuple,
+    Union,
+    ValuesView,
+)
+
+from ..utils.logging import get_logger
+from .manager import ConfigurationManager
+
+logger = get_logger(__name__)
+
+# Most distinct (config, custom mappings) combinations kept per process
+MAX_CACHED_INDEXES = 32
+
+_index_cache: Dict[tuple, "MappingIndex"] = {}
+_index_lock = threading.Lock()
+
+
+class MappingIndex(Mapping):
+    """
+    Read-only short name to FQCN mappings with precomputed lookups.
+
+    Behaves as a mapping of short names to FQCNs and additionally holds the
+    set of known FQCNs, reverse lookups from an FQCN to its short names, and
+    short names grouped by collection.
+
+    Example:
+        >>> index = MappingIndex({"copy": "ansible.builtin.copy"})
+        >>> index["copy"]
+        'ansible.builtin.copy'
+        >>> index.is_fqcn("ansible.builtin.copy")
+        True
+        >>> index.collections["ansible.builtin"]
+        ('copy',)
+    """
+
+    __slots__ = ("_mappings", "_fqcns", "_reverse", "_collections")
+
+    def __init__(self, mappings: Mapping) -> None:
+        """
+        Build the index.
+
+        Args:
+            mappings: Short module names mapped to FQCNs; copied
+        """
+        reverse: Dict[str, list] = {}
+        collections: Dict[str, list] = {}
+        for short_name, fqcn in mappings.items():
+            reverse.setdefault(fqcn, []).append(short_name)
+            collection = fqcn.rpartition(".")[0]
+            collections.setdefault(collection, []).append(short_name)
+
+        self._mappings = MappingProxyType(dict(mappings))
+        self._fqcns: FrozenSet[str] = frozenset(reverse)
+        self._reverse = MappingProxyType(
+            {fqcn: tuple(sorted(names)) for fqcn, names in reverse.items()}
+        )
+        self._collections = MappingProxyType(
+            {name: tuple(sorted(names)) for name, names in collections.items()}
+        )
+
+    def __getitem__(self, short_name: str) -> str:
+        return self._mappings[short_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._mappings)
+
+    def __len__(self) -> int:
+        return len(self._mappings)
+
+    # Delegate lookups to the underlying dict rather than the generic
+    # Mapping implementations, as they sit on the conversion hot path
+    def __contains__(self, short_name: object) -> bool:
+        return short_name in self._mappings
+
+    def get(self, short_name: str, default: Optional[str] = None) -> Optional[str]:
+        return self._mappings.get(short_name, default)
+
+    def keys(self) -> KeysView:
+        return self._mappings.keys()
+
+    def items(self) -> ItemsView:
+        return self._mappings.items()
+
+    def values(self) -> ValuesView:
+        return self._mappings.values()
+
+    def __repr__(self) -> str:
+        return f"MappingIndex({len(self)} mappings)"
+
+    @property
+    def fqcns(self) -> FrozenSet[str]:
+        """All FQCNs that some short name maps to."""
+        return self._fqcns
+
+    @property
+    def collections(self) -> Mapping:
+        """Short names grouped by collection, e.g. "ansible.builtin"."""
+        return self._collections
+
+    def is_fqcn(self, name: str) -> bool:
+        """Return whether name is the target FQCN of a mapping."""
+        return name in self._fqcns
+
+    def short_names(self, fqcn: str) -> Tuple[str, ...]:
+        """Return the short names that map to an FQCN, sorted."""
+        return self._reverse.get(fqcn, ())
+
+
+def load_mapping_index(
+    config_path: Optional[Union[str, Path]] = None,
+    custom_mappings: Optional[Dict[str, str]] = None,
+    manager: Optional[ConfigurationManager] = None,
+) -> MappingIndex:
+    """
+    Return the mapping index for a configuration, building it at most once.
+
+    Defaults are merged with the mappings of config_path, then with
+    custom_mappings. Indexes are memoized per process by the default and
+    custom configuration files with their modification times and by the
+    custom mappings, so editing a configuration file yields a fresh index.
+
+    Args:
+        config_path: Optional custom configuration file
+        custom_mappings: Optional mappings that take precedence over files
+        manager: Configuration manager to load with. Only indexes loaded by
+                a stock ConfigurationManager are memoized.
+
+    Returns:
+        Shared MappingIndex
+
+    Raises:
+        ConfigurationError: If a configuration file cannot be loaded
+    """
+    manager = manager if manager is not None else ConfigurationManager()
+    key = _index_key(manager, config_path, custom_mappings)
+
+    if key is not None:
+        with _index_lock:
+            index = _index_cache.get(key)
+        if index is not None:
+            logger.debug("Reusing shared mapping index")
+            return index
+
+    mappings = manager.load_default_mappings()
+    if config_path:
+        custom_config = manager.load_custom_mappings(str(config_path))
+        mappings = manager.merge_mappings(mappings, custom_config)
+    if custom_mappings:
+        mappings = manager.merge_mappings(mappings, custom_mappings)
+    index = MappingIndex(mappings)
+
+    if key is not None:
+        with _index_lock:
+            if len(_index_cache) >= MAX_CACHED_INDEXES:
+                _index_cache.pop(next(iter(_index_cache)))
+            index = _index_cache.setdefault(key, index)
+
+    return index
+
+
+def clear_mapping_index_cache() -> None:
+    """Forget all memoized mapping indexes."""
+    with _index_lock:
+        _index_cache.clear()
+
+
+def _index_key(
+    manager: ConfigurationManager,
+    config_path: Optional[Union[str, Path]],
+    custom_mappings: Optional[Dict[str, str]],
+) -> Optional[tuple]:
+    """Build the memoization key of an index, or None if it must not be cached."""
+    if type(manager) is not ConfigurationManager:
+        return None
+
+    try:
+        custom = tuple(sorted((custom_mappings or {}).items()))
+        hash(custom)
+    except TypeError:
+        return None
+
+    return (
+        _file_stamp(manager._default_config_path),
+        _file_stamp(config_path),
+        custom,
+    )
+
+
+def _file_stamp(path: Optional[Union[str, Path]]) -> Optional[tuple]:
+    """Return (resolved path, mtime, size) of a file, or the path if missing."""
+    if not path:
+        return None
+
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path), None, None)
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
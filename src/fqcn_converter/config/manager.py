@@ -13,6 +13,8 @@ import yaml
 
 from ..exceptions import ConfigurationError
 from ..utils.logging import get_logger
+from ..utils.yaml_handler import safe_load
+from .bundle import read_bundle, write_bundle
 
 logger = get_logger(__name__)
 
@@ -117,8 +119,14 @@ class ConfigurationManager:
                 )
                 return self._get_minimal_builtin_mappings()
 
+            # A current precompiled bundle skips parsing and merging the YAML
+            mappings = read_bundle(self._default_config_path)
+            if mappings is not None:
+                logger.info(f"Loaded {len(mappings)} default module mappings (bundle)")
+                return mappings
+
             with open(self._default_config_path, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
+                config_data = safe_load(f)
 
             if not config_data:
                 logger.warning(
@@ -143,6 +151,42 @@ class ConfigurationManager:
                 details=str(e),
             ) from e
 
+    def build_mapping_bundle(self, output: Optional[Path] = None) -> Path:
+        """
+        Precompile the default configuration into a mapping bundle.
+
+        Args:
+            output: Bundle file to write; defaults to the file next to the
+                   default configuration that load_default_mappings reads
+
+        Returns:
+            Path of the written bundle
+
+        Raises:
+            ConfigurationError: If there is no default configuration or it
+                              cannot be parsed
+            FileAccessError: If the bundle cannot be written
+        """
+        source = self._default_config_path
+        if not source or not source.exists():
+            raise ConfigurationError(
+                "Default configuration file not found",
+                details="A mapping bundle is built from config/fqcn_mapping.yml",
+            )
+
+        try:
+            with open(source, "r", encoding="utf-8") as f:
+                config_data = safe_load(f) or {}
+        except yaml.YAMLError as e:
+            raise ConfigurationError(
+                f"Failed to parse default configuration YAML: {source}",
+                details=str(e),
+            ) from e
+
+        return write_bundle(
+            source, self._extract_mappings_from_config(config_data), output
+        )
+
     def load_custom_mappings(self, config_path: Union[str, Path]) -> Dict[str, str]:
         """
         Load custom mappings from user-provided file.
@@ -166,7 +210,7 @@ class ConfigurationManager:
                 )
 
             with open(config_path, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
+                config_data = safe_load(f)
 
             if not config_data:
                 logger.warning(f"Custom configuration file is empty: {config_path}")
@@ -417,7 +461,7 @@ class ConfigurationManager:
         """Load settings from a configuration file."""
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
+                config_data = safe_load(f)
 
             settings = ConversionSettings()
 
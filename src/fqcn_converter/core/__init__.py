@@ -1,15 +1,60 @@
 """Core conversion functionality for FQCN Converter."""
 
-from .batch import BatchProcessor, BatchResult
-from .converter import ConversionResult, FQCNConverter
-from .validator import ValidationEngine, ValidationIssue, ValidationResult
+from typing import TYPE_CHECKING, Any, List
+
+from .._lazy import lazy_attribute
+
+_LAZY_IMPORTS = {
+    "BackupStore": ".backups",
+    "BatchProcessor": ".batch",
+    "BatchResult": ".batch",
+    "ResultCache": ".cache",
+    "ConversionMetrics": ".converter",
+    "ConversionResult": ".converter",
+    "FQCNConverter": ".converter",
+    "ResultRecord": ".converter",
+    "ParsedDocument": ".document",
+    "ValidationEngine": ".validator",
+    "ValidationIssue": ".validator",
+    "ValidationResult": ".validator",
+    "FileWriter": ".writer",
+}
+
+if TYPE_CHECKING:
+    from .backups import BackupStore
+    from .batch import BatchProcessor, BatchResult
+    from .cache import ResultCache
+    from .converter import (
+        ConversionMetrics,
+        ConversionResult,
+        FQCNConverter,
+        ResultRecord,
+    )
+    from .document import ParsedDocument
+    from .validator import ValidationEngine, ValidationIssue, ValidationResult
+    from .writer import FileWriter
 
 __all__ = [
     "FQCNConverter",
     "ConversionResult",
+    "ConversionMetrics",
+    "ResultRecord",
+    "ParsedDocument",
     "ValidationEngine",
     "ValidationResult",
     "ValidationIssue",
     "BatchProcessor",
     "BatchResult",
+    "ResultCache",
+    "BackupStore",
+    "FileWriter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodule exports on first access."""
+    return lazy_attribute(__name__, _LAZY_IMPORTS, name, globals())
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,471 @@
+"""
+Content-addressed backup store for converted files.
+
+Backups live in one directory (``.fqcn_backups`` by default) instead of as
+siblings of every converted file::
+
+    .fqcn_backups/
+        objects/ab/cdef...   original file content, named by its SHA-256
+        runs/<run-id>.jsonl  one manifest per run: a header line, then one
+                             line per backed-up file
+
+Identical originals, such as the same tasks file vendored into many roles,
+are stored once. A manifest only lists files a run actually changed, and it
+is appended to as files are backed up, so a run interrupted halfway can still
+be rolled back; rolling back touches only those files, restoring each one
+atomically. Each entry also records the digest of the content the run wrote,
+so files edited after the run are left alone unless the rollback is forced.
+"""
+
+import hashlib
+import json
+import os
+import secrets
+import stat
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Set, Tuple, Union
+
+from ..exceptions import FileAccessError
+from ..utils.logging import get_logger
+from .writer import atomic_write
+
+logger = get_logger(__name__)
+
+# Default backup directory, relative to the working directory
+DEFAULT_BACKUP_DIR = ".fqcn_backups"
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+# Run id accepted by BackupStore.resolve for the most recent run
+LATEST_RUN = "latest"
+
+
+@dataclass
+class BackupEntry:
+    """
+    A file backed up by a run.
+
+    Attributes:
+        path: Path of the file as given to the run
+        digest: SHA-256 of the original content, naming its blob
+        mode: Permission bits of the original file
+        converted: SHA-256 of the content the run wrote, if recorded
+    """
+
+    path: str
+    digest: str
+    mode: int
+    converted: Optional[str] = None
+
+
+@dataclass
+class RunInfo:
+    """
+    Summary of a backup run.
+
+    Attributes:
+        run_id: Identifier of the run, sortable by start time
+        created: ISO 8601 start time of the run
+        command: Command that created the run
+        files: Number of files backed up by the run
+    """
+
+    run_id: str
+    created: str
+    command: str
+    files: int
+
+
+@dataclass
+class RollbackResult:
+    """
+    Outcome of rolling back a run.
+
+    Attributes:
+        run_id: Identifier of the rolled back run
+        restored: Files restored to their original content
+        unchanged: Files that already held their original content
+        modified: Files changed since the run, left alone without force
+        failed: Files that could not be restored, with the reason
+        dry_run: Whether files were only compared, not restored
+    """
+
+    run_id: str
+    restored: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    dry_run: bool = False
+
+    @property
+    def success(self) -> bool:
+        """Whether every file of the run holds its original content."""
+        return not self.failed and not self.modified
+
+
+class BackupStore:
+    """
+    Directory of deduplicated file backups grouped into runs.
+
+    Example:
+        >>> store = BackupStore(".fqcn_backups")
+        >>> run = store.begin_run("convert")
+        >>> run.add("site.yml")  # before site.yml is replaced
+        >>> store.rollback(run.run_id).restored
+        ['site.yml']
+    """
+
+    def __init__(self, root: Union[str, Path, None] = None) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            root: Backup directory; defaults to DEFAULT_BACKUP_DIR. It is
+                 created with the first backup.
+        """
+        self.root = Path(root if root is not None else DEFAULT_BACKUP_DIR)
+        self.objects_dir = self.root / "objects"
+        self.runs_dir = self.root / "runs"
+
+    def begin_run(self, command: str = "convert") -> "BackupRun":
+        """
+        Start a new run.
+
+        Args:
+            command: Command creating the run, recorded in its manifest
+
+        Returns:
+            BackupRun to back files up into
+        """
+        run_id = (
+            datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+            + "-"
+            + secrets.token_hex(3)
+        )
+        return BackupRun(self, run_id, command)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _manifest_path(self, run_id: str) -> Path:
+        return self.runs_dir / f"{run_id}.jsonl"
+
+    def store_blob(self, data: bytes) -> str:
+        """
+        Store content unless a blob with the same hash exists.
+
+        Args:
+            data: File content
+
+        Returns:
+            SHA-256 hex digest naming the blob
+
+        Raises:
+            OSError: If the blob cannot be written
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            if not self.root.is_dir():
+                self.root.mkdir(parents=True, exist_ok=True)
+                # Keep backups out of commits when the store is inside a repo
+                (self.root / ".gitignore").write_text("*\n", encoding="utf-8")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, data)
+        return digest
+
+    def read_blob(self, digest: str) -> bytes:
+        """
+        Read stored content.
+
+        Raises:
+            OSError: If the blob is missing or unreadable
+        """
+        return self._blob_path(digest).read_bytes()
+
+    def runs(self) -> List[RunInfo]:
+        """Return all runs, oldest first."""
+        if not self.runs_dir.is_dir():
+            return []
+        infos = []
+        for manifest in sorted(self.runs_dir.glob("*.jsonl")):
+            try:
+                header, entries = self._read_manifest(manifest)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable backup manifest {manifest}: {e}")
+                continue
+            infos.append(
+                RunInfo(
+                    run_id=manifest.stem,
+                    created=header.get("created", ""),
+                    command=header.get("command", ""),
+                    files=len(entries),
+                )
+            )
+        return infos
+
+    def resolve(self, run_id: str) -> str:
+        """
+        Resolve "latest" or a unique run id prefix to a run id.
+
+        Raises:
+            FileAccessError: If no run or several runs match
+        """
+        run_ids = (
+            sorted(path.stem for path in self.runs_dir.glob("*.jsonl"))
+            if self.runs_dir.is_dir()
+            else []
+        )
+        if run_id == LATEST_RUN:
+            matches = run_ids[-1:]
+        else:
+            matches = [r for r in run_ids if r.startswith(run_id)]
+
+        if len(matches) != 1:
+            problem = "No backup run matches" if not matches else "Ambiguous run id"
+            raise FileAccessError(
+                f"{problem}: {run_id}",
+                file_path=str(self.runs_dir),
+                operation="read",
+            )
+        return matches[0]
+
+    def entries(self, run_id: str) -> List[BackupEntry]:
+        """
+        Return the files backed up by a run.
+
+        Raises:
+            FileAccessError: If the manifest cannot be read
+        """
+        manifest = self._manifest_path(self.resolve(run_id))
+        try:
+            _, entries = self._read_manifest(manifest)
+        except (OSError, ValueError) as e:
+            raise FileAccessError(
+                f"Cannot read backup manifest: {manifest}",
+                file_path=str(manifest),
+                operation="read",
+                os_error=e if isinstance(e, OSError) else None,
+            ) from e
+        return entries
+
+    def _read_manifest(
+        self, manifest: Path
+    ) -> Tuple[Dict[str, Any], List[BackupEntry]]:
+        """Parse a manifest into its header and its entries, latest per path."""
+        with open(manifest, "r", encoding="utf-8") as f:
+            lines = iter(f)
+            header = json.loads(next(lines, "{}"))
+            entries: Dict[str, BackupEntry] = {}
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A run killed mid-append leaves a partial last line
+                    logger.debug(f"Skipping partial manifest line in {manifest}")
+                    continue
+                # The first backup of a file holds its original content, the
+                # last one what the run finally wrote
+                entry = entries.setdefault(
+                    record["path"],
+                    BackupEntry(record["path"], record["digest"], record["mode"]),
+                )
+                entry.converted = record.get("converted")
+        return header, list(entries.values())
+
+    def rollback(
+        self, run_id: str, dry_run: bool = False, force: bool = False
+    ) -> RollbackResult:
+        """
+        Restore every file of a run to the content it had before the run.
+
+        Files whose content is no longer what the run wrote were edited
+        afterwards; they are skipped with a warning so the edits are not
+        lost, unless force is set.
+
+        Args:
+            run_id: Run id, unique prefix, or "latest"
+            dry_run: Only report which files would be restored
+            force: Also restore files modified since the run
+
+        Returns:
+            RollbackResult listing restored, unchanged, modified and failed
+            files
+
+        Raises:
+            FileAccessError: If the run cannot be found or read
+        """
+        resolved = self.resolve(run_id)
+        result = RollbackResult(run_id=resolved, dry_run=dry_run)
+
+        for entry in self.entries(resolved):
+            path = self._resolve_path(entry.path)
+            try:
+                with open(path, "rb") as f:
+                    current = hashlib.sha256(f.read()).hexdigest()
+            except FileNotFoundError:
+                current = None
+            except OSError as e:
+                result.failed[entry.path] = str(e)
+                continue
+
+            if current == entry.digest:
+                result.unchanged.append(entry.path)
+                continue
+
+            # A deleted file holds no edits to lose, so it is recreated
+            if current is not None and entry.converted not in (None, current):
+                if not force:
+                    logger.warning(
+                        f"Not restoring {entry.path}: modified since run "
+                        f"{resolved}; use force to overwrite it"
+                    )
+                    result.modified.append(entry.path)
+                    continue
+
+            try:
+                data = self.read_blob(entry.digest)
+                if not dry_run:
+                    atomic_write(path, data)
+                    os.chmod(path, entry.mode)
+            except OSError as e:
+                result.failed[entry.path] = str(e)
+                continue
+            result.restored.append(entry.path)
+
+        logger.info(
+            f"Rolled back run {resolved}: {len(result.restored)} restored, "
+            f"{len(result.unchanged)} unchanged, {len(result.modified)} modified, "
+            f"{len(result.failed)} failed"
+        )
+        return result
+
+    def _resolve_path(self, path: str) -> str:
+        """
+        Turn a manifest path back into an absolute path.
+
+        Relative paths are joined to the directory holding the store, the
+        base ``_relative_path`` recorded them against.
+        """
+        if os.path.isabs(path):
+            return path
+        return os.path.join(os.path.dirname(os.path.abspath(self.root)), path)
+
+    def _relative_path(self, path: Union[str, Path]) -> str:
+        """Record paths relative to the directory holding the store."""
+        absolute = os.path.abspath(path)
+        base = os.path.dirname(os.path.abspath(self.root))
+        try:
+            relative = os.path.relpath(absolute, base)
+        except ValueError:
+            # Different drives on Windows
+            return absolute
+        return absolute if relative.startswith(os.pardir) else relative
+
+
+class BackupRun:
+    """
+    Backups taken by one run, recorded in its manifest as they happen.
+
+    Safe to use from several threads.
+    """
+
+    def __init__(self, store: BackupStore, run_id: str, command: str) -> None:
+        self.store = store
+        self.run_id = run_id
+        self.command = command
+        self._paths: Set[str] = set()
+        self._lock = threading.Lock()
+        self._manifest: Optional[IO[str]] = None
+
+    @property
+    def files(self) -> int:
+        """Number of distinct files backed up, as listed for the run."""
+        return len(self._paths)
+
+    def add(
+        self,
+        file_path: Union[str, Path],
+        converted: Union[str, bytes, None] = None,
+    ) -> BackupEntry:
+        """
+        Back up a file before it is replaced.
+
+        Args:
+            file_path: File about to be written
+            converted: Content about to be written, recorded by digest so a
+                      rollback can tell whether the file was edited since
+
+        Returns:
+            BackupEntry recorded in the run's manifest
+
+        Raises:
+            FileAccessError: If the file cannot be read or the backup written
+        """
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+                mode = stat.S_IMODE(os.fstat(f.fileno()).st_mode)
+            digest = self.store.store_blob(data)
+            entry = BackupEntry(self.store._relative_path(file_path), digest, mode)
+            if converted is not None:
+                if isinstance(converted, str):
+                    converted = converted.encode("utf-8")
+                entry.converted = hashlib.sha256(converted).hexdigest()
+            self._append(entry)
+        except OSError as e:
+            raise FileAccessError(
+                f"Cannot back up file: {file_path}",
+                file_path=str(file_path),
+                operation="backup",
+                os_error=e,
+            ) from e
+        return entry
+
+    def _append(self, entry: BackupEntry) -> None:
+        """Append an entry to the manifest, creating it on first use."""
+        record: Dict[str, Any] = {
+            "path": entry.path,
+            "digest": entry.digest,
+            "mode": entry.mode,
+        }
+        if entry.converted is not None:
+            record["converted"] = entry.converted
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            if self._manifest is None:
+                self.store.runs_dir.mkdir(parents=True, exist_ok=True)
+                self._manifest = open(
+                    self.store._manifest_path(self.run_id), "x", encoding="utf-8"
+                )
+                header = {
+                    "version": MANIFEST_VERSION,
+                    "run_id": self.run_id,
+                    "created": datetime.now(timezone.utc).isoformat(),
+                    "command": self.command,
+                }
+                self._manifest.write(json.dumps(header) + "\n")
+            self._manifest.write(line + "\n")
+            # Flushed per entry so an interrupted run can still be rolled back
+            self._manifest.flush()
+            # A file backed up again is still one entry of the manifest
+            self._paths.add(entry.path)
+
+    def close(self) -> None:
+        """Close the manifest; a run without backups leaves no manifest."""
+        with self._lock:
+            if self._manifest is not None:
+                self._manifest.close()
+                self._manifest = None
+
+    def __enter__(self) -> "BackupRun":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -7,13 +7,51 @@ in parallel with detailed reporting and error handling.
 
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Optional, Union
-
-from ..exceptions import BatchProcessingError
-from .converter import ConversionResult, FQCNConverter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from ..exceptions import BatchProcessingError, ConfigurationError
+from ..utils.profiling import phase
+from .converter import ConversionMetrics, ConversionResult, FQCNConverter
+from .discovery import (
+    VCS_SKIP_DIRS,
+    YAML_SUFFIXES,
+    IgnoreRules,
+    WalkEntry,
+    has_project_marker,
+    iter_files,
+    parallel_walk,
+    walk,
+)
+from .workers import (
+    EXECUTORS,
+    FileRecord,
+    ProjectFiles,
+    iter_file_records,
+    iter_thread_records,
+    largest_first,
+)
+
+if TYPE_CHECKING:
+    from ..utils.metrics import BatchMetrics
+
+# Deepest directory level searched when no project sits directly under the root
+MAX_DISCOVERY_DEPTH = 10
+
+# Project files are collected from everywhere except VCS and virtualenv
+# directories, so roles named e.g. build or dist are still converted
+PROJECT_RULES = IgnoreRules.compile(skip_dirs=VCS_SKIP_DIRS)
 
 
 @dataclass
@@ -36,6 +74,7 @@ class BatchResult:
         total_modules_converted: Total number of modules converted across all projects
         success_rate: Success rate as a percentage (0.0 to 1.0)
         average_processing_time: Average processing time per project in seconds
+        metrics: Per-phase timings and counters summed over all converted files
 
     Example:
         >>> result = processor.process_projects(project_paths)
@@ -85,6 +124,32 @@ class BatchResult:
     total_modules_converted: int = 0
     success_rate: float = 0.0
     average_processing_time: float = 0.0
+    metrics: ConversionMetrics = field(default_factory=ConversionMetrics)
+
+    @property
+    def files_per_second(self) -> float:
+        """Files converted per second of batch execution time."""
+        return self.metrics.throughput(self.execution_time)[0]
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """MB of file content converted per second of batch execution time."""
+        return self.metrics.throughput(self.execution_time)[1]
+
+
+def _add_metrics(total: ConversionMetrics, result: Any) -> None:
+    """Add the metrics of a result or file record to total, if it has any."""
+    metrics = getattr(result, "metrics", None)
+    if isinstance(metrics, ConversionMetrics):
+        total.add(metrics)
+
+
+def _total_metrics(results: Iterable[Any]) -> ConversionMetrics:
+    """Sum the metrics of results or file records."""
+    total = ConversionMetrics()
+    for result in results:
+        _add_metrics(total, result)
+    return total
 
 
 class BatchProcessor:
@@ -97,6 +162,7 @@ class BatchProcessor:
 
     Features:
         - Parallel processing with configurable worker count
+        - Thread or process executors (processes scale past the GIL)
         - Automatic project discovery
         - Comprehensive error handling and recovery
         - Detailed progress reporting
@@ -119,6 +185,9 @@ class BatchProcessor:
         ...     max_workers=4,
         ...     progress_callback=progress_callback
         ... )
+        >>>
+        >>> # Use all cores for CPU-bound conversion
+        >>> processor = BatchProcessor(max_workers=8, executor="process")
     """
 
     def __init__(
@@ -126,6 +195,8 @@ class BatchProcessor:
         max_workers: int = 4,
         config_path: Optional[Union[str, Path]] = None,
         progress_callback: Optional[Callable] = None,
+        executor: str = "thread",
+        metrics: Optional["BatchMetrics"] = None,
     ) -> None:
         """
         Initialize batch processor with worker configuration.
@@ -136,6 +207,15 @@ class BatchProcessor:
             config_path: Optional path to configuration file for conversions.
             progress_callback: Optional callback function for progress updates.
                              Called with (completed_count, total_count, current_project).
+            executor: Parallel execution model, "thread" (default) or "process".
+                     The process executor builds one converter per worker
+                     process and converts files in chunks.
+            metrics: Optional BatchMetrics updated with every converted
+                    file and, like progress_callback, every finished project.
+
+        Raises:
+            ConfigurationError: If the executor is not supported
+            BatchProcessingError: If the converter cannot be initialized
 
         Example:
             >>> # Basic initialization
@@ -148,10 +228,23 @@ class BatchProcessor:
             >>> def track_progress(done, total, current):
             ...     print(f"{done}/{total}: {current}")
             >>> processor = BatchProcessor(progress_callback=track_progress)
+
+            >>> # With metrics scraped from http://127.0.0.1:9464/metrics
+            >>> metrics = BatchMetrics()
+            >>> MetricsServer(metrics.registry, port=9464).start()
+            >>> processor = BatchProcessor(metrics=metrics)
         """
+        if executor not in EXECUTORS:
+            raise ConfigurationError(
+                f"Unknown executor: {executor}",
+                details=f"Supported executors: {', '.join(EXECUTORS)}",
+            )
+
         self.max_workers = max(1, max_workers)  # Ensure at least 1 worker
+        self.executor = executor
         self.config_path = config_path
         self.progress_callback = progress_callback
+        self.metrics = metrics
         self.logger = logging.getLogger(__name__)
         self._last_batch_result = None  # Store last batch result for reporting
 
@@ -232,15 +325,18 @@ class BatchProcessor:
 
         projects = []
 
-        def check_directory_for_project(directory: Path) -> bool:
-            """Check if a directory looks like an Ansible project root."""
+        rules = IgnoreRules.compile(tuple(exclude_patterns), frozenset())
+
+        def check_directory_for_project(listing: WalkEntry) -> bool:
+            """Check if a directory listing looks like an Ansible project root."""
+            directory = listing.path
+
             # First check for explicit project root indicators
-            for pattern in project_patterns:
-                if list(directory.glob(pattern)):
-                    return True
+            if has_project_marker(listing, project_patterns):
+                return True
 
             # Check for roles directory (strong indicator of project root)
-            if (directory / "roles").exists():
+            if "roles" in listing.dirnames or "roles" in listing.filenames:
                 return True
 
             # Avoid detecting subdirectories of roles as separate projects
@@ -253,9 +349,12 @@ class BatchProcessor:
             # Check for any YAML files that might be Ansible playbooks
             # Only do this if using default patterns (not custom patterns)
             if patterns is None:
-                yaml_files = list(directory.glob("*.yml")) + list(
-                    directory.glob("*.yaml")
-                )
+                yaml_files = [
+                    directory / name
+                    for suffix in YAML_SUFFIXES
+                    for name in listing.filenames
+                    if name.endswith(suffix)
+                ]
                 if yaml_files:
                     # Only check files that have reasonable playbook-like names
                     for yaml_file in yaml_files[
@@ -310,45 +409,41 @@ class BatchProcessor:
             return False
 
         try:
-            # First try direct subdirectories (original behavior)
-            direct_projects = []
-            for item in root_path.iterdir():
-                if not item.is_dir():
-                    continue
-
-                # Check if directory should be excluded
-                if any(item.match(pattern) for pattern in exclude_patterns):
-                    continue
-
-                # Check if this directory looks like an Ansible project root
-                if check_directory_for_project(item):
-                    direct_projects.append(str(item))
-
-            # If we found projects in direct subdirectories, use those
-            if direct_projects:
-                projects.extend(direct_projects)
-            else:
-                # Only if no direct projects found, search recursively
-                # This maintains backward compatibility while adding deep search capability
-                for item in root_path.rglob("*"):
+            with phase("discover"):
+                # First try direct subdirectories (original behavior)
+                direct_projects = []
+                for item in root_path.iterdir():
                     if not item.is_dir():
                         continue
 
                     # Check if directory should be excluded
-                    if any(item.match(pattern) for pattern in exclude_patterns):
+                    if rules.is_excluded(item.name, is_dir=True):
                         continue
 
-                    # Skip if too deep (more than 10 levels to avoid performance issues)
-                    try:
-                        relative_path = item.relative_to(root_path)
-                        if len(relative_path.parts) > 10:
+                    # Check if this directory looks like an Ansible project root
+                    listing = next(walk(item, rules, max_depth=0), None)
+                    if listing is not None and check_directory_for_project(listing):
+                        direct_projects.append(str(item))
+
+                # If we found projects in direct subdirectories, use those
+                if direct_projects:
+                    projects.extend(direct_projects)
+                else:
+                    # Only if no direct projects found, search recursively in one
+                    # walk; excluded directories are pruned, and the depth limit
+                    # of 10 levels avoids performance issues
+                    for listing in parallel_walk(
+                        root_path,
+                        rules,
+                        max_depth=MAX_DISCOVERY_DEPTH,
+                        max_workers=self.max_workers,
+                    ):
+                        if listing.depth == 0:
                             continue
-                    except ValueError:
-                        continue
 
-                    # Check if this directory looks like an Ansible project root
-                    if check_directory_for_project(item):
-                        projects.append(str(item))
+                        # Check if this directory looks like an Ansible project root
+                        if check_directory_for_project(listing):
+                            projects.append(str(listing.path))
 
         except Exception as e:
             self.logger.warning(f"Error discovering projects in {root_dir}: {e}")
@@ -401,68 +496,7 @@ class BatchProcessor:
             )
 
         start_time = time.time()
-        project_results = []
-        completed_count = 0
-
-        def process_single_project(project_path: str) -> ConversionResult:
-            """Process a single project and return result."""
-            try:
-                return self._process_project_directory(project_path, dry_run)
-            except Exception as e:
-                self.logger.error(f"Failed to process project {project_path}: {e}")
-                return ConversionResult(
-                    success=False,
-                    file_path=project_path,
-                    changes_made=0,
-                    errors=[str(e)],
-                    warnings=[],
-                    original_content="",
-                    processing_time=0.0,
-                )
-
-        # Process projects in parallel or sequentially
-        if self.max_workers == 1:
-            # Sequential processing
-            for project in projects:
-                result = process_single_project(project)
-                project_results.append(result)
-                completed_count += 1
-
-                if self.progress_callback:
-                    self.progress_callback(completed_count, len(projects), project)
-
-                if not continue_on_error and not result.success:
-                    break
-        else:
-            # Parallel processing
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_project = {
-                    executor.submit(process_single_project, project): project
-                    for project in projects
-                }
-
-                for future in as_completed(future_to_project):
-                    project = future_to_project[future]
-                    try:
-                        result = future.result()
-                        project_results.append(result)
-                        completed_count += 1
-
-                        if self.progress_callback:
-                            self.progress_callback(
-                                completed_count, len(projects), project
-                            )
-
-                        if not continue_on_error and not result.success:
-                            # Cancel remaining futures
-                            for remaining_future in future_to_project:
-                                remaining_future.cancel()
-                            break
-
-                    except Exception as e:
-                        self.logger.error(f"Unexpected error processing {project}: {e}")
-                        if not continue_on_error:
-                            break
+        project_results = list(self.iter_results(projects, dry_run, continue_on_error))
 
         # Calculate statistics
         execution_time = time.time() - start_time
@@ -495,6 +529,7 @@ class BatchProcessor:
             total_modules_converted=total_modules_converted,
             success_rate=success_rate,
             average_processing_time=average_processing_time,
+            metrics=_total_metrics(project_results),
         )
 
         # Store for reporting
@@ -553,68 +588,7 @@ class BatchProcessor:
             )
 
         start_time = time.time()
-        project_results = []
-        completed_count = 0
-
-        def process_single_project(project_path: str) -> ConversionResult:
-            """Process a single project and return result."""
-            try:
-                return self._process_project_directory(project_path, dry_run)
-            except Exception as e:
-                self.logger.error(f"Failed to process project {project_path}: {e}")
-                return ConversionResult(
-                    success=False,
-                    file_path=project_path,
-                    changes_made=0,
-                    errors=[str(e)],
-                    warnings=[],
-                    original_content="",
-                    processing_time=0.0,
-                )
-
-        # Process projects in parallel or sequentially
-        if self.max_workers == 1:
-            # Sequential processing
-            for project in projects:
-                result = process_single_project(project)
-                project_results.append(result)
-                completed_count += 1
-
-                if self.progress_callback:
-                    self.progress_callback(completed_count, len(projects), project)
-
-                if not continue_on_error and not result.success:
-                    break
-        else:
-            # Parallel processing
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_project = {
-                    executor.submit(process_single_project, project): project
-                    for project in projects
-                }
-
-                for future in as_completed(future_to_project):
-                    project = future_to_project[future]
-                    try:
-                        result = future.result()
-                        project_results.append(result)
-                        completed_count += 1
-
-                        if self.progress_callback:
-                            self.progress_callback(
-                                completed_count, len(projects), project
-                            )
-
-                        if not continue_on_error and not result.success:
-                            # Cancel remaining futures
-                            for remaining_future in future_to_project:
-                                remaining_future.cancel()
-                            break
-
-                    except Exception as e:
-                        self.logger.error(f"Unexpected error processing {project}: {e}")
-                        if not continue_on_error:
-                            break
+        project_results = list(self.iter_results(projects, dry_run, continue_on_error))
 
         # Calculate statistics
         execution_time = time.time() - start_time
@@ -647,12 +621,202 @@ class BatchProcessor:
             total_modules_converted=total_modules_converted,
             success_rate=success_rate,
             average_processing_time=average_processing_time,
+            metrics=_total_metrics(project_results),
         )
 
         # Store for reporting
         self._last_batch_result = batch_result
         return batch_result
 
+    def iter_results(
+        self, projects: List[str], dry_run: bool = False, continue_on_error: bool = True
+    ) -> Iterator[ConversionResult]:
+        """
+        Process projects and yield each project result as soon as it finishes.
+
+        Streaming counterpart of process_projects: nothing is collected, so
+        callers can report progress or write reports while the batch runs and
+        memory does not grow with the number of projects. Project results
+        never carry file bodies.
+
+        Args:
+            projects: List of project directory paths to process
+            dry_run: If True, perform conversion preview without making changes
+            continue_on_error: If True, continue processing other projects
+                             when individual projects fail
+
+        Yields:
+            ConversionResult per project, in completion order
+
+        Example:
+            >>> for result in processor.iter_results(projects, dry_run=True):
+            ...     print(f"{result.file_path}: {result.changes_made} modules")
+        """
+        if self.metrics is not None:
+            self.metrics.start(self.max_workers)
+
+        # Finish the metrics even when the consumer stops early
+        try:
+            # Schedule files across worker processes or threads, or go sequentially
+            if self.executor == "process" or self.max_workers > 1:
+                yield from self._iter_projects_by_file(
+                    projects, dry_run, continue_on_error
+                )
+            else:
+                for completed, project in enumerate(projects, 1):
+                    result = self._process_single_project(project, dry_run)
+                    if self.progress_callback:
+                        self.progress_callback(completed, len(projects), project)
+                    if self.metrics is not None:
+                        self.metrics(completed, len(projects), project)
+
+                    yield result
+
+                    if not continue_on_error and not result.success:
+                        break
+        finally:
+            if self.metrics is not None:
+                self.metrics.finish()
+
+    def _process_single_project(
+        self, project_path: str, dry_run: bool
+    ) -> ConversionResult:
+        """Process a single project, turning failures into a failed result."""
+        try:
+            return self._process_project_directory(project_path, dry_run)
+        except Exception as e:
+            self.logger.error(f"Failed to process project {project_path}: {e}")
+            return ConversionResult(
+                success=False,
+                file_path=project_path,
+                changes_made=0,
+                errors=[str(e)],
+                warnings=[],
+                original_content="",
+                processing_time=0.0,
+            )
+
+    def _iter_projects_by_file(
+        self, projects: List[str], dry_run: bool, continue_on_error: bool
+    ) -> Iterator[ConversionResult]:
+        """
+        Convert the files of all projects as one largest-first work queue.
+
+        Files from every project are flattened into a single queue, so one
+        large project is spread across all workers instead of pinning one.
+        File records are rolled back up into one result per project, which
+        is yielded as soon as its last file completes.
+        """
+        completed = 0
+        project_files: Dict[str, List[str]] = {}
+
+        # Projects without files are resolved here; the rest are scheduled
+        for project in projects:
+            project_dir = Path(project)
+            files = []
+            if project_dir.exists():
+                files = [
+                    str(path) for path in iter_files(project_dir, PROJECT_RULES)
+                ]
+
+            if files:
+                project_files[project] = files
+            else:
+                completed += 1
+                self._report_progress(completed, len(projects), project)
+                result = self._process_project_directory(project, dry_run)
+                yield result
+
+                # Stop before any files are scheduled, as the sequential path does
+                if not continue_on_error and not result.success:
+                    return
+
+        work = ProjectFiles(project_files)
+        all_files = largest_first(work.files)
+        if self.metrics is not None:
+            self.metrics.enqueue(len(all_files))
+        if self.executor == "process":
+            file_records = iter_file_records(
+                all_files,
+                dry_run=dry_run,
+                max_workers=self.max_workers,
+                config_path=self.config_path,
+            )
+        else:
+            file_records = iter_thread_records(
+                self.converter, all_files, dry_run=dry_run, max_workers=self.max_workers
+            )
+        if self.metrics is not None:
+            file_records = self._observe_files(file_records)
+        try:
+            for project, project_records in work.collect(file_records):
+                result = self._project_result_from_records(project, project_records)
+                completed += 1
+                self._report_progress(completed, len(projects), project)
+
+                yield result
+
+                if not continue_on_error and not result.success:
+                    break
+        finally:
+            file_records.close()
+
+    def _observe_files(
+        self, file_records: Iterator[FileRecord]
+    ) -> Iterator[FileRecord]:
+        """Report every file record to the batch metrics as it arrives."""
+        try:
+            for record in file_records:
+                self.metrics.observe_file(record)
+                yield record
+        finally:
+            file_records.close()
+
+    def _report_progress(self, completed: int, total: int, project: str) -> None:
+        """Call the progress callback without letting it abort the batch."""
+        if self.metrics is not None:
+            self.metrics(completed, total, project)
+        if not self.progress_callback:
+            return
+
+        try:
+            self.progress_callback(completed, total, project)
+        except Exception as e:
+            self.logger.error(f"Unexpected error processing {project}: {e}")
+
+    def _project_result_from_records(
+        self, project_path: str, records: List[FileRecord]
+    ) -> ConversionResult:
+        """Aggregate worker file records into a project ConversionResult."""
+        all_errors = []
+        all_warnings = []
+        files_processed = 0
+
+        for record in records:
+            if record.exception is not None:
+                error_msg = f"Failed to process {record.file_path}: {record.exception}"
+                all_errors.append(error_msg)
+                self.logger.warning(error_msg)
+                continue
+
+            all_errors.extend(record.errors)
+            all_warnings.extend(record.warnings)
+            files_processed += 1
+
+        result = ConversionResult(
+            success=len(all_errors) == 0,
+            file_path=project_path,
+            changes_made=sum(record.changes_made for record in records),
+            errors=all_errors,
+            warnings=all_warnings,
+            original_content="",
+            processing_time=sum(record.processing_time for record in records),
+            metrics=_total_metrics(records),
+        )
+        # Add files_processed as a custom attribute
+        result.files_processed = files_processed
+        return result
+
     def _process_project_directory(
         self, project_path: str, dry_run: bool = False
     ) -> ConversionResult:
@@ -678,9 +842,7 @@ class BatchProcessor:
         all_warnings = []
 
         # Find all Ansible files in the project
-        ansible_files = []
-        for pattern in ["*.yml", "*.yaml"]:
-            ansible_files.extend(project_dir.rglob(pattern))
+        ansible_files = list(iter_files(project_dir, PROJECT_RULES))
 
         if not ansible_files:
             result = ConversionResult(
@@ -698,6 +860,9 @@ class BatchProcessor:
 
         # Process each file
         files_processed = 0
+        totals = ConversionMetrics()
+        if self.metrics is not None:
+            self.metrics.enqueue(len(ansible_files))
         for file_path in ansible_files:
             try:
                 if dry_run:
@@ -714,11 +879,16 @@ class BatchProcessor:
                     all_errors.extend(result.errors)
                     all_warnings.extend(result.warnings)
                     files_processed += 1
+                _add_metrics(totals, result)
+                if self.metrics is not None:
+                    self.metrics.observe_file(result)
 
             except Exception as e:
                 error_msg = f"Failed to process {file_path}: {e}"
                 all_errors.append(error_msg)
                 self.logger.warning(error_msg)
+                if self.metrics is not None:
+                    self.metrics.observe_error()
 
         processing_time = time.time() - start_time
         success = len(all_errors) == 0
@@ -731,6 +901,7 @@ class BatchProcessor:
             warnings=all_warnings,
             original_content="",
             processing_time=processing_time,
+            metrics=totals,
         )
         # Add files_processed as a custom attribute
         result.files_processed = files_processed
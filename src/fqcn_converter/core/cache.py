@@ -0,0 +1,305 @@
+"""
+On-disk result cache for FQCN conversion and validation.
+
+Results are stored as small JSON files keyed by the SHA-256 of the file
+content, a fingerprint of the mapping set and the tool version, so a file
+whose content has not changed since the last run skips parsing entirely.
+The cache is bounded in size: the least recently used entries are evicted
+once the total size exceeds the configured limit.
+
+Cache failures never fail a conversion or validation; they are logged and
+treated as misses.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .._version import __version__
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Default size bound of the cache directory
+DEFAULT_MAX_CACHE_SIZE = 256 * 1024 * 1024
+
+# Eviction trims the cache to this fraction of the limit to avoid evicting on every write
+EVICTION_TARGET_RATIO = 0.9
+
+# Kinds of cached results, one subdirectory each
+CACHE_KINDS = ("convert", "validate")
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the default cache directory.
+
+    Uses ``$XDG_CACHE_HOME/fqcn-converter`` when set, otherwise
+    ``~/.cache/fqcn-converter``.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return Path(base).expanduser() / "fqcn-converter"
+
+
+def mapping_fingerprint(mappings: Mapping[str, str], *extra: str) -> str:
+    """
+    Compute a stable fingerprint of a mapping set.
+
+    Args:
+        mappings: Short name to FQCN mappings
+        *extra: Additional settings that change results (e.g. engine name)
+
+    Returns:
+        Hex digest identifying the mapping set and settings
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(sorted(mappings.items())).encode("utf-8"))
+    for value in extra:
+        digest.update(b"\0" + value.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """
+    Statistics of a result cache.
+
+    Attributes:
+        cache_dir: Directory holding the cache
+        entries: Number of cached results per kind
+        size_bytes: Total size of all cached results
+        max_size_bytes: Size bound of the cache
+        hits: Lookups served from the cache by this instance
+        misses: Lookups not found by this instance
+    """
+
+    cache_dir: str
+    entries: Dict[str, int] = field(default_factory=dict)
+    size_bytes: int = 0
+    max_size_bytes: int = DEFAULT_MAX_CACHE_SIZE
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def total_entries(self) -> int:
+        """Total number of cached results."""
+        return sum(self.entries.values())
+
+
+class ResultCache:
+    """
+    Size-bounded, content-addressed cache of conversion and validation results.
+
+    Entries live at ``<cache_dir>/<kind>/<key[:2]>/<key>.json``. A hit refreshes
+    the entry's modification time, which serves as the LRU clock for eviction.
+    Writes go through a temporary file and ``os.replace`` so concurrent
+    processes never read partial entries.
+
+    Example:
+        >>> cache = ResultCache("~/.cache/fqcn-converter")
+        >>> converter = FQCNConverter(cache=cache)
+        >>> converter.convert_file("site.yml", dry_run=True)  # parses
+        >>> converter.convert_file("site.yml", dry_run=True)  # cache hit
+        >>> cache.stats().hits
+        1
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_size_bytes: int = DEFAULT_MAX_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize cache in a directory.
+
+        Args:
+            cache_dir: Cache directory; defaults to default_cache_dir()
+            max_size_bytes: Total size above which LRU entries are evicted
+        """
+        self.cache_dir = (
+            Path(cache_dir).expanduser() if cache_dir else default_cache_dir()
+        )
+        self.max_size_bytes = max(0, max_size_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._size_bytes: Optional[int] = None
+        # Converters and validators holding the cache are shared by threads
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(content: str, fingerprint: str) -> str:
+        """
+        Build the cache key of a file content.
+
+        Args:
+            content: File content
+            fingerprint: Fingerprint of the mappings and settings in use
+
+        Returns:
+            Hex digest of (content hash, fingerprint, tool version)
+        """
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        key = f"{content_hash}\0{fingerprint}\0{__version__}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Args:
+            kind: Result kind ("convert" or "validate")
+            key: Key from make_key()
+
+        Returns:
+            Cached payload, or None on a miss
+        """
+        path = self._entry_path(kind, key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return payload
+
+    def _count(self, hit: bool) -> None:
+        """Count a lookup as a hit or a miss."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def put(self, kind: str, key: str, payload: Dict[str, Any]) -> None:
+        """
+        Store a result, evicting least recently used entries if needed.
+
+        Args:
+            kind: Result kind ("convert" or "validate")
+            key: Key from make_key()
+            payload: JSON-serializable result
+        """
+        path = self._entry_path(kind, key)
+        try:
+            data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                with self._lock:
+                    # An overwritten entry no longer counts towards the size
+                    try:
+                        replaced = path.stat().st_size
+                    except OSError:
+                        replaced = 0
+                    os.replace(tmp_path, path)
+                    if self._size_bytes is not None:
+                        self._size_bytes += len(data) - replaced
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to write cache entry {path}: {e}")
+            return
+
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(size for _, size, _ in self._scan())
+
+            if self._size_bytes > self.max_size_bytes:
+                self._evict()
+
+    def stats(self) -> CacheStats:
+        """
+        Collect entry counts and size of the cache.
+
+        Returns:
+            CacheStats for the cache directory
+        """
+        entries = {kind: 0 for kind in CACHE_KINDS}
+        size_bytes = 0
+        for path, size, _ in self._scan():
+            kind = path.parent.parent.name
+            entries[kind] = entries.get(kind, 0) + 1
+            size_bytes += size
+
+        return CacheStats(
+            cache_dir=str(self.cache_dir),
+            entries=entries,
+            size_bytes=size_bytes,
+            max_size_bytes=self.max_size_bytes,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+    def clear(self) -> int:
+        """
+        Remove all cached results.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = sum(1 for _ in self._scan())
+            for kind in CACHE_KINDS:
+                shutil.rmtree(self.cache_dir / kind, ignore_errors=True)
+            self._size_bytes = 0
+        return removed
+
+    def _entry_path(self, kind: str, key: str) -> Path:
+        """Return the file path of a cache entry."""
+        return self.cache_dir / kind / key[:2] / f"{key}.json"
+
+    def _scan(self) -> Iterator[Tuple[Path, int, float]]:
+        """Yield (path, size, mtime) for every cache entry."""
+        for kind in CACHE_KINDS:
+            kind_dir = self.cache_dir / kind
+            if not kind_dir.is_dir():
+                continue
+            for entry in kind_dir.glob("*/*.json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                yield entry, stat.st_size, stat.st_mtime
+
+    def _evict(self) -> None:
+        """
+        Delete least recently used entries down to the eviction target.
+
+        Called with the lock held.
+        """
+        entries: List[Tuple[Path, int, float]] = sorted(
+            self._scan(), key=lambda entry: entry[2]
+        )
+        size_bytes = sum(size for _, size, _ in entries)
+        target = int(self.max_size_bytes * EVICTION_TARGET_RATIO)
+
+        evicted = 0
+        for path, size, _ in entries:
+            if size_bytes <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size_bytes -= size
+            evicted += 1
+
+        self._size_bytes = size_bytes
+        logger.debug(f"Evicted {evicted} cache entries from {self.cache_dir}")
@@ -0,0 +1,385 @@
+"""
+Change detection for incremental FQCN conversion and validation.
+
+Two sources of "touched" files are supported so routine runs only process
+what changed instead of rescanning whole repositories:
+
+- git: files reported by ``git diff --name-only`` against a ref (or the
+  index, for pre-commit hooks), plus untracked files
+- manifest: a persisted JSON record of each file's modification time and
+  size from the last successful run
+
+Discovery still walks the requested paths; the change set is applied as a
+filter on top of it, so exclude patterns and Ansible file detection keep
+working unchanged.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .._version import __version__
+from ..exceptions import FileAccessError, FQCNConverterError
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Only added, copied, modified and renamed files need processing
+GIT_DIFF_FILTER = "ACMR"
+
+# Default manifest location for --incremental, relative to the working directory
+DEFAULT_MANIFEST = ".fqcn-manifest.json"
+
+# Bumped when the manifest layout changes; older manifests are discarded
+MANIFEST_VERSION = 1
+
+YAML_SUFFIXES = (".yml", ".yaml")
+
+
+def _run_git(args: Sequence[str], cwd: Optional[Union[str, Path]] = None) -> str:
+    """Run a git command and return its stdout."""
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=str(cwd) if cwd else None,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except FileNotFoundError as e:
+        raise FQCNConverterError(
+            "git executable not found",
+            details=str(e),
+            suggestions=["Install git or use --incremental instead of --since"],
+        )
+    except subprocess.CalledProcessError as e:
+        raise FQCNConverterError(
+            f"git {' '.join(args)} failed",
+            details=(e.stderr or "").strip(),
+            suggestions=[
+                "Run inside a git working tree",
+                "Check that the ref exists (e.g. 'git fetch origin main')",
+            ],
+        )
+    return completed.stdout
+
+
+def resolve_commit(ref: str, cwd: Optional[Union[str, Path]] = None) -> str:
+    """
+    Resolve a user-supplied ref to a commit SHA.
+
+    Args:
+        ref: Branch, tag, SHA or other revision expression
+        cwd: Directory inside the git working tree
+
+    Returns:
+        Full SHA of the commit the ref points to
+
+    Raises:
+        FQCNConverterError: If the ref looks like an option or is unknown
+    """
+    if not ref or ref.startswith("-"):
+        raise FQCNConverterError(
+            f"Invalid git ref: {ref!r}",
+            suggestions=["Pass a branch, tag or commit, e.g. --since origin/main"],
+        )
+    verify_args = ["rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"]
+    return _run_git(verify_args, cwd).strip()
+
+
+def git_changed_files(
+    since: Optional[str] = None,
+    cwd: Optional[Union[str, Path]] = None,
+    staged: bool = False,
+    yaml_only: bool = True,
+) -> List[Path]:
+    """
+    List files touched relative to a git ref or the index.
+
+    Args:
+        since: Ref to diff the working tree against; defaults to HEAD
+        cwd: Directory inside the git working tree
+        staged: If True, list staged files only (``git diff --cached``),
+            as a pre-commit hook needs
+        yaml_only: If True, keep only .yml/.yaml files
+
+    Returns:
+        Absolute paths of existing changed files, sorted
+
+    Raises:
+        FQCNConverterError: If git is unavailable or the ref is unknown
+
+    Example:
+        >>> git_changed_files("origin/main")
+        [PosixPath('/repo/roles/web/tasks/main.yml')]
+    """
+    toplevel = Path(_run_git(["rev-parse", "--show-toplevel"], cwd).strip())
+
+    # -z keeps git from quoting paths with non-ASCII characters
+    diff_args = ["diff", "--name-only", "-z", f"--diff-filter={GIT_DIFF_FILTER}"]
+    if staged:
+        names = _run_git([*diff_args, "--cached"], cwd).split("\0")
+    else:
+        commit = resolve_commit(since or "HEAD", cwd)
+        names = _run_git([*diff_args, commit, "--"], cwd).split("\0")
+        names += _run_git(
+            ["ls-files", "-z", "--others", "--exclude-standard", "--full-name"],
+            toplevel,
+        ).split("\0")
+
+    changed = set()
+    for name in names:
+        if not name or (yaml_only and not name.endswith(YAML_SUFFIXES)):
+            continue
+        path = toplevel / name
+        if path.is_file():
+            changed.add(path.resolve())
+
+    source = "staged" if staged else f"since {since or 'HEAD'}"
+    logger.debug(f"git reports {len(changed)} changed files ({source})")
+    return sorted(changed)
+
+
+def filter_changed(files: Iterable[Path], changed: Iterable[Path]) -> List[Path]:
+    """
+    Keep only the discovered files that are in a change set.
+
+    Args:
+        files: Discovered files, in any form (relative or absolute)
+        changed: Changed files as absolute paths
+
+    Returns:
+        Files from ``files`` whose resolved path is in ``changed``, in order
+    """
+    changed_set = {Path(path).resolve() for path in changed}
+    return [path for path in files if Path(path).resolve() in changed_set]
+
+
+def common_directory(paths: Iterable[Union[str, Path]]) -> Optional[Path]:
+    """
+    Return the deepest directory containing all given paths.
+
+    Args:
+        paths: Files or directories
+
+    Returns:
+        Common parent directory, or None when no paths are given
+    """
+    directories = []
+    for path in paths:
+        resolved = Path(path).resolve()
+        directories.append(resolved if resolved.is_dir() else resolved.parent)
+    if not directories:
+        return None
+    try:
+        return Path(os.path.commonpath(directories))
+    except ValueError:
+        # Paths on different drives have no common parent
+        return directories[0]
+
+
+def settings_fingerprint(config_path: Optional[Union[str, Path]] = None) -> str:
+    """
+    Fingerprint the settings that change conversion results.
+
+    Covers the tool version and the content of a custom mapping file, so a
+    manifest recorded with other mappings is not trusted.
+
+    Args:
+        config_path: Optional path to a custom mapping configuration
+
+    Returns:
+        Hex digest of the settings
+    """
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    if config_path:
+        try:
+            digest.update(Path(config_path).read_bytes())
+        except OSError:
+            digest.update(str(config_path).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class FileManifest:
+    """
+    Persisted modification time and size of files from previous runs.
+
+    Each command keeps its own scope in the manifest file, so converting a
+    file does not mark it as validated. A scope recorded with a different
+    settings fingerprint is discarded.
+
+    Example:
+        >>> manifest = FileManifest(".fqcn-manifest.json", scope="validate")
+        >>> todo = manifest.changed(files)
+        >>> for path in todo:
+        ...     if validate(path).valid:
+        ...         manifest.record(path)
+        >>> manifest.save()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_MANIFEST,
+        scope: str = "convert",
+        fingerprint: str = "",
+    ) -> None:
+        """
+        Load a manifest scope.
+
+        Args:
+            path: Manifest file; a missing or unreadable file starts empty
+            scope: Name of the command owning the recorded entries
+            fingerprint: Settings fingerprint the entries are valid for
+        """
+        self.path = Path(path)
+        self.scope = scope
+        self.fingerprint = fingerprint
+        self._scopes: Dict[str, Dict[str, object]] = {}
+        self._entries: Dict[str, Tuple[int, int]] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        """Return the number of recorded files in this scope."""
+        return len(self._entries)
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of a file, or None if it cannot be stat-ed."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def is_changed(self, file_path: Union[str, Path]) -> bool:
+        """Return True if a file differs from its recorded state."""
+        path = Path(file_path).resolve()
+        recorded = self._entries.get(str(path))
+        return recorded is None or self._stat(path) != recorded
+
+    def changed(self, files: Iterable[Path]) -> List[Path]:
+        """
+        Keep only files that are new or changed since they were recorded.
+
+        Args:
+            files: Discovered files
+
+        Returns:
+            Files that need processing, in input order
+        """
+        return [path for path in files if self.is_changed(path)]
+
+    def record(self, file_path: Union[str, Path]) -> None:
+        """
+        Record the current state of a file as processed.
+
+        Call this after the file was written, so the recorded modification
+        time is that of the final content.
+        """
+        path = Path(file_path).resolve()
+        state = self._stat(path)
+        if state is not None:
+            self._entries[str(path)] = state
+
+    def forget(self, file_path: Union[str, Path]) -> None:
+        """Drop a file so it is processed again on the next run."""
+        self._entries.pop(str(Path(file_path).resolve()), None)
+
+    def save(self) -> None:
+        """
+        Write the manifest atomically.
+
+        Raises:
+            FileAccessError: If the manifest cannot be written
+        """
+        self._scopes[self.scope] = {
+            "fingerprint": self.fingerprint,
+            "files": {path: list(state) for path, state in self._entries.items()},
+        }
+        data = {"version": MANIFEST_VERSION, "scopes": self._scopes}
+
+        directory = self.path.parent
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            raise FileAccessError(
+                f"Cannot write manifest: {self.path}",
+                file_path=str(self.path),
+                operation="write",
+                os_error=e,
+            )
+
+    def _load(self) -> None:
+        """Read the manifest file, ignoring missing or outdated manifests."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+            return
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            logger.info(f"Ignoring outdated manifest {self.path}")
+            return
+
+        self._scopes = data.get("scopes") or {}
+        scope = self._scopes.get(self.scope) or {}
+        if scope.get("fingerprint") != self.fingerprint:
+            logger.info(
+                f"Settings changed since {self.path} was recorded; "
+                f"processing all files"
+            )
+            return
+
+        self._entries = {
+            path: (int(state[0]), int(state[1]))
+            for path, state in (scope.get("files") or {}).items()
+        }
+
+
+def select_changed_files(
+    files: List[Path],
+    since: Optional[str] = None,
+    manifest: Optional[FileManifest] = None,
+    cwd: Optional[Union[str, Path]] = None,
+) -> List[Path]:
+    """
+    Narrow discovered files down to the ones touched since the last run.
+
+    Args:
+        files: Discovered files
+        since: Git ref to diff against, if any
+        manifest: Manifest to compare against, if any
+        cwd: Directory inside the git working tree to diff; defaults to
+            the common parent of ``files``
+
+    Returns:
+        Files changed according to every given source; all files when
+        neither source is given
+    """
+    selected = files
+    if since is not None and selected:
+        if cwd is None:
+            cwd = common_directory(selected)
+        selected = filter_changed(selected, git_changed_files(since, cwd=cwd))
+    if manifest is not None:
+        selected = manifest.changed(selected)
+
+    skipped = len(files) - len(selected)
+    if skipped:
+        logger.info(f"Skipping {skipped} unchanged files")
+    return selected
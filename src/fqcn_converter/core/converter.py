@@ -6,13 +6,28 @@ for converting Ansible playbooks from short module names to fully qualified
 collection names (FQCNs).
 """
 
+import difflib
 import re
-from dataclasses import dataclass, field
+import time
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Pattern, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import yaml
 
+from ..config.index import load_mapping_index
 from ..config.manager import ConfigurationManager
 from ..exceptions import (
     ConfigurationError,
@@ -20,7 +35,15 @@ from ..exceptions import (
     FileAccessError,
     YAMLParsingError,
 )
-from ..utils.logging import get_logger
+from ..utils.logging import DebugAggregator, get_logger
+from ..utils.profiling import phase
+from .backups import BackupRun
+from .cache import ResultCache, mapping_fingerprint
+from .document import ParsedDocument, as_document
+from .matcher import ModuleMatcher
+from .reader import SizePolicy
+from .rewriter import ANSIBLE_DIRECTIVES, SpanMismatchError, StreamRewriter, splice
+from .writer import FileWriter, WriteFailure
 
 logger = get_logger(__name__)
 
@@ -32,6 +55,82 @@ FQCN_PATTERN = re.compile(
     r"^[a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*$"
 )
 
+# Available conversion engines: single-pass node marks or line heuristics
+CONVERSION_ENGINES = ("stream", "line")
+
+# How much file content a result keeps: nothing, a unified diff, or both bodies
+RETAIN_CONTENT_MODES = ("none", "diff", "full")
+
+# Phases timed for every converted file, in pipeline order
+METRIC_PHASES = ("read", "parse", "locate", "rewrite", "write")
+
+
+@dataclass
+class ConversionMetrics:
+    """
+    Per-phase timings and counters of one or more file conversions.
+
+    A result's metrics cover its own file; BatchResult and project results
+    hold the sum over their files. Phases a conversion did not go through,
+    such as reading for convert_content or all of them on a cache hit,
+    stay at zero.
+
+    Attributes:
+        files: Number of files the metrics cover
+        read_time: Seconds spent reading files
+        parse_time: Seconds spent parsing YAML
+        locate_time: Seconds spent locating module keys in the parsed tasks
+        rewrite_time: Seconds spent rewriting the content
+        write_time: Seconds spent writing backups and converted files; only
+                   the time to queue the write when the writer writes behind
+        bytes_read: Size of the converted content in bytes (UTF-8)
+        bytes_written: Bytes of converted content written to disk
+        tasks: Number of tasks scanned for modules (stream engine only)
+
+    Example:
+        >>> metrics = converter.convert_file("site.yml").metrics
+        >>> print(f"{metrics.bytes_read} bytes, parsed in {metrics.parse_time:.3f}s")
+    """
+
+    files: int = 0
+    read_time: float = 0.0
+    parse_time: float = 0.0
+    locate_time: float = 0.0
+    rewrite_time: float = 0.0
+    write_time: float = 0.0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    tasks: int = 0
+
+    @property
+    def phase_times(self) -> Dict[str, float]:
+        """Seconds spent per phase, keyed by METRIC_PHASES names."""
+        return {name: getattr(self, f"{name}_time") for name in METRIC_PHASES}
+
+    def add(self, other: "ConversionMetrics") -> "ConversionMetrics":
+        """Add the timings and counters of other to these metrics in place."""
+        for name, value in asdict(other).items():
+            setattr(self, name, getattr(self, name) + value)
+        return self
+
+    def throughput(self, elapsed: float) -> Tuple[float, float]:
+        """
+        Return the files per second and MB per second over a wall time.
+
+        Args:
+            elapsed: Wall time in seconds the conversions took
+
+        Returns:
+            Tuple of (files_per_second, megabytes_per_second)
+        """
+        if elapsed <= 0:
+            return 0.0, 0.0
+        return self.files / elapsed, self.bytes_read / (1024 * 1024) / elapsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+
 
 @dataclass
 class ConversionResult:
@@ -52,6 +151,8 @@ class ConversionResult:
         converted_content: File content after conversion (optional)
         processing_time: Time taken for the conversion operation in seconds
         backup_path: Path to backup file if one was created (optional)
+        diff: Unified diff of the conversion, kept when retain_content="diff"
+        metrics: Per-phase timings, byte counts and task counts
 
     Example:
         >>> result = converter.convert_file("playbook.yml")
@@ -70,6 +171,130 @@ class ConversionResult:
     converted_content: Optional[str] = None
     processing_time: float = 0.0
     backup_path: Optional[str] = None
+    diff: Optional[str] = None
+    metrics: ConversionMetrics = field(default_factory=ConversionMetrics)
+
+    def without_content(self) -> "ConversionResult":
+        """Drop the file bodies so long runs do not hold every file in memory."""
+        self.original_content = None
+        self.converted_content = None
+        return self
+
+    def unified_diff(self) -> str:
+        """Return a unified diff from the original to the converted content."""
+        if self.original_content is None or self.converted_content is None:
+            return self.diff or ""
+
+        return "".join(
+            difflib.unified_diff(
+                self.original_content.splitlines(keepends=True),
+                self.converted_content.splitlines(keepends=True),
+                fromfile=f"a/{self.file_path}",
+                tofile=f"b/{self.file_path}",
+            )
+        )
+
+    def retain(self, retain_content: str) -> "ConversionResult":
+        """Keep only the content allowed by a RETAIN_CONTENT_MODES value."""
+        _check_retain_content(retain_content)
+        if retain_content == "diff":
+            self.diff = self.unified_diff()
+        if retain_content != "full":
+            self.without_content()
+        return self
+
+    def compact(self, retain_content: str = "none") -> "ResultRecord":
+        """Return a slotted ResultRecord keeping only the requested content."""
+        self.retain(retain_content)
+        return ResultRecord(
+            success=self.success,
+            file_path=self.file_path,
+            changes_made=self.changes_made,
+            errors=self.errors,
+            warnings=self.warnings,
+            processing_time=self.processing_time,
+            backup_path=self.backup_path,
+            diff=self.diff,
+            original_content=self.original_content,
+            converted_content=self.converted_content,
+            metrics=self.metrics,
+        )
+
+
+class ResultRecord:
+    """
+    Compact record of a conversion result for long-running batches.
+
+    Holds the same fields as ConversionResult in ``__slots__`` with errors
+    and warnings as tuples, so a record without content costs a few hundred
+    bytes instead of a dictionary plus two copies of the file.
+
+    Example:
+        >>> records = [r.compact() for r in results]
+        >>> changed = [r.file_path for r in records if r.changes_made]
+    """
+
+    __slots__ = (
+        "success",
+        "file_path",
+        "changes_made",
+        "errors",
+        "warnings",
+        "processing_time",
+        "backup_path",
+        "diff",
+        "original_content",
+        "converted_content",
+        "metrics",
+    )
+
+    def __init__(
+        self,
+        success: bool,
+        file_path: str,
+        changes_made: int,
+        errors: Sequence[str] = (),
+        warnings: Sequence[str] = (),
+        processing_time: float = 0.0,
+        backup_path: Optional[str] = None,
+        diff: Optional[str] = None,
+        original_content: Optional[str] = None,
+        converted_content: Optional[str] = None,
+        metrics: Optional[ConversionMetrics] = None,
+    ) -> None:
+        self.success = success
+        self.file_path = file_path
+        self.changes_made = changes_made
+        self.errors: Tuple[str, ...] = tuple(errors)
+        self.warnings: Tuple[str, ...] = tuple(warnings)
+        self.processing_time = processing_time
+        self.backup_path = backup_path
+        self.diff = diff
+        self.original_content = original_content
+        self.converted_content = converted_content
+        self.metrics = metrics if metrics is not None else ConversionMetrics()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ResultRecord):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ResultRecord(success={self.success!r}, file_path={self.file_path!r}, "
+            f"changes_made={self.changes_made!r})"
+        )
+
+
+def _check_retain_content(retain_content: str) -> None:
+    """Raise ConfigurationError for an unknown content retention mode."""
+    if retain_content not in RETAIN_CONTENT_MODES:
+        raise ConfigurationError(
+            f"Unknown content retention mode: {retain_content}",
+            details=f"Available modes: {', '.join(RETAIN_CONTENT_MODES)}",
+        )
 
 
 class FQCNConverter:
@@ -110,6 +335,13 @@ class FQCNConverter:
         custom_mappings: Optional[Dict[str, str]] = None,
         create_backups: bool = True,
         backup_suffix: str = ".fqcn_backup",
+        engine: str = "stream",
+        cache: Optional[ResultCache] = None,
+        retain_content: str = "none",
+        max_file_size: Optional[int] = None,
+        large_files: str = "skip",
+        writer: Optional[FileWriter] = None,
+        backups: Optional[BackupRun] = None,
     ) -> None:
         """
         Initialize converter with configuration and settings.
@@ -127,6 +359,30 @@ class FQCNConverter:
             create_backups: Whether to create backup files before conversion.
                           Defaults to True for safety.
             backup_suffix: Suffix to append to backup files. Defaults to ".fqcn_backup".
+            engine: Conversion engine to use. "stream" (default) rewrites module
+                   keys at their exact positions in a single pass; "line" uses the
+                   line-based heuristics. The stream engine falls back to the line
+                   engine when it cannot map a key to its source text.
+            cache: Optional on-disk result cache. convert_file looks results up
+                  by file content and mapping fingerprint and skips parsing on
+                  a hit.
+            retain_content: Content convert_file keeps on results once the
+                           file has been written: "none" (default), "diff"
+                           for a unified diff, or "full" for both bodies.
+                           Dry-run results always keep their content.
+            max_file_size: Size in bytes above which convert_file applies the
+                          large_files policy; None (default) reads every file
+            large_files: Policy for files above max_file_size: "skip" (default)
+                        leaves them unread, "stream" reads only files whose
+                        memory-mapped bytes contain a convertible module key,
+                        "process" converts them normally
+            writer: Writer used by convert_file. Defaults to a FileWriter
+                   replacing files atomically without fsync; pass one with
+                   an fsync policy or write_behind=True, and call flush()
+                   once all files are converted.
+            backups: Run of a BackupStore that convert_file backs each file
+                    up into right before replacing it, so the run can be
+                    rolled back; files without changes are not backed up.
 
         Raises:
             ConfigurationError: If configuration loading fails or contains invalid data.
@@ -145,29 +401,52 @@ class FQCNConverter:
 
             >>> # Disable backups for testing
             >>> converter = FQCNConverter(create_backups=False)
+
+            >>> # Reuse results for unchanged files across runs
+            >>> converter = FQCNConverter(cache=ResultCache(".fqcn_cache"))
+
+            >>> # Only read files over 10 MB that contain short module names
+            >>> converter = FQCNConverter(
+            ...     max_file_size=10 * 1024**2, large_files="stream"
+            ... )
+
+            >>> # Write behind the conversion and sync all files at the end
+            >>> converter = FQCNConverter(
+            ...     writer=FileWriter(fsync="batch", write_behind=True)
+            ... )
+
+            >>> # Back up changed files so the run can be rolled back
+            >>> run = BackupStore(".fqcn_backups").begin_run()
+            >>> converter = FQCNConverter(backups=run)
         """
         self._config_manager = ConfigurationManager()
-        self._mappings: Dict[str, str] = {}
+        self._mappings: Mapping[str, str] = {}
         self._mapping_cache: Dict[str, Optional[str]] = {}  # Cache for frequent lookups
 
-        try:
-            # Load default mappings first
-            self._mappings = self._config_manager.load_default_mappings()
+        if engine not in CONVERSION_ENGINES:
+            raise ConfigurationError(
+                f"Unknown conversion engine: {engine}",
+                details=f"Available engines: {', '.join(CONVERSION_ENGINES)}",
+            )
+        self._engine = engine
+        _check_retain_content(retain_content)
+        self._retain_content = retain_content
+        self._rewriter = StreamRewriter(self._get_fqcn_mapping)
+        self._matcher = ModuleMatcher(self._get_fqcn_mapping)
+        self._cache = cache
+        self._fingerprint = ""
+        self._writer = writer if writer is not None else FileWriter()
+        self._backups = backups
 
-            # Load custom configuration if provided
-            if config_path:
-                custom_config = self._config_manager.load_custom_mappings(
-                    str(config_path)
-                )
-                self._mappings = self._config_manager.merge_mappings(
-                    self._mappings, custom_config
-                )
+        try:
+            # Defaults merged with the config file and custom mappings, shared
+            # with every other component using the same configuration
+            self._mappings = load_mapping_index(
+                config_path, custom_mappings, manager=self._config_manager
+            )
 
-            # Apply custom mappings if provided
-            if custom_mappings:
-                self._mappings = self._config_manager.merge_mappings(
-                    self._mappings, custom_mappings
-                )
+            if self._cache is not None:
+                self._fingerprint = mapping_fingerprint(self._mappings, engine)
 
             logger.info(
                 f"Initialized converter with {len(self._mappings)} module mappings"
@@ -179,6 +458,9 @@ class FQCNConverter:
                 details=f"Config path: {config_path}, Custom mappings: {bool(custom_mappings)}",
             ) from e
 
+        # Only short names are rewritten, so only they make a large file relevant
+        self._size_policy = SizePolicy(max_file_size, large_files, self._mappings)
+
     def _get_fqcn_mapping(self, module_name: str) -> Optional[str]:
         """Get FQCN mapping for a module with caching for performance."""
         if module_name in self._mapping_cache:
@@ -188,8 +470,25 @@ class FQCNConverter:
         self._mapping_cache[module_name] = fqcn
         return fqcn
 
+    def flush(self) -> List[WriteFailure]:
+        """
+        Wait for pending writes of convert_file and make them durable.
+
+        Only needed with a write-behind writer or the "batch" fsync policy;
+        with the default writer every file is on disk when convert_file
+        returns.
+
+        Returns:
+            Files whose write failed after convert_file returned
+        """
+        return self._writer.flush()
+
     def convert_file(
-        self, file_path: Union[str, Path], dry_run: bool = False
+        self,
+        file_path: Union[str, Path],
+        dry_run: bool = False,
+        document: Optional[ParsedDocument] = None,
+        retain_content: Optional[str] = None,
     ) -> ConversionResult:
         """
         Convert a single Ansible file to FQCN format.
@@ -197,6 +496,9 @@ class FQCNConverter:
         Args:
             file_path: Path to the Ansible file to convert
             dry_run: If True, perform conversion without writing changes
+            document: Pre-parsed document of the file; read from disk if None
+            retain_content: Content to keep once the file is on disk;
+                           defaults to the converter's retain_content
 
         Returns:
             ConversionResult with conversion details
@@ -206,34 +508,77 @@ class FQCNConverter:
             ConversionError: If conversion fails
         """
         file_path = Path(file_path)
+        start_time = time.perf_counter()
+        read_time = 0.0
 
         try:
-            # Read file content
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    original_content = f.read()
-            except (IOError, OSError) as e:
-                raise FileAccessError(
-                    f"Cannot read file: {file_path}", details=str(e)
-                ) from e
-
-            # Convert content
-            result = self.convert_content(original_content, file_type="yaml")
+            # Read file content unless the caller already parsed it or the
+            # size policy rules it out
+            if document is None:
+                reason = self._size_policy.check(file_path)
+                if reason is not None:
+                    return ConversionResult(
+                        success=True,
+                        file_path=str(file_path),
+                        changes_made=0,
+                        warnings=[reason],
+                    )
+                document = ParsedDocument.from_file(file_path)
+                read_time = time.perf_counter() - start_time
+
+            # Convert content, or reuse the cached result for unchanged content
+            cache_key = None
+            result = None
+            if self._cache is not None:
+                cache_key = self._cache.make_key(document.content, self._fingerprint)
+                result = self._cached_result(document.content, cache_key)
+
+            if result is None:
+                result = self.convert_content(document, file_type="yaml")
+                if cache_key is not None and result.success:
+                    self._cache_result(cache_key, result)
             result.file_path = str(file_path)
+            metrics = result.metrics
+            metrics.files = 1
+            metrics.read_time = read_time
+            if not metrics.bytes_read:
+                # Cache hits skip convert_content
+                metrics.bytes_read = document.size_bytes
 
             # Write changes if not dry run and conversion was successful
             if not dry_run and result.success and result.changes_made > 0:
                 try:
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(result.converted_content)
+                    write_start = time.perf_counter()
+                    if self._backups is not None:
+                        self._backups.add(file_path, result.converted_content)
+                    metrics.bytes_written = self._writer.write(
+                        file_path, result.converted_content
+                    )
+                    metrics.write_time = time.perf_counter() - write_start
+                    if self._cache is not None:
+                        # The written content is fully converted already
+                        self._cache.put(
+                            "convert",
+                            self._cache.make_key(
+                                result.converted_content, self._fingerprint
+                            ),
+                            {"success": True, "changes_made": 0, "warnings": []},
+                        )
                     logger.info(
-                        f"Successfully converted {file_path} with {result.changes_made} changes"
+                        "Successfully converted %s with %d changes",
+                        file_path,
+                        result.changes_made,
                     )
                 except (IOError, OSError) as e:
                     raise FileAccessError(
                         f"Cannot write file: {file_path}", details=str(e)
                     ) from e
 
+            # The file on disk now holds the final content
+            if not dry_run and result.success:
+                result.retain(retain_content or self._retain_content)
+
+            result.processing_time = time.perf_counter() - start_time
             return result
 
         except (FileAccessError, ConversionError):
@@ -244,91 +589,219 @@ class FQCNConverter:
                 f"Unexpected error converting file: {file_path}", details=str(e)
             ) from e
 
+    def iter_convert(
+        self,
+        paths: Iterable[Union[str, Path]],
+        dry_run: bool = False,
+        retain_content: Optional[str] = None,
+    ) -> Iterator[ResultRecord]:
+        """
+        Convert files one at a time, yielding each result as it finishes.
+
+        Unlike collecting convert_file results in a list, memory stays flat
+        for large runs: each result is yielded as a compact ResultRecord
+        holding only the content allowed by retain_content, also in dry-run
+        mode, and a file that cannot be converted yields a failed record
+        instead of aborting the iteration.
+
+        Args:
+            paths: Paths of the Ansible files to convert; may be a generator
+            dry_run: If True, perform conversion without writing changes
+            retain_content: "none", "diff" or "full"; defaults to the
+                           converter's retain_content
+
+        Yields:
+            ResultRecord for each path, in input order
+
+        Example:
+            >>> for result in converter.iter_convert(find_yaml_files("roles")):
+            ...     print(f"{result.file_path}: {result.changes_made} changes")
+        """
+        retain_content = retain_content or self._retain_content
+        _check_retain_content(retain_content)
+
+        for path in paths:
+            try:
+                result = self.convert_file(
+                    path, dry_run=dry_run, retain_content=retain_content
+                )
+            except (FileAccessError, ConversionError) as e:
+                logger.error(f"Failed to convert {path}: {e}")
+                result = ConversionResult(
+                    success=False,
+                    file_path=str(path),
+                    changes_made=0,
+                    errors=[str(e)],
+                )
+
+            yield result.compact(retain_content)
+
+    def _cached_result(
+        self, content: str, cache_key: str
+    ) -> Optional[ConversionResult]:
+        """Rebuild a ConversionResult from the cache, or None on a miss."""
+        payload = self._cache.get("convert", cache_key)
+        if payload is None:
+            return None
+
+        logger.debug("Using cached conversion result")
+        return ConversionResult(
+            success=payload["success"],
+            file_path="<content>",
+            changes_made=payload["changes_made"],
+            warnings=list(payload.get("warnings", [])),
+            original_content=content,
+            converted_content=payload.get("converted_content", content),
+        )
+
+    def _cache_result(self, cache_key: str, result: ConversionResult) -> None:
+        """Store a successful ConversionResult in the cache."""
+        payload: Dict[str, Any] = {
+            "success": result.success,
+            "changes_made": result.changes_made,
+            "warnings": result.warnings,
+        }
+        if result.changes_made > 0:
+            payload["converted_content"] = result.converted_content
+        self._cache.put("convert", cache_key, payload)
+
     def convert_content(
-        self, content: str, file_type: str = "yaml"
+        self, content: Union[str, ParsedDocument], file_type: str = "yaml"
     ) -> ConversionResult:
         """
         Convert Ansible content string to FQCN format.
 
         Args:
-            content: The content to convert
+            content: The content to convert, as text or a pre-parsed document
             file_type: Type of content ('yaml' supported)
 
         Returns:
             ConversionResult with conversion details
         """
-        result = ConversionResult(
-            success=False,
-            file_path="<content>",
-            changes_made=0,
-            original_content=content,
-        )
-
-        try:
-            if file_type.lower() != "yaml":
-                result.errors.append(f"Unsupported file type: {file_type}")
-                return result
+        start_time = time.perf_counter()
+        with phase("convert"):
+            document = as_document(content)
+            content = document.content
+            result = ConversionResult(
+                success=False,
+                file_path="<content>",
+                changes_made=0,
+                original_content=content,
+            )
+            metrics = result.metrics
+            metrics.files = 1
 
-            # Parse YAML content
             try:
-                yaml_data = yaml.safe_load(content)
-            except yaml.YAMLError as e:
-                raise YAMLParsingError(
-                    "Failed to parse YAML content", details=str(e)
-                ) from e
+                if file_type.lower() != "yaml":
+                    result.errors.append(f"Unsupported file type: {file_type}")
+                    return result
+
+                if self._engine == "stream":
+                    try:
+                        converted_content, changes_made = self._convert_with_stream(
+                            document, metrics
+                        )
+                    except yaml.YAMLError as e:
+                        raise YAMLParsingError(
+                            "Failed to parse YAML content", details=str(e)
+                        ) from e
+                    except SpanMismatchError as e:
+                        logger.debug("Falling back to line engine: %s", e)
+                        converted_content, changes_made = (
+                            self._convert_with_line_engine(document, metrics)
+                        )
+                else:
+                    converted_content, changes_made = self._convert_with_line_engine(
+                        document, metrics
+                    )
 
-            if yaml_data is None:
-                result.converted_content = content
+                metrics.bytes_read = document.size_bytes
+                result.converted_content = converted_content
+                result.changes_made = changes_made
                 result.success = True
-                return result
 
-            # Convert the content
-            converted_content = content
-            changes_made = 0
-
-            # Process different Ansible structures
-            if isinstance(yaml_data, list):
-                # Could be either a playbook (list of plays) or task file (list of tasks)
-                # Check if first item looks like a play (has 'hosts') or a task (has module names)
-                if yaml_data and isinstance(yaml_data[0], dict):
-                    if "hosts" in yaml_data[0] or "tasks" in yaml_data[0]:
-                        # Playbook format (list of plays)
-                        converted_content, changes = self._convert_playbook_content(
-                            content, yaml_data
-                        )
-                    else:
-                        # Task file format (list of tasks)
-                        converted_content, changes = self._convert_tasks_in_content(
-                            content, yaml_data
-                        )
-                    changes_made += changes
-            elif isinstance(yaml_data, dict):
-                # Task file or other dict-based format
-                converted_content, changes = self._convert_dict_content(
-                    content, yaml_data
-                )
-                changes_made += changes
+                if changes_made > 0:
+                    logger.debug("Made %d FQCN conversions", changes_made)
 
-            result.converted_content = converted_content
-            result.changes_made = changes_made
-            result.success = True
+                return result
+
+            except YAMLParsingError:
+                # Re-raise YAML parsing errors
+                raise
+            except Exception as e:
+                result.errors.append(f"Conversion failed: {str(e)}")
+                result.converted_content = content
+                return result
+            finally:
+                result.processing_time = time.perf_counter() - start_time
+
+    def _convert_with_stream(
+        self, document: ParsedDocument, metrics: ConversionMetrics
+    ) -> Tuple[str, int]:
+        """Convert content with the stream rewriter, timing each of its steps."""
+        start = time.perf_counter()
+        root = document.root
+        parsed = time.perf_counter()
+        metrics.parse_time += parsed - start
+        if root is None:
+            return document.content, 0
+
+        spans, metrics.tasks = self._rewriter.scan(document)
+        located = time.perf_counter()
+        converted_content = splice(document.content, spans)
+
+        metrics.locate_time += located - parsed
+        metrics.rewrite_time += time.perf_counter() - located
+        return converted_content, len(spans)
+
+    def _convert_with_line_engine(
+        self, document: ParsedDocument, metrics: Optional[ConversionMetrics] = None
+    ) -> Tuple[str, int]:
+        """Convert content using the line-based heuristic engine."""
+        content = document.content
+
+        # Parse YAML content
+        start = time.perf_counter()
+        try:
+            yaml_data = document.data
+        except yaml.YAMLError as e:
+            raise YAMLParsingError(
+                "Failed to parse YAML content", details=str(e)
+            ) from e
+        parsed = time.perf_counter()
+        if metrics is not None:
+            metrics.parse_time += parsed - start
 
-            if changes_made > 0:
-                logger.debug(f"Made {changes_made} FQCN conversions")
+        if yaml_data is None:
+            return content, 0
 
-            # Clear large variables to help with memory management
-            yaml_data = None
-            converted_content = None
+        converted_content = content
+        changes_made = 0
 
-            return result
+        # Process different Ansible structures
+        if isinstance(yaml_data, list):
+            # Could be either a playbook (list of plays) or task file (list of tasks)
+            # Check if first item looks like a play (has 'hosts') or a task (has module names)
+            if yaml_data and isinstance(yaml_data[0], dict):
+                if "hosts" in yaml_data[0] or "tasks" in yaml_data[0]:
+                    # Playbook format (list of plays)
+                    converted_content, changes = self._convert_playbook_content(
+                        content, yaml_data
+                    )
+                else:
+                    # Task file format (list of tasks)
+                    converted_content, changes = self._convert_tasks_in_content(
+                        content, yaml_data
+                    )
+                changes_made += changes
+        elif isinstance(yaml_data, dict):
+            # Task file or other dict-based format
+            converted_content, changes = self._convert_dict_content(content, yaml_data)
+            changes_made += changes
 
-        except YAMLParsingError:
-            # Re-raise YAML parsing errors
-            raise
-        except Exception as e:
-            result.errors.append(f"Conversion failed: {str(e)}")
-            result.converted_content = content
-            return result
+        if metrics is not None:
+            metrics.rewrite_time += time.perf_counter() - parsed
+        return converted_content, changes_made
 
     def _convert_playbook_content(
         self, content: str, yaml_data: List[Any]
@@ -372,49 +845,11 @@ class FQCNConverter:
         """Convert module names in tasks within the content string."""
         converted_content = content
         changes_made = 0
+        # One record per file rather than per module; free when DEBUG is off
+        debug = DebugAggregator(logger)
 
         # Skip special Ansible keys that aren't modules
-        ansible_directives = {
-            "name",
-            "when",
-            "register",
-            "changed_when",
-            "failed_when",
-            "notify",
-            "tags",
-            "become",
-            "become_user",
-            "vars",
-            "loop",
-            "loop_control",
-            "until",
-            "retries",
-            "delay",
-            "ignore_errors",
-            "delegate_to",
-            "delegate_facts",
-            "run_once",
-            "check_mode",
-            "diff",
-            "throttle",
-            "serial",
-            "max_fail_percentage",
-            "args",
-            "environment",
-            "no_log",
-            "any_errors_fatal",
-            "connection",
-            "remote_user",
-            "port",
-            "gather_facts",
-            "gather_subset",
-            "gather_timeout",
-            "fact_path",
-            "force_handlers",
-            "block",
-            "rescue",
-            "always",
-        }
+        ansible_directives = ANSIBLE_DIRECTIVES
 
         # Use the parsed YAML structure to identify actual modules vs parameters
         def find_modules_in_tasks(task_list: Any) -> List[str]:
@@ -466,11 +901,10 @@ class FQCNConverter:
             stripped = line.strip()
             if stripped.startswith("- name:") or stripped == "-":
                 task_boundaries.append(line_idx)
-            elif stripped.startswith("- ") and ":" in stripped:
+            elif stripped.startswith("- "):
                 # This might be a direct module task like "- service: ..."
-                # Check if it matches any known module
-                module_part = stripped[2:].split(":")[0].strip()
-                if self._get_fqcn_mapping(module_part) is not None:
+                hit = self._matcher.match(line)
+                if hit is not None and hit.list_item:
                     task_boundaries.append(line_idx)
 
         # Add end boundary
@@ -506,32 +940,18 @@ class FQCNConverter:
                     if not stripped or stripped.startswith("#"):
                         continue
 
-                    # Check if this line contains the expected module
-                    escaped_module = re.escape(expected_module)
-                    regular_pattern = re.compile(rf"^\s*{escaped_module}\s*:")
-                    list_item_pattern = re.compile(rf"^\s*-\s+{escaped_module}\s*:")
-
-                    if regular_pattern.match(line) or list_item_pattern.match(line):
+                    # Check if this line starts with the expected module key,
+                    # either "  module:" or "  - module:"
+                    hit = self._matcher.match(line, expected_module)
+                    if hit is not None:
                         # This should be the task module - convert it
-                        if list_item_pattern.match(line):
-                            # List item pattern: "  - module:"
-                            new_line = re.sub(
-                                rf"^(\s*-\s+){re.escape(expected_module)}(\s*:)",
-                                rf"\1{expected_fqcn}\2",
-                                line,
-                            )
-                        else:
-                            # Regular pattern: "  module:"
-                            new_line = re.sub(
-                                rf"^(\s*){re.escape(expected_module)}(\s*:)",
-                                rf"\1{expected_fqcn}\2",
-                                line,
-                            )
-
-                        lines[line_idx] = new_line
+                        lines[line_idx] = self._matcher.replace(line, hit)
                         changes_made += 1
-                        logger.debug(
-                            f"Converted {expected_module} -> {expected_fqcn} on line {line_idx+1}"
+                        debug.add(
+                            "Converted %s -> %s on line %d",
+                            expected_module,
+                            expected_fqcn,
+                            line_idx + 1,
                         )
                         task_idx += 1
                         break  # Move to next task
@@ -539,23 +959,20 @@ class FQCNConverter:
             elif boundary_line.startswith("- ") and expected_module in boundary_line:
                 # Direct module task - convert this line directly
                 line = lines[start_line]
-                escaped_module = re.escape(expected_module)
-                list_item_pattern = re.compile(rf"^\s*-\s+{escaped_module}\s*:")
+                hit = self._matcher.match(line, expected_module)
 
-                if list_item_pattern.match(line):
+                if hit is not None and hit.list_item:
                     # List item pattern: "  - module:"
-                    new_line = re.sub(
-                        rf"^(\s*-\s+){escaped_module}(\s*:)",
-                        rf"\1{expected_fqcn}\2",
-                        line,
-                    )
-
-                    lines[start_line] = new_line
+                    lines[start_line] = self._matcher.replace(line, hit)
                     changes_made += 1
-                    logger.debug(
-                        f"Converted {expected_module} -> {expected_fqcn} on line {start_line+1}"
+                    debug.add(
+                        "Converted %s -> %s on line %d",
+                        expected_module,
+                        expected_fqcn,
+                        start_line + 1,
                     )
                     task_idx += 1
 
+        debug.flush("Converted %d modules", changes_made)
         converted_content = "\n".join(lines)
         return converted_content, changes_made
@@ -0,0 +1,509 @@
+"""
+Single-walk file discovery for Ansible content.
+
+Every entry point (CLI commands, batch processing, interactive mode) finds
+YAML files and project directories through this module. The tree is walked
+once with ``os.scandir``; excluded directories are pruned before descending,
+so nothing below ``.git`` or ``node_modules`` is ever listed. Exclude
+patterns are compiled to regular expressions once per pattern set. On
+trees with slow metadata calls (e.g. NFS checkouts), ``parallel_walk``
+lists directories concurrently on a thread pool.
+
+Exclude pattern syntax follows ``.gitignore``:
+
+- ``*``, ``?`` and ``[...]`` match within one path component, ``**`` across
+  components
+- a pattern containing ``/`` is anchored to the walk root, otherwise it
+  matches any path component
+- a trailing ``/`` restricts a pattern to directories
+- a leading ``!`` re-includes paths excluded by an earlier pattern
+
+A plain word such as ``.git`` therefore excludes every path with a component
+of exactly that name, so ``infra.git-ops`` is not excluded by ``.git``. The
+CLI ``--exclude`` option compiles its patterns with ``substring_words=True``
+to keep its historical behaviour, where a plain word excludes every path
+containing it.
+"""
+
+import os
+import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Extensions of files that may hold Ansible content
+YAML_SUFFIXES = (".yml", ".yaml")
+
+# Directories that never hold Ansible content worth converting
+DEFAULT_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".github",
+        "__pycache__",
+        ".pytest_cache",
+        "node_modules",
+        ".venv",
+        "venv",
+        ".tox",
+        "build",
+        "dist",
+    }
+)
+
+# Version control and virtualenv directories; the only ones skipped when
+# collecting the files of a known project, where e.g. roles/build is content
+VCS_SKIP_DIRS = frozenset({".git", ".hg", ".svn", ".venv", "venv"})
+
+# Listing threads used by parallel_walk unless the caller chooses
+DEFAULT_WALK_WORKERS = 8
+
+# In-flight directory listings per walker thread
+PENDING_PER_WORKER = 4
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+class _Rule(NamedTuple):
+    """One compiled exclude pattern."""
+
+    regex: Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regular expression body."""
+    parts = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif char == "?":
+            parts.append("[^/]")
+            i += 1
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+                i += 1
+            else:
+                body = pattern[i + 1 : end].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                i = end + 1
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    return "".join(parts)
+
+
+def _compile_rule(pattern: str, substring_words: bool = False) -> Optional[_Rule]:
+    """Compile one exclude pattern, or return None for blank patterns."""
+    negate = pattern.startswith("!")
+    if negate:
+        pattern = pattern[1:]
+
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if not pattern:
+        return None
+
+    if substring_words and "/" not in pattern and not _GLOB_CHARS.intersection(pattern):
+        # Historical --exclude semantics: plain substring of the path
+        return _Rule(re.compile(re.escape(pattern)), negate, dir_only)
+
+    if "/" in pattern:
+        body = "^" + _translate(pattern.lstrip("/"))
+    else:
+        body = "(?:^|/)" + _translate(pattern)
+    return _Rule(re.compile(body + "(?:/|$)"), negate, dir_only)
+
+
+class IgnoreRules:
+    """
+    Compiled exclude patterns plus a set of directory names to skip.
+
+    Paths are matched as ``/``-separated strings, relative to the walk root
+    when used by the walkers. Build instances with ``IgnoreRules.compile``
+    to reuse compiled pattern sets.
+
+    Example:
+        >>> rules = IgnoreRules.compile(["archive/", "*.bak.yml", "!keep/**"])
+        >>> rules.is_excluded("roles/archive", is_dir=True)
+        True
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str] = (),
+        skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+        substring_words: bool = False,
+    ) -> None:
+        """
+        Compile exclude patterns.
+
+        Args:
+            patterns: Gitignore-style exclude patterns
+            skip_dirs: Directory names that are always pruned
+            substring_words: If True, a plain word without glob characters
+                or ``/`` excludes every path containing it, as ``--exclude``
+                always did, instead of matching whole path components
+        """
+        self.patterns = tuple(patterns)
+        self.skip_dirs = frozenset(skip_dirs)
+        self._rules: List[_Rule] = []
+        for pattern in self.patterns:
+            rule = _compile_rule(pattern, substring_words)
+            if rule is not None:
+                self._rules.append(rule)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def compile(
+        patterns: Tuple[str, ...] = (),
+        skip_dirs: frozenset = DEFAULT_SKIP_DIRS,
+        substring_words: bool = False,
+    ) -> "IgnoreRules":
+        """
+        Return compiled rules for a pattern set, reusing earlier compilations.
+
+        Args:
+            patterns: Gitignore-style exclude patterns
+            skip_dirs: Directory names that are always pruned
+            substring_words: If True, plain words match as substrings
+
+        Returns:
+            Shared IgnoreRules instance
+        """
+        return IgnoreRules(patterns, skip_dirs, substring_words)
+
+    def is_excluded(self, path: Union[str, Path], is_dir: bool = False) -> bool:
+        """
+        Check whether a path is excluded.
+
+        Args:
+            path: Path to check; any component in ``skip_dirs`` excludes it
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path should not be processed
+        """
+        path_str = str(path).replace(os.sep, "/")
+        parts = path_str.split("/")
+        skip_parts = parts if is_dir else parts[:-1]
+        if self.skip_dirs and not self.skip_dirs.isdisjoint(skip_parts):
+            return True
+
+        # Directory-only rules see a file's parent directory
+        parent = path_str.rsplit("/", 1)[0] if "/" in path_str else None
+
+        excluded = False
+        for rule in self._rules:
+            if rule.negate != excluded:
+                continue
+            target = path_str if is_dir or not rule.dir_only else parent
+            if target is not None and rule.regex.search(target):
+                excluded = not rule.negate
+        return excluded
+
+
+class WalkEntry(NamedTuple):
+    """
+    One directory visited by ``walk``.
+
+    Attributes:
+        path: Directory path
+        depth: Depth below the walk root (root is 0)
+        dirnames: Names of subdirectories that are not excluded; they are
+            descended into unless the depth limit is reached
+        filenames: Names of files in the directory that are not excluded
+        rel_path: Directory path relative to the walk root ("" for the root)
+    """
+
+    path: Path
+    depth: int
+    dirnames: List[str]
+    filenames: List[str]
+    rel_path: str = ""
+
+
+def _list_directory(
+    directory: Path,
+    rel_dir: str,
+    depth: int,
+    rules: IgnoreRules,
+    skip_hidden: bool,
+) -> Optional[WalkEntry]:
+    """List one directory with a single scandir call, applying exclude rules."""
+    try:
+        with os.scandir(directory) as iterator:
+            entries = sorted(iterator, key=lambda entry: entry.name)
+    except OSError as e:
+        logger.debug(f"Cannot access directory {directory}: {e}")
+        return None
+
+    dirnames = []
+    filenames = []
+    for entry in entries:
+        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+
+        if is_dir:
+            if skip_hidden and entry.name.startswith("."):
+                continue
+            if rules.is_excluded(rel_path, is_dir=True):
+                continue
+            dirnames.append(entry.name)
+        elif not rules.is_excluded(rel_path):
+            filenames.append(entry.name)
+
+    return WalkEntry(directory, depth, dirnames, filenames, rel_dir)
+
+
+def _children(
+    entry: WalkEntry, max_depth: Optional[int]
+) -> List[Tuple[Path, str, int]]:
+    """Return (path, relative path, depth) of the subdirectories to visit next."""
+    if max_depth is not None and entry.depth >= max_depth:
+        return []
+
+    return [
+        (
+            entry.path / name,
+            f"{entry.rel_path}/{name}" if entry.rel_path else name,
+            entry.depth + 1,
+        )
+        for name in entry.dirnames
+    ]
+
+
+def walk(
+    root: Union[str, Path],
+    rules: Optional[IgnoreRules] = None,
+    max_depth: Optional[int] = None,
+    skip_hidden: bool = False,
+) -> Iterator[WalkEntry]:
+    """
+    Walk a directory tree once, pruning excluded directories.
+
+    Directories are listed with a single ``os.scandir`` call each and
+    visited depth-first in name order. Symbolic links to directories are
+    not followed.
+
+    Args:
+        root: Directory to walk
+        rules: Exclude rules; defaults to skipping DEFAULT_SKIP_DIRS
+        max_depth: Deepest directory level to visit (root is 0); None for
+            no limit
+        skip_hidden: If True, do not descend into directories starting
+            with a dot
+
+    Yields:
+        WalkEntry for every visited directory, root first
+    """
+    if rules is None:
+        rules = IgnoreRules.compile()
+
+    stack: List[Tuple[Path, str, int]] = [(Path(root), "", 0)]
+
+    while stack:
+        entry = _list_directory(*stack.pop(), rules, skip_hidden)
+        if entry is None:
+            continue
+
+        yield entry
+
+        # Push in reverse so subdirectories are visited in name order
+        stack.extend(reversed(_children(entry, max_depth)))
+
+
+def parallel_walk(
+    root: Union[str, Path],
+    rules: Optional[IgnoreRules] = None,
+    max_depth: Optional[int] = None,
+    skip_hidden: bool = False,
+    max_workers: int = DEFAULT_WALK_WORKERS,
+    max_pending: Optional[int] = None,
+) -> Iterator[WalkEntry]:
+    """
+    Walk a directory tree with scandir calls fanned out over a thread pool.
+
+    Listing a directory is dominated by filesystem metadata latency, which
+    on network filesystems is high and releases the GIL, so listing many
+    directories concurrently hides most of it. At most ``max_pending``
+    listings are in flight; directories discovered meanwhile wait in a
+    backlog. Pruning, depth limit and exclude rules are those of ``walk``.
+
+    Args:
+        root: Directory to walk
+        rules: Exclude rules; defaults to skipping DEFAULT_SKIP_DIRS
+        max_depth: Deepest directory level to visit (root is 0); None for
+            no limit
+        skip_hidden: If True, do not descend into directories starting
+            with a dot
+        max_workers: Number of listing threads; 1 falls back to ``walk``
+        max_pending: Bound on in-flight listings; defaults to
+            ``max_workers * PENDING_PER_WORKER``
+
+    Yields:
+        WalkEntry for every visited directory, in completion order
+
+    Example:
+        >>> for entry in parallel_walk("/nfs/checkout", max_workers=16):
+        ...     if has_project_marker(entry, ["site.yml", "roles/"]):
+        ...         print(entry.path)
+    """
+    if max_workers <= 1:
+        yield from walk(root, rules, max_depth=max_depth, skip_hidden=skip_hidden)
+        return
+
+    if rules is None:
+        rules = IgnoreRules.compile()
+    max_pending = max(1, max_pending or max_workers * PENDING_PER_WORKER)
+
+    backlog: Deque[Tuple[Path, str, int]] = deque([(Path(root), "", 0)])
+    pending: Set[Future] = set()
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="fqcn-walk"
+    )
+    try:
+        while backlog or pending:
+            while backlog and len(pending) < max_pending:
+                pending.add(
+                    executor.submit(
+                        _list_directory, *backlog.popleft(), rules, skip_hidden
+                    )
+                )
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                entry = future.result()
+                if entry is None:
+                    continue
+                backlog.extend(_children(entry, max_depth))
+                yield entry
+    finally:
+        # Cancel work that has not started; shutdown() only takes
+        # cancel_futures from Python 3.9
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def iter_files(
+    root: Union[str, Path],
+    rules: Optional[IgnoreRules] = None,
+    suffixes: Tuple[str, ...] = YAML_SUFFIXES,
+    max_depth: Optional[int] = None,
+) -> Iterator[Path]:
+    """
+    Lazily yield files below a directory with one of the given suffixes.
+
+    Args:
+        root: Directory to search, or a single file
+        rules: Exclude rules; defaults to skipping DEFAULT_SKIP_DIRS
+        suffixes: File name suffixes to yield
+        max_depth: Deepest directory level to search (root is 0)
+
+    Yields:
+        Matching file paths, directory by directory in name order
+
+    Example:
+        >>> for path in iter_files("roles", IgnoreRules.compile(("tests/",))):
+        ...     print(path)
+    """
+    root_path = Path(root)
+    if root_path.is_file():
+        if root_path.name.endswith(suffixes):
+            yield root_path
+        return
+
+    for entry in walk(root_path, rules, max_depth=max_depth):
+        for name in entry.filenames:
+            if name.endswith(suffixes):
+                yield entry.path / name
+
+
+def has_project_marker(entry: WalkEntry, patterns: Iterable[str]) -> bool:
+    """
+    Check a directory listing for Ansible project indicators.
+
+    Works on the listing ``walk`` already produced, so detecting project
+    roots costs no extra filesystem calls.
+
+    Args:
+        entry: Directory visited by ``walk``
+        patterns: Indicator patterns; a trailing ``/`` names a directory,
+            a pattern containing ``/`` or ``**`` is globbed below the
+            directory (e.g. ``**/playbooks``), anything else is a glob
+            matched against entry names
+
+    Returns:
+        True if any pattern matches
+    """
+    for pattern in patterns:
+        name = pattern.rstrip("/")
+        if "/" in name or "**" in name:
+            # Path patterns need the tree below the directory, not its listing
+            matches = entry.path.glob(name)
+            if pattern.endswith("/"):
+                matches = (path for path in matches if path.is_dir())
+            if next(iter(matches), None) is not None:
+                return True
+        elif pattern.endswith("/"):
+            if name in entry.dirnames:
+                return True
+        elif any(
+            fnmatchcase(entry_name, pattern)
+            for entry_name in entry.filenames + entry.dirnames
+        ):
+            return True
+    return False
+
+
+def find_yaml_files(
+    root: Union[str, Path], exclude_patterns: Optional[Iterable[str]] = None
+) -> List[Path]:
+    """
+    Find all YAML files below a directory, sorted.
+
+    Args:
+        root: Directory to search
+        exclude_patterns: Optional gitignore-style exclude patterns
+
+    Returns:
+        Sorted list of YAML file paths
+    """
+    rules = IgnoreRules.compile(tuple(exclude_patterns or ()))
+    return sorted(iter_files(root, rules))
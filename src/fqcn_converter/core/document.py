@@ -0,0 +1,332 @@
+"""
+Shared parsed representation of an Ansible YAML document.
+
+This module provides the ParsedDocument class, which holds the raw text of a
+file together with its line index, composed node graph (with start/end marks)
+and constructed Python data. Each representation is computed at most once and
+cached, so the converter, validator and reporter can share one parse of the
+same file instead of calling ``yaml.safe_load`` repeatedly.
+
+Consumers that only look at which keys plays and tasks have, such as the
+validator, can use the document's ``skeleton`` instead of ``data``: it is
+built straight from the node graph down to task keys and never constructs
+values, so large ``vars`` blocks and templates cost nothing beyond parsing.
+"""
+
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import yaml
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+
+from ..exceptions import FileAccessError
+from ..utils.profiling import phase
+from ..utils.yaml_handler import compose
+
+_UNSET = object()
+
+# Play and task file keys holding lists of tasks
+TASK_SECTIONS = ("tasks", "handlers", "pre_tasks", "post_tasks")
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+class _IndexingLoader(yaml.SafeLoader):
+    """SafeLoader remembering the node each mapping was constructed from."""
+
+    def __init__(self, mapping_nodes: Dict[int, Tuple[Any, MappingNode]]) -> None:
+        super().__init__("")
+        self._mapping_nodes = mapping_nodes
+
+    def construct_object(self, node: Node, deep: bool = False) -> Any:
+        data = super().construct_object(node, deep)
+        if isinstance(node, MappingNode):
+            self._mapping_nodes[id(data)] = (data, node)
+        return data
+
+
+class ParsedDocument:
+    """
+    Raw text, line index, node graph and parsed data of one YAML document.
+
+    Parsing is lazy: the node graph is composed the first time ``root`` or
+    ``data`` is accessed, and the Python data is constructed from that same
+    node graph. YAML syntax errors are cached and re-raised on every access,
+    so an invalid document is never parsed twice either.
+
+    Attributes:
+        content: Raw text of the document
+        file_path: Path of the file the text was read from, or "<content>"
+
+    Example:
+        >>> document = ParsedDocument.from_file("playbook.yml")
+        >>> result = converter.convert_content(document)
+        >>> validation = validator.validate_content(document)
+        >>> document.line_of(120)
+        7
+    """
+
+    def __init__(self, content: str, file_path: Union[str, Path] = "<content>") -> None:
+        """
+        Initialize a document from its raw text.
+
+        Args:
+            content: Raw YAML text
+            file_path: Optional file path for reporting
+        """
+        self.content = content
+        self.file_path = str(file_path)
+        self._root: Any = _UNSET
+        self._data: Any = _UNSET
+        self._skeleton: Any = _UNSET
+        self._error: Optional[yaml.YAMLError] = None
+        self._lines: Optional[List[str]] = None
+        self._line_offsets: Optional[List[int]] = None
+        # Keyed by id() of the constructed dicts, which the entries keep alive
+        self._mapping_nodes: Dict[int, Tuple[Any, MappingNode]] = {}
+        self._key_positions: Dict[int, Dict[str, Tuple[int, int]]] = {}
+
+    @classmethod
+    def from_file(cls, file_path: Union[str, Path]) -> "ParsedDocument":
+        """
+        Read a file into a document.
+
+        Args:
+            file_path: Path to the YAML file
+
+        Returns:
+            ParsedDocument holding the file content
+
+        Raises:
+            FileAccessError: If the file cannot be read
+        """
+        try:
+            with phase("read"), open(file_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except (IOError, OSError) as e:
+            raise FileAccessError(
+                f"Cannot read file: {file_path}", details=str(e)
+            ) from e
+
+        return cls(content, file_path)
+
+    @property
+    def root(self) -> Optional[Node]:
+        """
+        Composed node graph with start/end marks, or None for empty documents.
+
+        Raises:
+            yaml.YAMLError: If the content is not valid YAML
+        """
+        if self._error is not None:
+            raise self._error
+
+        if self._root is _UNSET:
+            try:
+                with phase("parse"):
+                    self._root = compose(self.content)
+            except yaml.YAMLError as e:
+                self._error = e
+                raise
+
+        return self._root
+
+    @property
+    def data(self) -> Any:
+        """
+        Python data constructed from the node graph, as ``yaml.safe_load`` returns.
+
+        Raises:
+            yaml.YAMLError: If the content is not valid YAML
+        """
+        if self._data is _UNSET:
+            root = self.root
+            if root is None:
+                self._data = None
+            else:
+                loader = _IndexingLoader(self._mapping_nodes)
+                try:
+                    with phase("parse"):
+                        self._data = loader.construct_document(root)
+                except yaml.YAMLError as e:
+                    self._error = e
+                    raise
+                finally:
+                    loader.dispose()
+
+        return self._data
+
+    @property
+    def skeleton(self) -> Any:
+        """
+        Keys-only outline of the document, built without constructing values.
+
+        Mirrors the shape of ``data`` down to task level: the top-level list
+        of plays (or the mapping of a task file), play mappings, the task
+        lists of their TASK_SECTIONS and task mappings. Every other value,
+        including nested task arguments, is None, and entries of task lists
+        that are not mappings are None as well. Keys are constructed like in
+        ``data``; merge keys (``<<``) are resolved.
+
+        Raises:
+            yaml.YAMLError: If the content is not valid YAML
+        """
+        if self._skeleton is _UNSET:
+            root = self.root
+            loader = yaml.SafeLoader("")
+            try:
+                if isinstance(root, SequenceNode):
+                    self._skeleton = [
+                        self._outline(item, loader, sections=True)
+                        for item in root.value
+                    ]
+                else:
+                    self._skeleton = self._outline(root, loader, sections=True)
+            except yaml.YAMLError as e:
+                self._error = e
+                raise
+            finally:
+                loader.dispose()
+
+        return self._skeleton
+
+    def _outline(self, node: Optional[Node], loader: Any, sections: bool) -> Any:
+        """Build the keys-only dict of a play or task node, or None."""
+        if not isinstance(node, MappingNode):
+            return None
+
+        outline: Dict[Any, Any] = {}
+        for key_node, value_node in _mapping_pairs(node):
+            if isinstance(key_node, ScalarNode) and key_node.tag == _STR_TAG:
+                key = key_node.value
+            else:
+                key = loader.construct_object(key_node, deep=True)
+
+            value = None
+            if sections and key in TASK_SECTIONS:
+                if isinstance(value_node, SequenceNode):
+                    value = [
+                        self._outline(task, loader, sections=False)
+                        for task in value_node.value
+                    ]
+            outline[key] = value
+
+        self._mapping_nodes[id(outline)] = (outline, node)
+        return outline
+
+    def key_position(self, mapping: Any, key: str) -> Optional[Tuple[int, int]]:
+        """
+        Return where a key of a mapping in ``data`` or ``skeleton`` is written.
+
+        Positions come from the marks of the node graph, so every occurrence
+        of a repeated key is located exactly. The keys of a mapping are
+        indexed on first lookup, after which lookups are O(1).
+
+        Args:
+            mapping: A dict taken from ``data`` or ``skeleton``
+            key: Key of that dict
+
+        Returns:
+            1-based (line, column) of the key, where the merged mapping writes
+            it for keys merged in with ``<<``, or None if the mapping is not
+            part of the document or has no such key
+
+        Example:
+            >>> task = document.data[0]["tasks"][1]
+            >>> document.key_position(task, "copy")
+            (9, 7)
+        """
+        positions = self._key_positions.get(id(mapping))
+        if positions is None:
+            entry = self._mapping_nodes.get(id(mapping))
+            if entry is None or entry[0] is not mapping:
+                return None
+            positions = {}
+            node = entry[1]
+            for key_node, _ in _mapping_pairs(node):
+                if isinstance(key_node, ScalarNode):
+                    mark = key_node.start_mark
+                    positions[key_node.value] = (mark.line + 1, mark.column + 1)
+            self._key_positions[id(mapping)] = positions
+
+        return positions.get(key)
+
+    @property
+    def lines(self) -> List[str]:
+        """Content split into lines (without line terminators)."""
+        if self._lines is None:
+            self._lines = self.content.split("\n")
+        return self._lines
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the content in bytes when encoded as UTF-8."""
+        if self.content.isascii():
+            # One byte per character, without encoding a copy
+            return len(self.content)
+        return len(self.content.encode("utf-8"))
+
+    def line_of(self, index: int) -> int:
+        """
+        Return the 1-based line number of a character offset.
+
+        Args:
+            index: Character offset into the content
+
+        Returns:
+            Line number containing the offset
+        """
+        if self._line_offsets is None:
+            offsets = [0]
+            position = self.content.find("\n")
+            while position != -1:
+                offsets.append(position + 1)
+                position = self.content.find("\n", position + 1)
+            self._line_offsets = offsets
+
+        return bisect_right(self._line_offsets, index)
+
+
+def _mapping_pairs(node: MappingNode) -> List[Tuple[Node, Node]]:
+    """
+    Return the key and value nodes of a mapping with merge keys resolved.
+
+    Follows SafeConstructor.flatten_mapping, which PyYAML applies before
+    constructing a mapping, without modifying the node graph: merged pairs
+    come first and keys written in the mapping itself take precedence.
+    """
+    if not any(key.tag == _MERGE_TAG for key, _ in node.value):
+        return node.value
+
+    merged: List[Tuple[Node, Node]] = []
+    own: List[Tuple[Node, Node]] = []
+    for key_node, value_node in node.value:
+        if key_node.tag != _MERGE_TAG:
+            own.append((key_node, value_node))
+        elif isinstance(value_node, MappingNode):
+            merged.extend(_mapping_pairs(value_node))
+        elif isinstance(value_node, SequenceNode):
+            for subnode in reversed(value_node.value):
+                if isinstance(subnode, MappingNode):
+                    merged.extend(_mapping_pairs(subnode))
+    return merged + own
+
+
+def as_document(
+    content: Union[str, ParsedDocument], file_path: Union[str, Path] = "<content>"
+) -> ParsedDocument:
+    """
+    Return content as a ParsedDocument, wrapping raw text if needed.
+
+    Args:
+        content: Raw YAML text or an existing ParsedDocument
+        file_path: File path used when wrapping raw text
+
+    Returns:
+        The given document, or a new ParsedDocument for raw text
+    """
+    if isinstance(content, ParsedDocument):
+        return content
+    return ParsedDocument(content, file_path)
@@ -0,0 +1,93 @@
+"""
+Precompiled module key matcher for the line-based conversion engine.
+
+One regular expression, compiled at import time, splits a line into its
+indentation, optional list marker and leading mapping key. The key is then
+looked up in the converter's merged mapping table, so a single call finds a
+module hit on a line no matter how many short names the table holds and no
+pattern is ever built per module, task or file.
+"""
+
+import re
+from typing import Callable, NamedTuple, Optional
+
+# Indentation, optional "- " list marker, mapping key, separator up to the colon
+KEY_LINE_PATTERN = re.compile(r"^(\s*)(-\s+)?([^\s:#\-][^\s:]*)(\s*):")
+
+
+class ModuleHit(NamedTuple):
+    """
+    A module key found at the start of a line.
+
+    Attributes:
+        module: Short module name as written in the line
+        fqcn: Fully qualified collection name the module maps to
+        start: Offset of the first character of the module name
+        end: Offset just past the module name
+        list_item: Whether the key follows a "- " list marker
+    """
+
+    module: str
+    fqcn: str
+    start: int
+    end: int
+    list_item: bool
+
+
+class ModuleMatcher:
+    """
+    Finds mapped module keys in single lines of YAML.
+
+    The matcher holds no per-call state, so one instance built with the
+    converter is shared by every file and thread that converter serves.
+
+    Example:
+        >>> matcher = ModuleMatcher({"copy": "ansible.builtin.copy"}.get)
+        >>> hit = matcher.match("  - copy:")
+        >>> matcher.replace("  - copy:", hit)
+        '  - ansible.builtin.copy:'
+    """
+
+    __slots__ = ("_lookup",)
+
+    def __init__(self, lookup: Callable[[str], Optional[str]]) -> None:
+        """
+        Initialize the matcher.
+
+        Args:
+            lookup: Returns the FQCN for a short module name, or None
+        """
+        self._lookup = lookup
+
+    def match(self, line: str, module: Optional[str] = None) -> Optional[ModuleHit]:
+        """
+        Return the module key at the start of a line, if it is mapped.
+
+        Args:
+            line: Line of YAML text without its newline
+            module: Only report a hit for this module name
+
+        Returns:
+            ModuleHit for the leading key, or None if the line does not start
+            with a key, the key differs from module, or it has no mapping
+        """
+        found = KEY_LINE_PATTERN.match(line)
+        if found is None:
+            return None
+
+        key = found.group(3)
+        if module is not None and key != module:
+            return None
+
+        fqcn = self._lookup(key)
+        if fqcn is None:
+            return None
+
+        return ModuleHit(
+            key, fqcn, found.start(3), found.end(3), found.group(2) is not None
+        )
+
+    @staticmethod
+    def replace(line: str, hit: ModuleHit) -> str:
+        """Return the line with the module name of a hit replaced by its FQCN."""
+        return line[: hit.start] + hit.fqcn + line[hit.end :]
@@ -0,0 +1,217 @@
+"""
+Size-aware reading of YAML files.
+
+Generated inventories and vars files can be hundreds of megabytes, and reading
+one into a str decodes and copies all of it before anything can tell whether
+the file contains a single module key. A SizePolicy decides from the file size
+alone, before the file is read, what happens to files above a maximum size:
+
+- ``"skip"``: the file is not read at all; only ``os.stat`` is called
+- ``"stream"``: the file is memory-mapped and its raw bytes are scanned for
+  keys that are module names; it is read and processed only if one is found
+- ``"process"``: the file is read and processed like any other file
+
+The byte scan looks at block mapping keys, including those of list items and
+single-line flow mappings. It errs on the side of processing: a key that is
+also a module name anywhere in the file, e.g. ``copy:`` in a vars dict, makes
+the whole file go through the regular read and parse.
+"""
+
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import AbstractSet, FrozenSet, Iterable, Optional, Union
+
+from ..exceptions import ConfigurationError
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# What to do with files larger than the maximum size
+LARGE_FILE_POLICIES = ("skip", "stream", "process")
+
+# Multipliers of the size suffixes accepted by parse_size
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+)\s*([KMG]?)(?:I?B)?\s*$", re.IGNORECASE)
+
+# Key at the start of a line, optionally after a list marker or an opening
+# brace, with optional quotes
+MODULE_KEY_PATTERN = re.compile(
+    rb"^[ \t]*(?:-[ \t]+)?(?:\{[ \t]*)?['\"]?([A-Za-z_][\w.-]*)['\"]?[ \t]*:",
+    re.MULTILINE,
+)
+
+
+def check_large_file_policy(policy: str) -> None:
+    """Raise ConfigurationError for an unknown large file policy."""
+    if policy not in LARGE_FILE_POLICIES:
+        raise ConfigurationError(
+            f"Unknown large file policy: {policy}",
+            details=f"Available policies: {', '.join(LARGE_FILE_POLICIES)}",
+        )
+
+
+def parse_size(text: str) -> int:
+    """
+    Parse a size such as "512K", "200M" or "1GB" into bytes.
+
+    Args:
+        text: Number of bytes with an optional K, M or G suffix (powers of 1024)
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the text is not a valid size
+    """
+    match = _SIZE_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Invalid size: {text!r} (expected e.g. 512K, 200M, 1G)")
+    number, unit = match.groups()
+    return int(number) * SIZE_UNITS[unit.upper()]
+
+
+def find_module_keys(
+    file_path: Union[str, Path], module_names: AbstractSet[bytes]
+) -> FrozenSet[str]:
+    """
+    Scan the raw bytes of a file for keys that are module names.
+
+    The file is memory-mapped, so nothing is decoded or copied into Python
+    objects except the keys themselves.
+
+    Args:
+        file_path: File to scan
+        module_names: UTF-8 encoded module names to look for
+
+    Returns:
+        Module names found as keys in the file
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+    """
+    found = set()
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return frozenset()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for match in MODULE_KEY_PATTERN.finditer(content):
+                key = match.group(1)
+                if key in module_names:
+                    found.add(key)
+    return frozenset(name.decode("utf-8") for name in found)
+
+
+def has_module_key(
+    file_path: Union[str, Path], module_names: AbstractSet[bytes]
+) -> bool:
+    """
+    Check the raw bytes of a file for any key that is a module name.
+
+    Like find_module_keys, but stops at the first module key, so a large
+    file holding tasks is usually decided after its first few lines.
+
+    Args:
+        file_path: File to scan
+        module_names: UTF-8 encoded module names to look for
+
+    Returns:
+        True if the file has a module key
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for match in MODULE_KEY_PATTERN.finditer(content):
+                if match.group(1) in module_names:
+                    return True
+    return False
+
+
+class SizePolicy:
+    """
+    Decide from its size whether a file is read before reading it.
+
+    Example:
+        >>> policy = SizePolicy(200 * 1024**2, "stream", ["copy", "service"])
+        >>> reason = policy.check("inventory/group_vars/all.yml")
+        >>> if reason is not None:
+        ...     print(f"Not processed: {reason}")
+    """
+
+    __slots__ = ("max_size", "policy", "_encoded")
+
+    def __init__(
+        self,
+        max_size: Optional[int],
+        policy: str = "skip",
+        module_names: Iterable[str] = (),
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            max_size: Largest file size in bytes processed unconditionally;
+                     None disables the policy
+            policy: "skip", "stream" or "process" for larger files
+            module_names: Keys whose presence makes "stream" process a file
+
+        Raises:
+            ConfigurationError: If the policy or the size is invalid
+        """
+        check_large_file_policy(policy)
+        if max_size is not None and max_size < 0:
+            raise ConfigurationError(
+                f"Invalid maximum file size: {max_size}",
+                details="The maximum file size must not be negative",
+            )
+        self.max_size = max_size
+        self.policy = policy
+        # Encoded once, as module_names may be a one-shot iterator and
+        # check() runs concurrently on batch threads
+        self._encoded: FrozenSet[bytes] = frozenset(
+            name.encode("utf-8") for name in module_names
+        )
+
+    def check(self, file_path: Union[str, Path]) -> Optional[str]:
+        """
+        Check a file against the policy.
+
+        Args:
+            file_path: File about to be read
+
+        Returns:
+            Reason for not processing the file, or None to read and process it.
+            Files that cannot be inspected are left to the regular read, which
+            reports the error.
+        """
+        if self.max_size is None or self.policy == "process":
+            return None
+
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            return None
+        if size <= self.max_size:
+            return None
+
+        if self.policy == "skip":
+            reason = (
+                f"Skipped file of {size} bytes, larger than the maximum "
+                f"file size of {self.max_size} bytes"
+            )
+        else:
+            try:
+                if has_module_key(file_path, self._encoded):
+                    return None
+            except (OSError, ValueError):
+                return None
+            reason = f"Skipped file of {size} bytes without module keys"
+
+        logger.info(f"{reason}: {file_path}")
+        return reason
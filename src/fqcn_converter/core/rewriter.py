@@ -0,0 +1,299 @@
+"""
+Single-pass YAML rewriter for FQCN conversion.
+
+This module locates module keys in Ansible task lists by composing the PyYAML
+event stream once and reading the start/end marks of each key node. The exact
+character spans are then patched into the original text in a single splice
+pass, so formatting, comments and quoting outside the rewritten keys are left
+untouched and the cost grows linearly with the size of the file.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+
+from ..utils.yaml_handler import BOM
+from .document import ParsedDocument, as_document
+
+# Sections of a play or task file that hold task lists
+TASK_SECTIONS = ("pre_tasks", "tasks", "handlers", "post_tasks")
+
+# Task keys that hold nested task lists
+NESTED_TASK_SECTIONS = ("block", "rescue", "always")
+
+# Task keywords that are never module names
+ANSIBLE_DIRECTIVES = frozenset(
+    {
+        "name",
+        "when",
+        "register",
+        "changed_when",
+        "failed_when",
+        "notify",
+        "tags",
+        "become",
+        "become_user",
+        "vars",
+        "loop",
+        "loop_control",
+        "until",
+        "retries",
+        "delay",
+        "ignore_errors",
+        "delegate_to",
+        "delegate_facts",
+        "run_once",
+        "check_mode",
+        "diff",
+        "throttle",
+        "serial",
+        "max_fail_percentage",
+        "args",
+        "environment",
+        "no_log",
+        "any_errors_fatal",
+        "connection",
+        "remote_user",
+        "port",
+        "gather_facts",
+        "gather_subset",
+        "gather_timeout",
+        "fact_path",
+        "force_handlers",
+        "block",
+        "rescue",
+        "always",
+    }
+)
+
+
+class SpanMismatchError(Exception):
+    """Raised when a node mark does not point at the expected key text."""
+
+
+@dataclass(frozen=True)
+class KeySpan:
+    """
+    Location of a module key that should be rewritten.
+
+    Attributes:
+        start: Character offset of the first character of the key text
+        end: Character offset just past the last character of the key text
+        module: Short module name found at the span
+        fqcn: Fully qualified collection name that replaces the module name
+        line: Line number of the key (1-based)
+        column: Column number of the key (1-based)
+    """
+
+    start: int
+    end: int
+    module: str
+    fqcn: str
+    line: int
+    column: int
+
+
+class StreamRewriter:
+    """
+    Locate and rewrite module keys using node marks from a single compose pass.
+
+    The rewriter mirrors the structural rules of the line-based engine: top-level
+    lists whose first item has ``hosts`` or ``tasks`` are treated as playbooks,
+    other lists as task files, and mappings are searched for task sections.
+    Within every task the first non-directive key with a known mapping is the
+    module, and ``block``/``rescue``/``always`` lists are searched recursively.
+
+    Example:
+        >>> rewriter = StreamRewriter({"copy": "ansible.builtin.copy"}.get)
+        >>> rewriter.rewrite("- copy:\\n    src: a\\n")
+        ('- ansible.builtin.copy:\\n    src: a\\n', 1)
+    """
+
+    def __init__(self, lookup: Callable[[str], Optional[str]]) -> None:
+        """
+        Initialize rewriter with a module lookup.
+
+        Args:
+            lookup: Callable returning the FQCN for a short module name,
+                    or None when the name is not a known module.
+        """
+        self._lookup = lookup
+
+    def locate(self, content: Union[str, ParsedDocument]) -> List[KeySpan]:
+        """
+        Find the spans of all module keys that need conversion.
+
+        Args:
+            content: YAML content or pre-parsed document to scan
+
+        Returns:
+            List of KeySpan objects ordered by position in the content
+
+        Raises:
+            yaml.YAMLError: If the content is not valid YAML
+            SpanMismatchError: If a node mark does not match the source text
+        """
+        return self.scan(content)[0]
+
+    def scan(self, content: Union[str, ParsedDocument]) -> Tuple[List[KeySpan], int]:
+        """
+        Find the module key spans and count the tasks searched for them.
+
+        Args:
+            content: YAML content or pre-parsed document to scan
+
+        Returns:
+            Tuple of (spans ordered by position, number of tasks scanned)
+
+        Raises:
+            yaml.YAMLError: If the content is not valid YAML
+            SpanMismatchError: If a node mark does not match the source text
+        """
+        document = as_document(content)
+        root = document.root
+        if root is None:
+            return [], 0
+
+        spans: Dict[int, KeySpan] = {}
+        tasks = 0
+        for task_list in self._find_task_lists(root):
+            tasks += self._collect_task_list(document.content, task_list, spans)
+
+        return [spans[start] for start in sorted(spans)], tasks
+
+    def rewrite(self, content: Union[str, ParsedDocument]) -> Tuple[str, int]:
+        """
+        Rewrite all module keys in the content in one splice pass.
+
+        Args:
+            content: YAML content or pre-parsed document to convert
+
+        Returns:
+            Tuple of (converted_content, number_of_changes)
+
+        Raises:
+            yaml.YAMLError: If the content is not valid YAML
+            SpanMismatchError: If a node mark does not match the source text
+        """
+        document = as_document(content)
+        spans = self.locate(document)
+        return splice(document.content, spans), len(spans)
+
+    def _find_task_lists(self, root: Node) -> List[SequenceNode]:
+        """Return the task list nodes for a playbook or task file."""
+        if isinstance(root, SequenceNode):
+            if not root.value or not isinstance(root.value[0], MappingNode):
+                return []
+
+            first_keys = {key.value for key, _ in root.value[0].value}
+            if "hosts" in first_keys or "tasks" in first_keys:
+                # Playbook format (list of plays)
+                task_lists = []
+                for play in root.value:
+                    if isinstance(play, MappingNode):
+                        task_lists.extend(self._section_lists(play))
+                return task_lists
+
+            # Task file format (list of tasks)
+            return [root]
+
+        if isinstance(root, MappingNode):
+            return self._section_lists(root)
+
+        return []
+
+    def _section_lists(self, mapping: MappingNode) -> List[SequenceNode]:
+        """Return the task section lists of a play or task mapping."""
+        return [
+            value
+            for key, value in mapping.value
+            if isinstance(key, ScalarNode)
+            and key.value in TASK_SECTIONS
+            and isinstance(value, SequenceNode)
+        ]
+
+    def _collect_task_list(
+        self, content: str, task_list: SequenceNode, spans: Dict[int, KeySpan]
+    ) -> int:
+        """Collect module key spans of a task list and count its tasks."""
+        tasks = 0
+        for task in task_list.value:
+            if not isinstance(task, MappingNode):
+                continue
+            tasks += 1
+
+            # Handle nested structures
+            for key, value in task.value:
+                if (
+                    isinstance(key, ScalarNode)
+                    and key.value in NESTED_TASK_SECTIONS
+                    and isinstance(value, SequenceNode)
+                ):
+                    tasks += self._collect_task_list(content, value, spans)
+
+            # Find the actual module in this task
+            for key, _ in task.value:
+                if not isinstance(key, ScalarNode) or key.value in ANSIBLE_DIRECTIVES:
+                    continue
+
+                fqcn = self._lookup(key.value)
+                if fqcn is None:
+                    continue
+
+                span = self._key_span(content, key, fqcn)
+                spans[span.start] = span
+                break  # Only one module per task
+
+        return tasks
+
+    def _key_span(self, content: str, key: ScalarNode, fqcn: str) -> KeySpan:
+        """Build the span of a key node, excluding any surrounding quotes."""
+        # Marks index into the content after a leading BOM, which compose strips
+        offset = len(BOM) if content.startswith(BOM) else 0
+        start = key.start_mark.index + offset
+        end = key.end_mark.index + offset
+
+        if key.style in ("'", '"'):
+            start += 1
+            end -= 1
+
+        if content[start:end] != key.value:
+            raise SpanMismatchError(
+                f"Key '{key.value}' not found at offset {start} "
+                f"(line {key.start_mark.line + 1})"
+            )
+
+        return KeySpan(
+            start=start,
+            end=end,
+            module=key.value,
+            fqcn=fqcn,
+            line=key.start_mark.line + 1,
+            column=key.start_mark.column + 1,
+        )
+
+
+def splice(content: str, spans: List[KeySpan]) -> str:
+    """
+    Replace the given spans with their FQCNs in a single pass.
+
+    Args:
+        content: Original content
+        spans: Non-overlapping spans ordered by start offset
+
+    Returns:
+        Content with every span replaced by its FQCN
+    """
+    if not spans:
+        return content
+
+    pieces = []
+    position = 0
+    for span in spans:
+        pieces.append(content[position : span.start])
+        pieces.append(span.fqcn)
+        position = span.end
+    pieces.append(content[position:])
+
+    return "".join(pieces)
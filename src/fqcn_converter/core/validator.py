@@ -7,12 +7,14 @@ incomplete conversions.
 """
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Set, Union
+from typing import AbstractSet, Any, Dict, List, Mapping, Optional, Union
 
 import yaml
 
+from ..config.index import load_mapping_index
 from ..config.manager import ConfigurationManager
 from ..exceptions import (
     FileAccessError,
@@ -20,6 +22,10 @@ from ..exceptions import (
     YAMLParsingError,
 )
 from ..utils.logging import get_logger
+from ..utils.profiling import phase
+from .cache import ResultCache, mapping_fingerprint
+from .document import TASK_SECTIONS, ParsedDocument, as_document
+from .reader import SizePolicy
 
 logger = get_logger(__name__)
 
@@ -128,18 +134,38 @@ class ValidationEngine:
         >>> result = validator.validate_content(yaml_content)
     """
 
-    def __init__(self) -> None:
-        """Initialize validation engine."""
+    def __init__(
+        self,
+        cache: Optional[ResultCache] = None,
+        max_file_size: Optional[int] = None,
+        large_files: str = "skip",
+    ) -> None:
+        """
+        Initialize validation engine.
+
+        Args:
+            cache: Optional on-disk result cache. validate_conversion looks
+                  results up by file content and mapping fingerprint and skips
+                  parsing on a hit.
+            max_file_size: Size in bytes above which validate_conversion
+                          applies the large_files policy; None (default)
+                          reads every file
+            large_files: Policy for files above max_file_size: "skip" (default)
+                        leaves them unread, "stream" reads only files whose
+                        memory-mapped bytes contain a known short name or FQCN
+                        key, "process" validates them normally
+        """
         self._config_manager = ConfigurationManager()
-        self._known_modules: Dict[str, str] = {}
-        self._fqcn_modules: Set[str] = set()
+        self._known_modules: Mapping[str, str] = {}
+        self._fqcn_modules: AbstractSet[str] = set()
+        self._cache = cache
+        self._fingerprint = ""
 
         try:
-            # Load known module mappings for validation
-            self._known_modules = self._config_manager.load_default_mappings()
-
-            # Build set of FQCN module names for validation
-            self._fqcn_modules = set(self._known_modules.values())
+            # Known module mappings and their FQCNs, shared across components
+            index = load_mapping_index(manager=self._config_manager)
+            self._known_modules = index
+            self._fqcn_modules = index.fqcns
 
             logger.info(
                 f"Initialized validator with {len(self._known_modules)} known modules"
@@ -150,12 +176,26 @@ class ValidationEngine:
             self._known_modules = {}
             self._fqcn_modules = set()
 
-    def validate_conversion(self, file_path: Union[str, Path]) -> ValidationResult:
+        if self._cache is not None:
+            self._fingerprint = mapping_fingerprint(self._known_modules)
+
+        self._size_policy = SizePolicy(
+            max_file_size,
+            large_files,
+            chain(self._known_modules, self._fqcn_modules),
+        )
+
+    def validate_conversion(
+        self,
+        file_path: Union[str, Path],
+        document: Optional[ParsedDocument] = None,
+    ) -> ValidationResult:
         """
         Validate that a file has been properly converted.
 
         Args:
             file_path: Path to the file to validate
+            document: Pre-parsed document of the file; read from disk if None
 
         Returns:
             ValidationResult with validation details
@@ -169,25 +209,56 @@ class ValidationEngine:
         result = ValidationResult(valid=True, file_path=str(file_path))
 
         try:
-            # Read file content
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except (IOError, OSError) as e:
-                raise FileAccessError(
-                    f"Cannot read file for validation: {file_path}", details=str(e)
-                ) from e
+            # Read file content unless the caller already parsed it or the
+            # size policy rules it out
+            if document is None:
+                reason = self._size_policy.check(file_path)
+                if reason is not None:
+                    result.score = 1.0
+                    result.issues.append(
+                        ValidationIssue(
+                            line_number=1,
+                            column=1,
+                            severity="info",
+                            message=reason,
+                            suggestion="Raise --max-file-size or use "
+                            "--large-files process to validate this file",
+                        )
+                    )
+                    return result
+                try:
+                    with phase("read"), open(file_path, "r", encoding="utf-8") as f:
+                        document = ParsedDocument(f.read(), file_path)
+                except (IOError, OSError) as e:
+                    raise FileAccessError(
+                        f"Cannot read file for validation: {file_path}",
+                        details=str(e),
+                    ) from e
+
+            # Reuse the cached result for unchanged content
+            cache_key = None
+            if self._cache is not None:
+                cache_key = self._cache.make_key(document.content, self._fingerprint)
+                payload = self._cache.get("validate", cache_key)
+                if payload is not None:
+                    logger.debug("Using cached validation result for %s", file_path)
+                    return self._result_from_payload(str(file_path), payload)
 
             # Parse and validate content
-            self._validate_content(content, result)
+            self._validate_content(document, result)
 
             # Calculate overall validation score
-            result.score = self._calculate_completeness_score(content, result.issues)
+            result.score = self._calculate_completeness_score(document, result.issues)
 
             # Determine if validation passed
             error_count = sum(1 for issue in result.issues if issue.severity == "error")
             result.valid = error_count == 0
 
+            if cache_key is not None:
+                payload = asdict(result)
+                del payload["file_path"]
+                self._cache.put("validate", cache_key, payload)
+
             logger.debug(
                 f"Validation completed for {file_path}: "
                 f"valid={result.valid}, score={result.score:.2f}, "
@@ -204,49 +275,63 @@ class ValidationEngine:
                 f"Unexpected error during validation: {file_path}", details=str(e)
             ) from e
 
+    def _result_from_payload(
+        self, file_path: str, payload: Dict[str, Any]
+    ) -> ValidationResult:
+        """Rebuild a ValidationResult from a cached payload."""
+        fields = dict(payload)
+        fields["issues"] = [ValidationIssue(**issue) for issue in fields["issues"]]
+        return ValidationResult(file_path=file_path, **fields)
+
     def validate_content(
-        self, content: str, file_path: str = "<content>"
+        self, content: Union[str, ParsedDocument], file_path: str = "<content>"
     ) -> ValidationResult:
         """
         Validate content string for FQCN compliance.
 
         Args:
-            content: The content to validate
+            content: The content to validate, as text or a pre-parsed document
             file_path: Optional file path for reporting
 
         Returns:
             ValidationResult with validation details
         """
-        result = ValidationResult(valid=True, file_path=file_path)
+        with phase("validate"):
+            result = ValidationResult(valid=True, file_path=file_path)
+            document = as_document(content, file_path)
 
-        self._validate_content(content, result)
+            self._validate_content(document, result)
 
-        # Count modules and calculate score
-        try:
-            yaml_data = yaml.safe_load(content)
-            if yaml_data is not None:
-                total_modules, fqcn_modules, short_modules = self._count_modules(
-                    yaml_data
-                )
-                result.total_modules = total_modules
-                result.fqcn_modules = fqcn_modules
-                result.short_modules = short_modules
-        except Exception as e:
-            logger.warning(f"Error counting modules: {e}")
+            # Count modules and calculate score
+            try:
+                yaml_data = document.skeleton
+                if yaml_data is not None:
+                    total_modules, fqcn_modules, short_modules = self._count_modules(
+                        yaml_data
+                    )
+                    result.total_modules = total_modules
+                    result.fqcn_modules = fqcn_modules
+                    result.short_modules = short_modules
+            except Exception as e:
+                logger.warning(f"Error counting modules: {e}")
 
-        result.score = self._calculate_completeness_score(content, result.issues)
+            result.score = self._calculate_completeness_score(document, result.issues)
 
-        error_count = sum(1 for issue in result.issues if issue.severity == "error")
-        result.valid = error_count == 0
+            error_count = sum(1 for issue in result.issues if issue.severity == "error")
+            result.valid = error_count == 0
 
-        return result
+            return result
 
-    def _validate_content(self, content: str, result: ValidationResult) -> None:
+    def _validate_content(
+        self, content: Union[str, ParsedDocument], result: ValidationResult
+    ) -> None:
         """Perform validation on content and populate result with issues."""
+        document = as_document(content, result.file_path)
         try:
-            # Parse YAML content
+            # Only keys down to task level are checked, so skip constructing
+            # values such as large vars blocks
             try:
-                yaml_data = yaml.safe_load(content)
+                yaml_data = document.skeleton
             except yaml.YAMLError as e:
                 result.issues.append(
                     ValidationIssue(
@@ -262,16 +347,13 @@ class ValidationEngine:
             if yaml_data is None:
                 return
 
-            # Split content into lines for line number tracking
-            lines = content.split("\n")
-
             # Validate different Ansible structures
             if isinstance(yaml_data, list):
                 # Playbook format (list of plays)
-                self._validate_playbook(yaml_data, lines, result)
+                self._validate_playbook(yaml_data, document, result)
             elif isinstance(yaml_data, dict):
                 # Task file or other dict-based format
-                self._validate_dict_structure(yaml_data, lines, result)
+                self._validate_dict_structure(yaml_data, document, result)
 
         except Exception as e:
             result.issues.append(
@@ -285,7 +367,10 @@ class ValidationEngine:
             )
 
     def _validate_playbook(
-        self, playbook: List[Any], lines: List[str], result: ValidationResult
+        self,
+        playbook: List[Any],
+        document: ParsedDocument,
+        result: ValidationResult,
     ) -> None:
         """Validate playbook structure (list of plays)."""
         for play_idx, play in enumerate(playbook):
@@ -293,23 +378,30 @@ class ValidationEngine:
                 continue
 
             # Validate tasks in different sections
-            for section in ["tasks", "handlers", "pre_tasks", "post_tasks"]:
+            for section in TASK_SECTIONS:
                 if section in play and isinstance(play[section], list):
                     self._validate_tasks(
-                        play[section], lines, result, f"play[{play_idx}].{section}"
+                        play[section], document, result, f"play[{play_idx}].{section}"
                     )
 
     def _validate_dict_structure(
-        self, data: Dict[str, Any], lines: List[str], result: ValidationResult
+        self,
+        data: Dict[str, Any],
+        document: ParsedDocument,
+        result: ValidationResult,
     ) -> None:
         """Validate dictionary-based structure."""
         # Check for tasks in various locations
-        for section in ["tasks", "handlers", "pre_tasks", "post_tasks"]:
+        for section in TASK_SECTIONS:
             if section in data and isinstance(data[section], list):
-                self._validate_tasks(data[section], lines, result, section)
+                self._validate_tasks(data[section], document, result, section)
 
     def _validate_tasks(
-        self, tasks: List[Any], lines: List[str], result: ValidationResult, context: str
+        self,
+        tasks: List[Any],
+        document: ParsedDocument,
+        result: ValidationResult,
+        context: str,
     ) -> None:
         """Validate tasks for FQCN compliance."""
         for task_idx, task in enumerate(tasks):
@@ -343,8 +435,13 @@ class ValidationEngine:
                 ]:
                     continue
 
-                # Find line number for this task/module
-                line_number = self._find_line_number(lines, key, task_idx)
+                # Exact position of this key from the node graph marks
+                position = document.key_position(task, key)
+                if position is not None:
+                    line_number, column = position
+                else:
+                    line_number = self._find_line_number(document.lines, key, task_idx)
+                    column = 1
 
                 # Check if this is a known short module name
                 if key in self._known_modules:
@@ -352,7 +449,7 @@ class ValidationEngine:
                     result.issues.append(
                         ValidationIssue(
                             line_number=line_number,
-                            column=1,
+                            column=column,
                             severity="error",
                             message=f"Short module name '{key}' should be converted to FQCN",
                             suggestion=f"Replace '{key}' with '{fqcn}'",
@@ -367,7 +464,7 @@ class ValidationEngine:
                         result.issues.append(
                             ValidationIssue(
                                 line_number=line_number,
-                                column=1,
+                                column=column,
                                 severity="info",
                                 message=f"Unknown FQCN module '{key}' - verify this is correct",
                                 suggestion="Ensure this FQCN is valid and the collection is available",
@@ -378,7 +475,7 @@ class ValidationEngine:
                         result.issues.append(
                             ValidationIssue(
                                 line_number=line_number,
-                                column=1,
+                                column=column,
                                 severity="warning",
                                 message=f"Unknown module '{key}' - may need FQCN conversion",
                                 suggestion="Check if this module requires FQCN conversion",
@@ -388,7 +485,12 @@ class ValidationEngine:
     def _find_line_number(
         self, lines: List[str], module_name: str, task_index: int
     ) -> int:
-        """Find the line number where a module is used."""
+        """
+        Estimate the line number where a module is used.
+
+        Fallback for keys without a node position; scans all lines and
+        returns the first match, so prefer ParsedDocument.key_position.
+        """
         # Simple heuristic to find the line number
         # Look for the module name in the lines
         for i, line in enumerate(lines):
@@ -484,21 +586,21 @@ class ValidationEngine:
         return total_modules, fqcn_modules, short_modules
 
     def _calculate_completeness_score(
-        self, content: str, issues: List[ValidationIssue]
+        self, content: Union[str, ParsedDocument], issues: List[ValidationIssue]
     ) -> float:
         """
         Calculate FQCN completeness score (0.0 to 1.0).
 
         Args:
-            content: The file content
+            content: The file content or its pre-parsed document
             issues: List of validation issues
 
         Returns:
             Score from 0.0 (no FQCN compliance) to 1.0 (fully compliant)
         """
         try:
-            # Parse content to count modules
-            yaml_data = yaml.safe_load(content)
+            # Reuse the parsed document to count modules
+            yaml_data = as_document(content).skeleton
             if yaml_data is None:
                 return 1.0  # Empty file is considered compliant
 
@@ -537,7 +639,7 @@ class ValidationEngine:
             # Playbook format
             for play in yaml_data:
                 if isinstance(play, dict):
-                    for section in ["tasks", "handlers", "pre_tasks", "post_tasks"]:
+                    for section in TASK_SECTIONS:
                         if section in play and isinstance(play[section], list):
                             t, f, s = self._count_modules_in_tasks(play[section])
                             total_modules += t
@@ -546,7 +648,7 @@ class ValidationEngine:
 
         elif isinstance(yaml_data, dict):
             # Task file format
-            for section in ["tasks", "handlers", "pre_tasks", "post_tasks"]:
+            for section in TASK_SECTIONS:
                 if section in yaml_data and isinstance(yaml_data[section], list):
                     t, f, s = self._count_modules_in_tasks(yaml_data[section])
                     total_modules += t
@@ -624,11 +726,10 @@ class ValidationEngine:
 
         return total_modules, fqcn_modules, short_modules
 
-
     def validate_file(self, file_path: Union[str, Path]) -> ValidationResult:
         """Alias for validate_conversion for backward compatibility."""
         return self.validate_conversion(file_path)
 
 
 # Alias for backward compatibility and simpler imports
-FQCNValidator = ValidationEngine
\ No newline at end of file
+FQCNValidator = ValidationEngine
@@ -0,0 +1,379 @@
+"""
+File-level workers for batch FQCN conversion.
+
+Batch processing flattens the files of all projects into one work queue,
+ordered largest-file-first so long conversions start early and the pool stays
+busy until the end. Files are converted either on a thread pool sharing one
+converter, or in worker processes: conversion is pure-Python YAML parsing and
+text rewriting, so threads are limited to roughly one core by the GIL. Each
+worker process builds a single FQCNConverter in its initializer, receives
+chunks of file paths, and sends back compact FileRecord tuples rather than
+full ConversionResult objects with file bodies.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from pathlib import Path
+from typing import (
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .converter import ConversionMetrics, FQCNConverter
+
+# Available executors for batch processing
+EXECUTORS = ("thread", "process")
+
+# Number of chunks queued per worker, to balance load without tiny tasks
+CHUNKS_PER_WORKER = 4
+
+# Upper bound on files per chunk
+MAX_CHUNK_SIZE = 64
+
+# Thread batches of at most this many files are converted on the calling
+# thread, as starting the threads would take longer than the conversions
+INLINE_MAX_FILES = 8
+
+# Converter owned by the current worker process
+_worker_converter: Optional[FQCNConverter] = None
+
+# Project identifier of a ProjectFiles, a path string or Path
+ProjectT = TypeVar("ProjectT", bound=Hashable)
+
+
+class FileRecord(NamedTuple):
+    """
+    Compact outcome of converting one file in a batch worker.
+
+    Attributes:
+        file_path: Path of the converted file
+        success: Whether the converter reported success
+        changes_made: Number of modules converted
+        errors: Errors reported by the converter
+        warnings: Warnings reported by the converter
+        exception: Message of an exception raised while converting, if any
+        processing_time: Time spent converting the file in seconds
+        metrics: Per-phase timings and counters of the conversion, if any
+    """
+
+    file_path: str
+    success: bool
+    changes_made: int
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+    exception: Optional[str]
+    processing_time: float
+    metrics: Optional[ConversionMetrics] = None
+
+
+def init_worker(config_path: Optional[str] = None) -> None:
+    """
+    Build the converter used by this worker process.
+
+    Args:
+        config_path: Optional path to a custom mapping configuration
+    """
+    global _worker_converter
+    _worker_converter = FQCNConverter(config_path=config_path)
+
+
+def convert_file_record(
+    converter: FQCNConverter, file_path: str, dry_run: bool = False
+) -> FileRecord:
+    """
+    Convert one file and summarize the outcome as a FileRecord.
+
+    Args:
+        converter: Converter to use
+        file_path: Path of the file to convert
+        dry_run: If True, perform conversion without writing changes
+
+    Returns:
+        FileRecord for the file; exceptions are captured, not raised
+    """
+    start_time = time.time()
+    try:
+        if dry_run:
+            result = converter.convert_file(file_path, dry_run=True)
+        else:
+            result = converter.convert_file(file_path)
+        return FileRecord(
+            file_path=file_path,
+            success=result.success,
+            changes_made=result.changes_made,
+            errors=tuple(result.errors),
+            warnings=tuple(result.warnings),
+            exception=None,
+            processing_time=time.time() - start_time,
+            metrics=result.metrics,
+        )
+    except Exception as e:
+        return FileRecord(
+            file_path=file_path,
+            success=False,
+            changes_made=0,
+            errors=(),
+            warnings=(),
+            exception=str(e),
+            processing_time=time.time() - start_time,
+        )
+
+
+def convert_chunk(file_paths: Sequence[str], dry_run: bool = False) -> List[FileRecord]:
+    """
+    Convert a chunk of files with the worker's converter.
+
+    Args:
+        file_paths: Paths of the files to convert
+        dry_run: If True, perform conversion without writing changes
+
+    Returns:
+        One FileRecord per file, in input order
+    """
+    if _worker_converter is None:
+        init_worker()
+
+    return [
+        convert_file_record(_worker_converter, file_path, dry_run)
+        for file_path in file_paths
+    ]
+
+
+def largest_first(file_paths: Sequence[Union[str, Path]]) -> List[str]:
+    """
+    Order file paths by size, largest first.
+
+    Files that cannot be stat-ed sort last; their error is reported when
+    the conversion tries to read them.
+
+    Args:
+        file_paths: Paths to order
+
+    Returns:
+        Paths as strings, largest file first
+    """
+    sizes = {}
+    for path in file_paths:
+        try:
+            sizes[str(path)] = os.stat(path).st_size
+        except OSError:
+            sizes[str(path)] = -1
+
+    return sorted(sizes, key=sizes.__getitem__, reverse=True)
+
+
+class ProjectFiles(Generic[ProjectT]):
+    """
+    Files of several projects scheduled as one work queue.
+
+    Projects may be nested or overlap, e.g. ``p`` and ``p/sub``: a file
+    shared by several projects is scheduled once and its record counted
+    towards every project containing it, so each project completes once all
+    of its own files have a record.
+
+    Example:
+        >>> work = ProjectFiles({"p": ["p/a.yml", "p/sub/b.yml"],
+        ...                      "p/sub": ["p/sub/b.yml"]})
+        >>> records = iter_thread_records(converter, largest_first(work.files))
+        >>> for project, project_records in work.collect(records):
+        ...     print(project, len(project_records))
+    """
+
+    def __init__(
+        self, project_files: Mapping[ProjectT, Sequence[Union[str, Path]]]
+    ) -> None:
+        """
+        Index the files of every project.
+
+        Args:
+            project_files: Files of each project; projects without files
+                          are never completed by collect()
+        """
+        self._owners: Dict[str, List[ProjectT]] = {}
+        self._expected: Dict[ProjectT, int] = {}
+        for project, files in project_files.items():
+            paths = {os.path.normpath(str(path)) for path in files}
+            if not paths:
+                continue
+            self._expected[project] = len(paths)
+            for path in paths:
+                self._owners.setdefault(path, []).append(project)
+
+    @property
+    def files(self) -> List[str]:
+        """Files to convert, each once however many projects contain it."""
+        return list(self._owners)
+
+    def collect(
+        self, records: Iterable[FileRecord]
+    ) -> Iterator[Tuple[ProjectT, List[FileRecord]]]:
+        """
+        Group file records by project as they arrive.
+
+        Args:
+            records: Records of the scheduled files, in any order
+
+        Yields:
+            (project, records) as soon as a project's last file has a record
+        """
+        remaining = dict(self._expected)
+        collected: Dict[ProjectT, List[FileRecord]] = {
+            project: [] for project in remaining
+        }
+        for record in records:
+            for project in self._owners.get(os.path.normpath(record.file_path), ()):
+                collected[project].append(record)
+                remaining[project] -= 1
+                if remaining[project] == 0:
+                    # Release the records of a finished project straight away
+                    yield project, collected.pop(project)
+
+
+def iter_thread_records(
+    converter: FQCNConverter,
+    file_paths: Sequence[Union[str, Path]],
+    dry_run: bool = False,
+    max_workers: int = 4,
+) -> Iterator[FileRecord]:
+    """
+    Convert files on a thread pool and yield records as files complete.
+
+    Files are submitted in the given order, so pass them largest-first.
+    Closing the generator early cancels files that have not started yet.
+    Up to INLINE_MAX_FILES files are converted on the calling thread instead.
+
+    Args:
+        converter: Converter shared by all threads
+        file_paths: Paths of the files to convert
+        dry_run: If True, perform conversion without writing changes
+        max_workers: Number of threads
+
+    Yields:
+        FileRecord for every file, in completion order
+    """
+    paths = [str(path) for path in file_paths]
+    if not paths:
+        return
+
+    if len(paths) <= INLINE_MAX_FILES:
+        for path in paths:
+            yield convert_file_record(converter, path, dry_run)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths))))
+    pending: Set[Future] = set()
+    try:
+        pending = {
+            executor.submit(convert_file_record, converter, path, dry_run)
+            for path in paths
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # Cancel work that has not started; shutdown() only takes
+        # cancel_futures from Python 3.9
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def chunk_files(
+    file_paths: Sequence[str], max_workers: int, chunk_size: Optional[int] = None
+) -> List[List[str]]:
+    """
+    Split file paths into chunks for the worker pool.
+
+    Args:
+        file_paths: Paths to split
+        max_workers: Number of worker processes
+        chunk_size: Files per chunk; derived from the worker count if None
+
+    Returns:
+        List of file path chunks
+    """
+    if chunk_size is None:
+        chunk_size = math.ceil(len(file_paths) / (max_workers * CHUNKS_PER_WORKER))
+        chunk_size = min(MAX_CHUNK_SIZE, chunk_size)
+    chunk_size = max(1, chunk_size)
+
+    return [
+        list(file_paths[i : i + chunk_size])
+        for i in range(0, len(file_paths), chunk_size)
+    ]
+
+
+def iter_file_records(
+    file_paths: Sequence[Union[str, Path]],
+    dry_run: bool = False,
+    max_workers: int = 4,
+    config_path: Optional[Union[str, Path]] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[FileRecord]:
+    """
+    Convert files in a process pool and yield records as chunks complete.
+
+    Chunks are cut from the given order, so pass files largest-first to
+    start the longest conversions early. Closing the generator early cancels
+    chunks that have not started yet.
+
+    Args:
+        file_paths: Paths of the files to convert
+        dry_run: If True, perform conversion without writing changes
+        max_workers: Number of worker processes
+        config_path: Optional path to a custom mapping configuration
+        chunk_size: Files per chunk; derived from the worker count if None
+
+    Yields:
+        FileRecord for every file, grouped by chunk in completion order
+
+    Example:
+        >>> for record in iter_file_records(files, dry_run=True, max_workers=8):
+        ...     print(record.file_path, record.changes_made)
+    """
+    paths = [str(path) for path in file_paths]
+    if not paths:
+        return
+
+    max_workers = max(1, max_workers)
+    chunks = chunk_files(paths, max_workers, chunk_size)
+    executor = ProcessPoolExecutor(
+        max_workers=min(max_workers, len(chunks)),
+        initializer=init_worker,
+        initargs=(str(config_path) if config_path else None,),
+    )
+
+    pending: Set[Future] = set()
+    try:
+        pending = {executor.submit(convert_chunk, chunk, dry_run) for chunk in chunks}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        # Cancel work that has not started; shutdown() only takes
+        # cancel_futures from Python 3.9
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,355 @@
+"""
+Crash-safe writing of converted files.
+
+Converted content is written to a temporary file next to its target and
+swapped in with ``os.replace``, so a crash or a full disk leaves either the
+old or the new file, never a truncated one. The temporary file takes over the
+permissions, owner and group of the file it replaces, and symlinks are
+followed so the link itself stays in place.
+
+Replacing a file gives it a new inode, which would split hardlinks and drop
+POSIX ACLs. Files with more than one link or with an ACL, and files whose
+owner cannot be restored (e.g. another user's file written by a non-root
+user), are therefore rewritten in place instead, without the crash safety
+of a swap. Other extended attributes are not carried over.
+
+Durability is governed by an fsync policy:
+
+- ``"file"``: each file is fsynced before it is swapped in
+- ``"batch"``: written files and their directories are synced when the
+  writer is flushed, instead of on every write
+- ``"none"``: durability is left to the operating system
+
+A FileWriter can also write behind: writes are queued to a background thread
+so the caller never waits on the disk, and failures are collected until
+flush(). An unexpected error in the background thread is re-raised by flush().
+"""
+
+import os
+import queue
+import stat
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Union
+
+from ..exceptions import ConfigurationError
+from ..utils.logging import get_logger
+from ..utils.profiling import phase
+
+logger = get_logger(__name__)
+
+# When written files are made durable: on every write, on flush, or never
+FSYNC_POLICIES = ("file", "batch", "none")
+
+# Pending writes of a write-behind writer before write() blocks
+WRITE_BEHIND_QUEUE_SIZE = 64
+
+# Mode of files created from scratch, before the umask
+_NEW_FILE_MODE = 0o666
+
+# Extended attributes holding POSIX ACLs, which a replaced file would lose
+_ACL_XATTRS = ("system.posix_acl_access", "system.posix_acl_default")
+
+
+class WriteFailure(NamedTuple):
+    """A queued write that failed."""
+
+    path: str
+    error: OSError
+
+
+def check_fsync_policy(policy: str) -> None:
+    """Raise ConfigurationError for an unknown fsync policy."""
+    if policy not in FSYNC_POLICIES:
+        raise ConfigurationError(
+            f"Unknown fsync policy: {policy}",
+            details=f"Available policies: {', '.join(FSYNC_POLICIES)}",
+        )
+
+
+def _current_umask() -> int:
+    """Return the process umask, without changing it where the platform allows."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    # Elsewhere the umask can only be read by setting it; this briefly
+    # affects files other threads create, so it is only done for new files
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def _must_write_in_place(target: str, st: os.stat_result) -> bool:
+    """Check whether replacing a file would split hardlinks or drop an ACL."""
+    if st.st_nlink > 1:
+        return True
+    if not hasattr(os, "listxattr"):
+        return False
+    try:
+        return any(name in _ACL_XATTRS for name in os.listxattr(target))
+    except OSError:
+        return False
+
+
+def _restore_owner(tmp_path: str, st: os.stat_result) -> bool:
+    """Give a temporary file the owner and group of the file it replaces."""
+    if not hasattr(os, "chown"):
+        return True
+    if (st.st_uid, st.st_gid) == (os.geteuid(), os.getegid()):
+        return True
+    try:
+        os.chown(tmp_path, st.st_uid, st.st_gid)
+    except OSError:
+        return False
+    return True
+
+
+def _write_in_place(target: str, data: bytes, fsync: bool) -> None:
+    """Overwrite a file's content, keeping its inode, links and attributes."""
+    with open(target, "wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def atomic_write(
+    file_path: Union[str, Path], content: Union[str, bytes], fsync: bool = False
+) -> None:
+    """
+    Replace a file's content atomically.
+
+    Hardlinked files, files with a POSIX ACL and files whose owner cannot
+    be kept are rewritten in place instead; see the module docstring.
+
+    Args:
+        file_path: File to write; a symlink is followed and its target written
+        content: New content; str is encoded as UTF-8
+        fsync: Flush the new content and the directory entry to disk
+
+    Raises:
+        OSError: If the file cannot be written; the original is left untouched
+    """
+    target = os.path.realpath(file_path)
+    directory = os.path.dirname(target)
+    data = content.encode("utf-8") if isinstance(content, str) else content
+
+    try:
+        st: Optional[os.stat_result] = os.stat(target)
+    except FileNotFoundError:
+        st = None
+
+    if st is not None and _must_write_in_place(target, st):
+        _write_in_place(target, data, fsync)
+        return
+    mode = stat.S_IMODE(st.st_mode) if st else _NEW_FILE_MODE & ~_current_umask()
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(target)}.", suffix=".tmp"
+    )
+    try:
+        try:
+            f = open(fd, "wb")
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        owner_kept = st is None or _restore_owner(tmp_path, st)
+        if owner_kept:
+            os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if not owner_kept:
+        # Replacing the file would hand it to the current user
+        os.unlink(tmp_path)
+        _write_in_place(target, data, fsync)
+        return
+
+    if fsync:
+        _fsync_directory(directory)
+
+
+def _fsync_file(file_path: str) -> None:
+    """Flush a written file to disk without needing write permission on it."""
+    # Windows can only flush handles opened for writing
+    flags = os.O_RDWR if sys.platform == "win32" else os.O_RDONLY
+    fd = os.open(file_path, flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(directory: str) -> None:
+    """Flush a directory entry to disk where the platform allows it."""
+    if sys.platform == "win32":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class FileWriter:
+    """
+    Writes converted files atomically under an fsync policy.
+
+    Example:
+        >>> writer = FileWriter(fsync="batch", write_behind=True)
+        >>> writer.write("site.yml", converted_content)
+        >>> for failure in writer.flush():
+        ...     print(f"{failure.path}: {failure.error}")
+    """
+
+    def __init__(self, fsync: str = "none", write_behind: bool = False) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            fsync: "file", "batch" or "none"; see the module documentation
+            write_behind: Queue writes to a background thread; OSErrors are
+                         returned by flush() instead of raised by write(),
+                         other errors are raised by flush()
+
+        Raises:
+            ConfigurationError: If the fsync policy is unknown
+        """
+        check_fsync_policy(fsync)
+        self.fsync = fsync
+        self.write_behind = write_behind
+        self._written: List[str] = []
+        self._failures: List[WriteFailure] = []
+        self._error: Optional[Exception] = None
+        self._lock = threading.Lock()
+        self._queue: Optional["queue.Queue[Optional[tuple]]"] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self, file_path: Union[str, Path], content: Union[str, bytes]) -> int:
+        """
+        Write a file, or queue the write when writing behind.
+
+        Args:
+            file_path: File to replace
+            content: New content
+
+        Returns:
+            Number of bytes written or queued
+
+        Raises:
+            OSError: If a direct write fails
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        if not self.write_behind:
+            self._write(os.fspath(file_path), data)
+            return len(data)
+
+        with self._lock:
+            if self._thread is None:
+                self._queue = queue.Queue(maxsize=WRITE_BEHIND_QUEUE_SIZE)
+                self._thread = threading.Thread(
+                    target=self._drain,
+                    args=(self._queue,),
+                    name="fqcn-write-behind",
+                    daemon=True,
+                )
+                self._thread.start()
+            pending = self._queue
+        pending.put((os.fspath(file_path), data))
+        return len(data)
+
+    def _write(self, file_path: str, data: bytes) -> None:
+        with phase("write"):
+            atomic_write(file_path, data, fsync=self.fsync == "file")
+        if self.fsync == "batch":
+            with self._lock:
+                self._written.append(file_path)
+
+    def _drain(self, pending: "queue.Queue[Optional[tuple]]") -> None:
+        """Run queued writes until the end marker arrives."""
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            file_path, data = item
+            try:
+                self._write(file_path, data)
+            except OSError as e:
+                logger.debug(f"Failed to write {file_path}: {e}")
+                with self._lock:
+                    self._failures.append(WriteFailure(file_path, e))
+            except Exception as e:
+                # Keep draining so write() never blocks on a full queue
+                logger.error(f"Unexpected error writing {file_path}: {e}")
+                with self._lock:
+                    if self._error is None:
+                        self._error = e
+
+    def flush(self) -> List[WriteFailure]:
+        """
+        Wait for queued writes and sync written files under the batch policy.
+
+        The background thread of a write-behind writer stops here and is
+        started again by the next write.
+
+        Returns:
+            Queued writes that failed since the last flush
+
+        Raises:
+            Exception: The first unexpected error of the background thread
+                      since the last flush
+        """
+        with self._lock:
+            thread, pending = self._thread, self._queue
+            self._thread = self._queue = None
+        if thread is not None:
+            pending.put(None)
+            thread.join()
+
+        with self._lock:
+            written, self._written = self._written, []
+            failures, self._failures = self._failures, []
+            error, self._error = self._error, None
+
+        if written:
+            self._sync(written)
+        if error is not None:
+            raise error
+        return failures
+
+    def _sync(self, written: List[str]) -> None:
+        """Make a batch of written files and their directory entries durable."""
+        targets = [os.path.realpath(file_path) for file_path in written]
+        for target in targets:
+            try:
+                _fsync_file(target)
+            except OSError as e:
+                logger.warning(f"Failed to sync {target}: {e}")
+        for directory in dict.fromkeys(map(os.path.dirname, targets)):
+            try:
+                _fsync_directory(directory)
+            except OSError as e:
+                logger.warning(f"Failed to sync {directory}: {e}")
+
+    def __enter__(self) -> "FileWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
@@ -84,10 +84,19 @@ class ConsoleReportFormatter(ReportFormatter):
             lines.append(f"  Conversions Made: {stats.total_conversions_made}")
             lines.append(f"  Conversion Efficiency: {self._colorize_percentage(stats.conversion_efficiency)}")
             lines.append(f"  Processing Speed: {stats.processing_speed:.1f} files/sec")
+            lines.append(f"  Throughput: {stats.throughput:.2f} MB/sec")
+            if any(stats.phase_times.values()):
+                phases = ", ".join(f"{name} {seconds:.3f}s"
+                                   for name, seconds in stats.phase_times.items())
+                lines.append(f"  Phase Times: {phases}")
+            if stats.peak_memory_usage:
+                lines.append(f"  Peak Memory: {stats.peak_memory_usage / (1024 * 1024):.1f} MB")
         else:
             lines.append(f"  {stats.total_files_processed} files, "
                         f"{self._colorize_percentage(stats.success_rate)} success, "
-                        f"{stats.total_conversions_made} conversions")
+                        f"{stats.total_conversions_made} conversions, "
+                        f"{stats.processing_speed:.1f} files/sec, "
+                        f"{stats.throughput:.2f} MB/sec")
         
         lines.append("")
         
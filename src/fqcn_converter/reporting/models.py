@@ -38,6 +38,9 @@ class FileChangeRecord:
     error_message: Optional[str] = None
     warnings: List[str] = None
     conversions: List[Dict[str, Any]] = None
+    bytes_written: int = 0
+    tasks_scanned: int = 0
+    phase_times: Dict[str, float] = None
     
     def __post_init__(self):
         """Initialize default values."""
@@ -45,6 +48,8 @@ class FileChangeRecord:
             self.warnings = []
         if self.conversions is None:
             self.conversions = []
+        if self.phase_times is None:
+            self.phase_times = {}
     
     @property
     def success_rate(self) -> float:
@@ -111,6 +116,14 @@ class ConversionStatistics:
     average_processing_time: float = 0.0
     average_file_size: float = 0.0
     peak_memory_usage: Optional[int] = None
+    total_bytes_written: int = 0
+    total_tasks_scanned: int = 0
+    phase_times: Dict[str, float] = None
+    
+    def __post_init__(self):
+        """Initialize default values."""
+        if self.phase_times is None:
+            self.phase_times = {}
     
     @property
     def success_rate(self) -> float:
@@ -133,6 +146,13 @@ class ConversionStatistics:
             return 0.0
         return self.total_files_processed / self.total_processing_time
     
+    @property
+    def throughput(self) -> float:
+        """Calculate megabytes processed per second."""
+        if self.total_processing_time == 0:
+            return 0.0
+        return self.total_bytes_processed / (1024 * 1024) / self.total_processing_time
+    
     def update_from_file_record(self, record: FileChangeRecord) -> None:
         """Update statistics from a file change record."""
         self.total_files_processed += 1
@@ -140,6 +160,10 @@ class ConversionStatistics:
         self.total_conversions_attempted += record.conversions_attempted
         self.total_processing_time += record.processing_time
         self.total_bytes_processed += record.file_size_bytes
+        self.total_bytes_written += record.bytes_written
+        self.total_tasks_scanned += record.tasks_scanned
+        for name, seconds in record.phase_times.items():
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + seconds
         
         if record.status == ConversionStatus.SUCCESS:
             self.total_files_successful += 1
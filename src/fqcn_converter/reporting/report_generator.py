@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, Union
 from .models import ConversionReport, FileChangeRecord, ConversionStatus
 from .formatters import JSONReportFormatter, ConsoleReportFormatter
 from ..utils.logging import get_logger
+from ..utils.profiling import peak_memory_bytes
 
 logger = get_logger(__name__)
 
@@ -32,11 +33,26 @@ class ReportGenerator:
         self.report.target_path = target_path
         logger.info(f"Started conversion session {self.session_id} for {target_path}")
     
-    def add_file_result(self, file_path: Path, result: Any, processing_time: float) -> None:
-        """Add a file conversion result to the report."""
+    def add_file_result(self, file_path: Path, result: Any, processing_time: float,
+                        document: Optional[Any] = None) -> None:
+        """Add a file conversion result to the report.
+
+        The optional ``document`` is the ParsedDocument the result was produced
+        from; when given, its size is used instead of stat-ing the file again.
+        Phase timings and counters are taken from the result's ``metrics``.
+        """
         try:
+            metrics = getattr(result, 'metrics', None)
+            if not isinstance(getattr(metrics, 'phase_times', None), dict):
+                metrics = None
+            
             # Get file size
-            file_size = file_path.stat().st_size if file_path.exists() else 0
+            if document is not None:
+                file_size = document.size_bytes
+            elif metrics is not None and metrics.bytes_read:
+                file_size = metrics.bytes_read
+            else:
+                file_size = file_path.stat().st_size if file_path.exists() else 0
             
             # Determine status
             if hasattr(result, 'success') and result.success:
@@ -66,7 +82,10 @@ class ReportGenerator:
                 backup_created=getattr(result, 'backup_created', False),
                 error_message=error_message,
                 warnings=getattr(result, 'warnings', []),
-                conversions=[]  # We don't have detailed conversion info in current result
+                conversions=[],  # We don't have detailed conversion info in current result
+                bytes_written=metrics.bytes_written if metrics is not None else 0,
+                tasks_scanned=metrics.tasks if metrics is not None else 0,
+                phase_times=dict(metrics.phase_times) if metrics is not None else {}
             )
             
             self.report.add_file_record(record)
@@ -89,6 +108,7 @@ class ReportGenerator:
     def finalize_session(self) -> ConversionReport:
         """Finalize the conversion session and return the report."""
         self.report.finalize()
+        self.report.statistics.peak_memory_usage = peak_memory_bytes()
         
         logger.info(f"Finalized conversion session {self.session_id}")
         logger.info(f"Session summary: {self.report.statistics.total_files_processed} files, "
@@ -133,6 +153,9 @@ class ReportGenerator:
             'conversions_made': stats.total_conversions_made,
             'conversion_efficiency': stats.conversion_efficiency,
             'processing_speed': stats.processing_speed,
+            'throughput': stats.throughput,
+            'phase_times': dict(stats.phase_times),
+            'peak_memory_usage': stats.peak_memory_usage,
             'total_time': stats.total_processing_time,
             'has_errors': self.report.has_errors,
             'has_warnings': self.report.has_warnings,
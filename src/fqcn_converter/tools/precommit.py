@@ -5,8 +5,9 @@ import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import tempfile
-import shutil
 
+from ..core.backups import BackupStore
+from ..core.changes import git_changed_files
 from ..core.validator import FQCNValidator
 from ..core.converter import FQCNConverter
 from ..utils.logging import get_logger
@@ -14,20 +15,43 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+def get_staged_files(repo_path: Optional[Path] = None) -> List[Path]:
+    """Get list of staged YAML files.
+    
+    Args:
+        repo_path: Directory inside the git repository (default: cwd)
+        
+    Returns:
+        Absolute paths of staged YAML files, or an empty list outside git
+    """
+    try:
+        return git_changed_files(cwd=repo_path, staged=True)
+    except Exception as e:
+        logger.warning(f"Could not list staged files: {e}")
+        return []
+
+
 class PreCommitHook:
     """Pre-commit hook for FQCN validation and conversion."""
     
-    def __init__(self, auto_fix: bool = False, strict_mode: bool = False):
+    def __init__(self, auto_fix: bool = False, strict_mode: bool = False,
+                 backup_dir: Optional[str] = None):
         """Initialize pre-commit hook.
         
         Args:
             auto_fix: Whether to automatically fix FQCN issues
             strict_mode: Whether to fail on any FQCN issues
+            backup_dir: Backup store for files changed by auto-fix
+                (default: .fqcn_backups)
         """
         self.auto_fix = auto_fix
         self.strict_mode = strict_mode
         self.validator = FQCNValidator()
-        self.converter = FQCNConverter() if auto_fix else None
+        # Auto-fixed files can be restored with 'fqcn-converter rollback'
+        self.backup_run = (
+            BackupStore(backup_dir).begin_run("pre-commit") if auto_fix else None
+        )
+        self.converter = FQCNConverter(backups=self.backup_run) if auto_fix else None
         
     def run_hook(self, files: List[Path]) -> Tuple[bool, List[str]]:
         """Run the pre-commit hook on specified files.
@@ -62,6 +86,12 @@ class PreCommitHook:
                 messages.append(f"Error checking {file_path}: {e}")
                 overall_success = False
         
+        if self.backup_run is not None and self.backup_run.files:
+            self.backup_run.close()
+            messages.append(
+                f"Backed up auto-fixed files as run {self.backup_run.run_id}"
+            )
+        
         return overall_success, messages   
  
     def _check_file(self, file_path: Path) -> Tuple[bool, List[str]]:
@@ -112,27 +142,19 @@ class PreCommitHook:
             Tuple of (success, messages)
         """
         try:
-            # Create backup
-            backup_path = file_path.with_suffix(file_path.suffix + '.backup')
-            shutil.copy2(file_path, backup_path)
-            
-            # Attempt conversion
+            # The converter backs the file up into the backup store and
+            # replaces it atomically, so a failed fix leaves it untouched
             result = self.converter.convert_file(file_path)
             
             if result.success:
-                messages.append(f"✓ {file_path}: Auto-fixed {len(result.conversions)} FQCN issues")
+                messages.append(f"✓ {file_path}: Auto-fixed {result.changes_made} FQCN issues")
                 
                 # Stage the fixed file
                 self._stage_file(file_path)
                 
-                # Remove backup
-                backup_path.unlink()
-                
                 return True, messages
             else:
-                # Restore backup
-                shutil.move(backup_path, file_path)
-                messages.append(f"✗ {file_path}: Auto-fix failed - {result.error}")
+                messages.append(f"✗ {file_path}: Auto-fix failed - {'; '.join(result.errors)}")
                 return False, messages
                 
         except Exception as e:
@@ -203,6 +225,11 @@ from pathlib import Path
 
 def get_staged_files():
     """Get list of staged YAML files."""
+    try:
+        from fqcn_converter.tools.precommit import get_staged_files as staged
+        return staged()
+    except ImportError:
+        pass
     try:
         result = subprocess.run(
             ['git', 'diff', '--cached', '--name-only', '--diff-filter=ACM'],
@@ -288,6 +315,7 @@ def main():
     parser.add_argument('files', nargs='*', help='Files to check')
     parser.add_argument('--auto-fix', action='store_true', help='Automatically fix issues')
     parser.add_argument('--strict', action='store_true', help='Strict mode - fail on any issues')
+    parser.add_argument('--staged', action='store_true', help='Check staged YAML files')
     parser.add_argument('--install', metavar='REPO_PATH', help='Install hook in repository')
     parser.add_argument('--uninstall', metavar='REPO_PATH', help='Uninstall hook from repository')
     
@@ -304,6 +332,9 @@ def main():
         success = PreCommitHook.uninstall_hook(repo_path)
         sys.exit(0 if success else 1)
     
+    if args.staged:
+        args.files = [str(f) for f in get_staged_files()]
+    
     if not args.files:
         print("No files specified")
         sys.exit(0)
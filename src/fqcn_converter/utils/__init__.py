@@ -1,11 +1,48 @@
 """Utility functions for FQCN Converter."""
 
-from .logging import get_logger, setup_logging
-from .yaml_handler import load_yaml_file, save_yaml_file
+from typing import TYPE_CHECKING, Any, List
+
+from .._lazy import lazy_attribute
+
+_LAZY_IMPORTS = {
+    "setup_logging": ".logging",
+    "get_logger": ".logging",
+    "DebugAggregator": ".logging",
+    "load_yaml_file": ".yaml_handler",
+    "save_yaml_file": ".yaml_handler",
+    "BatchMetrics": ".metrics",
+    "MetricsRegistry": ".metrics",
+    "MetricsServer": ".metrics",
+    "Profiler": ".profiling",
+    "phase": ".profiling",
+    "profile": ".profiling",
+}
+
+if TYPE_CHECKING:
+    from .logging import DebugAggregator, get_logger, setup_logging
+    from .metrics import BatchMetrics, MetricsRegistry, MetricsServer
+    from .profiling import Profiler, phase, profile
+    from .yaml_handler import load_yaml_file, save_yaml_file
 
 __all__ = [
     "setup_logging",
     "get_logger",
+    "DebugAggregator",
     "load_yaml_file",
     "save_yaml_file",
+    "BatchMetrics",
+    "MetricsRegistry",
+    "MetricsServer",
+    "Profiler",
+    "phase",
+    "profile",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodule exports on first access."""
+    return lazy_attribute(__name__, _LAZY_IMPORTS, name, globals())
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
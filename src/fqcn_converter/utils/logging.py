@@ -4,48 +4,175 @@ Logging configuration for FQCN Converter.
 This module provides centralized logging configuration with support for
 configurable log levels, structured JSON output, log rotation, file output,
 and performance metrics logging for optimization.
+
+Hot loops log through DebugAggregator, which costs one call per message when
+DEBUG is off and emits one record per loop when it is on. With
+``setup_logging(async_logging=True)``, or ``enable_async_logging()`` for
+logging configured elsewhere (``fqcn-converter --verbose`` does this),
+handlers run on a background thread, so formatting and writing records no
+longer slow down conversion.
 """
 
+import atexit
 import json
 import logging
-import logging.config
-import logging.handlers
 import os
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# logging.config and logging.handlers are imported where they are used, as
+# they add noticeably to the start-up of every command
+if TYPE_CHECKING:
+    import logging.handlers
 
 # Global logger registry and configuration lock
 _logger_registry: Dict[str, logging.Logger] = {}
 _config_lock = Lock()
 _current_config: Optional[Dict[str, Any]] = None
 
+# Listener running the handlers of asynchronous logging, if enabled
+_queue_listener: Optional["logging.handlers.QueueListener"] = None
+_atexit_registered = False
+
+# Loggers given the queue handler, with the handlers it replaced
+_queued_loggers: List[
+    Tuple[logging.Logger, logging.Handler, List[logging.Handler]]
+] = []
+
+# Seconds between memory samples taken by PerformanceFilter
+MEMORY_SAMPLE_INTERVAL = 1.0
+
 
 class PerformanceFilter(logging.Filter):
-    """Filter that adds performance metrics to log records."""
+    """
+    Filter that adds performance metrics to log records.
+
+    Memory usage is sampled at most once per sample_interval seconds from a
+    process handle created on first use; records in between reuse the last
+    sample.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, sample_interval: float = MEMORY_SAMPLE_INTERVAL) -> None:
         super().__init__()
         self.start_time = time.time()
+        self.sample_interval = sample_interval
+        self._process: Any = None
+        self._pid: Optional[int] = None
+        self._memory_usage = 0.0
+        self._sampled_at = float("-inf")
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Add performance metrics to the log record."""
-        record.elapsed_time = time.time() - self.start_time
-        record.memory_usage = self._get_memory_usage()
+        # Measured from the creation of the record, which may be handled
+        # later on the thread of asynchronous logging
+        record.elapsed_time = record.created - self.start_time
+        if record.created - self._sampled_at >= self.sample_interval:
+            self._sampled_at = record.created
+            self._memory_usage = self._get_memory_usage()
+        record.memory_usage = self._memory_usage
         return True
 
     def _get_memory_usage(self) -> float:
         """Get current memory usage in MB."""
-        try:
-            import psutil
-
-            process = psutil.Process(os.getpid())
-            return process.memory_info().rss / 1024 / 1024  # Convert to MB
-        except ImportError:
+        pid = os.getpid()
+        if self._pid != pid:
+            # Created once, and again in forked worker processes
+            self._pid = pid
+            try:
+                import psutil
+
+                self._process = psutil.Process(pid)
+            except ImportError:
+                self._process = None
+
+        if self._process is None:
             return 0.0
+        return self._process.memory_info().rss / 1024 / 1024  # Convert to MB
+
+
+class _JoinedMessages:
+    """Messages of a DebugAggregator, joined when a handler formats them."""
+
+    __slots__ = ("entries",)
+
+    def __init__(self, entries: List[Tuple[str, Tuple[Any, ...]]]) -> None:
+        self.entries = entries
+
+    def __str__(self) -> str:
+        return "\n".join(
+            "  " + (msg % args if args else msg) for msg, args in self.entries
+        )
+
+
+class DebugAggregator:
+    """
+    Debug messages of a hot loop, logged as one record.
+
+    Whether the logger emits DEBUG is checked once, when the aggregator is
+    created; when it does not, add() returns at once and nothing is formatted.
+    Messages take %-style arguments and are only joined when a handler
+    formats the record.
+
+    Example:
+        >>> debug = DebugAggregator(logger)
+        >>> for task in tasks:
+        ...     debug.add("Converted %s on line %d", task.module, task.line)
+        >>> debug.flush("Converted %d modules", len(tasks))
+    """
+
+    __slots__ = ("logger", "enabled", "_entries")
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+        self.enabled = logger.isEnabledFor(logging.DEBUG)
+        self._entries: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def add(self, msg: str, *args: Any) -> None:
+        """Collect one message with its %-style arguments."""
+        if self.enabled:
+            self._entries.append((msg, args))
+
+    def flush(self, summary: str, *args: Any) -> None:
+        """
+        Log the collected messages below a summary line, if any were added.
+
+        Args:
+            summary: First line of the record, with %-style placeholders
+            *args: Arguments of the summary
+        """
+        if not self._entries:
+            return
+        entries, self._entries = self._entries, []
+        self.logger.debug(
+            summary + "\n%s", *args, _JoinedMessages(entries), stacklevel=2
+        )
+
+
+class QueueingHandler(logging.Handler):
+    """
+    Handler passing records to the listener thread of asynchronous logging.
+
+    The message is merged with its arguments before the record is queued,
+    as they may change before the listener formats it. Exception info is
+    kept, since records never leave the process.
+    """
+
+    def __init__(self, queue: Any) -> None:
+        super().__init__()
+        self.queue = queue
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue the record."""
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+            self.queue.put_nowait(record)
+        except Exception:
+            self.handleError(record)
 
 
 class ContextFilter(logging.Filter):
@@ -176,8 +303,10 @@ def create_rotating_file_handler(
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
     backup_count: int = 5,
     encoding: str = "utf-8",
-) -> logging.handlers.RotatingFileHandler:
+) -> "logging.handlers.RotatingFileHandler":
     """Create a rotating file handler with specified parameters."""
+    import logging.handlers
+
     # Ensure log directory exists
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -198,8 +327,10 @@ def create_timed_rotating_handler(
     interval: int = 1,
     backup_count: int = 30,
     encoding: str = "utf-8",
-) -> logging.handlers.TimedRotatingFileHandler:
+) -> "logging.handlers.TimedRotatingFileHandler":
     """Create a time-based rotating file handler."""
+    import logging.handlers
+
     # Ensure log directory exists
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -322,6 +453,7 @@ def setup_logging(
     enable_colors: bool = True,
     context: Optional[Dict[str, Any]] = None,
     force_reconfigure: bool = False,
+    async_logging: bool = False,
 ) -> None:
     """
     Configure logging for the application.
@@ -335,11 +467,15 @@ def setup_logging(
         enable_colors: Whether to use colored console output (ignored if format_json=True)
         context: Additional context to include in all log messages
         force_reconfigure: Whether to force reconfiguration even if already configured
+        async_logging: Whether to run the handlers on a background thread fed
+                       through a queue, so logging threads only queue records
 
     Raises:
         ValueError: If invalid logging level is provided
         OSError: If log file cannot be created or accessed
     """
+    import logging.config
+
     global _current_config
 
     with _config_lock:
@@ -365,11 +501,17 @@ def setup_logging(
                 context=context,
             )
 
+        # Drain records queued for the handlers about to be replaced
+        _stop_async_logging()
+
         try:
             # Apply the configuration
             logging.config.dictConfig(config)
             _current_config = config
 
+            if async_logging:
+                _start_async_logging(["", "fqcn_converter"])
+
             # Log successful configuration
             logger = logging.getLogger("fqcn_converter.logging")
             logger.info(
@@ -379,6 +521,7 @@ def setup_logging(
                     "format_json": format_json,
                     "log_file": log_file,
                     "performance_logging": enable_performance_logging,
+                    "async_logging": async_logging,
                 },
             )
 
@@ -394,6 +537,83 @@ def setup_logging(
             raise
 
 
+def _start_async_logging(logger_names: Iterable[str]) -> None:
+    """
+    Move the handlers of the loggers behind a queue drained by a thread.
+
+    Args:
+        logger_names: Loggers whose handlers to move; "" is the root logger
+    """
+    import logging.handlers
+    import queue
+
+    global _queue_listener, _atexit_registered
+
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = QueueingHandler(records)
+    handlers: List[logging.Handler] = []
+    for name in logger_names:
+        logger = logging.getLogger(name)
+        if not logger.handlers:
+            continue
+        replaced = list(logger.handlers)
+        for handler in replaced:
+            if handler not in handlers:
+                handlers.append(handler)
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+        _queued_loggers.append((logger, queue_handler, replaced))
+
+    if not handlers:
+        return
+
+    _queue_listener = logging.handlers.QueueListener(
+        records, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    if not _atexit_registered:
+        # Write out records still queued when the interpreter exits
+        atexit.register(_stop_async_logging)
+        _atexit_registered = True
+
+
+def _stop_async_logging() -> None:
+    """
+    Handle every queued record and stop the thread of asynchronous logging.
+
+    The loggers get their own handlers back, so records logged afterwards
+    are not left in a queue nothing drains.
+    """
+    global _queue_listener
+
+    listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
+
+    while _queued_loggers:
+        logger, queue_handler, replaced = _queued_loggers.pop()
+        logger.removeHandler(queue_handler)
+        for handler in replaced:
+            logger.addHandler(handler)
+
+
+def enable_async_logging(
+    logger_names: Iterable[str] = ("", "fqcn_converter")
+) -> None:
+    """
+    Run the handlers of already configured loggers on a background thread.
+
+    For logging set up without setup_logging, e.g. by ``logging.basicConfig``.
+    Records are written at exit, or when logging is reconfigured or reset.
+
+    Args:
+        logger_names: Loggers whose handlers to move; "" is the root logger
+    """
+    with _config_lock:
+        _stop_async_logging()
+        _start_async_logging(logger_names)
+
+
 def get_logger(
     name: str,
     context: Optional[Dict[str, Any]] = None,
@@ -547,6 +767,7 @@ def reset_logging() -> None:
     global _current_config, _logger_registry
 
     with _config_lock:
+        _stop_async_logging()
         _current_config = None
         _logger_registry.clear()
 
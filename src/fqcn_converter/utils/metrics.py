@@ -0,0 +1,629 @@
+"""
+Prometheus/OpenMetrics metrics for long-running batch jobs.
+
+A MetricsRegistry holds counters, gauges and histograms and renders them in
+the Prometheus text format or as OpenMetrics. Two exporters publish it:
+
+``MetricsRegistry.write_textfile``
+    Atomically rewrites a ``.prom`` file for the node_exporter textfile
+    collector.
+``MetricsServer``
+    Serves ``/metrics`` over HTTP from a daemon thread, bound to localhost
+    by default.
+
+BatchMetrics defines the batch metrics on a registry and is fed by
+BatchProcessor through its progress reporting: every converted file updates
+the counters, the queue depth and the latency histograms, and every finished
+project the progress gauges and, when configured, the textfile.
+
+Only the standard library is used; no Prometheus client is required.
+
+Example:
+    >>> from fqcn_converter.utils.metrics import BatchMetrics, MetricsServer
+    >>> metrics = BatchMetrics(textfile="/var/lib/node_exporter/fqcn.prom")
+    >>> with MetricsServer(metrics.registry, port=9464):
+    ...     BatchProcessor(metrics=metrics).process_projects(projects)
+"""
+
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..exceptions import ConfigurationError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Minimum seconds between textfile rewrites while a batch runs
+TEXTFILE_INTERVAL = 5.0
+
+# Seconds the HTTP exporter may take to notice it should stop
+SHUTDOWN_POLL_INTERVAL = 0.1
+
+# Content types of the two exposition formats
+TEXT_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the exposition formats."""
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_bound(bound: float) -> str:
+    """Format a bucket bound as the canonical float both formats accept."""
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+class Metric:
+    """Base class of the registry's metric types."""
+
+    kind = "unknown"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    def samples(self) -> List[Sample]:
+        """Return the samples of the metric as (name, labels, value)."""
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing count.
+
+    The name excludes the ``_total`` suffix, which is added to the sample.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        super().__init__(name, documentation)
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        """Current count."""
+        return self._value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the count.
+
+        Args:
+            amount: Non-negative amount to add
+
+        Raises:
+            ValueError: If amount is negative
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._value += amount
+
+    def samples(self) -> List[Sample]:
+        return [(f"{self.name}_total", {}, self._value)]
+
+
+class Gauge(Metric):
+    """Value that can go up and down, or be read from a function on scrape."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        function: Optional[Callable[[], Optional[float]]] = None,
+    ) -> None:
+        super().__init__(name, documentation)
+        self._value = 0.0
+        self._function = function
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current value; None when the function cannot provide one."""
+        if self._function is not None:
+            return self._function()
+        return self._value
+
+    def set(self, value: float) -> None:
+        """Set the value."""
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the value."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the value."""
+        with self._lock:
+            self._value -= amount
+
+    def samples(self) -> List[Sample]:
+        value = self.value
+        if value is None:
+            return []
+        return [(self.name, {}, value)]
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets))
+        # One count per bucket plus one for values above the last bound
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of observed values."""
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """Sum of the observed values."""
+        return self._sum
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        samples: List[Sample] = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            samples.append(
+                (f"{self.name}_bucket", {"le": _format_bound(bound)}, cumulative)
+            )
+        samples.append((f"{self.name}_sum", {}, total))
+        samples.append((f"{self.name}_count", {}, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together.
+
+    Example:
+        >>> registry = MetricsRegistry()
+        >>> files = registry.counter("fqcn_files_processed", "Files converted")
+        >>> files.inc()
+        >>> print(registry.render())
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Add a metric to the registry.
+
+        Args:
+            metric: Metric to add
+
+        Returns:
+            The metric
+
+        Raises:
+            ConfigurationError: If a metric with the same name is registered
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ConfigurationError(
+                    f"Metric already registered: {metric.name}",
+                    details="Metric names must be unique within a registry",
+                )
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        """Create and register a counter."""
+        metric = Counter(name, documentation)
+        self.register(metric)
+        return metric
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        function: Optional[Callable[[], Optional[float]]] = None,
+    ) -> Gauge:
+        """Create and register a gauge, optionally read from a function."""
+        metric = Gauge(name, documentation, function=function)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self, name: str, documentation: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Create and register a histogram."""
+        metric = Histogram(name, documentation, buckets=buckets)
+        self.register(metric)
+        return metric
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Return the metric registered under name, if any."""
+        return self._metrics.get(name)
+
+    def render(self, openmetrics: bool = False) -> str:
+        """
+        Render every metric in an exposition format.
+
+        Args:
+            openmetrics: Render OpenMetrics instead of the Prometheus text format
+
+        Returns:
+            Exposition text
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            # Prometheus names counter families after their sample
+            family = metric.name
+            if metric.kind == "counter" and not openmetrics:
+                family = f"{metric.name}_total"
+            lines.append(f"# HELP {family} {metric.documentation}")
+            lines.append(f"# TYPE {family} {metric.kind}")
+            for name, labels, value in metric.samples():
+                label_text = ""
+                if labels:
+                    pairs = ",".join(f'{key}="{val}"' for key, val in labels.items())
+                    label_text = "{" + pairs + "}"
+                lines.append(f"{name}{label_text} {_format_value(value)}")
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Union[str, Path]) -> None:
+        """
+        Atomically write the metrics for the node_exporter textfile collector.
+
+        Args:
+            path: File to write, conventionally ending in ``.prom``
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        from ..core.writer import atomic_write
+
+        atomic_write(path, self.render())
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serve the registry of the server at /metrics."""
+
+    server: "_RegistryServer"
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+
+        openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+        body = self.server.registry.render(openmetrics=openmetrics).encode("utf-8")
+        self.send_response(200)
+        self.send_header(
+            "Content-Type",
+            OPENMETRICS_CONTENT_TYPE if openmetrics else TEXT_CONTENT_TYPE,
+        )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"Metrics scrape: {format % args}")
+
+
+class _RegistryServer(ThreadingHTTPServer):
+    daemon_threads = True
+    registry: MetricsRegistry
+
+
+class MetricsServer:
+    """
+    HTTP exporter serving a registry at ``/metrics`` from a daemon thread.
+
+    Scrapers sending ``Accept: application/openmetrics-text`` get OpenMetrics,
+    everyone else the Prometheus text format.
+
+    Example:
+        >>> with MetricsServer(registry, port=9464) as server:
+        ...     print(f"Scrape {server.url}")
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, port: int = 0, host: str = "127.0.0.1"
+    ) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            registry: Registry to serve
+            port: Port to listen on; 0 picks a free one, see the port attribute
+            host: Address to bind; localhost unless scraped from elsewhere
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[_RegistryServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL of the metrics endpoint."""
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        """
+        Start serving in a background thread.
+
+        Raises:
+            OSError: If the address cannot be bound
+        """
+        self._server = _RegistryServer((self.host, self.port), _MetricsHandler)
+        self._server.registry = self.registry
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": SHUTDOWN_POLL_INTERVAL},
+            name="fqcn-metrics",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Serving metrics at {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "MetricsServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def resident_memory_bytes() -> Optional[int]:
+    """
+    Return the current resident set size of this process.
+
+    Returns:
+        RSS in bytes, or None when the platform does not report it
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm", "rb") as f:
+                pages = int(f.read().split()[1])
+            return pages * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            pass
+
+    try:
+        import psutil
+
+        return int(psutil.Process().memory_info().rss)
+    except Exception:
+        return None
+
+
+class BatchMetrics:
+    """
+    Batch processing metrics on a registry.
+
+    Pass it to BatchProcessor as ``metrics``: the processor reports every
+    converted file with observe_file and every finished project through
+    the progress callback signature of ``__call__``. Use one per batch job;
+    counters accumulate over every batch run with it.
+
+    Attributes:
+        registry: Registry holding the metrics
+        textfile: File rewritten with the metrics as projects finish, if any
+    """
+
+    def __init__(
+        self,
+        registry: Optional[MetricsRegistry] = None,
+        textfile: Union[str, Path, None] = None,
+        textfile_interval: float = TEXTFILE_INTERVAL,
+    ) -> None:
+        """
+        Define the batch metrics.
+
+        Args:
+            registry: Registry to define them on; a new one if None
+            textfile: File to write for the node_exporter textfile collector
+            textfile_interval: Minimum seconds between textfile rewrites;
+                              the last one, from finish(), is always written
+
+        Raises:
+            ConfigurationError: If the registry already has batch metrics
+        """
+        self.registry = registry or MetricsRegistry()
+        self.textfile = Path(textfile) if textfile else None
+        self.textfile_interval = textfile_interval
+        self._lock = threading.Lock()
+        self._started: Optional[float] = None
+        self._busy = 0.0
+        self._written = float("-inf")
+
+        registry = self.registry
+        self.files_processed = registry.counter(
+            "fqcn_files_processed", "Files converted, including failed ones"
+        )
+        self.modules_converted = registry.counter(
+            "fqcn_modules_converted", "Module names rewritten to FQCNs"
+        )
+        self.errors = registry.counter("fqcn_errors", "Files that failed to convert")
+        self.bytes_processed = registry.counter(
+            "fqcn_bytes_processed", "Bytes of file content converted"
+        )
+        self.queue_depth = registry.gauge(
+            "fqcn_queue_depth", "Files scheduled but not converted yet"
+        )
+        self.workers = registry.gauge("fqcn_workers", "Workers converting files")
+        self.worker_utilization = registry.gauge(
+            "fqcn_worker_utilization",
+            "Share of worker time spent converting files since the start",
+            function=self.utilization,
+        )
+        self.projects_completed = registry.gauge(
+            "fqcn_projects_completed", "Projects finished in the current batch"
+        )
+        self.projects_total = registry.gauge(
+            "fqcn_projects", "Projects in the current batch"
+        )
+        self.parse_seconds = registry.histogram(
+            "fqcn_parse_seconds", "YAML parse latency per file"
+        )
+        self.file_seconds = registry.histogram(
+            "fqcn_file_seconds", "Conversion latency per file"
+        )
+        self.resident_memory = registry.gauge(
+            "process_resident_memory_bytes",
+            "Resident memory size in bytes",
+            function=resident_memory_bytes,
+        )
+
+    def start(self, workers: int) -> None:
+        """
+        Mark the start of a batch run.
+
+        Args:
+            workers: Number of workers converting files
+        """
+        self.workers.set(workers)
+        self.projects_completed.set(0)
+        with self._lock:
+            if self._started is None:
+                self._started = time.perf_counter()
+
+    def enqueue(self, files: int) -> None:
+        """Add scheduled files to the queue depth."""
+        self.queue_depth.inc(files)
+
+    def observe_file(self, record: Any) -> None:
+        """
+        Record one converted file.
+
+        Args:
+            record: ConversionResult or FileRecord of the file
+        """
+        processing_time = record.processing_time
+        if getattr(record, "exception", None) is not None or not record.success:
+            self.observe_error(processing_time)
+            return
+
+        self._done(processing_time)
+        self.modules_converted.inc(record.changes_made)
+        metrics = getattr(record, "metrics", None)
+        if metrics is not None and metrics.files:
+            self.bytes_processed.inc(metrics.bytes_read)
+            self.parse_seconds.observe(metrics.parse_time)
+
+    def observe_error(self, processing_time: float = 0.0) -> None:
+        """Record one file that failed to convert."""
+        self._done(processing_time)
+        self.errors.inc()
+
+    def _done(self, processing_time: float) -> None:
+        self.files_processed.inc()
+        self.queue_depth.dec()
+        self.file_seconds.observe(processing_time)
+        with self._lock:
+            self._busy += processing_time
+
+    def utilization(self) -> float:
+        """Return the share of worker time spent converting, from 0 to 1."""
+        with self._lock:
+            started, busy = self._started, self._busy
+        workers = self.workers.value or 1
+        if started is None:
+            return 0.0
+        elapsed = time.perf_counter() - started
+        if elapsed <= 0:
+            return 0.0
+        return min(1.0, busy / (elapsed * workers))
+
+    def __call__(self, completed: int, total: int, project: str) -> None:
+        """Record a finished project; same signature as progress callbacks."""
+        self.projects_completed.set(completed)
+        self.projects_total.set(total)
+        self._write_textfile(force=False)
+
+    def finish(self) -> None:
+        """Mark the end of a batch run and write the textfile."""
+        self.queue_depth.set(0)
+        self._write_textfile(force=True)
+
+    def _write_textfile(self, force: bool) -> None:
+        if self.textfile is None:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._written < self.textfile_interval:
+            return
+        self._written = now
+        try:
+            self.registry.write_textfile(self.textfile)
+        except OSError as e:
+            logger.warning(f"Cannot write metrics to {self.textfile}: {e}")
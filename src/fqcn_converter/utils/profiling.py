@@ -0,0 +1,374 @@
+"""
+Profiling hooks for the CLI and the Python API.
+
+A Profiler wraps a block of work with one of three profilers:
+
+``cprofile``
+    Function-level CPU profile of the calling thread, written as a
+    ``.pstats`` file for ``python -m pstats`` or snakeviz.
+``tracemalloc``
+    The top allocation sites by size at the end of the block, with the
+    current and peak traced memory, written as text.
+``timeline``
+    Wall time spent in each processing phase (PHASES), written as a Chrome
+    trace-event JSON file (chrome://tracing, Perfetto) with per-phase totals.
+
+Hot paths mark their phase with ``phase(name)``. While no timeline is
+recording it returns a shared no-op context manager, so instrumented code
+pays one global lookup per call. Phases run in worker processes of the
+process executor are not recorded.
+
+Example:
+    >>> from fqcn_converter.utils.profiling import profile
+    >>> with profile("timeline", output="convert.json") as profiler:
+    ...     converter.convert_file("site.yml")
+    >>> print(profiler.timeline.format_summary())
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, ContextManager, Dict, List, Optional, Union
+
+from ..exceptions import ConfigurationError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Supported profilers; mirrored by the --profile choices of cli/main.py
+PROFILERS = ("cprofile", "tracemalloc", "timeline")
+
+# Processing phases marked in the CLI and the engines, in pipeline order
+PHASES = ("discover", "read", "parse", "convert", "validate", "write", "report")
+
+# Allocation sites listed by the tracemalloc profiler
+DEFAULT_TOP = 25
+
+# Output file name, without the profiler's suffix
+DEFAULT_OUTPUT = "fqcn-profile"
+
+_SUFFIXES = {"cprofile": ".pstats", "tracemalloc": ".txt", "timeline": ".json"}
+
+# Timeline recording phases, if any
+_timeline: Optional["Timeline"] = None
+
+
+class _NullPhase:
+    """Context manager doing nothing, returned by phase() when not recording."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def phase(name: str) -> ContextManager[None]:
+    """
+    Mark a block as one processing phase of the recording timeline.
+
+    Args:
+        name: Phase name, one of PHASES
+
+    Returns:
+        Context manager timing the block, or a no-op one when no timeline
+        is recording
+    """
+    timeline = _timeline
+    if timeline is None:
+        return _NULL_PHASE
+    return _Span(timeline, name)
+
+
+def peak_memory_bytes() -> Optional[int]:
+    """
+    Return the peak resident set size of this process.
+
+    Returns:
+        Peak RSS in bytes, or None when the platform does not report it
+    """
+    try:
+        import resource
+    except ImportError:
+        resource = None  # type: ignore[assignment]
+
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+    try:
+        import psutil
+
+        info = psutil.Process().memory_info()
+        # Windows reports the peak working set
+        return int(getattr(info, "peak_wset", info.rss))
+    except Exception:
+        return None
+
+
+@dataclass
+class PhaseStats:
+    """
+    Time spent in one phase.
+
+    Attributes:
+        name: Phase name
+        count: Number of times the phase was entered
+        total: Seconds from entering to leaving the phase, summed
+        self_time: Seconds of total not spent in nested phases
+    """
+
+    name: str
+    count: int
+    total: float
+    self_time: float
+
+
+class _Span:
+    """One timed occurrence of a phase."""
+
+    __slots__ = ("timeline", "name", "start", "nested")
+
+    def __init__(self, timeline: "Timeline", name: str) -> None:
+        self.timeline = timeline
+        self.name = name
+        self.start = 0.0
+        self.nested = 0.0
+
+    def __enter__(self) -> None:
+        self.timeline._stack().append(self)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        end = time.perf_counter()
+        stack = self.timeline._stack()
+        stack.pop()
+        if stack:
+            stack[-1].nested += end - self.start
+        self.timeline._record(self, end)
+
+
+class Timeline:
+    """
+    Phases recorded while a timeline profiler is active.
+
+    Safe to record from several threads; nesting is tracked per thread.
+    """
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._events: List[Dict[str, Any]] = []
+        self._stats: Dict[str, PhaseStats] = {}
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, span: _Span, end: float) -> None:
+        duration = end - span.start
+        with self._lock:
+            self._events.append(
+                {
+                    "name": span.name,
+                    "cat": "phase",
+                    "ph": "X",
+                    "ts": (span.start - self.origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+            )
+            stats = self._stats.get(span.name)
+            if stats is None:
+                stats = self._stats[span.name] = PhaseStats(span.name, 0, 0.0, 0.0)
+            stats.count += 1
+            stats.total += duration
+            stats.self_time += duration - span.nested
+
+    def summary(self) -> List[PhaseStats]:
+        """Return the time spent per phase, in pipeline order."""
+        with self._lock:
+            stats = list(self._stats.values())
+        order = {name: i for i, name in enumerate(PHASES)}
+        return sorted(stats, key=lambda s: (order.get(s.name, len(PHASES)), s.name))
+
+    def to_trace(self) -> Dict[str, Any]:
+        """Return the timeline in Chrome trace-event format."""
+        with self._lock:
+            events = list(self._events)
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "phases": {stats.name: asdict(stats) for stats in self.summary()},
+        }
+
+    def format_summary(self) -> str:
+        """Return the per-phase totals as a text table."""
+        lines = [f"{'Phase':<10} {'Count':>7} {'Total s':>10} {'Self s':>10}"]
+        for stats in self.summary():
+            lines.append(
+                f"{stats.name:<10} {stats.count:>7} "
+                f"{stats.total:>10.4f} {stats.self_time:>10.4f}"
+            )
+        return "\n".join(lines)
+
+
+class Profiler:
+    """
+    Profile a block of work and write the result to a file.
+
+    Use profile() to create one as a context manager.
+    """
+
+    def __init__(
+        self,
+        mode: str = "timeline",
+        output: Union[str, Path, None] = None,
+        top: int = DEFAULT_TOP,
+    ) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            mode: One of PROFILERS
+            output: File to write; defaults to DEFAULT_OUTPUT with a suffix
+                   matching the profiler in the working directory
+            top: Number of allocation sites listed by tracemalloc
+
+        Raises:
+            ConfigurationError: If the profiler is not supported
+        """
+        if mode not in PROFILERS:
+            raise ConfigurationError(
+                f"Unknown profiler: {mode}",
+                details=f"Supported profilers: {', '.join(PROFILERS)}",
+            )
+        self.mode = mode
+        self.output = Path(output or DEFAULT_OUTPUT + _SUFFIXES[mode])
+        self.top = top
+        self.timeline: Optional[Timeline] = None
+        self._profiler: Any = None
+        self._previous: Optional[Timeline] = None
+        self._owns_tracemalloc = False
+
+    def start(self) -> None:
+        """Start profiling."""
+        global _timeline
+
+        if self.mode == "cprofile":
+            import cProfile
+
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.mode == "tracemalloc":
+            import tracemalloc
+
+            self._owns_tracemalloc = not tracemalloc.is_tracing()
+            if self._owns_tracemalloc:
+                tracemalloc.start()
+            elif hasattr(tracemalloc, "reset_peak"):
+                # Python 3.9+
+                tracemalloc.reset_peak()
+        else:
+            self.timeline = Timeline()
+            self._previous, _timeline = _timeline, self.timeline
+
+    def stop(self) -> Path:
+        """
+        Stop profiling and write the output file.
+
+        Returns:
+            Path of the written file
+        """
+        global _timeline
+
+        if self.mode == "cprofile":
+            self._profiler.disable()
+            self._profiler.dump_stats(str(self.output))
+        elif self.mode == "tracemalloc":
+            self.output.write_text(self._allocation_report(), encoding="utf-8")
+        else:
+            _timeline = self._previous
+            self.output.write_text(
+                json.dumps(self.timeline.to_trace(), indent=1), encoding="utf-8"
+            )
+
+        logger.info(f"Wrote {self.mode} profile to {self.output}")
+        return self.output
+
+    def _allocation_report(self) -> str:
+        """Snapshot traced memory and format its top allocation sites."""
+        import tracemalloc
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ]
+        )
+        current, peak = tracemalloc.get_traced_memory()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+
+        stats = snapshot.statistics("lineno")[: self.top]
+        lines = [
+            f"Traced memory: current {current / 1024 / 1024:.1f} MiB, "
+            f"peak {peak / 1024 / 1024:.1f} MiB",
+            f"Top {len(stats)} allocation sites by size:",
+        ]
+        for rank, stat in enumerate(stats, 1):
+            frame = stat.traceback[0]
+            lines.append(
+                f"#{rank}: {frame.filename}:{frame.lineno}: "
+                f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+            )
+        return "\n".join(lines) + "\n"
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def profile(
+    mode: str = "timeline",
+    output: Union[str, Path, None] = None,
+    top: int = DEFAULT_TOP,
+) -> Profiler:
+    """
+    Profile the block of a with statement.
+
+    Args:
+        mode: "cprofile", "tracemalloc" or "timeline"
+        output: File to write; defaults to fqcn-profile.pstats, .txt or
+               .json in the working directory
+        top: Number of allocation sites listed by tracemalloc
+
+    Returns:
+        Profiler to use as a context manager
+
+    Raises:
+        ConfigurationError: If the profiler is not supported
+
+    Example:
+        >>> with profile("cprofile", output="batch.pstats"):
+        ...     BatchProcessor().process_projects(projects)
+    """
+    return Profiler(mode, output=output, top=top)
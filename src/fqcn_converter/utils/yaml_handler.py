@@ -3,19 +3,139 @@ YAML processing utilities for FQCN Converter.
 
 This module provides safe YAML loading and processing functionality
 with proper error handling and validation.
+
+All parsing in the package goes through safe_load and compose, which use the
+fastest available backend: PyYAML's libyaml bindings (``yaml.CSafeLoader``)
+when PyYAML was built with them, otherwise the pure-Python ``yaml.SafeLoader``.
+Set the environment variable FQCN_YAML_BACKEND to "python" to force the
+pure-Python loader.
+
+A leading byte order mark is stripped before parsing, as the backends count
+it differently in mark indexes; marks therefore index into the text after
+the BOM. For input both backends accept, they produce the same data and
+node graphs with the same marks.
+
+The backends do not accept exactly the same input. Input libyaml rejects is
+parsed again with the pure-Python loader, which returns its result if it
+accepts the input and otherwise raises its own error, so error messages do
+not depend on the backend. libyaml is looser in places, though: it accepts
+a tab as the separator after a mapping colon (``key:<TAB>value``), which
+the pure-Python loader rejects. Such files convert and validate with libyaml and fail to parse with
+FQCN_YAML_BACKEND=python.
 """
 
+import os
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import IO, Any, Callable, Dict, Optional, Type, Union
 
 import yaml
+from yaml.nodes import Node
+
+from ..exceptions import ConfigurationError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Backends in order of preference, mapped to their loader classes
+_LOADERS: Dict[str, Type[yaml.SafeLoader]] = {}
+if getattr(yaml, "__with_libyaml__", False):
+    _LOADERS["libyaml"] = yaml.CSafeLoader
+_LOADERS["python"] = yaml.SafeLoader
+
+_backend: Optional[str] = None
+
+# Byte order mark, as text and as UTF-8
+BOM = "\ufeff"
+_BOM_BYTES = BOM.encode("utf-8")
+
+
+def available_yaml_backends() -> tuple:
+    """Return the names of the usable YAML backends, fastest first."""
+    return tuple(_LOADERS)
+
+
+def set_yaml_backend(name: Optional[str] = "auto") -> str:
+    """
+    Select the YAML backend used by safe_load and compose.
+
+    Args:
+        name: "libyaml", "python", or "auto"/None for the fastest available
+
+    Returns:
+        Name of the selected backend
 
+    Raises:
+        ConfigurationError: If the backend is unknown or not available
+    """
+    global _backend
 
-def safe_load(content: str) -> Any:
+    if name in (None, "", "auto"):
+        selected = next(iter(_LOADERS))
+    elif name in _LOADERS:
+        selected = name
+    else:
+        raise ConfigurationError(
+            f"YAML backend not available: {name}",
+            details=f"Available backends: {', '.join(available_yaml_backends())}",
+        )
+
+    _backend = selected
+    return selected
+
+
+def yaml_backend() -> str:
+    """Return the name of the active YAML backend, selecting it if needed."""
+    if _backend is None:
+        try:
+            return set_yaml_backend(os.environ.get("FQCN_YAML_BACKEND"))
+        except ConfigurationError as e:
+            logger.warning(f"{e.message}, using the default backend")
+            return set_yaml_backend()
+    return _backend
+
+
+def _parse(parse: Callable[..., Any], content: Union[str, bytes]) -> Any:
+    """Run a PyYAML parse function with the active loader."""
+    # libyaml leaves a BOM out of mark indexes, the pure-Python reader counts it
+    if isinstance(content, str) and content.startswith(BOM):
+        content = content[len(BOM) :]
+    elif isinstance(content, bytes) and content.startswith(_BOM_BYTES):
+        content = content[len(_BOM_BYTES) :]
+
+    loader = _LOADERS[yaml_backend()]
+    try:
+        return parse(content, Loader=loader)
+    except Exception:
+        if loader is yaml.SafeLoader:
+            raise
+    # Use the pure-Python loader's result, or raise its error (including for
+    # invalid input types) so that messages do not depend on the backend
+    return parse(content, Loader=yaml.SafeLoader)
+
+
+def safe_load(content: Union[str, bytes, IO, None]) -> Any:
     """Safely load YAML content."""
     if content is None:
         return None
-    return yaml.safe_load(content)
+    if not isinstance(content, (str, bytes)):
+        content = content.read()
+    return _parse(yaml.load, content)
+
+
+def compose(content: Union[str, bytes]) -> Optional[Node]:
+    """
+    Compose YAML content into a node graph with start/end marks.
+
+    Args:
+        content: YAML text
+
+    Returns:
+        Root node, or None for an empty document
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+    """
+    return _parse(yaml.compose, content)
 
 
 def safe_dump(data: Any, **kwargs) -> str:
@@ -291,6 +291,59 @@ def sample_converted_content():
 """
 
 
+@pytest.fixture
+def minimal_playbook_content():
+    """Playbook with a single short module name, converted in one change."""
+    return """---
+- hosts: all
+  tasks:
+    - name: Copy file
+      copy:
+        src: a.txt
+        dest: /tmp/a.txt
+"""
+
+
+@pytest.fixture
+def minimal_task_file_content():
+    """Task file with a single short module name, converted in one change."""
+    return """---
+- name: Copy file
+  copy:
+    src: a.txt
+    dest: /tmp/a.txt
+"""
+
+
+@pytest.fixture
+def write_project(tmp_path):
+    """
+    Factory writing files under tmp_path.
+
+    Takes a mapping of relative paths to content, creates any parent
+    directories and returns the written paths in mapping order.
+    """
+
+    def write(files):
+        paths = []
+        for relative, content in files.items():
+            path = tmp_path / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+            paths.append(path)
+        return paths
+
+    return write
+
+
+@pytest.fixture
+def converter():
+    """Converter with the default mappings that keeps no backups."""
+    from fqcn_converter.core.converter import FQCNConverter
+
+    return FQCNConverter(create_backups=False)
+
+
 @pytest.fixture
 def sample_fqcn_mappings():
     """Sample FQCN mappings for testing."""
@@ -330,7 +330,9 @@ ansible_ssh_private_key_file=~/.ssh/id_rsa
         assert test_file.read_text() == original_content
 
         # Perform actual conversion
-        actual_result = converter.convert_file(test_file, dry_run=False)
+        actual_result = converter.convert_file(
+            test_file, dry_run=False, retain_content="full"
+        )
 
         # Results should be consistent
         assert dry_run_result.success == actual_result.success
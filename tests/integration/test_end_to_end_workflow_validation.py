@@ -962,7 +962,9 @@ all:
         assert test_file.read_text() == original_content  # File unchanged
 
         # Test actual conversion
-        actual_result = converter.convert_file(test_file, dry_run=False)
+        actual_result = converter.convert_file(
+            test_file, dry_run=False, retain_content="full"
+        )
 
         assert actual_result.success is True
         assert actual_result.changes_made == dry_result.changes_made
@@ -1121,7 +1123,9 @@ all:
         dry_result = converter.convert_file(test_file, dry_run=True)
         assert test_file.read_text() == original_content  # File unchanged
 
-        actual_result = converter.convert_file(test_file, dry_run=False)
+        actual_result = converter.convert_file(
+            test_file, dry_run=False, retain_content="full"
+        )
         assert dry_result.changes_made == actual_result.changes_made
         assert dry_result.converted_content == actual_result.converted_content
 
@@ -136,7 +136,7 @@ class TestConversionScenarios:
         assert result.changes_made == scenario_config["expected_changes"], f"Expected {scenario_config['expected_changes']} changes in '{scenario}'"
         
         # 3. Verify expected modules are present (equivalent to Molecule's verify)
-        converted_content = result.converted_content
+        converted_content = test_file.read_text()
         for expected_module in scenario_config["expected_modules"]:
             assert expected_module in converted_content, f"Expected module '{expected_module}' not found in '{scenario}'"
         
@@ -341,7 +341,7 @@ web2.example.com""")
         
         assert result.success, "Valid playbook should be converted"
         assert result.changes_made == 1, "Should convert the copy module"
-        assert "ansible.builtin.copy" in result.converted_content
+        assert "ansible.builtin.copy" in playbook_file.read_text()
 
     def test_deeply_nested_scenario(self, tmp_path):
         """Test handling of deeply nested project structures."""
@@ -363,4 +363,4 @@ web2.example.com""")
         assert result.changes_made == 1, "Should convert the copy module"
         
         # Verify conversion worked
-        assert "ansible.builtin.copy" in result.converted_content, "Nested file should be converted"
\ No newline at end of file
+        assert "ansible.builtin.copy" in deep_path.read_text(), "Nested file should be converted"
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Import-time benchmark for the package and the CLI entry point.
+
+Runs ``python -X importtime`` in a fresh interpreter and sums the self time
+of every module imported beyond interpreter start-up. Short runs such as
+``fqcn-converter --version`` and the pre-commit hook pay this cost on every
+invocation, so the heavy modules (PyYAML, the engines, worker pools and
+subprocess handling) must only load once a subcommand actually needs them.
+
+Which modules load is checked in every run. The millisecond budget only
+runs serially: under pytest-xdist the other workers compete for the CPU and
+the timings say nothing about the imports.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Generous compared to the ~25 ms measured locally, to absorb slow CI hosts
+IMPORT_BUDGET_MS = 150
+
+# Best of several runs, as the first run also pays for cold disk caches
+RUNS = 3
+
+HEAVY_MODULES = (
+    "yaml",
+    "subprocess",
+    "concurrent.futures",
+    "fqcn_converter.core.converter",
+    "fqcn_converter.core.batch",
+    "fqcn_converter.core.validator",
+    "fqcn_converter.config.manager",
+    "fqcn_converter.cli.convert",
+    "fqcn_converter.reporting",
+)
+
+
+def _import_times(statement):
+    """Return self times in microseconds of the modules a statement imports."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def _import_cost_ms(module):
+    """Return the best import time of a module over RUNS fresh interpreters."""
+    startup = set(_import_times("pass"))
+    costs = []
+    for _ in range(RUNS):
+        times = _import_times(f"import {module}")
+        costs.append(
+            sum(us for name, us in times.items() if name not in startup) / 1000
+        )
+    return min(costs)
+
+
+def _loaded_modules(statement):
+    """Return the names in sys.modules after running a statement."""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(completed.stdout.split())
+
+
+@pytest.mark.performance
+class TestImportTime:
+    """Import-time budget tests."""
+
+    @pytest.mark.parametrize("module", ["fqcn_converter", "fqcn_converter.cli.main"])
+    def test_import_budget(self, module, worker_id):
+        """Test that importing stays within the start-up budget."""
+        if worker_id != "master":
+            pytest.skip("wall-clock budget only runs without pytest-xdist")
+
+        cost = _import_cost_ms(module)
+
+        print(f"\nimport {module}: {cost:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+        assert cost < IMPORT_BUDGET_MS
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import fqcn_converter",
+            "from fqcn_converter import __version__",
+            "from fqcn_converter.exceptions import FQCNConverterError",
+            "from fqcn_converter.cli.main import create_parser\n"
+            "create_parser().parse_args(['cache', 'stats'])",
+        ],
+    )
+    def test_heavy_modules_deferred(self, statement):
+        """Test that light imports do not load the heavy modules."""
+        loaded = _loaded_modules(statement)
+
+        assert not loaded.intersection(HEAVY_MODULES)
+
+    def test_public_api_still_importable(self):
+        """Test that lazily exported names resolve on access."""
+        loaded = _loaded_modules(
+            "from fqcn_converter import FQCNConverter, ValidationEngine"
+        )
+
+        assert "fqcn_converter.core.converter" in loaded
+        assert "fqcn_converter.core.validator" in loaded
@@ -95,6 +95,35 @@ class TestLargeFileProcessing:
         )
         assert result.success, f"Conversion of {num_tasks} tasks should succeed"
 
+    def test_conversion_time_scales_linearly_with_plays(self):
+        """Test that many task sections do not make conversion quadratic."""
+        play = (
+            "- hosts: all\n"
+            "  tasks:\n"
+            "    - name: Copy file\n"
+            "      copy:\n"
+            "        src: a.txt\n"
+            "  handlers:\n"
+            "    - name: Restart service\n"
+            "      service:\n"
+            "        name: nginx\n"
+        )
+        converter = FQCNConverter()
+
+        timings = {}
+        for num_plays in (200, 800):
+            start_time = time.perf_counter()
+            result = converter.convert_content(play * num_plays)
+            timings[num_plays] = time.perf_counter() - start_time
+
+            assert result.success
+            assert result.changes_made == num_plays * 2
+
+        # Four times the input should take roughly four times as long;
+        # a quadratic engine would take sixteen times as long.
+        scaling_ratio = timings[800] / timings[200]
+        assert scaling_ratio < 10, f"Conversion scaled by {scaling_ratio:.1f}x for 4x input"
+
 
 @pytest.mark.performance
 class TestBatchProcessingPerformance:
@@ -0,0 +1,69 @@
+"""
+Scaling benchmark for the parallel directory walker.
+
+Simulates a filesystem with slow metadata calls (as on NFS-backed
+checkouts) by adding a fixed latency to every directory listing, then
+compares the sequential walker against parallel_walk. Listing latency
+releases the GIL, so the speedup does not depend on the number of cores.
+"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from fqcn_converter.core.discovery import parallel_walk, walk
+
+LISTING_LATENCY = 0.005
+FANOUT = 6
+DEPTH = 2
+
+
+@pytest.fixture
+def wide_tree(tmp_path):
+    """Create a tree of FANOUT**DEPTH leaf directories with one file each."""
+
+    def build(directory, depth):
+        if depth == DEPTH:
+            (directory / "main.yml").write_text("---\n")
+            return
+        for i in range(FANOUT):
+            child = directory / f"dir_{i}"
+            child.mkdir()
+            build(child, depth + 1)
+
+    build(tmp_path, 0)
+    return tmp_path
+
+
+def _slow_scandir():
+    """Patch os.scandir with a fixed per-call latency."""
+    real_scandir = os.scandir
+
+    def scandir(path):
+        time.sleep(LISTING_LATENCY)
+        return real_scandir(path)
+
+    return patch("os.scandir", side_effect=scandir)
+
+
+def _timed(walker):
+    """Return (elapsed_seconds, visited paths) of a walk."""
+    start = time.perf_counter()
+    visited = {entry.path for entry in walker}
+    return time.perf_counter() - start, visited
+
+
+@pytest.mark.performance
+def test_parallel_walk_hides_listing_latency(wide_tree):
+    """Test that concurrent listings beat a sequential walk on slow metadata."""
+    with _slow_scandir():
+        sequential_time, sequential = _timed(walk(wide_tree))
+        parallel_time, parallel = _timed(parallel_walk(wide_tree, max_workers=8))
+
+    assert parallel == sequential
+    assert len(sequential) == 1 + FANOUT + FANOUT**DEPTH
+    assert (
+        parallel_time * 2 < sequential_time
+    ), f"parallel {parallel_time:.3f}s vs sequential {sequential_time:.3f}s"
@@ -0,0 +1,77 @@
+"""
+Scaling benchmark for the process-pool batch executor.
+
+Compares single-threaded batch conversion against the process executor on the
+same set of projects. The speedup assertion only runs on machines with at
+least two cores; on a single core the test still checks that both executors
+produce identical results.
+"""
+
+import os
+import time
+
+import pytest
+
+from fqcn_converter.core.batch import BatchProcessor
+from tests.fixtures.data_generators import PlaybookGenerator
+
+NUM_PROJECTS = 4
+FILES_PER_PROJECT = 12
+TASKS_PER_FILE = 150
+
+
+@pytest.fixture
+def projects(tmp_path):
+    """Generate several projects of CPU-heavy playbooks."""
+    generator = PlaybookGenerator()
+    content = generator.generate_simple_playbook(num_tasks=TASKS_PER_FILE)
+
+    paths = []
+    for p in range(NUM_PROJECTS):
+        project = tmp_path / f"project_{p}"
+        project.mkdir()
+        for f in range(FILES_PER_PROJECT):
+            (project / f"playbook_{f}.yml").write_text(content)
+        paths.append(str(project))
+    return paths
+
+
+def _timed_run(processor, projects):
+    """Run a dry-run batch and return (elapsed_seconds, results)."""
+    start = time.perf_counter()
+    results = processor.process_projects(projects, dry_run=True)
+    return time.perf_counter() - start, results
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestProcessPoolScaling:
+    """Benchmark thread versus process executors."""
+
+    def test_process_executor_scales_across_cores(self, projects):
+        """Test that worker processes convert faster than one thread."""
+        cores = min(4, os.cpu_count() or 1)
+
+        serial = BatchProcessor(max_workers=1, executor="thread")
+        pooled = BatchProcessor(max_workers=cores, executor="process")
+
+        serial_time, serial_results = _timed_run(serial, projects)
+        pooled_time, pooled_results = _timed_run(pooled, projects)
+
+        def totals(results):
+            return sorted((r["project_path"], r["modules_converted"]) for r in results)
+
+        assert totals(pooled_results) == totals(serial_results)
+        assert all(r["success"] for r in pooled_results)
+
+        speedup = serial_time / pooled_time
+        print(
+            f"\nserial={serial_time:.2f}s process[{cores}]={pooled_time:.2f}s "
+            f"speedup={speedup:.2f}x"
+        )
+
+        if cores < 2:
+            pytest.skip("Scaling needs at least two cores")
+
+        # Allow for pool start-up and IPC; expect a clear gain over one core
+        assert speedup > 1.3, f"Process executor speedup only {speedup:.2f}x"
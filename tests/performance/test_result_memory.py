@@ -0,0 +1,73 @@
+"""
+Memory benchmark for conversion results kept over a long batch.
+
+Holds one result per converted file, as a batch report does, and compares
+the traced allocations of full ConversionResult objects (the previous
+behaviour, both bodies kept) with compact ResultRecord objects for each
+content retention mode.
+"""
+
+import tracemalloc
+
+import pytest
+
+from fqcn_converter.core.converter import FQCNConverter
+
+FILE_COUNT = 200
+TASK = """- name: Copy file {index}
+  copy:
+    src: file_{index}.txt
+    dest: /tmp/file_{index}.txt
+"""
+
+
+@pytest.fixture(scope="module")
+def results():
+    """Convert FILE_COUNT in-memory playbooks of about 4 KB each."""
+    converter = FQCNConverter(create_backups=False)
+    content = "---\n" + "".join(TASK.format(index=i) for i in range(40))
+    return [converter.convert_content(content) for _ in range(FILE_COUNT)]
+
+
+def _retained_bytes(build):
+    """Return the bytes still allocated after building a list of results."""
+    tracemalloc.start()
+    try:
+        kept = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(kept) == FILE_COUNT
+    return current
+
+
+def _copy(text):
+    """Return an unshared copy of a string, as read from a distinct file."""
+    return text.encode().decode() if text is not None else None
+
+
+def _full_results(results):
+    """Copy results with both bodies, as batches kept them before."""
+    return [
+        type(result)(
+            success=result.success,
+            file_path=result.file_path,
+            changes_made=result.changes_made,
+            original_content=_copy(result.original_content),
+            converted_content=_copy(result.converted_content),
+        )
+        for result in results
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("mode,ratio", [("none", 20), ("diff", 1.25)])
+def test_compact_records_use_less_memory(results, mode, ratio):
+    """Test that compact records retain a fraction of the full results."""
+    full = _retained_bytes(lambda: _full_results(results))
+    compact = _retained_bytes(
+        lambda: [result.compact(mode) for result in _full_results(results)]
+    )
+
+    print(f"\nfull: {full / 1024:.0f} KiB, {mode}: {compact / 1024:.0f} KiB")
+    assert compact * ratio < full
@@ -6,9 +6,11 @@ with various file sizes and complexity levels.
 """
 
 import time
+import tracemalloc
 
 import pytest
 
+from fqcn_converter.core.document import ParsedDocument
 from fqcn_converter.core.validator import ValidationEngine
 from tests.fixtures.data_generators import PlaybookGenerator
 from tests.fixtures.performance_utils import PerformanceUtils
@@ -51,6 +53,58 @@ class TestValidationPerformance:
         )
         assert result is not None, "Validation should return a result"
 
+    def test_issue_positions_scale_linearly(self):
+        """Test that locating issues does not scan the file once per task."""
+        validator = ValidationEngine()
+        # Distinct module names, so a line scan has to reach each task
+        task = "    - name: Task {i}\n      custom_module_{i}:\n        src: a\n"
+
+        def validate(num_tasks):
+            content = "---\n- hosts: all\n  tasks:\n" + "".join(
+                task.format(i=i) for i in range(num_tasks)
+            )
+            start_time = time.perf_counter()
+            result = validator.validate_content(content)
+            assert len(result.issues) == num_tasks
+            return time.perf_counter() - start_time
+
+        validate(100)  # warm up
+        small = min(validate(500) for _ in range(3))
+        large = min(validate(2000) for _ in range(3))
+
+        # Four times the tasks: ~4x when linear, ~16x with a scan per task
+        assert large / small < 8
+
+    def test_vars_heavy_file_skips_value_construction(self):
+        """Test that validation of a vars-heavy play does not build its values."""
+        vars_block = "".join(
+            f"    var_{i}: {{items: [1, 2, 3], text: 'value {i}'}}\n"
+            for i in range(5000)
+        )
+        content = (
+            "---\n- hosts: all\n  vars:\n"
+            + vars_block
+            + "  tasks:\n    - name: Copy\n      copy:\n        src: a\n"
+        )
+        validator = ValidationEngine()
+
+        def peak_bytes(use):
+            document = ParsedDocument(content)
+            document.root  # parsing is shared by both modes
+            tracemalloc.start()
+            try:
+                result = use(document)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return result, peak
+
+        result, validation_peak = peak_bytes(validator.validate_content)
+        _, construction_peak = peak_bytes(lambda document: document.data)
+
+        assert result.short_modules == 1
+        assert validation_peak * 20 < construction_peak
+
     def test_validation_memory_efficiency(self, tmp_path):
         """Test that validation doesn't consume excessive memory."""
         import psutil
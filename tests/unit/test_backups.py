@@ -0,0 +1,367 @@
+"""
+Unit tests for the content-addressed backup store.
+
+Tests blob deduplication, run manifests, rollback and the convert and
+rollback commands.
+"""
+
+import json
+import os
+import stat
+import sys
+
+import pytest
+
+from fqcn_converter.core.backups import BackupStore
+from fqcn_converter.core.converter import FQCNConverter
+from fqcn_converter.exceptions import FileAccessError
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Backup store inside a temporary project directory."""
+    return BackupStore(tmp_path / ".fqcn_backups")
+
+
+@pytest.fixture
+def converted_run(store, write_project, minimal_playbook_content):
+    """Factory converting playbooks in one backup run and returning the run."""
+
+    def convert(names=("a.yml", "b.yml")):
+        run = store.begin_run()
+        converter = FQCNConverter(backups=run)
+        for path in write_project({name: minimal_playbook_content for name in names}):
+            converter.convert_file(path)
+        run.close()
+        return run
+
+    return convert
+
+
+def _blobs(store):
+    return [path for path in store.objects_dir.rglob("*") if path.is_file()]
+
+
+class TestBackupRun:
+    """Test cases for BackupRun."""
+
+    def test_identical_files_stored_once(
+        self, store, write_project, minimal_playbook_content
+    ):
+        """Test that identical content is stored as one blob."""
+        files = {name: minimal_playbook_content for name in ("a.yml", "b.yml", "c.yml")}
+        run = store.begin_run()
+        for path in write_project(files):
+            run.add(path)
+        run.close()
+
+        assert run.files == 3
+        assert len(_blobs(store)) == 1
+        assert [entry.path for entry in store.entries(run.run_id)] == [
+            "a.yml",
+            "b.yml",
+            "c.yml",
+        ]
+
+    def test_manifest_written_as_files_are_added(
+        self, store, write_project, minimal_playbook_content
+    ):
+        """Test that an unclosed run can already be read back."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        run = store.begin_run()
+
+        run.add(path)
+
+        assert [entry.path for entry in store.entries(run.run_id)] == ["site.yml"]
+        run.close()
+
+    def test_first_backup_of_a_file_wins(self, tmp_path, store):
+        """Test that a file backed up twice keeps its original content."""
+        path = tmp_path / "site.yml"
+        path.write_text("original\n")
+        run = store.begin_run()
+
+        first = run.add(path)
+        path.write_text("converted\n")
+        run.add(path)
+        run.close()
+
+        assert [entry.digest for entry in store.entries(run.run_id)] == [first.digest]
+
+    def test_file_backed_up_twice_counted_once(self, tmp_path, store):
+        """Test that the run counts distinct files like the run listing."""
+        path = tmp_path / "site.yml"
+        path.write_text("original\n")
+        run = store.begin_run()
+
+        run.add(path)
+        run.add(path, converted="converted\n")
+        run.close()
+
+        assert run.files == 1
+        assert [listed.files for listed in store.runs()] == [1]
+
+    def test_run_without_backups_leaves_no_manifest(self, store):
+        """Test that empty runs are not listed."""
+        store.begin_run().close()
+
+        assert store.runs() == []
+
+    def test_store_ignored_by_git(self, store, write_project, minimal_playbook_content):
+        """Test that the store directory ignores itself."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+
+        with store.begin_run() as run:
+            run.add(path)
+
+        assert (store.root / ".gitignore").read_text() == "*\n"
+
+    def test_missing_file(self, tmp_path, store):
+        """Test that backing up a missing file raises FileAccessError."""
+        with pytest.raises(FileAccessError, match="Cannot back up file"):
+            store.begin_run().add(tmp_path / "missing.yml")
+
+
+class TestRollback:
+    """Test cases for BackupStore.rollback."""
+
+    def test_rollback_restores_converted_files(
+        self, tmp_path, store, converted_run, minimal_playbook_content
+    ):
+        """Test that rollback restores every file of a run."""
+        run = converted_run()
+        assert "ansible.builtin.copy:" in (tmp_path / "a.yml").read_text()
+
+        result = store.rollback(run.run_id)
+
+        assert result.success
+        assert sorted(result.restored) == ["a.yml", "b.yml"]
+        assert (tmp_path / "a.yml").read_text() == minimal_playbook_content
+        assert (tmp_path / "b.yml").read_text() == minimal_playbook_content
+
+    def test_rollback_skips_unchanged_files(
+        self, store, converted_run, write_project, minimal_playbook_content
+    ):
+        """Test that files already holding their original are left alone."""
+        run = converted_run()
+        write_project({"a.yml": minimal_playbook_content})
+
+        result = store.rollback(run.run_id)
+
+        assert result.restored == ["b.yml"]
+        assert result.unchanged == ["a.yml"]
+
+    def test_rollback_dry_run(self, tmp_path, store, converted_run):
+        """Test that a dry run reports files without restoring them."""
+        run = converted_run()
+
+        result = store.rollback(run.run_id, dry_run=True)
+
+        assert sorted(result.restored) == ["a.yml", "b.yml"]
+        assert "ansible.builtin.copy:" in (tmp_path / "a.yml").read_text()
+
+    def test_rollback_recreates_deleted_files(
+        self, tmp_path, store, converted_run, minimal_playbook_content
+    ):
+        """Test that deleted files are restored."""
+        run = converted_run()
+        (tmp_path / "a.yml").unlink()
+
+        store.rollback(run.run_id)
+
+        assert (tmp_path / "a.yml").read_text() == minimal_playbook_content
+
+    def test_rollback_skips_files_edited_since_the_run(
+        self, tmp_path, store, converted_run
+    ):
+        """Test that edits made after the conversion are not overwritten."""
+        run = converted_run()
+        edited = (tmp_path / "a.yml").read_text() + "# reviewed\n"
+        (tmp_path / "a.yml").write_text(edited)
+
+        result = store.rollback(run.run_id)
+
+        assert not result.success
+        assert result.modified == ["a.yml"]
+        assert result.restored == ["b.yml"]
+        assert (tmp_path / "a.yml").read_text() == edited
+
+    def test_rollback_force_restores_edited_files(
+        self, tmp_path, store, converted_run, minimal_playbook_content
+    ):
+        """Test that force restores files edited since the run."""
+        run = converted_run()
+        (tmp_path / "a.yml").write_text("# rewritten\n")
+
+        result = store.rollback(run.run_id, force=True)
+
+        assert result.success
+        assert sorted(result.restored) == ["a.yml", "b.yml"]
+        assert (tmp_path / "a.yml").read_text() == minimal_playbook_content
+
+    def test_rollback_without_converted_digest(
+        self, store, write_project, minimal_playbook_content
+    ):
+        """Test that manifests without converted digests still roll back."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        run = store.begin_run()
+        run.add(path)
+        run.close()
+        path.write_text("# rewritten\n")
+
+        result = store.rollback(run.run_id)
+
+        assert result.restored == ["site.yml"]
+        assert path.read_text() == minimal_playbook_content
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_rollback_restores_mode(
+        self, store, write_project, minimal_playbook_content
+    ):
+        """Test that restored files get their original permissions."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        path.chmod(0o640)
+        run = store.begin_run()
+        FQCNConverter(backups=run).convert_file(path)
+        run.close()
+        path.chmod(0o600)
+
+        store.rollback(run.run_id)
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_rollback_reports_missing_blobs(self, store, converted_run):
+        """Test that a file whose blob is gone fails without stopping the run."""
+        run = converted_run(names=("a.yml",))
+        for blob in _blobs(store):
+            blob.unlink()
+
+        result = store.rollback(run.run_id)
+
+        assert not result.success
+        assert list(result.failed) == ["a.yml"]
+
+    def test_unchanged_files_not_backed_up(self, tmp_path, store):
+        """Test that the converter only backs up files it changes."""
+        path = tmp_path / "site.yml"
+        path.write_text("- hosts: all\n  tasks:\n    - ansible.builtin.ping:\n")
+        run = store.begin_run()
+
+        FQCNConverter(backups=run).convert_file(path)
+
+        assert run.files == 0
+
+    def test_resolve_latest_and_prefix(self, store, converted_run):
+        """Test run lookup by "latest" and by unique prefix."""
+        first = converted_run(names=("a.yml",))
+        second = converted_run(names=("b.yml",))
+
+        assert store.resolve("latest") == second.run_id
+        assert store.resolve(first.run_id[:-2]) == first.run_id
+        assert [run.files for run in store.runs()] == [1, 1]
+
+    def test_resolve_unknown_run(self, store):
+        """Test that an unknown run id raises FileAccessError."""
+        with pytest.raises(FileAccessError, match="No backup run matches"):
+            store.resolve("20000101")
+
+    def test_partial_manifest_line_ignored(self, store, converted_run):
+        """Test that a run killed mid-append can still be rolled back."""
+        run = converted_run(names=("a.yml",))
+        with open(store.runs_dir / f"{run.run_id}.jsonl", "a") as f:
+            f.write('{"path": "b.y')
+
+        result = store.rollback(run.run_id)
+
+        assert result.restored == ["a.yml"]
+
+
+class TestCommands:
+    """Test cases for convert --backup and the rollback command."""
+
+    def _run(self, *argv):
+        from fqcn_converter.cli.main import create_parser, load_command
+
+        args = create_parser().parse_args(list(argv))
+        return load_command(args.command).main(args)
+
+    def test_convert_backup_then_rollback(
+        self, tmp_path, capsys, write_project, minimal_playbook_content
+    ):
+        """Test a full convert and rollback round trip."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        backup_dir = str(tmp_path / "backups")
+
+        assert (
+            self._run("convert", "--backup", "--backup-dir", backup_dir, str(path)) == 0
+        )
+        assert "ansible.builtin.copy:" in path.read_text()
+        assert not (tmp_path / "site.yml.fqcn_backup").exists()
+        assert "fqcn-converter rollback" in capsys.readouterr().out
+
+        assert self._run("rollback", "--list", "--backup-dir", backup_dir) == 0
+        assert "convert  1 files" in capsys.readouterr().out
+
+        assert self._run("rollback", "latest", "--backup-dir", backup_dir) == 0
+        assert path.read_text() == minimal_playbook_content
+        assert "1 restored" in capsys.readouterr().out
+
+    def test_rollback_force_option(
+        self, tmp_path, capsys, write_project, minimal_playbook_content
+    ):
+        """Test that rollback --force restores files edited since the run."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        backup_dir = str(tmp_path / "backups")
+        self._run("convert", "--backup", "--backup-dir", backup_dir, str(path))
+        path.write_text("# rewritten\n")
+        capsys.readouterr()
+
+        assert self._run("rollback", "latest", "--backup-dir", backup_dir) == 1
+        assert "use --force" in capsys.readouterr().out
+        assert path.read_text() == "# rewritten\n"
+
+        assert (
+            self._run("rollback", "latest", "--force", "--backup-dir", backup_dir) == 0
+        )
+        assert path.read_text() == minimal_playbook_content
+
+    def test_rollback_json(
+        self, tmp_path, capsys, write_project, minimal_playbook_content
+    ):
+        """Test JSON output of a dry-run rollback."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        backup_dir = str(tmp_path / "backups")
+        self._run("convert", "--backup", "--backup-dir", backup_dir, str(path))
+        capsys.readouterr()
+
+        code = self._run(
+            "rollback", "latest", "-n", "--format", "json", "--backup-dir", backup_dir
+        )
+
+        report = json.loads(capsys.readouterr().out)
+        assert code == 0
+        assert report["dry_run"] is True
+        assert report["restored"] == [os.path.relpath(path, tmp_path)]
+
+    def test_rollback_requires_run_id(self, tmp_path):
+        """Test that rollback without a run id fails."""
+        assert self._run("rollback", "--backup-dir", str(tmp_path)) == 1
+
+    def test_rollback_unknown_run(self, tmp_path):
+        """Test that rolling back an unknown run fails."""
+        assert self._run("rollback", "nope", "--backup-dir", str(tmp_path)) == 1
+
+    def test_backup_directory_from_config(
+        self, tmp_path, monkeypatch, write_project, minimal_playbook_content
+    ):
+        """Test that settings.backup_directory of --config sets the store."""
+        monkeypatch.chdir(tmp_path)
+        config = tmp_path / "fqcn.yml"
+        config.write_text("settings:\n  backup_directory: .my_backups\n")
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+
+        assert (
+            self._run("convert", "--backup", "--config", str(config), "site.yml") == 0
+        )
+
+        assert BackupStore(tmp_path / ".my_backups").resolve("latest")
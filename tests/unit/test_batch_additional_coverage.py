@@ -356,18 +356,17 @@ class TestBatchProcessorAdditionalCoverage:
             assert "success" in result
 
     def test_process_single_project_exception_in_parallel_mode(self, processor):
-        """Test exception handling in process_single_project function during parallel processing."""
+        """Test exception handling for file conversions during parallel processing."""
         processor.max_workers = 2
         
         with tempfile.TemporaryDirectory() as temp_dir:
             project_path = Path(temp_dir)
             (project_path / "playbook.yml").write_text("- hosts: all")
             
-            # Mock _process_project_directory to raise exception
-            def mock_process_directory(path, dry_run=False):
-                raise Exception("Process directory failed")
-            
-            processor._process_project_directory = mock_process_directory
+            # Parallel mode schedules individual files, so fail the file conversion
+            processor.converter.convert_file.side_effect = Exception(
+                "Process directory failed"
+            )
             
             result = processor.process_projects([str(project_path)])
             
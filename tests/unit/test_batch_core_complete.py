@@ -15,7 +15,7 @@ import pytest
 
 from fqcn_converter.core.batch import BatchProcessor, BatchResult
 from fqcn_converter.core.converter import ConversionResult, FQCNConverter
-from fqcn_converter.exceptions import BatchProcessingError
+from fqcn_converter.exceptions import BatchProcessingError, ConfigurationError
 
 
 class TestBatchProcessorInit:
@@ -589,4 +589,157 @@ class TestBatchProcessorEdgeCases:
                 projects2 = processor.discover_projects(temp_dir)
                 
                 assert isinstance(projects1, list)
-                assert isinstance(projects2, list)
\ No newline at end of file
+                assert isinstance(projects2, list)
+
+class TestBatchProcessorFileScheduling:
+    """Test file-level scheduling across projects."""
+
+    def test_files_scheduled_largest_first_across_projects(self, tmp_path):
+        """Test that one queue holds all files, largest first."""
+        sizes = {("big", "huge.yml"): 5000, ("small", "tiny.yml"): 10}
+        for (project, name), size in sizes.items():
+            (tmp_path / project).mkdir(exist_ok=True)
+            (tmp_path / project / name).write_text("#" * size)
+        (tmp_path / "big" / "mid.yml").write_text("#" * 500)
+
+        with patch('fqcn_converter.core.batch.FQCNConverter'):
+            processor = BatchProcessor(max_workers=1)
+        processor.max_workers = 2
+        calls = []
+
+        def convert_file(file_path):
+            calls.append(Path(file_path).name)
+            return ConversionResult(file_path=file_path, success=True, changes_made=1)
+
+        processor.converter.convert_file.side_effect = convert_file
+
+        results = processor.process_projects(
+            [str(tmp_path / "small"), str(tmp_path / "big")]
+        )
+
+        assert calls[0] == "huge.yml"
+        assert sorted(calls) == ["huge.yml", "mid.yml", "tiny.yml"]
+        by_path = {r["project_path"]: r for r in results}
+        assert by_path[str(tmp_path / "big")]["modules_converted"] == 2
+        assert by_path[str(tmp_path / "big")]["files_processed"] == 2
+        assert by_path[str(tmp_path / "small")]["modules_converted"] == 1
+
+    def test_stop_on_first_failed_project(self, tmp_path):
+        """Test that continue_on_error=False stops after a failed project."""
+        for name in ["a", "b", "c"]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "site.yml").write_text("#")
+
+        with patch('fqcn_converter.core.batch.FQCNConverter'):
+            processor = BatchProcessor(max_workers=1)
+        processor.max_workers = 2
+        processor.converter.convert_file.return_value = ConversionResult(
+            file_path="site.yml", success=False, changes_made=0, errors=["boom"]
+        )
+
+        result = processor.process_projects_batch_result(
+            [str(tmp_path / name) for name in ["a", "b", "c"]],
+            continue_on_error=False,
+        )
+
+        assert len(result.project_results) == 1
+        assert result.failed_conversions == 1
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_nested_projects_all_reported(self, tmp_path, max_workers):
+        """Test that a project containing another project is still reported."""
+        playbook = "- hosts: all\n  tasks:\n    - copy:\n        src: a\n"
+        parent = tmp_path / "p"
+        child = parent / "sub"
+        child.mkdir(parents=True)
+        (parent / "site.yml").write_text(playbook)
+        (child / "site.yml").write_text(playbook)
+
+        results = BatchProcessor(max_workers=max_workers).process_projects(
+            [str(parent), str(child)], dry_run=True
+        )
+
+        by_path = {r["project_path"]: r for r in results}
+        assert by_path[str(parent)]["files_processed"] == 2
+        assert by_path[str(parent)]["modules_converted"] == 2
+        assert by_path[str(child)]["files_processed"] == 1
+        assert by_path[str(child)]["modules_converted"] == 1
+
+
+class TestBatchProcessorProcessExecutor:
+    """Test BatchProcessor with the process executor."""
+
+    PLAYBOOK = (
+        "- hosts: all\n"
+        "  tasks:\n"
+        "    - copy:\n"
+        "        src: a\n"
+        "        dest: b\n"
+        "    - debug:\n"
+        "        msg: hi\n"
+    )
+
+    @pytest.fixture
+    def projects(self, tmp_path):
+        """Create two projects with playbooks and one empty project."""
+        paths = []
+        for name in ["alpha", "beta"]:
+            project = tmp_path / name
+            project.mkdir()
+            (project / "site.yml").write_text(self.PLAYBOOK)
+            (project / "extra.yml").write_text(self.PLAYBOOK)
+            paths.append(str(project))
+
+        empty = tmp_path / "empty"
+        empty.mkdir()
+        paths.append(str(empty))
+        return paths
+
+    def test_init_invalid_executor(self):
+        """Test that unknown executors are rejected."""
+        with pytest.raises(ConfigurationError, match="Unknown executor"):
+            BatchProcessor(executor="fiber")
+
+    def test_process_projects_in_processes(self, projects):
+        """Test that process mode aggregates file records per project."""
+        callback = Mock()
+        processor = BatchProcessor(
+            max_workers=2, executor="process", progress_callback=callback
+        )
+
+        results = processor.process_projects(projects, dry_run=True)
+
+        by_path = {r["project_path"]: r for r in results}
+        assert by_path[projects[0]]["modules_converted"] == 4
+        assert by_path[projects[0]]["files_processed"] == 2
+        assert by_path[projects[1]]["modules_converted"] == 4
+        assert by_path[projects[2]]["modules_converted"] == 0
+        assert all(r["success"] for r in results)
+        assert callback.call_count == 3
+        # Dry run leaves files untouched
+        assert "ansible.builtin" not in Path(projects[0], "site.yml").read_text()
+
+    def test_process_projects_batch_result_in_processes(self, projects):
+        """Test that process mode writes conversions and reports totals."""
+        processor = BatchProcessor(max_workers=2, executor="process")
+
+        result = processor.process_projects_batch_result(projects[:2])
+
+        assert result.total_projects == 2
+        assert result.successful_conversions == 2
+        assert result.total_modules_converted == 8
+        assert "ansible.builtin.copy" in Path(projects[0], "site.yml").read_text()
+
+    def test_process_projects_in_processes_with_errors(self, tmp_path):
+        """Test that worker failures are reported as project errors."""
+        project = tmp_path / "broken"
+        project.mkdir()
+        (project / "site.yml").write_text("key: [unclosed\n")
+        processor = BatchProcessor(max_workers=2, executor="process")
+
+        result = processor.process_projects_batch_result(
+            [str(project)], dry_run=True
+        )
+
+        assert result.failed_conversions == 1
+        assert "Failed to process" in result.project_results[0].errors[0]
@@ -439,7 +439,7 @@ class TestBatchProcessorErrorHandling:
             yaml_file.write_text("- hosts: all")
             
             # Mock ThreadPoolExecutor constructor to raise exception
-            with patch('fqcn_converter.core.batch.ThreadPoolExecutor', side_effect=Exception("ThreadPool creation failed")):
+            with patch('fqcn_converter.core.workers.ThreadPoolExecutor', side_effect=Exception("ThreadPool creation failed")):
                 # Should handle the error gracefully
                 try:
                     result = processor.process_projects([str(project_path)])
@@ -14,6 +14,7 @@ from unittest.mock import Mock, patch, MagicMock
 import pytest
 
 from fqcn_converter.cli.batch import BatchCommand, add_batch_arguments, ProjectResult, BatchResult
+from fqcn_converter.core.workers import FileRecord
 
 
 class TestBatchProcessingCore:
@@ -236,28 +237,20 @@ class TestBatchProcessingCore:
         
         projects = [Path("/test/proj1"), Path("/test/proj2"), Path("/test/proj3")]
         
-        # Mock the processing methods
-        with patch.object(command, '_process_single_project') as mock_process:
-            mock_process.return_value = ProjectResult(
-                project_path="/test/proj",
-                success=True
-            )
+        # Mock file discovery and the thread pool conversion
+        with patch.object(command, '_find_ansible_files_in_project') as mock_find:
+            mock_find.side_effect = lambda project: [project / "site.yml"]
             
-            with patch('fqcn_converter.cli.batch.ThreadPoolExecutor') as mock_executor:
-                mock_future = Mock()
-                mock_future.result.return_value = ProjectResult(
-                    project_path="/test/proj",
-                    success=True
+            with patch('fqcn_converter.cli.batch.iter_thread_records') as mock_records:
+                mock_records.side_effect = lambda converter, files, **kwargs: iter(
+                    FileRecord(path, True, 0, (), (), None, 0.0) for path in files
                 )
                 
-                mock_executor.return_value.__enter__.return_value.submit.return_value = mock_future
-                mock_executor.return_value.__enter__.return_value.__iter__ = Mock(return_value=iter([mock_future]))
+                result = command._process_projects_parallel(projects)
                 
-                # Mock as_completed
-                with patch('fqcn_converter.cli.batch.as_completed', return_value=[mock_future]):
-                    result = command._process_projects_parallel(projects)
-                    
-                    assert result is True or result is False  # Should return a boolean
+                assert result is True
+                assert mock_records.call_args.kwargs["max_workers"] == 8
+                assert len(command.results) == 3
 
     def test_directory_walking(self, mock_args):
         """Test directory walking functionality."""
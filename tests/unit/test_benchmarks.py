@@ -0,0 +1,131 @@
+"""
+Unit tests for the benchmark harness.
+
+Tests latency statistics, baseline comparison and the runner.
+"""
+
+import json
+
+import pytest
+
+from benchmarks.cases import CASES
+from benchmarks.harness import BenchmarkResult, compare, measure, percentile
+from benchmarks.runner import main
+
+
+def _result(name="convert_content/tasks_file", **metrics):
+    values = {"ops_per_sec": 100.0, "p50_ms": 5.0, "p99_ms": 10.0, "peak_rss_mb": 50.0}
+    values.update(metrics)
+    return BenchmarkResult(name=name, iterations=10, params={"tasks": 20}, **values)
+
+
+class TestHarness:
+    """Test cases for measurement and comparison."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        samples = [float(i) for i in range(1, 101)]
+
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 99) == 99.0
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([], 50) == 0.0
+
+    def test_measure(self):
+        """Test that measure times every iteration after the warmup."""
+        calls = []
+
+        result = measure("noop", lambda: calls.append(1), iterations=20, warmup=3)
+
+        assert len(calls) == 23
+        assert result.iterations == 20
+        assert result.ops_per_sec > 0
+        assert result.p50_ms <= result.p99_ms
+
+    def test_compare_within_threshold(self):
+        """Test that changes within the threshold are not regressions."""
+        current = _result(ops_per_sec=85.0, p99_ms=11.0)
+
+        assert compare([current], [_result()], threshold=0.2) == []
+
+    def test_compare_flags_regressions(self):
+        """Test that slower, higher-latency or larger runs are flagged."""
+        current = _result(ops_per_sec=50.0, p99_ms=20.0, peak_rss_mb=80.0)
+
+        regressions = compare([current], [_result()], threshold=0.2)
+
+        assert [r.metric for r in regressions] == [
+            "ops_per_sec",
+            "p99_ms",
+            "peak_rss_mb",
+        ]
+        assert regressions[0].change == pytest.approx(0.5)
+
+    def test_compare_skips_unmatched_benchmarks(self):
+        """Test that new benchmarks and changed params are not compared."""
+        slow = _result(ops_per_sec=1.0)
+        resized = _result(ops_per_sec=1.0)
+        resized.params = {"tasks": 40}
+
+        assert compare([slow], [_result(name="other")]) == []
+        assert compare([resized], [_result()]) == []
+
+
+class TestRunner:
+    """Test cases for the benchmark runner."""
+
+    def test_cases_registered(self):
+        """Test that every hot path has a benchmark."""
+        apis = {name.split("/")[0] for name in CASES}
+
+        assert apis == {
+            "mapping_load",
+            "convert_content",
+            "validate_content",
+            "discover_projects",
+            "process_projects",
+        }
+
+    def test_run_and_compare(self, tmp_path, capsys):
+        """Test a report saved as baseline and compared against."""
+        baseline = str(tmp_path / "baseline.json")
+        argv = ["-k", "convert_content/tasks_file", "--iterations", "3"]
+
+        assert (
+            main([*argv, "--in-process", "--save-baseline", "--baseline", baseline])
+            == 0
+        )
+        report = json.loads(capsys.readouterr().out)
+        (result,) = report["benchmarks"]
+        assert result["name"] == "convert_content/tasks_file"
+        assert result["iterations"] == 3
+        assert {"ops_per_sec", "p50_ms", "p99_ms", "peak_rss_mb"} <= set(result)
+
+        assert (
+            main([*argv, "--compare", "--baseline", baseline, "--threshold", "1e9"])
+            == 0
+        )
+        assert json.loads(capsys.readouterr().out)["regressions"] == []
+
+    def test_compare_fails_on_regression(self, tmp_path, monkeypatch, capsys):
+        """Test that a regression makes the runner exit with status 1."""
+        baseline = tmp_path / "baseline.json"
+        fast = _result(ops_per_sec=1e12, p99_ms=1e-9, peak_rss_mb=1e-9)
+        baseline.write_text(json.dumps({"benchmarks": [fast.to_dict()]}))
+        monkeypatch.setattr(
+            "benchmarks.runner.run_case", lambda name, iterations: _result()
+        )
+
+        code = main(
+            [
+                "-k",
+                "convert_content/tasks_file",
+                "--in-process",
+                "--compare",
+                "--baseline",
+                str(baseline),
+            ]
+        )
+
+        assert code == 1
+        assert "3 regression(s)" in capsys.readouterr().err
@@ -0,0 +1,233 @@
+"""
+Unit tests for the on-disk result cache.
+
+Tests keying, LRU eviction, statistics and clearing of ResultCache, and
+that FQCNConverter and ValidationEngine skip parsing on cache hits.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from argparse import Namespace
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from fqcn_converter.cli.cache import CacheCommand
+from fqcn_converter.cli.main import create_parser
+from fqcn_converter.core.cache import (
+    ResultCache,
+    default_cache_dir,
+    mapping_fingerprint,
+)
+from fqcn_converter.core.converter import FQCNConverter
+from fqcn_converter.core.validator import ValidationEngine
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    return ResultCache(tmp_path / "cache")
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_key_depends_on_content_and_fingerprint(self):
+        """Test that content and fingerprint both change the key."""
+        key = ResultCache.make_key("a: 1", "fp")
+
+        assert key == ResultCache.make_key("a: 1", "fp")
+        assert key != ResultCache.make_key("a: 2", "fp")
+        assert key != ResultCache.make_key("a: 1", "other")
+
+    def test_mapping_fingerprint(self):
+        """Test that fingerprints ignore order but not content."""
+        first = mapping_fingerprint({"copy": "a.b.copy", "file": "a.b.file"})
+        second = mapping_fingerprint({"file": "a.b.file", "copy": "a.b.copy"})
+
+        assert first == second
+        assert first != mapping_fingerprint({"copy": "a.b.copy"})
+        assert first != mapping_fingerprint(
+            {"copy": "a.b.copy", "file": "a.b.file"}, "line"
+        )
+
+    def test_get_miss_and_hit(self, cache):
+        """Test round-tripping a payload and hit/miss counters."""
+        assert cache.get("convert", "ab" * 32) is None
+
+        cache.put("convert", "ab" * 32, {"changes_made": 3})
+
+        assert cache.get("convert", "ab" * 32) == {"changes_made": 3}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        """Test that unreadable entries are ignored."""
+        key = "cd" * 32
+        cache.put("validate", key, {"valid": True})
+        cache._entry_path("validate", key).write_text("{not json")
+
+        assert cache.get("validate", key) is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted first."""
+        cache = ResultCache(tmp_path / "cache", max_size_bytes=300)
+        payload = {"data": "x" * 80}
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+
+        for i, key in enumerate(keys):
+            cache.put("convert", key, payload)
+            path = cache._entry_path("convert", key)
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+        # Touch the oldest entry so the second one becomes LRU
+        assert cache.get("convert", keys[0]) is not None
+        cache.put("convert", "99" * 32, payload)
+
+        assert cache.get("convert", keys[1]) is None
+        assert cache.get("convert", keys[0]) is not None
+        assert cache.stats().size_bytes <= 300
+
+    def test_overwrite_does_not_grow_size(self, tmp_path):
+        """Test that rewriting a key replaces its size instead of adding to it."""
+        cache = ResultCache(tmp_path / "cache", max_size_bytes=300)
+        payload = {"data": "x" * 80}
+        cache.put("convert", "aa" * 32, payload)
+        cache.put("convert", "bb" * 32, payload)
+
+        for _ in range(5):
+            cache.put("convert", "aa" * 32, payload)
+
+        assert cache._size_bytes == cache.stats().size_bytes
+        assert cache.stats().total_entries == 2
+
+    def test_concurrent_puts_keep_size(self, cache):
+        """Test that puts from several threads keep the size accurate."""
+        keys = [f"{i:02x}" * 32 for i in range(8)]
+        cache.put("convert", "ff" * 32, {})
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(
+                    lambda key: cache.put("convert", key, {"key": key}), keys * 4
+                )
+            )
+
+        assert cache._size_bytes == cache.stats().size_bytes
+
+    def test_stats_and_clear(self, cache):
+        """Test entry counts per kind and clearing."""
+        cache.put("convert", "aa" * 32, {})
+        cache.put("convert", "bb" * 32, {})
+        cache.put("validate", "aa" * 32, {})
+
+        stats = cache.stats()
+        assert stats.entries == {"convert": 2, "validate": 1}
+        assert stats.total_entries == 3
+        assert stats.size_bytes > 0
+
+        assert cache.clear() == 3
+        assert cache.stats().total_entries == 0
+
+    def test_default_cache_dir(self, monkeypatch, tmp_path):
+        """Test that XDG_CACHE_HOME is honoured."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert default_cache_dir() == tmp_path / "fqcn-converter"
+
+
+class TestCachedConversion:
+    """Test cache integration in converter and validator."""
+
+    def test_convert_file_hit_skips_parsing(
+        self, cache, write_project, minimal_playbook_content
+    ):
+        """Test that an unchanged file is not parsed again."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        converter = FQCNConverter(cache=cache)
+
+        first = converter.convert_file(path, dry_run=True)
+        with patch("yaml.compose", side_effect=AssertionError("parsed")):
+            second = converter.convert_file(path, dry_run=True)
+
+        assert second.changes_made == first.changes_made == 1
+        assert second.converted_content == first.converted_content
+        assert second.file_path == str(path)
+
+    def test_convert_file_caches_written_content(
+        self, cache, write_project, minimal_playbook_content
+    ):
+        """Test that converted output is cached as already converted."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        converter = FQCNConverter(cache=cache)
+
+        converter.convert_file(path)
+        with patch("yaml.compose", side_effect=AssertionError("parsed")):
+            result = converter.convert_file(path)
+
+        assert result.changes_made == 0
+        assert "ansible.builtin.copy" in path.read_text()
+
+    def test_mapping_change_invalidates(self, cache, tmp_path):
+        """Test that different mappings do not share results."""
+        path = tmp_path / "site.yml"
+        path.write_text("- my_module:\n    arg: 1\n")
+
+        FQCNConverter(cache=cache).convert_file(path, dry_run=True)
+        result = FQCNConverter(
+            cache=cache, custom_mappings={"my_module": "my.coll.my_module"}
+        ).convert_file(path, dry_run=True)
+
+        assert result.changes_made == 1
+
+    def test_validate_conversion_hit_skips_parsing(
+        self, cache, write_project, minimal_playbook_content
+    ):
+        """Test that validation results are reused for unchanged files."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        validator = ValidationEngine(cache=cache)
+
+        first = validator.validate_conversion(path)
+        with patch("yaml.compose", side_effect=yaml.YAMLError("parsed")):
+            second = validator.validate_conversion(path)
+
+        assert second == first
+        assert second.valid is False
+        assert second.issues[0].message == first.issues[0].message
+
+
+class TestCacheCommand:
+    """Test cases for the cache CLI command."""
+
+    def test_stats_json(self, cache, capsys):
+        """Test printing cache statistics as JSON."""
+        cache.put("convert", "aa" * 32, {})
+        args = Namespace(action="stats", cache_dir=str(cache.cache_dir), format="json")
+
+        assert CacheCommand(args).run() == 0
+
+        stats = json.loads(capsys.readouterr().out)
+        assert stats["entries"] == {"convert": 1, "validate": 0}
+
+    def test_clear(self, cache, capsys):
+        """Test clearing the cache from the CLI."""
+        cache.put("validate", "aa" * 32, {})
+        args = Namespace(action="clear", cache_dir=str(cache.cache_dir), format="text")
+
+        assert CacheCommand(args).run() == 0
+
+        assert "Removed 1 cached results" in capsys.readouterr().out
+        assert cache.stats().total_entries == 0
+
+    def test_cache_dir_arguments(self):
+        """Test that convert, validate and cache accept --cache-dir."""
+        parser = create_parser()
+
+        for argv in (
+            ["convert", "--cache-dir", "c", "site.yml"],
+            ["validate", "--cache-dir", "c", "site.yml"],
+            ["cache", "stats", "--cache-dir", "c"],
+        ):
+            assert parser.parse_args(argv).cache_dir == "c"
@@ -0,0 +1,288 @@
+"""
+Unit tests for incremental change detection.
+
+Tests git-based change sets, the mtime/size manifest and the --since and
+--incremental options of the convert and validate commands.
+"""
+
+import subprocess
+
+import pytest
+
+from fqcn_converter.cli.batch import BatchCommand
+from fqcn_converter.cli.convert import ConvertCommand
+from fqcn_converter.cli.main import create_parser
+from fqcn_converter.cli.validate import ValidateCommand
+from fqcn_converter.core.changes import (
+    FileManifest,
+    filter_changed,
+    git_changed_files,
+    select_changed_files,
+    settings_fingerprint,
+)
+from fqcn_converter.exceptions import FQCNConverterError
+
+
+def _git(repo, *args):
+    """Run a git command in a repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path, write_project, minimal_task_file_content):
+    """Create a git repository with two committed task files."""
+    write_project(
+        {
+            "tasks/main.yml": minimal_task_file_content,
+            "tasks/other.yml": minimal_task_file_content,
+        }
+    )
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+class TestGitChangedFiles:
+    """Test cases for git_changed_files."""
+
+    def test_modified_and_untracked(self, repo, minimal_task_file_content):
+        """Test that modified and untracked YAML files are reported."""
+        (repo / "tasks" / "main.yml").write_text(minimal_task_file_content + "\n")
+        (repo / "tasks" / "new.yaml").write_text(minimal_task_file_content)
+        (repo / "notes.txt").write_text("not yaml")
+
+        changed = git_changed_files("HEAD", cwd=repo)
+
+        assert changed == sorted(
+            [
+                (repo / "tasks" / "main.yml").resolve(),
+                (repo / "tasks" / "new.yaml").resolve(),
+            ]
+        )
+
+    def test_staged_only(self, repo, minimal_task_file_content):
+        """Test that staged mode ignores unstaged changes."""
+        (repo / "tasks" / "main.yml").write_text(minimal_task_file_content + "\n")
+        (repo / "tasks" / "other.yml").write_text(minimal_task_file_content + "\n")
+        _git(repo, "add", "tasks/other.yml")
+
+        changed = git_changed_files(cwd=repo, staged=True)
+
+        assert changed == [(repo / "tasks" / "other.yml").resolve()]
+
+    def test_unknown_ref(self, repo):
+        """Test that an unknown ref raises a converter error."""
+        with pytest.raises(FQCNConverterError):
+            git_changed_files("no-such-ref", cwd=repo)
+
+    def test_non_ascii_paths(self, repo, minimal_task_file_content):
+        """Test that paths git would quote are still reported."""
+        role = repo / "r\u00f6le" / "tasks"
+        role.mkdir(parents=True)
+        (role / "main.yml").write_text(minimal_task_file_content)
+
+        changed = git_changed_files("HEAD", cwd=repo)
+
+        assert changed == [(role / "main.yml").resolve()]
+
+    def test_option_like_ref_rejected(self, repo, tmp_path_factory):
+        """Test that a ref starting with a dash is not passed on as an option."""
+        output = tmp_path_factory.mktemp("out") / "diff.txt"
+
+        with pytest.raises(FQCNConverterError):
+            git_changed_files(f"--output={output}", cwd=repo)
+
+        assert not output.exists()
+
+    def test_select_uses_files_repository(
+        self, repo, tmp_path_factory, monkeypatch, minimal_task_file_content
+    ):
+        """Test that the change set comes from the repository of the files."""
+        edited = repo / "tasks" / "main.yml"
+        edited.write_text(minimal_task_file_content + "\n")
+        monkeypatch.chdir(tmp_path_factory.mktemp("elsewhere"))
+        files = [edited, repo / "tasks" / "other.yml"]
+
+        assert select_changed_files(files, since="HEAD") == [edited]
+
+    def test_filter_changed(self, repo):
+        """Test filtering relative paths against absolute changes."""
+        files = [repo / "tasks" / "main.yml", repo / "tasks" / "other.yml"]
+
+        kept = filter_changed(files, [(repo / "tasks" / "other.yml").resolve()])
+
+        assert kept == [repo / "tasks" / "other.yml"]
+
+
+class TestFileManifest:
+    """Test cases for FileManifest."""
+
+    def test_record_and_detect_changes(
+        self, tmp_path, write_project, minimal_task_file_content
+    ):
+        """Test that recorded files are skipped until they change."""
+        (target,) = write_project({"main.yml": minimal_task_file_content})
+        manifest_path = tmp_path / "manifest.json"
+
+        manifest = FileManifest(manifest_path)
+        assert manifest.changed([target]) == [target]
+        manifest.record(target)
+        manifest.save()
+
+        reloaded = FileManifest(manifest_path)
+        assert reloaded.changed([target]) == []
+
+        target.write_text(minimal_task_file_content + "# edited\n")
+        assert reloaded.changed([target]) == [target]
+
+    def test_scopes_are_independent(
+        self, tmp_path, write_project, minimal_task_file_content
+    ):
+        """Test that converting a file does not mark it validated."""
+        (target,) = write_project({"main.yml": minimal_task_file_content})
+        manifest_path = tmp_path / "manifest.json"
+
+        converted = FileManifest(manifest_path, scope="convert")
+        converted.record(target)
+        converted.save()
+
+        assert FileManifest(manifest_path, scope="validate").changed([target]) == [
+            target
+        ]
+        assert len(FileManifest(manifest_path, scope="convert")) == 1
+
+    def test_fingerprint_change_discards_entries(
+        self, tmp_path, write_project, minimal_task_file_content
+    ):
+        """Test that entries recorded with other settings are not trusted."""
+        (target,) = write_project({"main.yml": minimal_task_file_content})
+        manifest_path = tmp_path / "manifest.json"
+
+        manifest = FileManifest(manifest_path, fingerprint="a")
+        manifest.record(target)
+        manifest.save()
+
+        assert len(FileManifest(manifest_path, fingerprint="b")) == 0
+
+    def test_corrupt_manifest_starts_empty(self, tmp_path):
+        """Test that an unreadable manifest is ignored."""
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text("{broken")
+
+        assert len(FileManifest(manifest_path)) == 0
+
+    def test_settings_fingerprint_covers_config(self, tmp_path):
+        """Test that mapping file content changes the fingerprint."""
+        config = tmp_path / "mappings.yml"
+        config.write_text("a: b\n")
+        first = settings_fingerprint(config)
+        config.write_text("a: c\n")
+
+        assert settings_fingerprint(config) != first
+        assert settings_fingerprint() != first
+
+    def test_select_changed_files_without_sources(self, tmp_path):
+        """Test that all files are selected without --since or a manifest."""
+        files = [tmp_path / "a.yml", tmp_path / "b.yml"]
+
+        assert select_changed_files(files) == files
+
+
+class TestIncrementalCommands:
+    """Test cases for --since and --incremental on the CLI."""
+
+    def test_convert_incremental_skips_unchanged(
+        self, tmp_path, write_project, minimal_task_file_content
+    ):
+        """Test that a second incremental run converts nothing."""
+        write_project({"tasks/main.yml": minimal_task_file_content})
+        manifest = tmp_path / "manifest.json"
+        argv = ["convert", "--incremental", str(manifest), str(tmp_path / "tasks")]
+
+        first = ConvertCommand(create_parser().parse_args(argv))
+        assert first.run() == 0
+        assert first.stats["files_converted"] == 1
+
+        second = ConvertCommand(create_parser().parse_args(argv))
+        assert second.run() == 0
+        assert second.stats["files_processed"] == 0
+
+    def test_convert_dry_run_does_not_record(
+        self, tmp_path, write_project, minimal_task_file_content
+    ):
+        """Test that dry runs leave the manifest untouched."""
+        (target,) = write_project({"main.yml": minimal_task_file_content})
+        manifest = tmp_path / "manifest.json"
+
+        args = create_parser().parse_args(
+            ["convert", "--dry-run", "--incremental", str(manifest), str(target)]
+        )
+        assert ConvertCommand(args).run() == 0
+
+        assert not manifest.exists()
+
+    def test_validate_records_only_passing_files(
+        self, tmp_path, write_project, minimal_playbook_content
+    ):
+        """Test that failing files are validated again next time."""
+        good, bad = write_project(
+            {
+                "tasks/good.yml": minimal_playbook_content.replace(
+                    "copy:", "ansible.builtin.copy:"
+                ),
+                "tasks/bad.yml": minimal_playbook_content,
+            }
+        )
+        manifest = tmp_path / "manifest.json"
+        argv = ["validate", "--incremental", str(manifest), str(good), str(bad)]
+
+        ValidateCommand(create_parser().parse_args(argv)).run()
+        second = ValidateCommand(create_parser().parse_args(argv))
+        second.run()
+
+        assert [r.file_path for r in second.results] == [str(bad)]
+
+    def test_validate_since(self, repo, monkeypatch, minimal_task_file_content):
+        """Test that --since limits validation to changed files."""
+        edited = repo / "tasks" / "main.yml"
+        edited.write_text(minimal_task_file_content + "\n")
+        monkeypatch.chdir(repo)
+
+        args = create_parser().parse_args(
+            ["validate", "--since", "HEAD", str(repo / "tasks")]
+        )
+        command = ValidateCommand(args)
+        command.run()
+
+        assert [r.file_path for r in command.results] == [str(edited)]
+
+    def test_batch_incremental(
+        self, tmp_path, write_project, minimal_task_file_content
+    ):
+        """Test that batch records files of successful projects."""
+        write_project({"project/tasks/main.yml": minimal_task_file_content})
+        project = tmp_path / "project"
+        manifest = tmp_path / "manifest.json"
+        argv = [
+            "batch",
+            "--projects",
+            str(project),
+            "--workers",
+            "1",
+            "--incremental",
+            str(manifest),
+        ]
+
+        first = BatchCommand(create_parser().parse_args(argv))
+        assert first.run() == 0
+        assert first.stats["total_files_converted"] == 1
+
+        second = BatchCommand(create_parser().parse_args(argv))
+        assert second.run() == 0
+        assert second.stats["total_files_processed"] == 0
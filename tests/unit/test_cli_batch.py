@@ -61,6 +61,20 @@ class TestBatchParser:
         assert args.dry_run is True
         assert args.config == "custom_config.yml"
         assert args.workers == 4
+        assert args.executor == "thread"
+
+    def test_batch_parser_executor(self):
+        """Test batch parser with the process executor."""
+        import argparse
+
+        parser = argparse.ArgumentParser()
+        add_batch_arguments(parser)
+
+        args = parser.parse_args(["/path/to/projects", "--executor", "process"])
+        assert args.executor == "process"
+
+        with pytest.raises(SystemExit):
+            parser.parse_args(["/path/to/projects", "--executor", "fiber"])
 
     def test_batch_parser_help(self):
         """Test that batch parser shows help."""
@@ -477,6 +491,103 @@ class TestBatchCLIExecution:
         command._print_summary()
 
 
+class TestBatchCLIProcessExecutor:
+    """Test batch CLI execution with worker processes."""
+
+    PLAYBOOK = (
+        "- hosts: all\n"
+        "  tasks:\n"
+        "    - copy:\n"
+        "        src: a\n"
+        "        dest: b\n"
+    )
+
+    def test_process_projects_in_pool(self, tmp_path):
+        """Test that process mode converts files and rolls up projects."""
+        import argparse
+
+        from fqcn_converter.cli.batch import BatchCommand
+
+        for name in ["alpha", "beta"]:
+            project = tmp_path / name
+            (project / "roles").mkdir(parents=True)
+            (project / "site.yml").write_text(self.PLAYBOOK)
+
+        parser = argparse.ArgumentParser()
+        add_batch_arguments(parser)
+        args = parser.parse_args(
+            [str(tmp_path), "--executor", "process", "--workers", "2", "--validate"]
+        )
+
+        command = BatchCommand(args)
+        command._initialize_components()
+        success = command._process_projects(
+            [tmp_path / "alpha", tmp_path / "beta"]
+        )
+
+        assert success is True
+        assert [r.project_path for r in command.results] == [
+            str(tmp_path / "alpha"),
+            str(tmp_path / "beta"),
+        ]
+        assert command.stats["total_modules_converted"] == 2
+        assert all(r.validation_result.valid for r in command.results)
+        assert "ansible.builtin.copy" in (tmp_path / "alpha" / "site.yml").read_text()
+
+    def test_nested_projects_in_pool(self, tmp_path):
+        """Test that a project containing another project is still reported."""
+        import argparse
+
+        from fqcn_converter.cli.batch import BatchCommand
+
+        parent = tmp_path / "p"
+        child = parent / "sub"
+        child.mkdir(parents=True)
+        (parent / "site.yml").write_text(self.PLAYBOOK)
+        (child / "site.yml").write_text(self.PLAYBOOK)
+
+        parser = argparse.ArgumentParser()
+        add_batch_arguments(parser)
+        args = parser.parse_args(
+            [str(tmp_path), "--executor", "process", "--workers", "2", "--dry-run"]
+        )
+
+        command = BatchCommand(args)
+        command._initialize_components()
+        success = command._process_projects([parent, child])
+
+        by_path = {r.project_path: r for r in command.results}
+        assert success is True
+        assert sorted(by_path) == [str(parent), str(child)]
+        assert by_path[str(parent)].modules_converted == 2
+        assert by_path[str(child)].modules_converted == 1
+
+    def test_single_project_on_threads(self, tmp_path):
+        """Test that thread mode converts the files of one project together."""
+        import argparse
+
+        from fqcn_converter.cli.batch import BatchCommand
+
+        project = tmp_path / "big"
+        (project / "playbooks").mkdir(parents=True)
+        for i in range(12):
+            (project / "playbooks" / f"play{i}.yml").write_text(self.PLAYBOOK)
+
+        parser = argparse.ArgumentParser()
+        add_batch_arguments(parser)
+        args = parser.parse_args([str(tmp_path), "--workers", "4", "--validate"])
+
+        command = BatchCommand(args)
+        command._initialize_components()
+        success = command._process_projects([project])
+
+        assert success is True
+        assert len(command.results) == 1
+        assert command.results[0].files_processed == 12
+        assert command.results[0].modules_converted == 12
+        assert command.results[0].validation_result.valid
+
+
 class TestBatchCLIErrorHandling:
     """Test batch CLI error handling scenarios."""
 
@@ -734,25 +845,16 @@ class TestBatchCLIErrorHandling:
         assert result is False
         assert len(command.results) == 1  # Only first project processed
 
-    @patch('fqcn_converter.cli.batch.ThreadPoolExecutor')
-    def test_process_projects_parallel_exception(self, mock_executor_class):
+    @patch('fqcn_converter.cli.batch.BatchCommand._find_ansible_files_in_project')
+    def test_process_projects_parallel_exception(self, mock_find_files):
         """Test parallel project processing with exception."""
         from fqcn_converter.cli.batch import BatchCommand
         
         projects = [Path("/project1")]
+        mock_find_files.side_effect = Exception("Processing error")
         
-        # Mock executor and future with exception
-        mock_executor = MagicMock()
-        mock_executor_class.return_value.__enter__.return_value = mock_executor
-        
-        mock_future = MagicMock()
-        mock_future.result.side_effect = Exception("Processing error")
-        mock_executor.submit.return_value = mock_future
-        
-        # Mock as_completed
-        with patch('fqcn_converter.cli.batch.as_completed', return_value=[mock_future]):
-            command = BatchCommand(self.mock_args)
-            result = command._process_projects_parallel(projects)
+        command = BatchCommand(self.mock_args)
+        result = command._process_projects_parallel(projects)
         
         assert result is False
 
@@ -25,6 +25,7 @@ from fqcn_converter.cli.batch import (
 )
 from fqcn_converter.core.converter import ConversionResult
 from fqcn_converter.core.validator import ValidationResult
+from fqcn_converter.core.workers import FileRecord
 from fqcn_converter.exceptions import ConfigurationError, FQCNConverterError
 
 
@@ -303,33 +304,22 @@ class TestBatchCLIExecution:
         assert result is False  # Overall failure due to one failed project
         assert len(command.results) == 2  # Both projects processed
 
-    @patch('fqcn_converter.cli.batch.ThreadPoolExecutor')
-    def test_process_projects_parallel_success(self, mock_executor_class):
+    @patch('fqcn_converter.cli.batch.iter_thread_records')
+    @patch.object(BatchCommand, '_find_ansible_files_in_project')
+    def test_process_projects_parallel_success(self, mock_find_files, mock_records):
         """Test parallel project processing with success."""
         projects = [Path("/project1"), Path("/project2")]
-        
-        # Mock successful results
-        mock_result1 = ProjectResult(project_path="/project1", success=True)
-        mock_result2 = ProjectResult(project_path="/project2", success=True)
-        
-        # Mock executor and futures
-        mock_executor = MagicMock()
-        mock_executor_class.return_value.__enter__.return_value = mock_executor
-        
-        mock_future1 = MagicMock()
-        mock_future2 = MagicMock()
-        mock_future1.result.return_value = mock_result1
-        mock_future2.result.return_value = mock_result2
-        
-        mock_executor.submit.side_effect = [mock_future1, mock_future2]
-        
-        # Mock as_completed
-        with patch('fqcn_converter.cli.batch.as_completed', return_value=[mock_future1, mock_future2]):
-            command = BatchCommand(self.mock_args)
-            result = command._process_projects_parallel(projects)
-        
+        mock_find_files.side_effect = lambda project: [project / "site.yml"]
+        mock_records.side_effect = lambda converter, files, **kwargs: iter(
+            FileRecord(path, True, 1, (), (), None, 0.1) for path in files
+        )
+
+        command = BatchCommand(self.mock_args)
+        result = command._process_projects_parallel(projects)
+
         assert result is True
-        assert len(command.results) == 2
+        assert [r.project_path for r in command.results] == ["/project1", "/project2"]
+        assert all(r.modules_converted == 1 for r in command.results)
 
     @patch.object(BatchCommand, '_find_ansible_files_in_project')
     @patch('fqcn_converter.cli.batch.FQCNConverter')
@@ -621,7 +611,7 @@ class TestBatchCLIExecution:
         assert result == 1
 
     def test_process_projects_parallel_condition(self):
-        """Test process projects chooses parallel when workers > 1 and projects > 1."""
+        """Test process projects chooses parallel when workers > 1."""
         self.mock_args.workers = 4
         projects = [Path("/project1"), Path("/project2")]
         
@@ -644,16 +634,16 @@ class TestBatchCLIExecution:
             mock_sequential.assert_called_once_with(projects)
             assert result is True
 
-    def test_process_projects_sequential_condition_single_project(self):
-        """Test process projects chooses sequential when only one project."""
+    def test_process_projects_parallel_condition_single_project(self):
+        """Test process projects splits the files of a single project over workers."""
         self.mock_args.workers = 4
         projects = [Path("/project1")]
         
         command = BatchCommand(self.mock_args)
         
-        with patch.object(command, '_process_projects_sequential', return_value=True) as mock_sequential:
+        with patch.object(command, '_process_projects_parallel', return_value=True) as mock_parallel:
             result = command._process_projects(projects)
-            mock_sequential.assert_called_once_with(projects)
+            mock_parallel.assert_called_once_with(projects)
             assert result is True
 
     @patch('sys.stderr')
@@ -688,57 +678,57 @@ class TestBatchCLIExecution:
         assert len(command.results) == 1  # Only first project processed
         assert mock_process_single.call_count == 1
 
-    @patch('fqcn_converter.cli.batch.ThreadPoolExecutor')
-    @patch('fqcn_converter.cli.batch.as_completed')
+    @patch('fqcn_converter.cli.batch.iter_thread_records')
+    @patch.object(BatchCommand, '_find_ansible_files_in_project')
     @patch('sys.stderr')
-    def test_process_projects_parallel_with_stderr_output(self, mock_stderr, mock_as_completed, mock_executor_class):
+    def test_process_projects_parallel_with_stderr_output(self, mock_stderr, mock_find_files, mock_records):
         """Test parallel processing with stderr output."""
         projects = [Path("/project1")]
-        
-        # Mock executor and future
-        mock_executor = MagicMock()
-        mock_executor_class.return_value.__enter__.return_value = mock_executor
-        
-        mock_future = MagicMock()
-        mock_result = ProjectResult(project_path="/project1", success=True)
-        mock_future.result.return_value = mock_result
-        mock_executor.submit.return_value = mock_future
-        
-        # Mock as_completed to return our future
-        mock_as_completed.return_value = [mock_future]
-        
+        mock_find_files.return_value = [Path("/project1/site.yml")]
+        mock_records.side_effect = lambda converter, files, **kwargs: iter(
+            FileRecord(path, True, 0, (), (), None, 0.1) for path in files
+        )
+
         command = BatchCommand(self.mock_args)
         result = command._process_projects_parallel(projects)
-        
+
         assert result is True
-        # Verify stderr was written to
-        assert mock_stderr.write.called or hasattr(mock_stderr, 'write')
+        assert mock_stderr.write.called
 
-    @patch('fqcn_converter.cli.batch.ThreadPoolExecutor')
-    @patch('fqcn_converter.cli.batch.as_completed')
-    def test_process_projects_parallel_exception_handling(self, mock_as_completed, mock_executor_class):
+    @patch.object(BatchCommand, '_find_ansible_files_in_project')
+    def test_process_projects_parallel_exception_handling(self, mock_find_files):
         """Test parallel processing handles exceptions properly."""
         projects = [Path("/project1")]
-        
-        # Mock executor and future
-        mock_executor = MagicMock()
-        mock_executor_class.return_value.__enter__.return_value = mock_executor
-        
-        mock_future = MagicMock()
-        mock_future.result.side_effect = RuntimeError("Processing error")
-        mock_executor.submit.return_value = mock_future
-        
-        # Mock as_completed to return our future
-        mock_as_completed.return_value = [mock_future]
-        
-        # Create a mapping for future_to_project
-        future_to_project = {mock_future: projects[0]}
-        mock_executor.submit.return_value = mock_future
-        
+        mock_find_files.side_effect = RuntimeError("Processing error")
+
         command = BatchCommand(self.mock_args)
         result = command._process_projects_parallel(projects)
-        
+
         assert result is False
+        assert command.results[0].errors == ["Unexpected error: Processing error"]
+
+    @patch('fqcn_converter.cli.batch.iter_thread_records')
+    @patch.object(BatchCommand, '_find_ansible_files_in_project')
+    def test_process_projects_parallel_file_level(self, mock_find_files, mock_records, tmp_path):
+        """Test that parallel mode queues files of all projects largest-first."""
+        small = tmp_path / "small" / "site.yml"
+        large = tmp_path / "large" / "site.yml"
+        for path, size in [(small, 10), (large, 1000)]:
+            path.parent.mkdir()
+            path.write_text("#" * size)
+        mock_find_files.side_effect = lambda project: [project / "site.yml"]
+        mock_records.side_effect = lambda converter, files, **kwargs: iter(
+            FileRecord(path, True, 1, (), (), None, 0.1) for path in files
+        )
+        self.mock_args.workers = 4
+
+        command = BatchCommand(self.mock_args)
+        result = command._process_projects_parallel([small.parent, large.parent])
+
+        assert result is True
+        mock_records.assert_called_once()
+        assert mock_records.call_args.args[1] == [str(large), str(small)]
+        assert mock_records.call_args.kwargs["max_workers"] == 4
 
     @patch.object(BatchCommand, '_find_ansible_files_in_project')
     def test_process_single_project_no_ansible_files_warning(self, mock_find_files):
@@ -384,19 +384,12 @@ class TestConvertCommandFileDiscovery:
         args = Namespace()
         command = ConvertCommand(args)
 
-        # Mock different files for different patterns to avoid duplicates
-        def mock_glob(pattern):
-            if pattern == "**/*.yml":
-                return [Path("test.yml")]
-            elif pattern == "**/*.yaml":
-                return [Path("playbook.yaml")]
-            return []
-
-        with patch("pathlib.Path.glob", side_effect=mock_glob):
-            with patch("pathlib.Path.is_file", return_value=True):
-                with patch.object(command, "_should_process_file", return_value=True):
-                    with patch.object(command, "_is_ansible_file", return_value=True):
-                        files = command._find_ansible_files(Path("."), [])
+        # Discovery walks the tree once and yields both extensions
+        walked = [Path("test.yml"), Path("playbook.yaml")]
+
+        with patch("fqcn_converter.cli.convert.iter_files", return_value=iter(walked)):
+            with patch.object(command, "_is_ansible_file", return_value=True):
+                files = command._find_ansible_files(Path("."), [])
 
         assert len(files) == 2
 
@@ -514,25 +507,36 @@ class TestConvertCommandConversion:
         assert success is True
 
     @patch("fqcn_converter.cli.convert.FQCNConverter")
-    def test_convert_files_with_backup(self, mock_converter_class):
-        """Test file conversion with backup creation."""
-        mock_converter = MagicMock()
-        mock_converter_class.return_value = mock_converter
-
-        mock_result = ConversionResult(
-            file_path="test.yml", success=True, changes_made=1, errors=[], warnings=[]
+    def test_initialize_converter_with_backup(self, mock_converter_class, tmp_path):
+        """Test that --backup hands the converter a run of the backup store."""
+        args = Namespace(
+            config=None,
+            backup=True,
+            no_backup=False,
+            dry_run=False,
+            backup_dir=str(tmp_path / "backups"),
         )
-        mock_converter.convert_file.return_value = mock_result
-
-        args = Namespace(progress=False, backup=True, dry_run=False, no_backup=False)
         command = ConvertCommand(args)
-        command.converter = mock_converter
 
-        with patch.object(command, "_create_backup") as mock_backup:
-            success = command._convert_files([Path("test.yml")])
+        command._initialize_converter()
 
-        assert success is True
-        mock_backup.assert_called_once_with(Path("test.yml"))
+        backups = mock_converter_class.call_args.kwargs["backups"]
+        assert backups is command.backup_run
+        assert backups.store.root == tmp_path / "backups"
+
+    @patch("fqcn_converter.cli.convert.FQCNConverter")
+    def test_initialize_converter_no_backup_overrides(self, mock_converter_class):
+        """Test that --no-backup and dry runs do not start a backup run."""
+        for no_backup, dry_run in ((True, False), (False, True)):
+            args = Namespace(
+                config=None, backup=True, no_backup=no_backup, dry_run=dry_run
+            )
+            command = ConvertCommand(args)
+
+            command._initialize_converter()
+
+            assert command.backup_run is None
+            assert "backups" not in mock_converter_class.call_args.kwargs
 
     @patch("fqcn_converter.cli.convert.FQCNConverter")
     def test_convert_files_no_changes(self, mock_converter_class):
@@ -617,26 +621,6 @@ class TestConvertCommandConversion:
         assert success is False
         assert command.stats["files_failed"] == 1
 
-    def test_create_backup_success(self):
-        """Test successful backup creation."""
-        args = Namespace()
-        command = ConvertCommand(args)
-
-        with patch("shutil.copy2") as mock_copy:
-            command._create_backup(Path("test.yml"))
-
-            mock_copy.assert_called_once_with(
-                Path("test.yml"), Path("test.yml.fqcn_backup")
-            )
-
-    def test_create_backup_failure(self):
-        """Test backup creation failure."""
-        args = Namespace()
-        command = ConvertCommand(args)
-
-        with patch("shutil.copy2", side_effect=Exception("Permission denied")):
-            command._create_backup(Path("test.yml"))  # Should not raise exception
-
 
 class TestConvertCommandReporting:
     """Test reporting methods."""
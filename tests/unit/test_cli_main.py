@@ -46,6 +46,22 @@ class TestSetupLogging:
             args, kwargs = mock_config.call_args
             assert kwargs["level"] == logging.DEBUG
 
+    def test_setup_logging_verbose_is_async(self):
+        """Test that verbose logging writes records on a background thread."""
+        from fqcn_converter.utils import logging as logging_utils
+
+        root = logging.getLogger()
+        with patch.object(root, "handlers", []), patch.object(root, "level"):
+            setup_logging("verbose")
+            try:
+                assert isinstance(root.handlers[0], logging_utils.QueueingHandler)
+                assert logging_utils._queue_listener is not None
+            finally:
+                logging_utils._stop_async_logging()
+
+            assert isinstance(root.handlers[0], logging.StreamHandler)
+            assert root.handlers[0].stream is sys.stdout
+
     def test_setup_logging_invalid_level(self):
         """Test logging setup with invalid verbosity level."""
         with patch("logging.basicConfig") as mock_config:
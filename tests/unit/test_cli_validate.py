@@ -350,19 +350,12 @@ class TestValidateCommandFileDiscovery:
         args = Namespace()
         command = ValidateCommand(args)
 
-        # Mock different files for different patterns to avoid duplicates
-        def mock_glob(pattern):
-            if pattern == "**/*.yml":
-                return [Path("test.yml")]
-            elif pattern == "**/*.yaml":
-                return [Path("playbook.yaml")]
-            return []
-
-        with patch("pathlib.Path.glob", side_effect=mock_glob):
-            with patch("pathlib.Path.is_file", return_value=True):
-                with patch.object(command, "_should_process_file", return_value=True):
-                    with patch.object(command, "_is_ansible_file", return_value=True):
-                        files = command._find_ansible_files(Path("."), [])
+        # Discovery walks the tree once and yields both extensions
+        walked = [Path("test.yml"), Path("playbook.yaml")]
+
+        with patch("fqcn_converter.cli.validate.iter_files", return_value=iter(walked)):
+            with patch.object(command, "_is_ansible_file", return_value=True):
+                files = command._find_ansible_files(Path("."), [])
 
         assert len(files) == 2
 
@@ -0,0 +1,213 @@
+"""
+Unit tests for per-phase conversion metrics.
+
+Tests the timings and counters recorded on conversion results, their
+aggregation by batch results and reports, and the console throughput lines.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from fqcn_converter.core.batch import BatchProcessor
+from fqcn_converter.core.cache import ResultCache
+from fqcn_converter.core.converter import (
+    METRIC_PHASES,
+    ConversionMetrics,
+    FQCNConverter,
+)
+from fqcn_converter.core.document import ParsedDocument
+from fqcn_converter.core.rewriter import StreamRewriter
+from fqcn_converter.core.workers import convert_file_record
+from fqcn_converter.reporting.formatters import ConsoleReportFormatter
+from fqcn_converter.reporting.report_generator import ReportGenerator
+
+PLAYBOOK = """- hosts: all
+  tasks:
+    - name: Copy file
+      copy:
+        src: a
+        dest: b
+    - block:
+        - shell: ls
+        - debug:
+            msg: hi
+"""
+
+
+@pytest.fixture
+def playbook(write_project):
+    """Write the playbook and return its path."""
+    (path,) = write_project({"site.yml": PLAYBOOK})
+    return path
+
+
+class TestConversionMetrics:
+    """Test cases for the ConversionMetrics dataclass."""
+
+    def test_add_sums_every_field(self):
+        """Test that adding metrics sums timings and counters."""
+        total = ConversionMetrics(files=1, parse_time=0.5, bytes_read=10, tasks=2)
+        total.add(ConversionMetrics(files=1, parse_time=0.25, bytes_read=5))
+
+        assert total.files == 2
+        assert total.parse_time == 0.75
+        assert total.bytes_read == 15
+        assert total.tasks == 2
+
+    def test_phase_times_in_pipeline_order(self):
+        """Test that phase times are keyed by the metric phases in order."""
+        metrics = ConversionMetrics(read_time=1.0, write_time=2.0)
+
+        assert tuple(metrics.phase_times) == METRIC_PHASES
+        assert metrics.phase_times["read"] == 1.0
+        assert metrics.phase_times["write"] == 2.0
+
+    def test_throughput(self):
+        """Test files and megabytes per second over a wall time."""
+        metrics = ConversionMetrics(files=4, bytes_read=2 * 1024 * 1024)
+
+        assert metrics.throughput(2.0) == (2.0, 1.0)
+        assert metrics.throughput(0.0) == (0.0, 0.0)
+
+
+class TestConverterMetrics:
+    """Test cases for metrics recorded by FQCNConverter."""
+
+    def test_convert_content_records_phases(self, converter):
+        """Test that the stream engine times parse, locate and rewrite."""
+        result = converter.convert_content(PLAYBOOK)
+
+        metrics = result.metrics
+        assert result.processing_time > 0
+        assert metrics.files == 1
+        assert metrics.bytes_read == len(PLAYBOOK)
+        assert metrics.tasks == 4
+        assert metrics.parse_time > 0
+        assert metrics.locate_time > 0
+        assert metrics.read_time == 0.0
+        assert metrics.write_time == 0.0
+
+    def test_line_engine_records_parse_and_rewrite(self):
+        """Test that the line engine times parsing and rewriting."""
+        result = FQCNConverter(engine="line").convert_content(PLAYBOOK)
+
+        assert result.metrics.parse_time > 0
+        assert result.metrics.rewrite_time > 0
+        assert result.metrics.locate_time == 0.0
+
+    def test_convert_file_records_read_and_write(self, converter, playbook):
+        """Test that convert_file times reading and writing the file."""
+        result = converter.convert_file(playbook)
+
+        metrics = result.metrics
+        assert result.changes_made == 3
+        assert metrics.read_time > 0
+        assert metrics.write_time > 0
+        assert metrics.bytes_written == playbook.stat().st_size
+        assert result.processing_time >= metrics.read_time + metrics.write_time
+
+    def test_dry_run_writes_nothing(self, converter, playbook):
+        """Test that a dry run records no write."""
+        result = converter.convert_file(playbook, dry_run=True)
+
+        assert result.metrics.bytes_written == 0
+        assert result.metrics.write_time == 0.0
+
+    def test_cache_hit_counts_bytes(self, tmp_path, playbook):
+        """Test that a cached result still reports the bytes read."""
+        converter = FQCNConverter(cache=ResultCache(tmp_path / "cache"))
+        converter.convert_file(playbook, dry_run=True)
+        result = converter.convert_file(playbook, dry_run=True)
+
+        assert result.metrics.files == 1
+        assert result.metrics.bytes_read == len(PLAYBOOK)
+        assert result.metrics.parse_time == 0.0
+
+    def test_compact_keeps_metrics(self, converter):
+        """Test that compact records keep the metrics."""
+        result = converter.convert_content(PLAYBOOK)
+
+        assert result.compact().metrics is result.metrics
+
+
+class TestMetricsSupport:
+    """Test cases for the pieces metrics are built from."""
+
+    def test_scan_counts_nested_tasks(self):
+        """Test that the rewriter counts tasks inside blocks."""
+        spans, tasks = StreamRewriter({"copy": "ansible.builtin.copy"}.get).scan(
+            PLAYBOOK
+        )
+
+        assert [span.module for span in spans] == ["copy"]
+        assert tasks == 4
+
+    def test_size_bytes_of_non_ascii_content(self):
+        """Test that non-ASCII content is sized as UTF-8."""
+        assert ParsedDocument("- name: é\n").size_bytes == 11
+        assert ParsedDocument("- name: e\n").size_bytes == 10
+
+
+class TestAggregation:
+    """Test cases for metrics summed by batches and reports."""
+
+    def test_file_record_carries_metrics(self, converter, playbook):
+        """Test that batch file records carry the conversion metrics."""
+        record = convert_file_record(converter, str(playbook), dry_run=True)
+
+        assert record.metrics.files == 1
+        assert record.metrics.tasks == 4
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_batch_result_sums_metrics(self, tmp_path, write_project, max_workers):
+        """Test that a batch result sums the metrics of every file."""
+        write_project(
+            {
+                f"{name}/{file}": PLAYBOOK
+                for name in ("one", "two")
+                for file in ("site.yml", "other.yml")
+            }
+        )
+
+        processor = BatchProcessor(max_workers=max_workers)
+        result = processor.process_projects_batch_result(
+            [str(tmp_path / "one"), str(tmp_path / "two")], dry_run=True
+        )
+
+        assert result.metrics.files == 4
+        assert result.metrics.tasks == 16
+        assert result.metrics.bytes_read == 4 * len(PLAYBOOK)
+        assert result.project_results[0].metrics.files == 2
+        assert result.files_per_second > 0
+        assert result.megabytes_per_second > 0
+
+    def test_report_aggregates_metrics(self, converter, playbook):
+        """Test that reports sum phase times, bytes and tasks per file."""
+        generator = ReportGenerator()
+        for _ in range(2):
+            result = converter.convert_file(playbook, dry_run=True)
+            generator.add_file_result(Path(playbook), result, result.processing_time)
+        report = generator.finalize_session()
+
+        stats = report.statistics
+        assert stats.total_bytes_processed == 2 * len(PLAYBOOK)
+        assert stats.total_tasks_scanned == 8
+        assert set(stats.phase_times) == set(METRIC_PHASES)
+        assert stats.phase_times["parse"] > 0
+        assert stats.peak_memory_usage is None or stats.peak_memory_usage > 0
+        assert stats.throughput > 0
+        assert report.file_records[0].phase_times["parse"] > 0
+
+    def test_console_report_shows_throughput(self, converter, playbook):
+        """Test that the console report shows files/sec and MB/sec."""
+        generator = ReportGenerator()
+        result = converter.convert_file(playbook, dry_run=True)
+        generator.add_file_result(Path(playbook), result, result.processing_time)
+        report = generator.finalize_session()
+
+        output = ConsoleReportFormatter(use_colors=False).format_report(report)
+
+        assert "files/sec" in output
+        assert "MB/sec" in output
+        assert "Phase Times: read" in output
@@ -13,6 +13,7 @@ import pytest
 import yaml
 
 from fqcn_converter.core.converter import ConversionResult, FQCNConverter
+from fqcn_converter.core.rewriter import SpanMismatchError
 from fqcn_converter.exceptions import (
     ConfigurationError,
     ConversionError,
@@ -508,8 +509,8 @@ class TestFQCNConverter:
 
     def test_convert_content_exception_handling(self, converter):
         """Test exception handling in content conversion."""
-        # Mock yaml.safe_load to raise an exception
-        with patch("yaml.safe_load", side_effect=Exception("Unexpected error")):
+        # Mock yaml.compose to raise an exception
+        with patch("yaml.compose", side_effect=Exception("Unexpected error")):
             content = "---\nsome: content"
             result = converter.convert_content(content)
 
@@ -906,6 +907,107 @@ handlers: []
         assert result.changes_made >= 1
         assert "ansible.builtin.copy:" in result.converted_content
 
+    def test_init_invalid_engine(self, sample_mappings):
+        """Test converter initialization with an unknown engine."""
+        with patch("fqcn_converter.core.converter.ConfigurationManager") as mock_config:
+            mock_config.return_value.load_default_mappings.return_value = (
+                sample_mappings
+            )
+
+            with pytest.raises(ConfigurationError) as exc_info:
+                FQCNConverter(engine="unknown")
+
+            assert "Unknown conversion engine" in str(exc_info.value)
+
+    def test_convert_content_line_engine(self, sample_mappings):
+        """Test that the line engine can be selected explicitly."""
+        with patch("fqcn_converter.core.converter.ConfigurationManager") as mock_config:
+            mock_config.return_value.load_default_mappings.return_value = (
+                sample_mappings
+            )
+            converter = FQCNConverter(engine="line")
+
+        content = """---
+- name: Copy file
+  copy:
+    src: test.txt
+    dest: /tmp/test.txt
+"""
+
+        with patch.object(
+            converter._rewriter, "scan", side_effect=AssertionError("unused")
+        ):
+            result = converter.convert_content(content)
+
+        assert result.success is True
+        assert result.changes_made == 1
+        assert "ansible.builtin.copy:" in result.converted_content
+
+    def test_convert_content_falls_back_to_line_engine(self, converter):
+        """Test fallback to the line engine when spans cannot be mapped."""
+        content = """---
+- name: Copy file
+  copy:
+    src: test.txt
+"""
+
+        with patch.object(
+            converter._rewriter,
+            "scan",
+            side_effect=SpanMismatchError("Key 'copy' not found"),
+        ):
+            result = converter.convert_content(content)
+
+        assert result.success is True
+        assert result.changes_made == 1
+        assert "ansible.builtin.copy:" in result.converted_content
+
+    def test_convert_content_preserves_formatting(self, converter):
+        """Test that only module keys are rewritten and everything else is kept."""
+        content = """---
+# Deploy application
+- hosts: all   # all hosts
+  vars:
+    copy: not-a-module
+  tasks:
+    - name: Copy file
+      copy:   {src: a.txt, dest: /tmp/a.txt}   # inline
+    - name: Repeat copy
+      copy:
+        src: b.txt
+        dest: /tmp/b.txt
+"""
+
+        result = converter.convert_content(content)
+
+        assert result.success is True
+        assert result.changes_made == 2
+        assert result.converted_content == content.replace(
+            "      copy:", "      ansible.builtin.copy:"
+        )
+        assert "    copy: not-a-module" in result.converted_content
+
+    def test_convert_content_quoted_module_key(self, converter):
+        """Test that quoted module keys keep their quotes."""
+        content = """---
+- name: Quoted key
+  "copy":
+    src: test.txt
+"""
+
+        result = converter.convert_content(content)
+
+        assert result.success is True
+        assert result.changes_made == 1
+        assert '"ansible.builtin.copy":' in result.converted_content
+
+    def test_convert_content_multiple_documents(self, converter):
+        """Test that multi-document streams are rejected like safe_load does."""
+        content = "---\n- copy: {}\n---\n- file: {}\n"
+
+        with pytest.raises(YAMLParsingError):
+            converter.convert_content(content)
+
 
 class TestConversionResult:
     """Test cases for ConversionResult dataclass."""
@@ -159,7 +159,7 @@ class TestValidatorCoverageImprovements:
         """Test exception handling in validate_content."""
         # Mock YAML parsing to raise exception - validate_content catches exceptions
         # and adds them as validation issues rather than raising ValidationError
-        with patch('yaml.safe_load', side_effect=Exception("Parse error")):
+        with patch('yaml.compose', side_effect=Exception("Parse error")):
             result = validator.validate_content("some content")
             
             # Should return a result with validation issues, not raise an exception
@@ -0,0 +1,285 @@
+"""
+Unit tests for single-walk file discovery.
+
+Tests gitignore-style exclude rules, directory pruning, depth limits,
+project marker detection from directory listings and the parallel walker.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from fqcn_converter.core.batch import BatchProcessor
+from fqcn_converter.core.discovery import (
+    IgnoreRules,
+    find_yaml_files,
+    has_project_marker,
+    iter_files,
+    parallel_walk,
+    walk,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Create a small tree with YAML files and skipped directories."""
+    for rel in [
+        "site.yml",
+        "roles/web/tasks/main.yml",
+        "roles/web/tasks/extra.yaml",
+        "roles/web/files/readme.txt",
+        "roles/archive/tasks/main.yml",
+        "node_modules/pkg/config.yml",
+        ".git/hooks/sample.yml",
+        "group_vars/all.yml",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("---\n")
+    return tmp_path
+
+
+def _rel(paths, root):
+    """Return paths relative to root as posix strings."""
+    return sorted(Path(path).relative_to(root).as_posix() for path in paths)
+
+
+class TestIgnoreRules:
+    """Test cases for IgnoreRules."""
+
+    @pytest.mark.parametrize(
+        "pattern,path,is_dir,expected",
+        [
+            ("archive/", "roles/archive", True, True),
+            ("archive/", "roles/archive/tasks/main.yml", False, True),
+            ("archive/", "archive.yml", False, False),
+            ("*.bak.yml", "roles/x/main.bak.yml", False, True),
+            ("roles/web", "roles/web", True, True),
+            ("roles/web", "other/roles/web", True, False),
+            ("**/tmp/**", "a/b/tmp/c.yml", False, True),
+            ("test", "/path/to/mytests/x.yml", False, False),
+            ("test", "/path/to/test/x.yml", False, True),
+            (".git", "infra.git-ops", True, False),
+            (".env", "app.environments/site.yml", False, False),
+            ("test?.yml", "test1.yml", False, True),
+            ("test?.yml", "test10.yml", False, False),
+            ("[ab].yml", "b.yml", False, True),
+        ],
+    )
+    def test_patterns(self, pattern, path, is_dir, expected):
+        """Test gitignore-style and legacy substring patterns."""
+        rules = IgnoreRules([pattern], skip_dirs=())
+
+        assert rules.is_excluded(path, is_dir=is_dir) is expected
+
+    def test_substring_words(self):
+        """Test the historical --exclude behaviour of plain words."""
+        rules = IgnoreRules(["test", "*.bak"], skip_dirs=(), substring_words=True)
+
+        assert rules.is_excluded("/path/to/mytests/x.yml")
+        assert not rules.is_excluded("x.bak.yml")
+
+    def test_negation_reincludes(self):
+        """Test that a later negated pattern re-includes a path."""
+        rules = IgnoreRules(["*.yml", "!keep.yml"], skip_dirs=())
+
+        assert rules.is_excluded("drop.yml")
+        assert not rules.is_excluded("keep.yml")
+
+    def test_skip_dirs(self):
+        """Test that any skipped component excludes a path."""
+        rules = IgnoreRules()
+
+        assert rules.is_excluded("a/node_modules/b.yml")
+        assert rules.is_excluded(".git", is_dir=True)
+        assert not rules.is_excluded("build.yml")
+
+    def test_compile_is_cached(self):
+        """Test that identical pattern sets share compiled rules."""
+        assert IgnoreRules.compile(("a/",)) is IgnoreRules.compile(("a/",))
+
+
+class TestWalk:
+    """Test cases for walk and iter_files."""
+
+    def test_iter_files_prunes_skip_dirs(self, tree):
+        """Test that skipped directories are never listed."""
+        listed = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            listed.append(Path(path))
+            return real_scandir(path)
+
+        with patch("os.scandir", side_effect=recording_scandir):
+            files = list(iter_files(tree))
+
+        assert _rel(files, tree) == [
+            "group_vars/all.yml",
+            "roles/archive/tasks/main.yml",
+            "roles/web/tasks/extra.yaml",
+            "roles/web/tasks/main.yml",
+            "site.yml",
+        ]
+        assert tree / "node_modules" not in listed
+        assert tree / ".git" not in listed
+        # Each directory is listed exactly once
+        assert len(listed) == len(set(listed))
+
+    def test_find_yaml_files_with_excludes(self, tree):
+        """Test exclude patterns relative to the walk root."""
+        files = find_yaml_files(tree, ["archive/", "group_vars"])
+
+        assert _rel(files, tree) == [
+            "roles/web/tasks/extra.yaml",
+            "roles/web/tasks/main.yml",
+            "site.yml",
+        ]
+
+    def test_iter_files_single_file(self, tree):
+        """Test that a file root yields itself."""
+        assert list(iter_files(tree / "site.yml")) == [tree / "site.yml"]
+
+    def test_walk_max_depth(self, tree):
+        """Test that directories below the depth limit are not visited."""
+        visited = [entry.path for entry in walk(tree, max_depth=1)]
+
+        assert tree / "roles" in visited
+        assert tree / "roles" / "web" not in visited
+        # Subdirectories at the limit are still listed
+        roles = next(
+            entry for entry in walk(tree, max_depth=1) if entry.path == tree / "roles"
+        )
+        assert roles.dirnames == ["archive", "web"]
+
+    def test_walk_skip_hidden(self, tree):
+        """Test that hidden directories can be skipped."""
+        rules = IgnoreRules(skip_dirs=())
+
+        visited = [entry.path for entry in walk(tree, rules, skip_hidden=True)]
+
+        assert tree / ".git" not in visited
+        assert tree / "node_modules" in visited
+
+    def test_walk_unreadable_root(self, tmp_path):
+        """Test that an unreadable directory is skipped."""
+        assert list(walk(tmp_path / "missing")) == []
+
+    def test_has_project_marker(self, tree):
+        """Test project detection from a single listing."""
+        listing = next(walk(tree, max_depth=0))
+
+        assert has_project_marker(listing, ["site.y*ml"])
+        assert has_project_marker(listing, ["roles/"])
+        assert not has_project_marker(listing, ["ansible.cfg", "inventory/"])
+
+    def test_has_project_marker_path_patterns(self, tree):
+        """Test that patterns with / or ** are matched below the directory."""
+        listing = next(walk(tree, max_depth=0))
+
+        assert has_project_marker(listing, ["**/tasks"])
+        assert has_project_marker(listing, ["roles/web/"])
+        assert not has_project_marker(listing, ["**/handlers"])
+        assert not has_project_marker(listing, ["site.yml/"])
+
+
+class TestParallelWalk:
+    """Test cases for parallel_walk."""
+
+    def test_same_entries_as_walk(self, tree):
+        """Test that parallel and sequential walks visit the same directories."""
+        sequential = {entry.path: entry for entry in walk(tree, max_depth=2)}
+        parallel = {
+            entry.path: entry
+            for entry in parallel_walk(tree, max_depth=2, max_workers=4)
+        }
+
+        assert parallel == sequential
+
+    def test_bounded_in_flight_listings(self, tree):
+        """Test that no more than max_pending listings run at once."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        real_scandir = os.scandir
+
+        def slow_scandir(path):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return real_scandir(path)
+
+        with patch("os.scandir", side_effect=slow_scandir):
+            visited = list(parallel_walk(tree, max_workers=8, max_pending=2))
+
+        assert len(visited) == len(list(walk(tree)))
+        assert state["peak"] <= 2
+
+    def test_single_worker_falls_back_to_walk(self, tree):
+        """Test that one worker yields the deterministic sequential order."""
+        assert list(parallel_walk(tree, max_workers=1)) == list(walk(tree))
+
+    def test_processor_discovery_matches(self, tmp_path):
+        """Test that recursive project discovery finds nested projects."""
+        for name in ["a", "b", "c"]:
+            project = tmp_path / "group" / name
+            project.mkdir(parents=True)
+            (project / "site.yml").write_text("- hosts: all\n")
+
+        processor = BatchProcessor(max_workers=4)
+
+        assert processor.discover_projects(str(tmp_path)) == sorted(
+            str(tmp_path / "group" / name) for name in ["a", "b", "c"]
+        )
+
+
+class TestDiscoverProjects:
+    """Test cases for BatchProcessor.discover_projects on the walker."""
+
+    def test_path_project_patterns(self, tmp_path):
+        """Test that ** project patterns find projects with nested markers."""
+        (tmp_path / "a" / "deploy" / "playbooks").mkdir(parents=True)
+        (tmp_path / "b" / "roles").mkdir(parents=True)
+        (tmp_path / "c" / "docs").mkdir(parents=True)
+
+        projects = BatchProcessor().discover_projects(
+            tmp_path, project_patterns=["**/playbooks", "**/roles"]
+        )
+
+        assert projects == [str(tmp_path / "a"), str(tmp_path / "b")]
+
+    def test_default_excludes_match_whole_names(self, tmp_path):
+        """Test that default excludes do not skip names merely containing them."""
+        for name in ("app.environments", "infra.git-ops", ".git"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "site.yml").write_text("- hosts: all\n")
+
+        projects = BatchProcessor().discover_projects(tmp_path)
+
+        assert projects == [
+            str(tmp_path / "app.environments"),
+            str(tmp_path / "infra.git-ops"),
+        ]
+
+    def test_project_files_keep_build_roles(self, tmp_path):
+        """Test that batch conversion keeps roles named like build output."""
+        for role in ("build", "dist", "web"):
+            (tmp_path / "roles" / role / "tasks").mkdir(parents=True)
+            (tmp_path / "roles" / role / "tasks" / "main.yml").write_text(
+                "- copy:\n    src: a\n    dest: b\n"
+            )
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "config.yml").write_text("- copy: {}\n")
+
+        results = BatchProcessor(max_workers=2).process_projects(
+            [str(tmp_path)], dry_run=True
+        )
+
+        assert results[0]["files_processed"] == 3
+        assert results[0]["modules_converted"] == 3
@@ -0,0 +1,221 @@
+"""
+Unit tests for the shared ParsedDocument.
+
+Tests lazy parsing, caching of the node graph and data, and that the
+converter and validator reuse one parse of the same document.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from fqcn_converter.core.converter import FQCNConverter
+from fqcn_converter.core.document import ParsedDocument, as_document
+from fqcn_converter.core.validator import ValidationEngine
+from fqcn_converter.exceptions import FileAccessError
+
+PLAYBOOK = """---
+- hosts: all
+  tasks:
+    - name: Copy file
+      copy:
+        src: a.txt
+        dest: /tmp/a.txt
+    - name: Debug
+      debug:
+        msg: hello
+"""
+
+
+class TestParsedDocument:
+    """Test cases for ParsedDocument."""
+
+    def test_data_matches_safe_load(self):
+        """Test that constructed data equals yaml.safe_load output."""
+        document = ParsedDocument(PLAYBOOK)
+
+        assert document.data == yaml.safe_load(PLAYBOOK)
+
+    def test_parses_only_once(self):
+        """Test that root and data share a single compose call."""
+        document = ParsedDocument(PLAYBOOK)
+
+        with patch("yaml.compose", wraps=yaml.compose) as mock_compose:
+            document.root
+            document.data
+            document.data
+
+        assert mock_compose.call_count == 1
+
+    def test_empty_document(self):
+        """Test that empty content has no root and no data."""
+        document = ParsedDocument("")
+
+        assert document.root is None
+        assert document.data is None
+
+    def test_yaml_error_is_cached(self):
+        """Test that a syntax error is raised again without re-parsing."""
+        document = ParsedDocument("key: [unclosed")
+
+        with pytest.raises(yaml.YAMLError):
+            document.data
+
+        with patch("yaml.compose") as mock_compose:
+            with pytest.raises(yaml.YAMLError):
+                document.root
+
+        mock_compose.assert_not_called()
+
+    def test_lines_and_line_of(self):
+        """Test line splitting and offset to line lookup."""
+        document = ParsedDocument("a: 1\nb: 2\nc: 3\n")
+
+        assert document.lines == ["a: 1", "b: 2", "c: 3", ""]
+        assert document.line_of(0) == 1
+        assert document.line_of(5) == 2
+        assert document.line_of(11) == 3
+
+    def test_size_bytes(self):
+        """Test that size is measured in encoded bytes."""
+        assert ParsedDocument("é").size_bytes == 2
+
+    def test_from_file(self, write_project):
+        """Test reading a document from disk."""
+        (path,) = write_project({"site.yml": PLAYBOOK})
+
+        document = ParsedDocument.from_file(path)
+
+        assert document.content == PLAYBOOK
+        assert document.file_path == str(path)
+
+    def test_from_file_missing(self, tmp_path):
+        """Test that unreadable files raise FileAccessError."""
+        with pytest.raises(FileAccessError):
+            ParsedDocument.from_file(tmp_path / "missing.yml")
+
+    def test_key_position(self):
+        """Test exact key positions of mappings taken from the data."""
+        document = ParsedDocument(PLAYBOOK)
+        copy_task, debug_task = document.data[0]["tasks"]
+
+        assert document.key_position(copy_task, "copy") == (5, 7)
+        assert document.key_position(debug_task, "debug") == (9, 7)
+        assert document.key_position(document.data[0], "hosts") == (2, 3)
+        assert document.key_position(copy_task, "missing") is None
+
+    def test_key_position_unknown_mapping(self):
+        """Test that mappings not constructed by the document are unknown."""
+        document = ParsedDocument(PLAYBOOK)
+
+        assert document.key_position(dict(document.data[0]), "hosts") is None
+        assert document.key_position({"copy": {}}, "copy") is None
+
+    def test_skeleton_keeps_keys_to_task_level(self):
+        """Test the keys-only outline of a playbook."""
+        document = ParsedDocument(PLAYBOOK + "- 42\n")
+
+        assert document.skeleton == [
+            {
+                "hosts": None,
+                "tasks": [
+                    {"name": None, "copy": None},
+                    {"name": None, "debug": None},
+                ],
+            },
+            None,
+        ]
+
+    def test_skeleton_does_not_construct_values(self):
+        """Test that values are neither constructed nor checked for tags."""
+        content = PLAYBOOK + "  vars:\n    secret: !vault |\n      $ANSIBLE_VAULT\n"
+        document = ParsedDocument(content)
+
+        with patch.object(
+            yaml.SafeLoader, "construct_mapping", side_effect=AssertionError
+        ):
+            skeleton = document.skeleton
+
+        assert skeleton[0]["vars"] is None
+        with pytest.raises(yaml.YAMLError):
+            document.data
+
+    def test_skeleton_resolves_merge_keys(self):
+        """Test that merged task keys appear like in the constructed data."""
+        content = """---
+- hosts: all
+  tasks:
+    - &base
+      name: Base
+      become: true
+    - <<: *base
+      name: Merged
+      copy:
+        src: a
+"""
+        document = ParsedDocument(content)
+        merged = document.skeleton[0]["tasks"][1]
+
+        assert list(merged) == list(document.data[0]["tasks"][1])
+        assert document.key_position(merged, "copy") == (9, 7)
+        assert document.key_position(merged, "become") == (6, 7)
+
+    def test_skeleton_of_task_file(self):
+        """Test that task files and empty documents are outlined too."""
+        assert ParsedDocument("handlers:\n  - service: {}\n").skeleton == {
+            "handlers": [{"service": None}]
+        }
+        assert ParsedDocument("").skeleton is None
+
+    def test_as_document(self):
+        """Test wrapping text and passing documents through."""
+        document = ParsedDocument(PLAYBOOK)
+
+        assert as_document(document) is document
+        assert as_document(PLAYBOOK).content == PLAYBOOK
+
+
+class TestSharedParse:
+    """Test that converter and validator share one parse."""
+
+    def test_convert_and_validate_share_document(self):
+        """Test converting and validating a document composes it once."""
+        converter = FQCNConverter()
+        validator = ValidationEngine()
+        document = ParsedDocument(PLAYBOOK)
+
+        with patch("yaml.compose", wraps=yaml.compose) as mock_compose:
+            conversion = converter.convert_content(document)
+            validation = validator.validate_content(document)
+
+        assert mock_compose.call_count == 1
+        assert conversion.changes_made == 2
+        assert validation.short_modules == 2
+        assert validation.score == 0.0
+
+    def test_convert_file_with_document(self, tmp_path):
+        """Test that convert_file uses the given document instead of reading."""
+        path = tmp_path / "site.yml"
+        path.write_text("stale: true\n")
+        converter = FQCNConverter()
+
+        result = converter.convert_file(
+            path, dry_run=True, document=ParsedDocument(PLAYBOOK, path)
+        )
+
+        assert result.changes_made == 2
+        assert result.original_content == PLAYBOOK
+
+    def test_validate_conversion_with_document(self, tmp_path):
+        """Test that validate_conversion uses the given document."""
+        path = tmp_path / "site.yml"
+        validator = ValidationEngine()
+        converted = FQCNConverter().convert_content(PLAYBOOK).converted_content
+
+        result = validator.validate_conversion(
+            path, document=ParsedDocument(converted, path)
+        )
+
+        assert result.valid is True
+        assert result.score == 1.0
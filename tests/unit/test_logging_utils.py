@@ -7,6 +7,8 @@ import json
 import logging
 import logging.config
 import os
+import queue
+import sys
 import tempfile
 import time
 from pathlib import Path
@@ -14,11 +16,15 @@ from unittest.mock import MagicMock, call, mock_open, patch
 
 import pytest
 
+import fqcn_converter.utils.logging as logging_utils
+from fqcn_converter.core.converter import FQCNConverter
 from fqcn_converter.utils.logging import (
     ColoredFormatter,
     ContextFilter,
+    DebugAggregator,
     JSONFormatter,
     PerformanceFilter,
+    QueueingHandler,
     _current_config,
     _logger_registry,
     configure_logger_for_module,
@@ -35,6 +41,43 @@ from fqcn_converter.utils.logging import (
 )
 
 
+class ListHandler(logging.Handler):
+    """Handler collecting the records it handles."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_record(msg="test message", args=(), exc_info=None):
+    """Create an INFO log record."""
+    return logging.LogRecord("test", logging.INFO, "", 0, msg, args, exc_info)
+
+
+@pytest.fixture
+def captured_logger():
+    """Return a function attaching a ListHandler to a logger at DEBUG."""
+    attached = []
+
+    def capture(name, level=logging.DEBUG):
+        logger = logging.getLogger(name)
+        handler = ListHandler()
+        attached.append((logger, handler, logger.level, logger.propagate))
+        logger.addHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = False
+        return logger, handler
+
+    yield capture
+    for logger, handler, level, propagate in attached:
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = propagate
+
+
 class TestPerformanceFilter:
     """Test PerformanceFilter class."""
 
@@ -84,6 +127,34 @@ class TestPerformanceFilter:
 
             assert memory_usage == 0.0
 
+    def test_memory_usage_sampled_per_interval(self):
+        """Test that records within the sample interval reuse the last sample."""
+        mock_process = MagicMock()
+        mock_process.memory_info.return_value.rss = 1024 * 1024 * 50
+
+        with patch("psutil.Process", return_value=mock_process) as mock_class:
+            filter_obj = PerformanceFilter(sample_interval=3600)
+            records = [make_record() for _ in range(3)]
+            for record in records:
+                filter_obj.filter(record)
+
+        assert [record.memory_usage for record in records] == [50.0] * 3
+        mock_class.assert_called_once()
+        mock_process.memory_info.assert_called_once()
+
+    def test_process_handle_created_once(self):
+        """Test that every sample reads the same process handle."""
+        mock_process = MagicMock()
+        mock_process.memory_info.return_value.rss = 1024 * 1024
+
+        with patch("psutil.Process", return_value=mock_process) as mock_class:
+            filter_obj = PerformanceFilter(sample_interval=0)
+            for _ in range(3):
+                filter_obj.filter(make_record())
+
+        mock_class.assert_called_once()
+        assert mock_process.memory_info.call_count == 3
+
 
 class TestContextFilter:
     """Test ContextFilter class."""
@@ -1343,3 +1414,176 @@ class TestThreadSafety:
         assert len(errors) == 0
         # Only one thread should actually configure logging
         assert sum(setup_calls) == 1
+
+
+class TestDebugAggregator:
+    """Test DebugAggregator for hot loops."""
+
+    def test_disabled_formats_nothing(self, captured_logger):
+        """Test that nothing is formatted or logged when DEBUG is off."""
+        logger, handler = captured_logger("test.aggregator.off", logging.INFO)
+        unformattable = MagicMock()
+        unformattable.__str__.side_effect = AssertionError("formatted")
+
+        debug = DebugAggregator(logger)
+        debug.add("Converted %s", unformattable)
+        debug.flush("Converted %d modules", 1)
+
+        assert debug.enabled is False
+        assert handler.records == []
+
+    def test_enabled_logs_one_record(self, captured_logger):
+        """Test that the collected messages are logged as one record."""
+        logger, handler = captured_logger("test.aggregator.on")
+
+        debug = DebugAggregator(logger)
+        debug.add("Converted %s on line %d", "copy", 3)
+        debug.add("Converted %s on line %d", "shell", 7)
+        debug.flush("Converted %d modules", 2)
+
+        assert len(handler.records) == 1
+        record = handler.records[0]
+        assert record.getMessage() == (
+            "Converted 2 modules\n  Converted copy on line 3\n"
+            "  Converted shell on line 7"
+        )
+        assert record.funcName == "test_enabled_logs_one_record"
+
+    def test_flush_without_messages(self, captured_logger):
+        """Test that flushing an empty aggregator logs nothing."""
+        logger, handler = captured_logger("test.aggregator.empty")
+
+        DebugAggregator(logger).flush("Converted %d modules", 0)
+
+        assert handler.records == []
+
+    def test_line_engine_logs_once_per_file(self, captured_logger):
+        """Test that the line engine logs its conversions in one record."""
+        content = (
+            "- hosts: all\n  tasks:\n    - name: Copy\n      copy:\n"
+            "        src: a\n    - name: List\n      shell: ls\n"
+        )
+        converter = FQCNConverter(engine="line")
+        _, handler = captured_logger("fqcn_converter.core.converter")
+
+        result = converter.convert_content(content)
+
+        conversions = [
+            record
+            for record in handler.records
+            if record.getMessage().startswith("Converted ")
+        ]
+        assert result.changes_made == 2
+        assert len(conversions) == 1
+        assert "copy -> ansible.builtin.copy on line 4" in conversions[0].getMessage()
+
+
+class TestAsyncLogging:
+    """Test queue-based asynchronous logging."""
+
+    def setup_method(self):
+        """Reset logging state before each test."""
+        reset_logging()
+
+    def teardown_method(self):
+        """Stop the listener and restore basic logging."""
+        reset_logging()
+
+    def test_handlers_run_on_listener(self, tmp_path):
+        """Test that loggers only queue records and the file gets them."""
+        log_file = tmp_path / "fqcn.log"
+        setup_logging(
+            level="DEBUG",
+            log_file=str(log_file),
+            enable_colors=False,
+            async_logging=True,
+        )
+
+        root_handlers = logging.getLogger().handlers
+        package_handlers = logging.getLogger("fqcn_converter").handlers
+        assert len(root_handlers) == 1
+        assert isinstance(root_handlers[0], QueueingHandler)
+        assert package_handlers == root_handlers
+
+        logging.getLogger("fqcn_converter.test").info("hello %s", "world")
+        reset_logging()
+
+        assert "hello world" in log_file.read_text()
+
+    def test_exception_kept_in_json(self, tmp_path):
+        """Test that queued records keep their exception info."""
+        log_file = tmp_path / "fqcn.json"
+        setup_logging(log_file=str(log_file), format_json=True, async_logging=True)
+
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            logging.getLogger("fqcn_converter.test").exception("Failed")
+        reset_logging()
+
+        entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+        failed = [entry for entry in entries if entry["message"] == "Failed"]
+        assert failed[0]["exception"]["type"] == "ValueError"
+
+    def test_arguments_merged_when_queued(self):
+        """Test that later changes to arguments do not reach the record."""
+        records = queue.SimpleQueue()
+        handler = QueueingHandler(records)
+        items = [1]
+        try:
+            raise KeyError("missing")
+        except KeyError:
+            record = make_record("items %s", (items,), sys.exc_info())
+
+        handler.handle(record)
+        items.append(2)
+
+        queued = records.get_nowait()
+        assert queued.getMessage() == "items [1]"
+        assert queued.exc_info[0] is KeyError
+
+    def test_reconfigure_stops_listener(self):
+        """Test that reconfiguring drains and stops the previous listener."""
+        setup_logging(async_logging=True)
+        listener = logging_utils._queue_listener
+        assert listener is not None
+
+        setup_logging(force_reconfigure=True)
+
+        assert logging_utils._queue_listener is None
+        assert listener._thread is None
+
+    def test_reset_restores_handlers(self):
+        """Test that reset gives loggers their handlers back instead of the queue."""
+        setup_logging(async_logging=True)
+        package = logging.getLogger("fqcn_converter")
+        handler = ListHandler()
+        package.addHandler(handler)
+        logging_utils.enable_async_logging(["fqcn_converter"])
+        assert package.handlers == [package.handlers[0]]
+        assert isinstance(package.handlers[0], QueueingHandler)
+
+        reset_logging()
+        package.info("after reset")
+
+        assert not any(isinstance(h, QueueingHandler) for h in package.handlers)
+        assert handler in package.handlers
+        assert [r.getMessage() for r in handler.records] == ["after reset"]
+        package.removeHandler(handler)
+
+    def test_enable_async_logging(self):
+        """Test moving the handlers of a configured logger onto the listener."""
+        logger = logging.getLogger("fqcn_converter.test_async")
+        handler = ListHandler()
+        logger.addHandler(handler)
+        try:
+            logging_utils.enable_async_logging(["fqcn_converter.test_async"])
+            assert isinstance(logger.handlers[0], QueueingHandler)
+
+            logger.warning("queued")
+            logging_utils._stop_async_logging()
+
+            assert logger.handlers == [handler]
+            assert [r.getMessage() for r in handler.records] == ["queued"]
+        finally:
+            logger.removeHandler(handler)
@@ -0,0 +1,120 @@
+"""
+Unit tests for the precompiled mapping bundle.
+
+Tests building and reading bundles, staleness detection and the bundle
+fast path of ConfigurationManager.load_default_mappings.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from fqcn_converter.config.bundle import (
+    BUNDLE_FORMAT,
+    bundle_path,
+    read_bundle,
+    write_bundle,
+)
+from fqcn_converter.config.manager import ConfigurationManager
+from fqcn_converter.exceptions import ConfigurationError, FileAccessError
+
+SOURCE = """---
+ansible_builtin:
+  copy: ansible.builtin.copy
+community_general:
+  ufw: community.general.ufw
+  copy: community.general.copy
+"""
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a manager whose default configuration is a temporary file."""
+    source = tmp_path / "fqcn_mapping.yml"
+    source.write_text(SOURCE)
+    with patch.object(
+        ConfigurationManager, "_find_default_config", return_value=source
+    ):
+        return ConfigurationManager()
+
+
+class TestBundle:
+    """Test cases for bundle reading and writing."""
+
+    def test_build_and_load(self, manager):
+        """Test that a built bundle is used instead of the YAML."""
+        from_yaml = manager.load_default_mappings()
+        bundle = manager.build_mapping_bundle()
+
+        with patch("fqcn_converter.config.manager.safe_load") as safe_load:
+            from_bundle = manager.load_default_mappings()
+
+        assert bundle == bundle_path(manager._default_config_path)
+        assert bundle.name == "fqcn_mapping.bundle.json"
+        assert from_bundle == from_yaml
+        assert list(from_bundle) == list(from_yaml)
+        assert from_bundle["copy"] == "ansible.builtin.copy"
+        safe_load.assert_not_called()
+
+    def test_stale_bundle_falls_back_to_yaml(self, manager):
+        """Test that editing the YAML invalidates the bundle."""
+        manager.build_mapping_bundle()
+        source = manager._default_config_path
+        source.write_text(SOURCE.replace("community.general.ufw", "my.own.ufw"))
+
+        assert read_bundle(source) is None
+        assert manager.load_default_mappings()["ufw"] == "my.own.ufw"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "not json",
+            json.dumps({"format": BUNDLE_FORMAT + 1, "mappings": {}}),
+            json.dumps([1, 2]),
+        ],
+    )
+    def test_unusable_bundle_ignored(self, manager, content):
+        """Test that corrupt or foreign bundles are ignored."""
+        source = manager._default_config_path
+        bundle_path(source).write_text(content)
+
+        assert read_bundle(source) is None
+        assert manager.load_default_mappings()["ufw"] == "community.general.ufw"
+
+    def test_write_bundle_custom_output(self, tmp_path):
+        """Test writing a bundle to an explicit location."""
+        source = tmp_path / "fqcn_mapping.yml"
+        source.write_text(SOURCE)
+        output = tmp_path / "out.json"
+
+        assert write_bundle(source, {"a": "x.y.a"}, output) == output
+        assert read_bundle(source, output) == {"a": "x.y.a"}
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_write_bundle_error(self, tmp_path):
+        """Test that an unwritable location raises FileAccessError."""
+        source = tmp_path / "fqcn_mapping.yml"
+        source.write_text(SOURCE)
+
+        with pytest.raises(FileAccessError):
+            write_bundle(source, {}, tmp_path / "missing" / "out.json")
+
+    def test_build_without_default_config(self):
+        """Test that building requires a default configuration."""
+        with patch.object(
+            ConfigurationManager, "_find_default_config", return_value=None
+        ):
+            manager = ConfigurationManager()
+
+        with pytest.raises(ConfigurationError):
+            manager.build_mapping_bundle()
+
+    def test_shipped_bundle_is_current(self):
+        """Test that the bundle in the repository matches its YAML."""
+        manager = ConfigurationManager()
+        source = manager._default_config_path
+        if source is None or not bundle_path(source).exists():
+            pytest.skip("Default mapping bundle not available")
+
+        assert read_bundle(source) is not None
@@ -0,0 +1,127 @@
+"""
+Unit tests for the shared mapping index.
+
+Tests MappingIndex lookups and immutability, and memoization of
+load_mapping_index across converters and validators.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from fqcn_converter.config.index import (
+    MappingIndex,
+    clear_mapping_index_cache,
+    load_mapping_index,
+)
+from fqcn_converter.config.manager import ConfigurationManager
+from fqcn_converter.core.converter import FQCNConverter
+from fqcn_converter.core.validator import ValidationEngine
+
+MAPPINGS = {
+    "copy": "ansible.builtin.copy",
+    "ansible.builtin.copy": "ansible.builtin.copy",
+    "ufw": "community.general.ufw",
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start and end every test with an empty index cache."""
+    clear_mapping_index_cache()
+    yield
+    clear_mapping_index_cache()
+
+
+class TestMappingIndex:
+    """Test cases for MappingIndex."""
+
+    def test_lookups(self):
+        """Test forward, reverse and per-collection lookups."""
+        index = MappingIndex(MAPPINGS)
+
+        assert index["copy"] == "ansible.builtin.copy"
+        assert index.get("missing") is None
+        assert "ufw" in index
+        assert len(index) == 3
+        assert index == MAPPINGS
+        assert index.fqcns == {"ansible.builtin.copy", "community.general.ufw"}
+        assert index.is_fqcn("community.general.ufw")
+        assert index.short_names("ansible.builtin.copy") == (
+            "ansible.builtin.copy",
+            "copy",
+        )
+        assert index.short_names("x.y.z") == ()
+        assert index.collections["community.general"] == ("ufw",)
+
+    def test_immutable(self):
+        """Test that the index cannot be changed through any view."""
+        source = dict(MAPPINGS)
+        index = MappingIndex(source)
+        source["new"] = "a.b.new"
+
+        assert "new" not in index
+        with pytest.raises(TypeError):
+            index["copy"] = "other"
+        with pytest.raises(TypeError):
+            index.collections["ansible.builtin"] = ()
+        with pytest.raises(AttributeError):
+            index.extra = True
+
+
+class TestLoadMappingIndex:
+    """Test cases for load_mapping_index."""
+
+    def test_memoized_per_process(self):
+        """Test that the defaults are parsed once for all components."""
+        with patch.object(
+            ConfigurationManager,
+            "load_default_mappings",
+            autospec=True,
+            return_value=MAPPINGS,
+        ) as load:
+            converter = FQCNConverter()
+            validator = ValidationEngine()
+            index = load_mapping_index()
+
+        assert load.call_count == 1
+        assert converter._mappings is index
+        assert validator._known_modules is index
+        assert validator._fqcn_modules is index.fqcns
+
+    def test_custom_mappings_are_keyed(self):
+        """Test that different custom mappings get different indexes."""
+        first = load_mapping_index(custom_mappings={"a": "x.y.a"})
+        again = load_mapping_index(custom_mappings={"a": "x.y.a"})
+        other = load_mapping_index(custom_mappings={"a": "x.y.b"})
+
+        assert first is again
+        assert other is not first
+        assert other["a"] == "x.y.b"
+
+    def test_config_change_rebuilds(self, tmp_path):
+        """Test that editing the config file invalidates its index."""
+        config = tmp_path / "mappings.yml"
+        config.write_text("ansible_builtin:\n  copy: my.own.copy\n")
+        first = load_mapping_index(config)
+
+        config.write_text("ansible_builtin:\n  copy: my.other.copy\n")
+        os.utime(config, ns=(0, 0))
+        second = load_mapping_index(config)
+
+        assert first["copy"] == "my.own.copy"
+        assert second["copy"] == "my.other.copy"
+        assert load_mapping_index(config) is second
+
+    def test_custom_manager_not_memoized(self):
+        """Test that subclassed managers always load."""
+
+        class Manager(ConfigurationManager):
+            def load_default_mappings(self):
+                return {"only": "a.b.only"}
+
+        index = load_mapping_index(manager=Manager())
+
+        assert dict(index) == {"only": "a.b.only"}
+        assert load_mapping_index() is not index
@@ -0,0 +1,98 @@
+"""
+Unit tests for the precompiled module key matcher.
+
+Tests ModuleMatcher hits, filtering by module name and replacement, and
+that the line engine uses one shared matcher without compiling patterns.
+"""
+
+import re
+from unittest.mock import patch
+
+import pytest
+
+from fqcn_converter.core.converter import FQCNConverter
+from fqcn_converter.core.matcher import ModuleHit, ModuleMatcher
+
+MAPPINGS = {"copy": "ansible.builtin.copy", "service": "ansible.builtin.service"}
+
+
+@pytest.fixture
+def matcher():
+    """Create a matcher over a small mapping table."""
+    return ModuleMatcher(MAPPINGS.get)
+
+
+class TestModuleMatcher:
+    """Test cases for ModuleMatcher."""
+
+    @pytest.mark.parametrize(
+        "line,module,list_item",
+        [
+            ("  copy:", "copy", False),
+            ("    - service: name=nginx", "service", True),
+            ("copy :", "copy", False),
+            ("-\tcopy:", "copy", True),
+        ],
+    )
+    def test_match(self, matcher, line, module, list_item):
+        """Test that mapped keys are found with their list marker."""
+        hit = matcher.match(line)
+
+        assert hit is not None
+        assert hit.module == module
+        assert hit.fqcn == MAPPINGS[module]
+        assert hit.list_item is list_item
+        assert line[hit.start : hit.end] == module
+
+    @pytest.mark.parametrize(
+        "line",
+        ["  name: copy", "  copyx:", "  # copy:", "  - - copy:", "  -copy:", ""],
+    )
+    def test_no_match(self, matcher, line):
+        """Test lines that do not start with a mapped key."""
+        assert matcher.match(line) is None
+
+    def test_match_specific_module(self, matcher):
+        """Test that a hit is only reported for the requested module."""
+        assert matcher.match("  copy:", "service") is None
+        assert matcher.match("  copy:", "copy").module == "copy"
+
+    def test_replace(self, matcher):
+        """Test that only the key text is replaced."""
+        line = "  - copy:   # keep comment"
+
+        assert matcher.replace(line, matcher.match(line)) == (
+            "  - ansible.builtin.copy:   # keep comment"
+        )
+
+    def test_hit_is_tuple(self):
+        """Test that hits are lightweight named tuples."""
+        assert ModuleHit("copy", "a.b.copy", 2, 6, False)[1] == "a.b.copy"
+
+
+class TestLineEngineMatcher:
+    """Test cases for the matcher in the line engine."""
+
+    def test_no_patterns_compiled_per_task(self):
+        """Test that converting content compiles no regular expressions."""
+        converter = FQCNConverter(engine="line")
+        content = "---\n" + "".join(
+            f"- name: Task {i}\n  copy:\n    src: a\n    dest: b\n" for i in range(20)
+        )
+
+        with patch.object(re, "compile", wraps=re.compile) as compile_spy:
+            result = converter.convert_content(content)
+
+        assert result.changes_made == 20
+        assert compile_spy.call_count == 0
+
+    def test_direct_module_tasks(self):
+        """Test conversion of tasks that start with the module key."""
+        converter = FQCNConverter(engine="line")
+        content = "---\n- copy:\n    src: a\n    dest: b\n- service: name=x\n"
+
+        result = converter.convert_content(content)
+
+        assert result.changes_made == 2
+        assert "- ansible.builtin.copy:" in result.converted_content
+        assert "- ansible.builtin.service: name=x" in result.converted_content
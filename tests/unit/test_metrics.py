@@ -0,0 +1,261 @@
+"""
+Unit tests for the Prometheus/OpenMetrics metrics exporter.
+
+Tests the registry's metric types and exposition formats, the textfile and
+HTTP exporters with a local scrape, and the batch metrics fed by
+BatchProcessor.
+"""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from fqcn_converter.core.batch import BatchProcessor
+from fqcn_converter.exceptions import ConfigurationError
+from fqcn_converter.utils.metrics import (
+    OPENMETRICS_CONTENT_TYPE,
+    TEXT_CONTENT_TYPE,
+    BatchMetrics,
+    MetricsRegistry,
+    MetricsServer,
+)
+
+
+def parse_samples(text):
+    """Return the samples of an exposition as a {name{labels}: value} dict."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def scrape(url, accept=None):
+    """Scrape an endpoint and return (content type, body)."""
+    request = urllib.request.Request(url, headers={"Accept": accept} if accept else {})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.headers["Content-Type"], response.read().decode("utf-8")
+
+
+@pytest.fixture
+def projects(tmp_path, write_project, minimal_playbook_content):
+    """Write two projects of three playbooks and return their paths."""
+    names = ("one", "two")
+    write_project(
+        {
+            f"{name}/play_{i}.yml": minimal_playbook_content
+            for name in names
+            for i in range(3)
+        }
+    )
+    return [str(tmp_path / name) for name in names]
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry and its metric types."""
+
+    def test_counter_only_increases(self):
+        """Test that counters add up and reject negative amounts."""
+        counter = MetricsRegistry().counter("files", "Files")
+        counter.inc()
+        counter.inc(2)
+
+        assert counter.value == 3
+        with pytest.raises(ValueError):
+            counter.inc(-1)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that histogram buckets count every value up to their bound."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=[0.1, 1])
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+
+        samples = parse_samples(registry.render())
+
+        assert samples['latency_seconds_bucket{le="0.1"}'] == 2
+        assert samples['latency_seconds_bucket{le="1.0"}'] == 3
+        assert samples['latency_seconds_bucket{le="+Inf"}'] == 4
+        assert samples["latency_seconds_count"] == 4
+        assert samples["latency_seconds_sum"] == pytest.approx(3.65)
+
+    def test_render_text_format(self):
+        """Test that the text format names counter families with _total."""
+        registry = MetricsRegistry()
+        registry.counter("files", "Files converted").inc(5)
+        registry.gauge("depth", "Queue depth").set(2.5)
+
+        text = registry.render()
+
+        assert "# HELP files_total Files converted\n" in text
+        assert "# TYPE files_total counter\n" in text
+        assert "files_total 5\n" in text
+        assert "# TYPE depth gauge\ndepth 2.5\n" in text
+        assert "# EOF" not in text
+
+    def test_render_openmetrics(self):
+        """Test that OpenMetrics names families without _total and ends in EOF."""
+        registry = MetricsRegistry()
+        registry.counter("files", "Files converted").inc()
+
+        text = registry.render(openmetrics=True)
+
+        assert "# TYPE files counter\nfiles_total 1\n" in text
+        assert text.endswith("# EOF\n")
+
+    def test_gauge_function_without_value_is_omitted(self):
+        """Test that a gauge whose function returns None has no sample."""
+        registry = MetricsRegistry()
+        registry.gauge("rss_bytes", "RSS", function=lambda: None)
+
+        assert "rss_bytes" not in parse_samples(registry.render())
+
+    def test_duplicate_names_rejected(self):
+        """Test that two metrics cannot share a name."""
+        registry = MetricsRegistry()
+        registry.counter("files", "Files")
+
+        with pytest.raises(ConfigurationError):
+            registry.gauge("files", "Files")
+
+    def test_write_textfile(self, tmp_path):
+        """Test that the textfile holds the text format."""
+        registry = MetricsRegistry()
+        registry.counter("files", "Files").inc(3)
+        path = tmp_path / "fqcn.prom"
+
+        registry.write_textfile(path)
+
+        assert parse_samples(path.read_text())["files_total"] == 3
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestMetricsServer:
+    """Test cases for the HTTP exporter."""
+
+    def test_scrape_text_format(self):
+        """Test scraping the Prometheus text format from a local port."""
+        registry = MetricsRegistry()
+        registry.counter("files", "Files").inc(7)
+
+        with MetricsServer(registry) as server:
+            content_type, body = scrape(server.url)
+
+        assert server.port > 0
+        assert content_type == TEXT_CONTENT_TYPE
+        assert parse_samples(body)["files_total"] == 7
+
+    def test_scrape_openmetrics(self):
+        """Test that OpenMetrics is served when the scraper asks for it."""
+        registry = MetricsRegistry()
+        registry.counter("files", "Files")
+
+        with MetricsServer(registry) as server:
+            content_type, body = scrape(
+                server.url, accept="application/openmetrics-text; version=1.0.0"
+            )
+
+        assert content_type == OPENMETRICS_CONTENT_TYPE
+        assert body.endswith("# EOF\n")
+
+    def test_unknown_path_not_found(self):
+        """Test that only the metrics endpoint is served."""
+        with MetricsServer(MetricsRegistry()) as server:
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                scrape(f"http://{server.host}:{server.port}/other")
+
+        assert exc_info.value.code == 404
+
+
+class TestBatchMetrics:
+    """Test cases for batch metrics fed by BatchProcessor."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_batch_updates_metrics(
+        self, projects, max_workers, minimal_playbook_content
+    ):
+        """Test that a batch run publishes file, module and project counts."""
+        metrics = BatchMetrics()
+        processor = BatchProcessor(max_workers=max_workers, metrics=metrics)
+
+        with MetricsServer(metrics.registry) as server:
+            processor.process_projects(projects, dry_run=True)
+            samples = parse_samples(scrape(server.url)[1])
+
+        assert samples["fqcn_files_processed_total"] == 6
+        assert samples["fqcn_modules_converted_total"] == 6
+        assert samples["fqcn_errors_total"] == 0
+        assert samples["fqcn_bytes_processed_total"] == 6 * len(
+            minimal_playbook_content
+        )
+        assert samples["fqcn_queue_depth"] == 0
+        assert samples["fqcn_projects_completed"] == 2
+        assert samples["fqcn_projects"] == 2
+        assert samples["fqcn_workers"] == max_workers
+        assert samples["fqcn_parse_seconds_count"] == 6
+        assert samples["fqcn_file_seconds_count"] == 6
+        assert 0 <= samples["fqcn_worker_utilization"] <= 1
+        assert samples.get("process_resident_memory_bytes", 1) > 0
+
+    def test_failed_files_counted_as_errors(self, tmp_path):
+        """Test that files failing to convert increase the error count."""
+        project = tmp_path / "broken"
+        project.mkdir()
+        (project / "site.yml").write_text("- hosts: all\n  tasks: [\n")
+        metrics = BatchMetrics()
+
+        BatchProcessor(max_workers=2, metrics=metrics).process_projects(
+            [str(project)], dry_run=True
+        )
+
+        assert metrics.errors.value == 1
+        assert metrics.files_processed.value == 1
+        assert metrics.modules_converted.value == 0
+
+    def test_textfile_written_at_finish(self, projects, tmp_path):
+        """Test that the textfile holds the final counts of the batch."""
+        path = tmp_path / "fqcn.prom"
+        metrics = BatchMetrics(textfile=path, textfile_interval=3600)
+
+        BatchProcessor(max_workers=2, metrics=metrics).process_projects(
+            projects, dry_run=True
+        )
+
+        samples = parse_samples(path.read_text())
+        assert samples["fqcn_files_processed_total"] == 6
+        assert samples["fqcn_projects_completed"] == 2
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_textfile_written_when_stream_closed_early(
+        self, projects, tmp_path, max_workers
+    ):
+        """Test that stopping an iter_results stream still finishes the metrics."""
+        path = tmp_path / "fqcn.prom"
+        metrics = BatchMetrics(textfile=path, textfile_interval=3600)
+        processor = BatchProcessor(max_workers=max_workers, metrics=metrics)
+
+        results = processor.iter_results(projects, dry_run=True)
+        next(results)
+        path.unlink(missing_ok=True)
+        results.close()
+
+        samples = parse_samples(path.read_text())
+        assert samples["fqcn_projects_completed"] >= 1
+        assert samples["fqcn_queue_depth"] == 0
+
+    def test_progress_throttles_textfile(self, tmp_path):
+        """Test that progress rewrites the textfile at most once per interval."""
+        path = tmp_path / "fqcn.prom"
+        metrics = BatchMetrics(textfile=path, textfile_interval=3600)
+
+        metrics(1, 2, "one")
+        path.unlink()
+        metrics(2, 2, "two")
+
+        assert not path.exists()
+
+    def test_utilization_without_start(self):
+        """Test that utilization is zero before a batch starts."""
+        assert BatchMetrics().utilization() == 0.0
@@ -0,0 +1,193 @@
+"""
+Unit tests for the profiling hooks.
+
+Tests the phase timeline, the cProfile and tracemalloc profilers and the
+global --profile option.
+"""
+
+import json
+import pstats
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from fqcn_converter.cli.main import PROFILERS as CLI_PROFILERS
+from fqcn_converter.cli.main import main, preprocess_args
+from fqcn_converter.core.converter import FQCNConverter
+from fqcn_converter.exceptions import ConfigurationError
+from fqcn_converter.utils import profiling
+from fqcn_converter.utils.profiling import PROFILERS, phase, profile
+
+
+class TestPhase:
+    """Test cases for phase markers and the timeline."""
+
+    def test_noop_when_not_recording(self):
+        """Test that phase returns the shared no-op context when disabled."""
+        assert phase("convert") is phase("parse")
+        with phase("convert"):
+            pass
+
+    def test_nested_phases(self, tmp_path):
+        """Test that nested phases count towards total but not self time."""
+        with profile("timeline", output=tmp_path / "t.json") as profiler:
+            with phase("convert"):
+                with phase("parse"):
+                    time.sleep(0.02)
+
+        stats = {s.name: s for s in profiler.timeline.summary()}
+        assert stats["convert"].total >= stats["parse"].total >= 0.02
+        assert stats["convert"].self_time < stats["parse"].total
+        assert phase("convert") is phase("parse")
+
+    def test_summary_in_pipeline_order(self, tmp_path):
+        """Test that phases are listed in pipeline order."""
+        with profile("timeline", output=tmp_path / "t.json") as profiler:
+            for name in ("report", "write", "discover"):
+                with phase(name):
+                    pass
+
+        assert [s.name for s in profiler.timeline.summary()] == [
+            "discover",
+            "write",
+            "report",
+        ]
+
+    def test_phases_from_threads(self, tmp_path):
+        """Test that phases recorded by worker threads are kept apart."""
+        with profile("timeline", output=tmp_path / "t.json") as profiler:
+
+            def work():
+                with phase("convert"):
+                    with phase("parse"):
+                        pass
+
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        stats = {s.name: s for s in profiler.timeline.summary()}
+        assert stats["convert"].count == stats["parse"].count == 4
+
+    def test_converter_phases(self, tmp_path, write_project, minimal_playbook_content):
+        """Test that converting a file records read, parse, convert and write."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        output = tmp_path / "timeline.json"
+
+        with profile("timeline", output=output):
+            FQCNConverter().convert_file(path)
+
+        trace = json.loads(output.read_text())
+        assert {"read", "parse", "convert", "write"} <= set(trace["phases"])
+        assert all(event["ph"] == "X" for event in trace["traceEvents"])
+
+
+class TestProfilers:
+    """Test cases for the cProfile and tracemalloc profilers."""
+
+    def test_unknown_profiler(self):
+        """Test that an unknown profiler raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="Unknown profiler"):
+            profile("perf")
+
+    def test_cprofile(self, tmp_path, minimal_playbook_content):
+        """Test that cprofile writes stats loadable by pstats."""
+        output = tmp_path / "run.pstats"
+
+        with profile("cprofile", output=output):
+            FQCNConverter().convert_content(minimal_playbook_content)
+
+        functions = {func[2] for func in pstats.Stats(str(output)).stats}
+        assert "convert_content" in functions
+
+    def test_tracemalloc(self, tmp_path):
+        """Test that tracemalloc lists the top allocation sites."""
+        output = tmp_path / "alloc.txt"
+
+        with profile("tracemalloc", output=output, top=5):
+            data = [bytearray(1024) for _ in range(100)]
+
+        report = output.read_text().splitlines()
+        assert report[0].startswith("Traced memory:")
+        assert len([line for line in report if line.startswith("#")]) <= 5
+        assert "test_profiling.py" in "\n".join(report)
+        assert data
+
+    def test_default_output(self, tmp_path, monkeypatch):
+        """Test that the output defaults to fqcn-profile with a suffix."""
+        monkeypatch.chdir(tmp_path)
+
+        with profile("timeline") as profiler:
+            pass
+
+        assert profiler.output.name == "fqcn-profile.json"
+        assert (tmp_path / "fqcn-profile.json").exists()
+
+
+class TestProfileOption:
+    """Test cases for the global --profile option."""
+
+    def test_cli_mirrors_profilers(self):
+        """Test that the CLI offers every profiler."""
+        assert CLI_PROFILERS == PROFILERS
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["convert", "--profile", "a.yml"], ["--profile=cprofile"]),
+            (["convert", "a.yml", "--profile", "timeline"], ["--profile=timeline"]),
+            (["--profile", "convert", "a.yml"], ["--profile=cprofile"]),
+            (
+                ["convert", "--profile-output", "out.json", "a.yml"],
+                ["--profile-output", "out.json"],
+            ),
+        ],
+    )
+    def test_preprocess_moves_profile_first(self, argv, expected):
+        """Test that --profile is a global flag allowed anywhere."""
+        processed, _ = preprocess_args(argv)
+
+        assert processed[: len(expected)] == expected
+        assert "a.yml" in processed
+
+    def test_profile_convert(
+        self, tmp_path, capsys, write_project, minimal_playbook_content
+    ):
+        """Test a profiled convert run writing its timeline."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+        output = tmp_path / "timeline.json"
+        argv = [
+            "fqcn-converter",
+            "convert",
+            str(path),
+            "--profile",
+            "timeline",
+            "--profile-output",
+            str(output),
+        ]
+
+        with patch.object(sys, "argv", argv):
+            assert main() == 0
+
+        phases = json.loads(output.read_text())["phases"]
+        assert {"discover", "read", "parse", "convert", "write", "report"} <= set(
+            phases
+        )
+        assert profiling._timeline is None
+
+    def test_no_profile_by_default(
+        self, tmp_path, monkeypatch, write_project, minimal_playbook_content
+    ):
+        """Test that commands run unprofiled without --profile."""
+        monkeypatch.chdir(tmp_path)
+        write_project({"site.yml": minimal_playbook_content})
+
+        with patch.object(sys, "argv", ["fqcn-converter", "convert", "site.yml"]):
+            assert main() == 0
+
+        assert not list(tmp_path.glob("fqcn-profile*"))
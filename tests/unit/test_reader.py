@@ -0,0 +1,304 @@
+"""
+Unit tests for size-aware file reading.
+
+Tests size parsing, the memory-mapped module key scan and the large file
+policies of the converter and the validator.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from fqcn_converter.core import reader
+from fqcn_converter.core.converter import FQCNConverter
+from fqcn_converter.core.reader import (
+    SizePolicy,
+    find_module_keys,
+    has_module_key,
+    parse_size,
+)
+from fqcn_converter.core.validator import ValidationEngine
+from fqcn_converter.exceptions import ConfigurationError
+
+VARS = """app_settings:
+  listen_port: 8080
+  workers: 4
+"""
+
+
+class TestParseSize:
+    """Test cases for parse_size."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("0", 0),
+            ("4096", 4096),
+            ("512K", 512 * 1024),
+            ("200m", 200 * 1024**2),
+            ("1GB", 1024**3),
+            ("2 MiB", 2 * 1024**2),
+        ],
+    )
+    def test_valid_sizes(self, text, expected):
+        """Test that sizes with and without suffixes are parsed."""
+        assert parse_size(text) == expected
+
+    @pytest.mark.parametrize("text", ["", "-1", "1.5M", "10T", "big"])
+    def test_invalid_sizes(self, text):
+        """Test that invalid sizes raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_size(text)
+
+
+class TestFindModuleKeys:
+    """Test cases for find_module_keys."""
+
+    def test_finds_task_keys(self, write_project, minimal_playbook_content):
+        """Test that module keys of tasks are found."""
+        (path,) = write_project({"play.yml": minimal_playbook_content})
+
+        found = find_module_keys(path, {b"copy", b"service"})
+
+        assert found == {"copy"}
+
+    def test_finds_list_item_and_flow_keys(self, tmp_path):
+        """Test that keys after list markers and opening braces are found."""
+        path = tmp_path / "tasks.yml"
+        path.write_text('- service: name=nginx\n- {"shell": "true"}\n')
+
+        found = find_module_keys(path, {b"service", b"shell", b"copy"})
+
+        assert found == {"service", "shell"}
+
+    def test_ignores_values(self, tmp_path):
+        """Test that module names appearing as values are not keys."""
+        path = tmp_path / "vars.yml"
+        path.write_text("strategy: copy\nitems: [service, shell]\n")
+
+        assert find_module_keys(path, {b"copy", b"service", b"shell"}) == set()
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file, which cannot be mapped, has no keys."""
+        path = tmp_path / "empty.yml"
+        path.write_bytes(b"")
+
+        assert find_module_keys(path, {b"copy"}) == set()
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file raises OSError."""
+        with pytest.raises(OSError):
+            find_module_keys(tmp_path / "missing.yml", {b"copy"})
+
+
+class TestHasModuleKey:
+    """Test cases for has_module_key."""
+
+    def test_stops_at_first_module_key(self, tmp_path, minimal_playbook_content):
+        """Test that the scan stops at the first module key."""
+        path = tmp_path / "play.yml"
+        path.write_text(minimal_playbook_content + VARS * 1000)
+        scanned = []
+        real_pattern = reader.MODULE_KEY_PATTERN
+
+        class RecordingPattern:
+            def finditer(self, content):
+                for match in real_pattern.finditer(content):
+                    scanned.append(match.group(1))
+                    yield match
+
+        with patch.object(reader, "MODULE_KEY_PATTERN", RecordingPattern()):
+            assert has_module_key(path, {b"copy"}) is True
+
+        assert scanned == [b"hosts", b"tasks", b"name", b"copy"]
+
+    def test_without_module_keys(self, tmp_path):
+        """Test that values and other keys are not module keys."""
+        path = tmp_path / "vars.yml"
+        path.write_text("strategy: copy\n" + VARS)
+
+        assert has_module_key(path, {b"copy"}) is False
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file has no module keys."""
+        path = tmp_path / "empty.yml"
+        path.write_bytes(b"")
+
+        assert has_module_key(path, {b"copy"}) is False
+
+
+class TestSizePolicy:
+    """Test cases for SizePolicy."""
+
+    def test_disabled_without_max_size(self, tmp_path):
+        """Test that no file is rejected without a maximum size."""
+        path = tmp_path / "vars.yml"
+        path.write_text(VARS)
+
+        assert SizePolicy(None).check(path) is None
+
+    def test_small_files_pass(self, tmp_path):
+        """Test that files up to the maximum size are processed."""
+        path = tmp_path / "vars.yml"
+        path.write_text(VARS)
+
+        assert SizePolicy(len(VARS)).check(path) is None
+
+    def test_skip_does_not_open_file(self, tmp_path):
+        """Test that skip decides from the file size alone."""
+        path = tmp_path / "vars.yml"
+        path.write_text(VARS)
+
+        with patch("builtins.open", side_effect=AssertionError("file opened")):
+            reason = SizePolicy(10).check(path)
+
+        assert reason is not None
+        assert "larger than the maximum file size of 10 bytes" in reason
+
+    def test_stream_processes_files_with_module_keys(
+        self, write_project, minimal_playbook_content
+    ):
+        """Test that stream keeps large files containing module keys."""
+        (path,) = write_project({"play.yml": minimal_playbook_content})
+
+        assert SizePolicy(10, "stream", ["copy"]).check(path) is None
+
+    def test_stream_skips_files_without_module_keys(self, tmp_path):
+        """Test that stream skips large files without module keys."""
+        path = tmp_path / "vars.yml"
+        path.write_text(VARS)
+
+        reason = SizePolicy(10, "stream", ["copy"]).check(path)
+
+        assert reason is not None
+        assert "without module keys" in reason
+
+    def test_stream_with_iterator_of_names(
+        self, write_project, minimal_playbook_content
+    ):
+        """Test that module names given as an iterator serve every check."""
+        (path,) = write_project({"play.yml": minimal_playbook_content})
+        policy = SizePolicy(10, "stream", iter(["service", "copy"]))
+
+        assert policy.check(path) is None
+        assert policy.check(path) is None
+
+    def test_process_keeps_large_files(self, tmp_path):
+        """Test that process never rejects a file."""
+        path = tmp_path / "vars.yml"
+        path.write_text(VARS)
+
+        assert SizePolicy(10, "process").check(path) is None
+
+    def test_missing_file_left_to_regular_read(self, tmp_path):
+        """Test that files that cannot be inspected are not rejected."""
+        assert SizePolicy(10).check(tmp_path / "missing.yml") is None
+
+    def test_invalid_policy(self):
+        """Test that an unknown policy raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="Unknown large file policy"):
+            SizePolicy(10, "truncate")
+
+    def test_negative_size(self):
+        """Test that a negative maximum size raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="Invalid maximum file size"):
+            SizePolicy(-1)
+
+
+class TestEnginePolicies:
+    """Test cases for the large file policies of the engines."""
+
+    def test_converter_skips_large_file(self, write_project, minimal_playbook_content):
+        """Test that the converter reports a skipped file without changes."""
+        (path,) = write_project({"play.yml": minimal_playbook_content})
+        converter = FQCNConverter(max_file_size=10)
+
+        result = converter.convert_file(path)
+
+        assert result.success
+        assert result.changes_made == 0
+        assert "larger than the maximum file size" in result.warnings[0]
+        assert path.read_text() == minimal_playbook_content
+
+    def test_converter_streams_file_with_module_keys(
+        self, write_project, minimal_playbook_content
+    ):
+        """Test that stream converts large files containing module keys."""
+        (path,) = write_project({"play.yml": minimal_playbook_content})
+        converter = FQCNConverter(max_file_size=10, large_files="stream")
+
+        result = converter.convert_file(path, dry_run=True)
+
+        assert result.success
+        assert result.changes_made == 1
+
+    def test_converter_streams_past_vars_file(self, tmp_path):
+        """Test that stream skips large vars files without parsing them."""
+        path = tmp_path / "vars.yml"
+        path.write_text(VARS)
+        converter = FQCNConverter(max_file_size=10, large_files="stream")
+
+        with patch("fqcn_converter.core.document.compose") as compose:
+            result = converter.convert_file(path)
+
+        compose.assert_not_called()
+        assert result.success
+        assert "without module keys" in result.warnings[0]
+
+    def test_validator_skips_large_file(self, write_project, minimal_playbook_content):
+        """Test that the validator reports a skipped file as an info issue."""
+        (path,) = write_project({"play.yml": minimal_playbook_content})
+        validator = ValidationEngine(max_file_size=10)
+
+        result = validator.validate_conversion(path)
+
+        assert result.valid
+        assert result.score == 1.0
+        assert len(result.issues) == 1
+        assert result.issues[0].severity == "info"
+        assert "larger than the maximum file size" in result.issues[0].message
+
+    def test_validator_processes_large_file(
+        self, write_project, minimal_playbook_content
+    ):
+        """Test that process validates large files normally."""
+        (path,) = write_project({"play.yml": minimal_playbook_content})
+        validator = ValidationEngine(max_file_size=10, large_files="process")
+
+        result = validator.validate_conversion(path)
+
+        assert not result.valid
+        assert any("copy" in issue.message for issue in result.issues)
+
+    def test_invalid_policy_rejected_by_engines(self):
+        """Test that the engines validate the policy on construction."""
+        with pytest.raises(ConfigurationError, match="Unknown large file policy"):
+            FQCNConverter(max_file_size=10, large_files="truncate")
+        with pytest.raises(ConfigurationError, match="Unknown large file policy"):
+            ValidationEngine(max_file_size=10, large_files="truncate")
+
+
+class TestCommandLine:
+    """Test cases for the large file options of the CLI."""
+
+    def test_options_parsed(self):
+        """Test that sizes are parsed and policies offered on both commands."""
+        from fqcn_converter.cli.main import create_parser
+
+        parser = create_parser()
+        for command in ("convert", "validate"):
+            args = parser.parse_args(
+                [command, "--max-file-size", "50M", "--large-files", "stream", "."]
+            )
+
+            assert args.max_file_size == 50 * 1024**2
+            assert args.large_files == "stream"
+
+    def test_invalid_size_rejected(self, capsys):
+        """Test that an invalid size is an argument error."""
+        from fqcn_converter.cli.main import create_parser
+
+        with pytest.raises(SystemExit):
+            create_parser().parse_args(["convert", "--max-file-size", "big", "."])
+
+        assert "Invalid size" in capsys.readouterr().err
@@ -0,0 +1,177 @@
+"""
+Unit tests for the single-pass stream rewriter.
+
+Tests span location, splicing and structural detection of task lists
+without going through the FQCNConverter configuration layer.
+"""
+
+import pytest
+import yaml
+
+from fqcn_converter.core.rewriter import (
+    KeySpan,
+    SpanMismatchError,
+    StreamRewriter,
+    splice,
+)
+
+
+@pytest.fixture
+def rewriter():
+    """Create a rewriter with a small mapping table."""
+    mappings = {
+        "copy": "ansible.builtin.copy",
+        "file": "ansible.builtin.file",
+        "debug": "ansible.builtin.debug",
+        "service": "ansible.builtin.service",
+    }
+    return StreamRewriter(mappings.get)
+
+
+class TestStreamRewriter:
+    """Test cases for StreamRewriter."""
+
+    def test_locate_playbook_spans(self, rewriter):
+        """Test that spans point at the module keys of a playbook."""
+        content = """---
+- hosts: all
+  tasks:
+    - name: Copy file
+      copy:
+        src: a.txt
+  handlers:
+    - name: Restart
+      service:
+        name: nginx
+"""
+
+        spans = rewriter.locate(content)
+
+        assert [span.module for span in spans] == ["copy", "service"]
+        assert [span.line for span in spans] == [5, 9]
+        assert all(content[s.start : s.end] == s.module for s in spans)
+
+    def test_locate_task_file(self, rewriter):
+        """Test that a top-level list of tasks is treated as a task file."""
+        content = "- copy: {src: a}\n- file: {path: /tmp}\n"
+
+        spans = rewriter.locate(content)
+
+        assert [(span.module, span.column) for span in spans] == [
+            ("copy", 3),
+            ("file", 3),
+        ]
+
+    def test_locate_dict_sections(self, rewriter):
+        """Test that task sections of a mapping are searched."""
+        content = """tasks:
+  - debug: {msg: hi}
+handlers:
+  - service: {name: nginx}
+vars:
+  copy: value
+"""
+
+        spans = rewriter.locate(content)
+
+        assert [span.module for span in spans] == ["debug", "service"]
+
+    def test_locate_nested_blocks(self, rewriter):
+        """Test that block, rescue and always lists are searched recursively."""
+        content = """- name: Outer
+  block:
+    - name: Inner
+      block:
+        - copy: {src: a}
+  rescue:
+    - debug: {msg: failed}
+  always:
+    - file: {path: /tmp}
+"""
+
+        spans = rewriter.locate(content)
+
+        assert [span.module for span in spans] == ["copy", "debug", "file"]
+
+    def test_locate_only_first_module_per_task(self, rewriter):
+        """Test that parameters sharing a module name are not rewritten."""
+        content = """- name: Copy
+  copy:
+    src: a
+  file: ignored
+"""
+
+        spans = rewriter.locate(content)
+
+        assert [span.module for span in spans] == ["copy"]
+
+    def test_locate_first_item_not_mapping(self, rewriter):
+        """Test that lists starting with a non-mapping item are ignored."""
+        assert rewriter.locate("- just a string\n- copy: {}\n") == []
+
+    def test_locate_empty_and_scalar_documents(self, rewriter):
+        """Test empty and scalar documents produce no spans."""
+        assert rewriter.locate("") == []
+        assert rewriter.locate("---\n") == []
+        assert rewriter.locate("just a string") == []
+
+    def test_locate_aliased_task_counted_once(self, rewriter):
+        """Test that an aliased task is only rewritten at its anchor."""
+        content = """- &task
+  copy: {src: a}
+- *task
+"""
+
+        spans = rewriter.locate(content)
+
+        assert len(spans) == 1
+
+    def test_locate_invalid_yaml(self, rewriter):
+        """Test that invalid YAML raises a YAMLError."""
+        with pytest.raises(yaml.YAMLError):
+            rewriter.locate("- copy: [unclosed\n")
+
+    def test_locate_escaped_key_mismatch(self, rewriter):
+        """Test that escaped keys that cannot be spliced are reported."""
+        content = '- "c\\x6fpy": {src: a}\n'
+
+        with pytest.raises(SpanMismatchError):
+            rewriter.locate(content)
+
+    def test_rewrite(self, rewriter):
+        """Test rewriting keeps everything but the module keys."""
+        content = "- copy: {src: a}  # keep\n- 'file': {path: /tmp}\n"
+
+        converted, changes = rewriter.rewrite(content)
+
+        assert changes == 2
+        assert converted == (
+            "- ansible.builtin.copy: {src: a}  # keep\n"
+            "- 'ansible.builtin.file': {path: /tmp}\n"
+        )
+
+    def test_rewrite_scales_linearly(self, rewriter):
+        """Test that the number of spans grows with the number of tasks."""
+        task = "- name: Task\n  copy:\n    src: a\n"
+
+        _, small = rewriter.rewrite(task * 100)
+        _, large = rewriter.rewrite(task * 1000)
+
+        assert (small, large) == (100, 1000)
+
+
+class TestSplice:
+    """Test cases for the splice helper."""
+
+    def test_splice_no_spans(self):
+        """Test that content is returned unchanged without spans."""
+        assert splice("copy:", []) == "copy:"
+
+    def test_splice_multiple_spans(self):
+        """Test that spans are replaced in order."""
+        spans = [
+            KeySpan(0, 4, "copy", "a.b.copy", 1, 1),
+            KeySpan(8, 12, "file", "a.b.file", 1, 9),
+        ]
+
+        assert splice("copy -> file!", spans) == "a.b.copy -> a.b.file!"
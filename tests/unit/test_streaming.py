@@ -0,0 +1,207 @@
+"""
+Unit tests for streaming result APIs.
+
+Tests FQCNConverter.iter_convert and BatchProcessor.iter_results, which
+yield results as they finish instead of collecting them in a list, and
+content retention on conversion results.
+"""
+
+import pytest
+
+from fqcn_converter.core.batch import BatchProcessor
+from fqcn_converter.core.converter import (
+    ConversionResult,
+    FQCNConverter,
+    ResultRecord,
+)
+from fqcn_converter.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def projects(tmp_path, write_project, minimal_task_file_content):
+    """Create three projects with one task file each."""
+    names = ["alpha", "beta", "gamma"]
+    write_project(
+        {f"{name}/tasks/main.yml": minimal_task_file_content for name in names}
+    )
+    return [str(tmp_path / name) for name in names]
+
+
+class TestIterConvert:
+    """Test cases for FQCNConverter.iter_convert."""
+
+    def test_yields_results_without_content(
+        self, converter, write_project, minimal_task_file_content
+    ):
+        """Test that results are yielded lazily with bodies dropped."""
+        paths = write_project(
+            {name: minimal_task_file_content for name in ["a.yml", "b.yml"]}
+        )
+
+        results = converter.iter_convert(iter(paths), dry_run=True)
+        first = next(results)
+
+        assert first.file_path == str(paths[0])
+        assert first.changes_made == 1
+        assert first.original_content is None
+        assert first.converted_content is None
+        assert [r.file_path for r in results] == [str(paths[1])]
+
+    def test_retain_full_content(
+        self, converter, write_project, minimal_task_file_content
+    ):
+        """Test that content is kept on request."""
+        (path,) = write_project({"a.yml": minimal_task_file_content})
+
+        (result,) = converter.iter_convert([path], dry_run=True, retain_content="full")
+
+        assert isinstance(result, ResultRecord)
+        assert result.original_content == minimal_task_file_content
+        assert "ansible.builtin.copy" in result.converted_content
+
+    def test_failure_does_not_stop_iteration(
+        self, converter, tmp_path, write_project, minimal_task_file_content
+    ):
+        """Test that an unreadable file yields a failed result."""
+        (good,) = write_project({"good.yml": minimal_task_file_content})
+
+        results = list(converter.iter_convert([tmp_path / "missing.yml", good]))
+
+        assert [r.success for r in results] == [False, True]
+        assert results[0].errors
+
+    def test_retain_diff(self, converter, write_project, minimal_task_file_content):
+        """Test that diff retention keeps a unified diff instead of bodies."""
+        (path,) = write_project({"a.yml": minimal_task_file_content})
+
+        (result,) = converter.iter_convert([path], dry_run=True, retain_content="diff")
+
+        assert result.original_content is None
+        assert "-  copy:" in result.diff
+        assert "+  ansible.builtin.copy:" in result.diff
+
+    def test_without_content(self):
+        """Test that without_content clears both bodies in place."""
+        result = ConversionResult(
+            success=True,
+            file_path="a.yml",
+            changes_made=0,
+            original_content="x",
+            converted_content="y",
+        )
+
+        assert result.without_content() is result
+        assert result.original_content is None
+        assert result.converted_content is None
+
+
+class TestRetainContent:
+    """Test cases for content retention and ResultRecord."""
+
+    def test_convert_file_drops_content_after_write(
+        self, write_project, minimal_task_file_content
+    ):
+        """Test that written results drop bodies by default."""
+        (path,) = write_project({"a.yml": minimal_task_file_content})
+
+        result = FQCNConverter(create_backups=False).convert_file(path)
+
+        assert result.changes_made == 1
+        assert result.original_content is None
+        assert result.converted_content is None
+        assert "ansible.builtin.copy" in path.read_text()
+
+    def test_convert_file_keeps_dry_run_content(
+        self, converter, write_project, minimal_task_file_content
+    ):
+        """Test that dry-run results keep their content for previews."""
+        (path,) = write_project({"a.yml": minimal_task_file_content})
+
+        result = converter.convert_file(path, dry_run=True)
+
+        assert result.original_content == minimal_task_file_content
+
+    @pytest.mark.parametrize("mode", ["diff", "full"])
+    def test_converter_retain_content(
+        self, write_project, minimal_task_file_content, mode
+    ):
+        """Test the converter-wide retention mode."""
+        (path,) = write_project({"a.yml": minimal_task_file_content})
+
+        result = FQCNConverter(retain_content=mode).convert_file(path)
+
+        assert (result.diff is not None) is (mode == "diff")
+        assert (result.converted_content is not None) is (mode == "full")
+
+    def test_unknown_mode(self):
+        """Test that an unknown retention mode is rejected."""
+        with pytest.raises(ConfigurationError):
+            FQCNConverter(retain_content="some")
+
+    def test_compact_record(self):
+        """Test that compact records are slotted and equal by value."""
+        result = ConversionResult(
+            success=False,
+            file_path="a.yml",
+            changes_made=0,
+            errors=["boom"],
+            original_content="x",
+        )
+
+        record = result.compact()
+
+        assert not hasattr(record, "__dict__")
+        assert record.errors == ("boom",)
+        assert record.original_content is None
+        assert record == ResultRecord(False, "a.yml", 0, errors=["boom"])
+
+
+class TestIterResults:
+    """Test cases for BatchProcessor.iter_results."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_yields_one_result_per_project(self, projects, max_workers):
+        """Test sequential and file-scheduled streaming."""
+        processor = BatchProcessor(max_workers=max_workers)
+
+        results = list(processor.iter_results(projects, dry_run=True))
+
+        assert sorted(r.file_path for r in results) == projects
+        assert all(r.success and r.changes_made == 1 for r in results)
+        assert all(not r.original_content for r in results)
+
+    def test_progress_reported_while_iterating(self, projects):
+        """Test that progress is reported before the next result is computed."""
+        calls = []
+        processor = BatchProcessor(
+            max_workers=1, progress_callback=lambda *args: calls.append(args)
+        )
+
+        results = processor.iter_results(projects, dry_run=True)
+        next(results)
+
+        assert calls == [(1, 3, projects[0])]
+
+    @pytest.mark.parametrize(
+        "max_workers, executor", [(1, "thread"), (2, "thread"), (2, "process")]
+    )
+    def test_stops_on_error(self, projects, tmp_path, max_workers, executor):
+        """Test that continue_on_error=False ends the stream at a failure."""
+        processor = BatchProcessor(max_workers=max_workers, executor=executor)
+        missing = str(tmp_path / "missing")
+        before = {path: path.read_text() for path in tmp_path.rglob("*.yml")}
+
+        results = list(
+            processor.iter_results([missing] + projects, continue_on_error=False)
+        )
+
+        assert [r.file_path for r in results] == [missing]
+        assert {path: path.read_text() for path in tmp_path.rglob("*.yml")} == before
+
+    def test_process_projects_consumes_stream(self, projects):
+        """Test that the list API returns the streamed results."""
+        processor = BatchProcessor(max_workers=1)
+
+        results = processor.process_projects(projects, dry_run=True)
+
+        assert [r["project_path"] for r in results] == projects
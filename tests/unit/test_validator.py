@@ -354,6 +354,27 @@ class TestValidationEngine:
         line_num = validator._find_line_number(lines, "unknown", 2)
         assert line_num == 11  # 2 * 5 + 1
 
+    def test_repeated_modules_reported_at_exact_positions(self, validator):
+        """Test that every occurrence of a module gets its own line and column."""
+        content = """---
+- hosts: all
+  tasks:
+    - name: First copy
+      copy:
+        src: a
+    - name: Second copy
+      copy:
+        src: b
+    -   shell: echo hi
+"""
+
+        with patch.object(validator, "_find_line_number") as find_line:
+            result = validator.validate_content(content)
+
+        positions = [(issue.line_number, issue.column) for issue in result.issues]
+        assert positions == [(5, 7), (8, 7), (10, 9)]
+        find_line.assert_not_called()
+
     def test_count_modules_method(self, validator):
         """Test the _count_modules method."""
         yaml_data = [
@@ -407,10 +428,10 @@ class TestValidationEngine:
 
     def test_validate_content_exception_handling(self, validator):
         """Test exception handling in content validation."""
-        # Mock yaml.safe_load to raise an exception during score calculation
+        # Mock yaml.compose to raise an exception during score calculation
         content = "---\nsome: content"
 
-        with patch("yaml.safe_load", side_effect=Exception("Unexpected error")):
+        with patch("yaml.compose", side_effect=Exception("Unexpected error")):
             result = validator.validate_content(content)
 
             # Should handle exception gracefully
@@ -519,8 +540,8 @@ class TestValidationEngineErrorHandling:
         dest: /tmp/test.txt
 """
 
-        # Mock yaml.safe_load to raise an exception in _validate_content
-        with patch("yaml.safe_load", side_effect=Exception("Unexpected parsing error")):
+        # Mock yaml.compose to raise an exception in _validate_content
+        with patch("yaml.compose", side_effect=Exception("Unexpected parsing error")):
             result = validator.validate_content(content)
 
             # Should handle exception gracefully and add error issue
@@ -752,8 +773,8 @@ post_tasks:
         content = "invalid: yaml: content: ["
         issues = []
 
-        # Mock yaml.safe_load to raise an exception
-        with patch("yaml.safe_load", side_effect=yaml.YAMLError("Invalid YAML")):
+        # Mock yaml.compose to raise an exception
+        with patch("yaml.compose", side_effect=yaml.YAMLError("Invalid YAML")):
             score = validator._calculate_completeness_score(content, issues)
 
             # Should return 0.0 when YAML parsing fails
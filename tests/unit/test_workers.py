@@ -0,0 +1,225 @@
+"""
+Unit tests for the process-pool batch workers.
+
+Tests chunking, in-process chunk conversion and record streaming from
+a real process pool.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from fqcn_converter.core import workers
+from fqcn_converter.core.converter import FQCNConverter
+from fqcn_converter.core.workers import (
+    FileRecord,
+    ProjectFiles,
+    chunk_files,
+    convert_chunk,
+    init_worker,
+    iter_file_records,
+    iter_thread_records,
+    largest_first,
+)
+
+
+@pytest.fixture
+def playbooks(write_project, minimal_playbook_content):
+    """Write a handful of playbooks and return their paths."""
+    files = {f"play_{i}.yml": minimal_playbook_content for i in range(5)}
+    return [str(path) for path in write_project(files)]
+
+
+class TestChunkFiles:
+    """Test cases for chunk_files."""
+
+    def test_chunk_size_derived_from_workers(self):
+        """Test that files are split into several chunks per worker."""
+        chunks = chunk_files([str(i) for i in range(80)], max_workers=2)
+
+        assert len(chunks) == 2 * workers.CHUNKS_PER_WORKER
+        assert sum(len(chunk) for chunk in chunks) == 80
+
+    def test_chunk_size_capped(self):
+        """Test that chunks never exceed the maximum size."""
+        chunks = chunk_files([str(i) for i in range(1000)], max_workers=1)
+
+        assert max(len(chunk) for chunk in chunks) == workers.MAX_CHUNK_SIZE
+
+    def test_explicit_chunk_size(self):
+        """Test that an explicit chunk size is honoured."""
+        assert chunk_files(["a", "b", "c"], max_workers=4, chunk_size=2) == [
+            ["a", "b"],
+            ["c"],
+        ]
+
+
+class TestConvertChunk:
+    """Test cases for convert_chunk."""
+
+    def test_convert_chunk_returns_records(self, playbooks):
+        """Test that a chunk yields one compact record per file."""
+        init_worker()
+
+        records = convert_chunk(playbooks[:2], dry_run=True)
+
+        assert [r.file_path for r in records] == playbooks[:2]
+        assert all(isinstance(r, FileRecord) for r in records)
+        assert all(r.success and r.changes_made == 1 for r in records)
+
+    def test_convert_chunk_records_exceptions(self, tmp_path):
+        """Test that conversion exceptions are captured in the record."""
+        init_worker()
+
+        records = convert_chunk([str(tmp_path / "missing.yml")])
+
+        assert records[0].success is False
+        assert "Cannot read file" in records[0].exception
+
+
+class TestLargestFirst:
+    """Test cases for largest_first."""
+
+    def test_orders_by_size_descending(self, tmp_path):
+        """Test that bigger files are scheduled first."""
+        sizes = {"small.yml": 10, "large.yml": 1000, "medium.yml": 100}
+        for name, size in sizes.items():
+            (tmp_path / name).write_text("x" * size)
+
+        ordered = largest_first([tmp_path / name for name in sizes])
+
+        assert [p.rsplit("/", 1)[-1] for p in ordered] == [
+            "large.yml",
+            "medium.yml",
+            "small.yml",
+        ]
+
+    def test_missing_files_last(self, tmp_path):
+        """Test that files which cannot be stat-ed sort last."""
+        existing = tmp_path / "a.yml"
+        existing.write_text("")
+
+        ordered = largest_first([tmp_path / "missing.yml", existing])
+
+        assert ordered == [str(existing), str(tmp_path / "missing.yml")]
+
+
+class TestProjectFiles:
+    """Test cases for scheduling the files of several projects."""
+
+    def record(self, file_path):
+        """Create a successful record for a file."""
+        return FileRecord(file_path, True, 1, (), (), None, 0.0)
+
+    def test_overlapping_projects_share_files(self):
+        """Test that a shared file is scheduled once and counted for both."""
+        work = ProjectFiles({"p": ["p/a.yml", "p/sub/b.yml"], "p/sub": ["p/sub/b.yml"]})
+
+        assert sorted(work.files) == ["p/a.yml", "p/sub/b.yml"]
+
+        done = list(work.collect([self.record("p/sub/b.yml"), self.record("p/a.yml")]))
+
+        assert [(project, len(records)) for project, records in done] == [
+            ("p/sub", 1),
+            ("p", 2),
+        ]
+
+    def test_projects_without_files_never_complete(self):
+        """Test that empty projects are left to the caller."""
+        work = ProjectFiles({"empty": [], "p": ["p/a.yml"]})
+
+        done = list(work.collect([self.record("p/a.yml")]))
+
+        assert [project for project, _ in done] == ["p"]
+
+
+class TestIterThreadRecords:
+    """Test cases for iter_thread_records."""
+
+    def test_iter_thread_records(self, playbooks):
+        """Test that threads convert every file with the shared converter."""
+        records = list(
+            iter_thread_records(FQCNConverter(), playbooks, dry_run=True, max_workers=3)
+        )
+
+        assert sorted(r.file_path for r in records) == sorted(playbooks)
+        assert all(r.changes_made == 1 for r in records)
+
+    def test_iter_thread_records_many_files(
+        self, write_project, minimal_playbook_content
+    ):
+        """Test that larger batches are converted on the thread pool."""
+        files = {
+            f"many_{i}.yml": minimal_playbook_content
+            for i in range(workers.INLINE_MAX_FILES + 3)
+        }
+        paths = [str(path) for path in write_project(files)]
+
+        records = list(
+            iter_thread_records(FQCNConverter(), paths, dry_run=True, max_workers=3)
+        )
+
+        assert sorted(r.file_path for r in records) == sorted(paths)
+        assert all(r.changes_made == 1 for r in records)
+
+    def test_iter_thread_records_close_early(self, playbooks):
+        """Test that closing the generator stops the pool."""
+        records = iter_thread_records(FQCNConverter(), playbooks, max_workers=1)
+
+        first = next(records)
+        records.close()
+
+        assert first.file_path in playbooks
+
+    def test_iter_thread_records_close_early_on_pool(
+        self, write_project, minimal_playbook_content
+    ):
+        """Test that closing early cancels queued files without cancel_futures."""
+        files = {
+            f"many_{i}.yml": minimal_playbook_content
+            for i in range(workers.INLINE_MAX_FILES + 20)
+        }
+        paths = [str(path) for path in write_project(files)]
+        converted = []
+        converter = FQCNConverter()
+        convert_file = converter.convert_file
+        real_shutdown = ThreadPoolExecutor.shutdown
+        closing = threading.Event()
+
+        def record_convert(file_path, **kwargs):
+            converted.append(file_path)
+            # Hold the worker so the queued files are still pending on close
+            if len(converted) > 1:
+                closing.wait(5)
+            return convert_file(file_path, **kwargs)
+
+        def shutdown(self, wait=True):
+            """Executor.shutdown as of Python 3.8, without cancel_futures."""
+            closing.set()
+            real_shutdown(self, wait=wait)
+
+        with patch.object(ThreadPoolExecutor, "shutdown", shutdown), patch.object(
+            converter, "convert_file", side_effect=record_convert
+        ):
+            records = iter_thread_records(converter, paths, dry_run=True, max_workers=1)
+            next(records)
+            records.close()
+
+        assert len(converted) < len(paths)
+
+
+class TestIterFileRecords:
+    """Test cases for iter_file_records."""
+
+    def test_iter_file_records_in_pool(self, playbooks):
+        """Test that every file is converted exactly once by the pool."""
+        records = list(iter_file_records(playbooks, max_workers=2, chunk_size=2))
+
+        assert sorted(r.file_path for r in records) == sorted(playbooks)
+        assert sum(r.changes_made for r in records) == 5
+
+    def test_iter_file_records_empty(self):
+        """Test that no pool is started for an empty file list."""
+        assert list(iter_file_records([])) == []
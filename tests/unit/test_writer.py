@@ -0,0 +1,351 @@
+"""
+Unit tests for crash-safe file writing.
+
+Tests atomic replacement, fsync policies and the write-behind queue.
+"""
+
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from fqcn_converter.core import writer as writer_module
+from fqcn_converter.core.converter import FQCNConverter
+from fqcn_converter.core.writer import FileWriter, atomic_write
+from fqcn_converter.exceptions import ConfigurationError
+
+
+class TestAtomicWrite:
+    """Test cases for atomic_write."""
+
+    def test_replaces_content(self, tmp_path):
+        """Test that the file holds the new content and no temp file is left."""
+        path = tmp_path / "play.yml"
+        path.write_text("old\n")
+
+        atomic_write(path, "new\n")
+
+        assert path.read_text() == "new\n"
+        assert os.listdir(tmp_path) == ["play.yml"]
+
+    def test_creates_new_inode(self, tmp_path):
+        """Test that the file is swapped in rather than rewritten in place."""
+        path = tmp_path / "play.yml"
+        path.write_text("old\n")
+        inode = path.stat().st_ino
+
+        atomic_write(path, b"new\n")
+
+        assert path.stat().st_ino != inode
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_keeps_permissions(self, tmp_path):
+        """Test that the replaced file keeps the original's mode."""
+        path = tmp_path / "play.yml"
+        path.write_text("old\n")
+        path.chmod(0o640)
+
+        atomic_write(path, "new\n")
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX ownership")
+    def test_keeps_owner(self, tmp_path):
+        """Test that the replaced file keeps the original's owner and group."""
+        path = tmp_path / "play.yml"
+        path.write_text("old\n")
+        if os.geteuid() == 0:
+            os.chown(path, 1234, 1234)
+        owner = (path.stat().st_uid, path.stat().st_gid)
+
+        atomic_write(path, "new\n")
+
+        assert (path.stat().st_uid, path.stat().st_gid) == owner
+        assert path.read_text() == "new\n"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX ownership")
+    def test_in_place_when_owner_cannot_be_kept(self, tmp_path):
+        """Test that a file whose owner cannot be restored is not swapped."""
+        path = tmp_path / "play.yml"
+        path.write_text("old\n")
+        inode = path.stat().st_ino
+
+        with patch.object(
+            writer_module.os, "geteuid", return_value=path.stat().st_uid + 1
+        ), patch.object(
+            writer_module.os, "chown", side_effect=PermissionError("not owner")
+        ):
+            atomic_write(path, "new\n")
+
+        assert path.stat().st_ino == inode
+        assert path.read_text() == "new\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["play.yml"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX hardlinks")
+    def test_keeps_hardlinks(self, tmp_path):
+        """Test that a hardlinked file is rewritten in place."""
+        path = tmp_path / "play.yml"
+        path.write_text("old\n")
+        link = tmp_path / "link.yml"
+        os.link(path, link)
+
+        atomic_write(path, "new\n")
+
+        assert path.stat().st_ino == link.stat().st_ino
+        assert link.read_text() == "new\n"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges")
+    def test_follows_symlinks(self, tmp_path):
+        """Test that a symlink stays in place and its target is written."""
+        target = tmp_path / "real.yml"
+        target.write_text("old\n")
+        link = tmp_path / "link.yml"
+        link.symlink_to(target)
+
+        atomic_write(link, "new\n")
+
+        assert link.is_symlink()
+        assert target.read_text() == "new\n"
+
+    def test_failure_leaves_original(self, tmp_path):
+        """Test that a failed write keeps the original and cleans up."""
+        path = tmp_path / "play.yml"
+        path.write_text("old\n")
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                atomic_write(path, "new\n")
+
+        assert path.read_text() == "old\n"
+        assert os.listdir(tmp_path) == ["play.yml"]
+
+    def test_fsync(self, tmp_path):
+        """Test that fsync flushes the file and its directory."""
+        path = tmp_path / "play.yml"
+        path.write_text("old\n")
+
+        with patch("os.fsync") as fsync:
+            atomic_write(path, "new\n", fsync=True)
+
+        assert fsync.call_count == (1 if sys.platform == "win32" else 2)
+
+
+class TestFileWriter:
+    """Test cases for FileWriter."""
+
+    def test_invalid_policy(self):
+        """Test that an unknown fsync policy raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="Unknown fsync policy"):
+            FileWriter(fsync="always")
+
+    def test_direct_write_raises(self, tmp_path):
+        """Test that a direct write raises its error."""
+        with pytest.raises(OSError):
+            FileWriter().write(tmp_path / "missing" / "play.yml", "new\n")
+
+    def test_write_behind(self, tmp_path):
+        """Test that queued writes are on disk after flush."""
+        paths = [tmp_path / f"play_{i}.yml" for i in range(10)]
+        for path in paths:
+            path.write_text("old\n")
+        writer = FileWriter(write_behind=True)
+
+        for path in paths:
+            writer.write(path, f"new {path.name}\n")
+        failures = writer.flush()
+
+        assert failures == []
+        assert all(path.read_text() == f"new {path.name}\n" for path in paths)
+
+    def test_write_behind_collects_failures(self, tmp_path):
+        """Test that failed queued writes are returned by flush."""
+        good = tmp_path / "play.yml"
+        good.write_text("old\n")
+        bad = tmp_path / "missing" / "play.yml"
+
+        with FileWriter(write_behind=True) as writer:
+            writer.write(bad, "new\n")
+            writer.write(good, "new\n")
+            failures = writer.flush()
+
+        assert [failure.path for failure in failures] == [str(bad)]
+        assert isinstance(failures[0].error, OSError)
+        assert good.read_text() == "new\n"
+        assert writer.flush() == []
+
+    def test_write_behind_restarts_after_flush(self, tmp_path):
+        """Test that a flushed writer accepts further writes."""
+        path = tmp_path / "play.yml"
+        writer = FileWriter(write_behind=True)
+
+        writer.write(path, "first\n")
+        writer.flush()
+        writer.write(path, "second\n")
+        writer.flush()
+
+        assert path.read_text() == "second\n"
+
+    def test_batch_policy_syncs_once_on_flush(self, tmp_path):
+        """Test that the batch policy defers syncing to flush."""
+        writer = FileWriter(fsync="batch")
+
+        with patch.object(writer, "_sync") as sync:
+            writer.write(tmp_path / "a.yml", "a\n")
+            writer.write(tmp_path / "b.yml", "b\n")
+            sync.assert_not_called()
+            writer.flush()
+
+        sync.assert_called_once_with([str(tmp_path / "a.yml"), str(tmp_path / "b.yml")])
+
+    def test_batch_sync_fsyncs_files_and_directories(self, tmp_path):
+        """Test that a batch sync fsyncs each file and directory once."""
+        (tmp_path / "sub").mkdir()
+        paths = [tmp_path / "a.yml", tmp_path / "b.yml", tmp_path / "sub" / "c.yml"]
+        writer = FileWriter(fsync="batch")
+        for path in paths:
+            writer.write(path, "new\n")
+
+        with patch("os.sync", create=True) as sync, patch.object(
+            writer_module, "_fsync_directory"
+        ) as fsync_directory, patch("os.fsync") as fsync:
+            writer.flush()
+
+        sync.assert_not_called()
+        assert fsync.call_count == 3
+        assert [call.args[0] for call in fsync_directory.call_args_list] == [
+            str(tmp_path),
+            str(tmp_path / "sub"),
+        ]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_batch_sync_opens_files_read_only(self, tmp_path):
+        """Test that read-only files are synced without asking for write access."""
+        path = tmp_path / "a.yml"
+        path.write_text("old\n")
+        path.chmod(0o444)
+        writer = FileWriter(fsync="batch")
+        writer.write(path, "new\n")
+
+        real_open = os.open
+        opened = []
+
+        def record_open(file_path, flags, *args):
+            opened.append((str(file_path), flags & os.O_ACCMODE))
+            return real_open(file_path, flags, *args)
+
+        with patch("os.open", side_effect=record_open), patch("os.fsync") as fsync:
+            writer.flush()
+
+        assert (str(path), os.O_RDONLY) in opened
+        assert fsync.call_count == 2
+        assert stat.S_IMODE(path.stat().st_mode) == 0o444
+
+    def test_write_behind_reraises_unexpected_errors(self, tmp_path):
+        """Test that a non-OSError in the writer thread surfaces on flush."""
+        writer = FileWriter(write_behind=True)
+
+        with patch.object(writer_module, "WRITE_BEHIND_QUEUE_SIZE", 1), patch.object(
+            writer_module, "atomic_write", side_effect=ValueError("boom")
+        ):
+            # More writes than the queue holds must not block
+            for index in range(5):
+                writer.write(tmp_path / f"{index}.yml", "new\n")
+            with pytest.raises(ValueError, match="boom"):
+                writer.flush()
+
+        writer.write(tmp_path / "a.yml", "new\n")
+        assert writer.flush() == []
+        assert (tmp_path / "a.yml").read_text() == "new\n"
+
+    @pytest.mark.skipif(
+        not os.path.exists("/proc/self/status"), reason="umask read from /proc"
+    )
+    def test_umask_not_changed_by_writes(self, tmp_path):
+        """Test that writing a new file leaves the process umask alone."""
+        umask = os.umask(0o027)
+        try:
+            with patch("os.umask") as set_umask:
+                atomic_write(tmp_path / "new.yml", "new\n")
+        finally:
+            os.umask(umask)
+
+        set_umask.assert_not_called()
+        mode = stat.S_IMODE((tmp_path / "new.yml").stat().st_mode)
+        assert mode == 0o640
+
+    def test_file_policy_syncs_each_write(self, tmp_path):
+        """Test that the file policy fsyncs every write."""
+        writer = FileWriter(fsync="file")
+
+        with patch.object(writer_module, "atomic_write") as write:
+            writer.write(tmp_path / "a.yml", "a\n")
+
+        write.assert_called_once_with(str(tmp_path / "a.yml"), b"a\n", fsync=True)
+
+
+class TestConverterWriter:
+    """Test cases for the converter's use of a writer."""
+
+    def test_convert_file_replaces_atomically(
+        self, write_project, minimal_playbook_content
+    ):
+        """Test that convert_file swaps in the converted file."""
+        (path,) = write_project({"play.yml": minimal_playbook_content})
+        inode = path.stat().st_ino
+
+        result = FQCNConverter().convert_file(path)
+
+        assert result.changes_made == 1
+        assert "ansible.builtin.copy:" in path.read_text()
+        assert path.stat().st_ino != inode
+
+    def test_write_behind_converter(self, write_project, minimal_playbook_content):
+        """Test that a write-behind converter writes files on flush."""
+        (path,) = write_project({"play.yml": minimal_playbook_content})
+        converter = FQCNConverter(writer=FileWriter(write_behind=True))
+
+        result = converter.convert_file(path)
+        failures = converter.flush()
+
+        assert result.success
+        assert failures == []
+        assert "ansible.builtin.copy:" in path.read_text()
+
+
+class TestConvertCommandWrites:
+    """Test cases for write-back in the convert command."""
+
+    def _run(self, *argv):
+        from fqcn_converter.cli import convert
+        from fqcn_converter.cli.main import create_parser
+
+        return convert.main(create_parser().parse_args(["convert", *argv]))
+
+    def test_batch_fsync(self, write_project, minimal_playbook_content):
+        """Test that converted files are synced once after the run."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+
+        with patch.object(FileWriter, "_sync") as sync:
+            assert self._run("--fsync", "batch", str(path)) == 0
+
+        sync.assert_called_once()
+        assert "ansible.builtin.copy:" in path.read_text()
+
+    def test_failed_write_fails_run(
+        self, capsys, write_project, minimal_playbook_content
+    ):
+        """Test that a write failing behind the conversion is reported."""
+        (path,) = write_project({"site.yml": minimal_playbook_content})
+
+        with patch.object(
+            writer_module, "atomic_write", side_effect=OSError("disk full")
+        ):
+            assert self._run(str(path)) == 1
+
+        assert path.read_text() == minimal_playbook_content
+        output = capsys.readouterr().out
+        assert "Files converted: 0" in output
+        assert "Files failed: 1" in output
+        assert "disk full" in output
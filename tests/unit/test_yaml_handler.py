@@ -10,11 +10,19 @@ from unittest.mock import mock_open, patch
 
 import pytest
 
+import yaml
+
+from fqcn_converter.exceptions import ConfigurationError
+from fqcn_converter.utils import yaml_handler
 from fqcn_converter.utils.yaml_handler import (
+    available_yaml_backends,
+    compose,
     load_yaml_file,
     safe_dump,
     safe_load,
     save_yaml_file,
+    set_yaml_backend,
+    yaml_backend,
 )
 
 
@@ -223,3 +231,116 @@ class TestYAMLHandler:
         assert callable(safe_dump)
         assert callable(load_yaml_file)
         assert callable(save_yaml_file)
+
+
+@pytest.fixture
+def restore_backend():
+    """Restore the automatically selected YAML backend after a test."""
+    yield
+    yaml_handler._backend = None
+
+
+@pytest.mark.usefixtures("restore_backend")
+class TestYAMLBackend:
+    """Test selection and behaviour of the YAML parsing backends."""
+
+    CONTENT = "---\n- name: Copy ✓\n  copy:\n    src: a\n- service: name=x\n"
+
+    def test_auto_prefers_libyaml(self):
+        """Test that the libyaml loader is used when PyYAML provides it."""
+        expected = "libyaml" if yaml.__with_libyaml__ else "python"
+
+        assert set_yaml_backend() == expected
+        assert available_yaml_backends()[0] == expected
+        assert yaml_backend() == expected
+
+    def test_environment_override(self):
+        """Test that FQCN_YAML_BACKEND selects the backend."""
+        yaml_handler._backend = None
+        with patch.dict(os.environ, {"FQCN_YAML_BACKEND": "python"}):
+            assert yaml_backend() == "python"
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ConfigurationError):
+            set_yaml_backend("ruamel")
+
+    def test_unknown_backend_in_environment(self):
+        """Test that an unknown backend in the environment falls back."""
+        yaml_handler._backend = None
+        with patch.dict(os.environ, {"FQCN_YAML_BACKEND": "bogus"}):
+            assert yaml_backend() == available_yaml_backends()[0]
+
+    @pytest.mark.parametrize("backend", available_yaml_backends())
+    def test_backends_agree(self, backend):
+        """Test that every backend yields the same data and marks."""
+        set_yaml_backend(backend)
+        root = compose(self.CONTENT)
+        key = root.value[0].value[1][0]
+
+        assert safe_load(self.CONTENT) == yaml.safe_load(self.CONTENT)
+        assert key.value == "copy"
+        assert (key.start_mark.line, key.start_mark.column) == (2, 2)
+        assert self.CONTENT[key.start_mark.index : key.end_mark.index] == "copy"
+
+    def test_fallback_result_returned(self):
+        """Test that input only the pure-Python loader accepts is loaded."""
+
+        class RejectingLoader(yaml.SafeLoader):
+            def __init__(self, stream):
+                raise yaml.YAMLError("rejected")
+
+        with patch.dict(yaml_handler._LOADERS, {"libyaml": RejectingLoader}):
+            set_yaml_backend("libyaml")
+
+            assert safe_load("key: value\n") == {"key": "value"}
+            assert compose("key: value\n").value[0][0].value == "key"
+
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="needs libyaml")
+    def test_libyaml_accepts_tab_separator(self):
+        """Test the documented difference: libyaml accepts a tab after a colon."""
+        content = "key:\tvalue\n"
+
+        set_yaml_backend("libyaml")
+        assert safe_load(content) == {"key": "value"}
+
+        set_yaml_backend("python")
+        with pytest.raises(yaml.YAMLError):
+            safe_load(content)
+
+    @pytest.mark.parametrize("backend", available_yaml_backends())
+    def test_bom_marks_agree(self, backend):
+        """Test that marks index into the text after a leading BOM."""
+        content = "\ufeff- copy:\n    src: a\n"
+        set_yaml_backend(backend)
+        key = compose(content).value[0].value[0][0]
+
+        assert (key.start_mark.index, key.start_mark.column) == (2, 2)
+        assert safe_load(content.encode("utf-8")) == [{"copy": {"src": "a"}}]
+
+    @pytest.mark.parametrize("backend", available_yaml_backends())
+    def test_bom_file_converts(self, backend):
+        """Test that a BOM-prefixed task file converts and keeps its BOM."""
+        from fqcn_converter.core.converter import FQCNConverter
+
+        set_yaml_backend(backend)
+        result = FQCNConverter().convert_content("\ufeff- copy:\n    src: a\n")
+
+        assert result.changes_made == 1
+        assert result.converted_content == (
+            "\ufeff- ansible.builtin.copy:\n    src: a\n"
+        )
+
+    @pytest.mark.parametrize("backend", available_yaml_backends())
+    def test_errors_do_not_depend_on_backend(self, backend):
+        """Test that syntax errors carry the pure-Python message and marks."""
+        invalid = "key: [1, 2\nother: value\n"
+        with pytest.raises(yaml.YAMLError) as expected:
+            yaml.load(invalid, Loader=yaml.SafeLoader)
+
+        set_yaml_backend(backend)
+        with pytest.raises(yaml.YAMLError) as error:
+            compose(invalid)
+
+        assert str(error.value) == str(expected.value)
+        assert error.value.problem_mark.line == 1